@@ -413,78 +413,10 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_82.setContentsMargins(10, 10, 10, 10)
         self.verticalLayout_82.setSpacing(10)
         self.verticalLayout_82.setObjectName("verticalLayout_82")
-        self.home_header_container = QtWidgets.QFrame(parent=self.home_frame)
-        self.home_header_container.setStyleSheet("QPushButton, QPushButton:flat {\n"
-"    background-color: white;\n"
-"    border: 0px solid white;\n"
-"    padding: 5;\n"
-"    border-radius: 10%;\n"
-"}\n"
-"QPushButton:hover {\n"
-"    background-color: rgb(239, 239, 239);\n"
-"    padding: 5;\n"
-"    border-radius: 10%;\n"
-"}")
-        self.home_header_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.home_header_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.home_header_container.setObjectName("home_header_container")
-        self.horizontalLayout_11 = QtWidgets.QHBoxLayout(self.home_header_container)
-        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
-        self.search_container = QtWidgets.QFrame(parent=self.home_header_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.search_container.sizePolicy().hasHeightForWidth())
-        self.search_container.setSizePolicy(sizePolicy)
-        self.search_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.search_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.search_container.setObjectName("search_container")
-        self.horizontalLayout_10 = QtWidgets.QHBoxLayout(self.search_container)
-        self.horizontalLayout_10.setContentsMargins(10, 0, 10, 0)
-        self.horizontalLayout_10.setSpacing(5)
-        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
-        self.search_icon = QtWidgets.QLabel(parent=self.search_container)
-        self.search_icon.setText("")
-        self.search_icon.setPixmap(QtGui.QPixmap("QtGUI\\asset/search_icon.png"))
-        self.search_icon.setObjectName("search_icon")
-        self.horizontalLayout_10.addWidget(self.search_icon)
-        self.search_edit = QtWidgets.QLineEdit(parent=self.search_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.search_edit.sizePolicy().hasHeightForWidth())
-        self.search_edit.setSizePolicy(sizePolicy)
-        self.search_edit.setStyleSheet("#search_edit {\n"
-"border: 0px solid white;\n"
-"}")
-        self.search_edit.setCursorMoveStyle(QtCore.Qt.CursorMoveStyle.LogicalMoveStyle)
-        self.search_edit.setObjectName("search_edit")
-        self.horizontalLayout_10.addWidget(self.search_edit)
-        self.horizontalLayout_11.addWidget(self.search_container)
-        spacerItem1 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_11.addItem(spacerItem1)
-        self.bell_button = QtWidgets.QPushButton(parent=self.home_header_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.bell_button.sizePolicy().hasHeightForWidth())
-        self.bell_button.setSizePolicy(sizePolicy)
-        self.bell_button.setText("")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("QtGUI\\asset/bell_icon.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.bell_button.setIcon(icon)
-        self.bell_button.setIconSize(QtCore.QSize(30, 30))
-        self.bell_button.setObjectName("bell_button")
-        self.horizontalLayout_11.addWidget(self.bell_button)
-        self.user_button = QtWidgets.QPushButton(parent=self.home_header_container)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("QtGUI\\asset/user_icon.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.user_button.setIcon(icon1)
-        self.user_button.setIconSize(QtCore.QSize(30, 30))
-        self.user_button.setObjectName("user_button")
-        self.horizontalLayout_11.addWidget(self.user_button)
-        self.verticalLayout_82.addWidget(self.home_header_container)
         self.home_body = QtWidgets.QFrame(parent=self.home_frame)
+        self.home_body.setStyleSheet("#notifications_label {\n"
+"    color: black;\n"
+"}")
         self.home_body.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.home_body.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
         self.home_body.setObjectName("home_body")
@@ -492,316 +424,15 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_81.setContentsMargins(10, 10, 10, 10)
         self.verticalLayout_81.setSpacing(10)
         self.verticalLayout_81.setObjectName("verticalLayout_81")
-        self.frame = QtWidgets.QFrame(parent=self.home_body)
-        self.frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.frame.setObjectName("frame")
-        self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.frame)
-        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_8.setSpacing(10)
-        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.home_welcome_container = QtWidgets.QFrame(parent=self.frame)
-        self.home_welcome_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.home_welcome_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.home_welcome_container.setObjectName("home_welcome_container")
-        self.verticalLayout_80 = QtWidgets.QVBoxLayout(self.home_welcome_container)
-        self.verticalLayout_80.setContentsMargins(10, 10, 10, 10)
-        self.verticalLayout_80.setSpacing(10)
-        self.verticalLayout_80.setObjectName("verticalLayout_80")
-        self.home_welcome = QtWidgets.QLabel(parent=self.home_welcome_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.home_welcome.sizePolicy().hasHeightForWidth())
-        self.home_welcome.setSizePolicy(sizePolicy)
+        self.notifications_label = QtWidgets.QLabel(parent=self.home_body)
         font = QtGui.QFont()
-        font.setPointSize(16)
-        font.setBold(True)
-        self.home_welcome.setFont(font)
-        self.home_welcome.setObjectName("home_welcome")
-        self.verticalLayout_80.addWidget(self.home_welcome)
-        self.home_info = QtWidgets.QLabel(parent=self.home_welcome_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.home_info.sizePolicy().hasHeightForWidth())
-        self.home_info.setSizePolicy(sizePolicy)
-        self.home_info.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
-        self.home_info.setWordWrap(True)
-        self.home_info.setObjectName("home_info")
-        self.verticalLayout_80.addWidget(self.home_info)
-        self.horizontalLayout_8.addWidget(self.home_welcome_container)
-        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_8.addItem(spacerItem2)
-        self.popup_container = QtWidgets.QFrame(parent=self.frame)
-        self.popup_container.setStyleSheet("")
-        self.popup_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.popup_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.popup_container.setObjectName("popup_container")
-        self.verticalLayout_83 = QtWidgets.QVBoxLayout(self.popup_container)
-        self.verticalLayout_83.setContentsMargins(10, 10, 10, 10)
-        self.verticalLayout_83.setSpacing(10)
-        self.verticalLayout_83.setObjectName("verticalLayout_83")
-        self.popup_notif = QtWidgets.QScrollArea(parent=self.popup_container)
-        self.popup_notif.setStyleSheet("#popup_notif {\n"
-"background-color: rgb(224, 222, 232);\n"
-"}")
-        self.popup_notif.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.popup_notif.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self.popup_notif.setLineWidth(0)
-        self.popup_notif.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.popup_notif.setWidgetResizable(True)
-        self.popup_notif.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
-        self.popup_notif.setObjectName("popup_notif")
-        self.popup_notif_container = QtWidgets.QWidget()
-        self.popup_notif_container.setGeometry(QtCore.QRect(0, 0, 264, 87))
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.popup_notif_container.sizePolicy().hasHeightForWidth())
-        self.popup_notif_container.setSizePolicy(sizePolicy)
-        self.popup_notif_container.setStyleSheet("#popup_notif_container {\n"
-"background-color: rgb(224, 222, 232);\n"
-"}")
-        self.popup_notif_container.setObjectName("popup_notif_container")
-        self.verticalLayout_79 = QtWidgets.QVBoxLayout(self.popup_notif_container)
-        self.verticalLayout_79.setContentsMargins(10, 10, 10, 10)
-        self.verticalLayout_79.setSpacing(5)
-        self.verticalLayout_79.setObjectName("verticalLayout_79")
-        self.popup_frame = QtWidgets.QFrame(parent=self.popup_notif_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.popup_frame.sizePolicy().hasHeightForWidth())
-        self.popup_frame.setSizePolicy(sizePolicy)
-        self.popup_frame.setStyleSheet("#popup_frame {\n"
-"background-color: rgb(156, 149, 162);\n"
-"border-radius: 10%;\n"
-"}")
-        self.popup_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.popup_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.popup_frame.setObjectName("popup_frame")
-        self.horizontalLayout_7 = QtWidgets.QHBoxLayout(self.popup_frame)
-        self.horizontalLayout_7.setContentsMargins(10, 10, 10, 10)
-        self.horizontalLayout_7.setSpacing(10)
-        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
-        self.popup_icon = QtWidgets.QLabel(parent=self.popup_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.popup_icon.sizePolicy().hasHeightForWidth())
-        self.popup_icon.setSizePolicy(sizePolicy)
-        self.popup_icon.setAutoFillBackground(False)
-        self.popup_icon.setStyleSheet("")
-        self.popup_icon.setLineWidth(0)
-        self.popup_icon.setPixmap(QtGui.QPixmap("QtGUI\\asset/doc_icon.png"))
-        self.popup_icon.setScaledContents(False)
-        self.popup_icon.setObjectName("popup_icon")
-        self.horizontalLayout_7.addWidget(self.popup_icon)
-        self.popup_label = QtWidgets.QLabel(parent=self.popup_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.popup_label.sizePolicy().hasHeightForWidth())
-        self.popup_label.setSizePolicy(sizePolicy)
-        self.popup_label.setStyleSheet("color: white;")
-        self.popup_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
-        self.popup_label.setObjectName("popup_label")
-        self.horizontalLayout_7.addWidget(self.popup_label)
-        self.verticalLayout_79.addWidget(self.popup_frame)
-        self.popup_notif.setWidget(self.popup_notif_container)
-        self.verticalLayout_83.addWidget(self.popup_notif)
-        self.horizontalLayout_8.addWidget(self.popup_container)
-        self.verticalLayout_81.addWidget(self.frame)
-        self.recent_act_frame = QtWidgets.QFrame(parent=self.home_body)
-        self.recent_act_frame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.recent_act_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self.recent_act_frame.setLineWidth(0)
-        self.recent_act_frame.setObjectName("recent_act_frame")
-        self.verticalLayout_78 = QtWidgets.QVBoxLayout(self.recent_act_frame)
-        self.verticalLayout_78.setContentsMargins(10, 10, 10, 10)
-        self.verticalLayout_78.setSpacing(10)
-        self.verticalLayout_78.setObjectName("verticalLayout_78")
-        self.recenct_act_header = QtWidgets.QFrame(parent=self.recent_act_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.recenct_act_header.sizePolicy().hasHeightForWidth())
-        self.recenct_act_header.setSizePolicy(sizePolicy)
-        self.recenct_act_header.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.recenct_act_header.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.recenct_act_header.setObjectName("recenct_act_header")
-        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.recenct_act_header)
-        self.horizontalLayout_4.setContentsMargins(0, 0, 10, 0)
-        self.horizontalLayout_4.setSpacing(10)
-        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
-        self.recent_act_label = QtWidgets.QLabel(parent=self.recenct_act_header)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.recent_act_label.sizePolicy().hasHeightForWidth())
-        self.recent_act_label.setSizePolicy(sizePolicy)
-        self.recent_act_label.setObjectName("recent_act_label")
-        self.horizontalLayout_4.addWidget(self.recent_act_label)
-        self.recent_act_icon = QtWidgets.QLabel(parent=self.recenct_act_header)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.recent_act_icon.sizePolicy().hasHeightForWidth())
-        self.recent_act_icon.setSizePolicy(sizePolicy)
-        self.recent_act_icon.setText("")
-        self.recent_act_icon.setPixmap(QtGui.QPixmap("QtGUI\\asset/graph_icon.png"))
-        self.recent_act_icon.setScaledContents(False)
-        self.recent_act_icon.setObjectName("recent_act_icon")
-        self.horizontalLayout_4.addWidget(self.recent_act_icon)
-        self.verticalLayout_78.addWidget(self.recenct_act_header)
-        self.recent_act = QtWidgets.QScrollArea(parent=self.recent_act_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.recent_act.sizePolicy().hasHeightForWidth())
-        self.recent_act.setSizePolicy(sizePolicy)
-        self.recent_act.setMinimumSize(QtCore.QSize(0, 126))
-        self.recent_act.setStyleSheet("")
-        self.recent_act.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.recent_act.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self.recent_act.setLineWidth(0)
-        self.recent_act.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.recent_act.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.recent_act.setWidgetResizable(True)
-        self.recent_act.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
-        self.recent_act.setObjectName("recent_act")
-        self.recent_act_container = QtWidgets.QWidget()
-        self.recent_act_container.setGeometry(QtCore.QRect(0, 0, 900, 189))
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.recent_act_container.sizePolicy().hasHeightForWidth())
-        self.recent_act_container.setSizePolicy(sizePolicy)
-        self.recent_act_container.setObjectName("recent_act_container")
-        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.recent_act_container)
-        self.verticalLayout_4.setContentsMargins(0, 0, 10, 0)
-        self.verticalLayout_4.setSpacing(7)
-        self.verticalLayout_4.setObjectName("verticalLayout_4")
-        self.activity_container_4 = QtWidgets.QFrame(parent=self.recent_act_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_container_4.sizePolicy().hasHeightForWidth())
-        self.activity_container_4.setSizePolicy(sizePolicy)
-        self.activity_container_4.setStyleSheet("#activity_container_4 {\n"
-"background-color: rgb(225, 206, 206);\n"
-"border: 1px solid black;\n"
-"border-radius: 20%;\n"
-"}")
-        self.activity_container_4.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.activity_container_4.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self.activity_container_4.setLineWidth(0)
-        self.activity_container_4.setObjectName("activity_container_4")
-        self.horizontalLayout_14 = QtWidgets.QHBoxLayout(self.activity_container_4)
-        self.horizontalLayout_14.setContentsMargins(10, 10, 10, 10)
-        self.horizontalLayout_14.setSpacing(10)
-        self.horizontalLayout_14.setObjectName("horizontalLayout_14")
-        self.activity_label_4 = QtWidgets.QLabel(parent=self.activity_container_4)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_label_4.sizePolicy().hasHeightForWidth())
-        self.activity_label_4.setSizePolicy(sizePolicy)
-        self.activity_label_4.setLineWidth(0)
-        self.activity_label_4.setObjectName("activity_label_4")
-        self.horizontalLayout_14.addWidget(self.activity_label_4)
-        self.verticalLayout_4.addWidget(self.activity_container_4)
-        self.activity_container_2 = QtWidgets.QFrame(parent=self.recent_act_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_container_2.sizePolicy().hasHeightForWidth())
-        self.activity_container_2.setSizePolicy(sizePolicy)
-        self.activity_container_2.setStyleSheet("#activity_container_2 {\n"
-"background-color: rgb(225, 206, 206);\n"
-"border: 1px solid black;\n"
-"border-radius: 20%;\n"
-"}")
-        self.activity_container_2.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.activity_container_2.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self.activity_container_2.setLineWidth(0)
-        self.activity_container_2.setObjectName("activity_container_2")
-        self.horizontalLayout_12 = QtWidgets.QHBoxLayout(self.activity_container_2)
-        self.horizontalLayout_12.setContentsMargins(10, 10, 10, 10)
-        self.horizontalLayout_12.setSpacing(10)
-        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
-        self.activity_label_2 = QtWidgets.QLabel(parent=self.activity_container_2)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_label_2.sizePolicy().hasHeightForWidth())
-        self.activity_label_2.setSizePolicy(sizePolicy)
-        self.activity_label_2.setLineWidth(0)
-        self.activity_label_2.setObjectName("activity_label_2")
-        self.horizontalLayout_12.addWidget(self.activity_label_2)
-        self.verticalLayout_4.addWidget(self.activity_container_2)
-        self.activity_container_3 = QtWidgets.QFrame(parent=self.recent_act_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_container_3.sizePolicy().hasHeightForWidth())
-        self.activity_container_3.setSizePolicy(sizePolicy)
-        self.activity_container_3.setStyleSheet("#activity_container_3 {\n"
-"background-color: rgb(225, 206, 206);\n"
-"border: 1px solid black;\n"
-"border-radius: 20%;\n"
-"}")
-        self.activity_container_3.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.activity_container_3.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self.activity_container_3.setLineWidth(0)
-        self.activity_container_3.setObjectName("activity_container_3")
-        self.horizontalLayout_13 = QtWidgets.QHBoxLayout(self.activity_container_3)
-        self.horizontalLayout_13.setContentsMargins(10, 10, 10, 10)
-        self.horizontalLayout_13.setSpacing(10)
-        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
-        self.activity_label_3 = QtWidgets.QLabel(parent=self.activity_container_3)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_label_3.sizePolicy().hasHeightForWidth())
-        self.activity_label_3.setSizePolicy(sizePolicy)
-        self.activity_label_3.setLineWidth(0)
-        self.activity_label_3.setObjectName("activity_label_3")
-        self.horizontalLayout_13.addWidget(self.activity_label_3)
-        self.verticalLayout_4.addWidget(self.activity_container_3)
-        self.activity_container = QtWidgets.QFrame(parent=self.recent_act_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_container.sizePolicy().hasHeightForWidth())
-        self.activity_container.setSizePolicy(sizePolicy)
-        self.activity_container.setStyleSheet("#activity_container {\n"
-"background-color: rgb(225, 206, 206);\n"
-"border: 1px solid black;\n"
-"border-radius: 20%;\n"
-"}")
-        self.activity_container.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.activity_container.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self.activity_container.setLineWidth(0)
-        self.activity_container.setObjectName("activity_container")
-        self.horizontalLayout_6 = QtWidgets.QHBoxLayout(self.activity_container)
-        self.horizontalLayout_6.setContentsMargins(10, 10, 10, 10)
-        self.horizontalLayout_6.setSpacing(10)
-        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
-        self.activity_label = QtWidgets.QLabel(parent=self.activity_container)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.activity_label.sizePolicy().hasHeightForWidth())
-        self.activity_label.setSizePolicy(sizePolicy)
-        self.activity_label.setLineWidth(0)
-        self.activity_label.setObjectName("activity_label")
-        self.horizontalLayout_6.addWidget(self.activity_label)
-        self.verticalLayout_4.addWidget(self.activity_container)
-        self.recent_act.setWidget(self.recent_act_container)
-        self.verticalLayout_78.addWidget(self.recent_act)
-        self.verticalLayout_81.addWidget(self.recent_act_frame)
+        font.setPointSize(24)
+        self.notifications_label.setFont(font)
+        self.notifications_label.setObjectName("notifications_label")
+        self.verticalLayout_81.addWidget(self.notifications_label)
+        self.notifications_center = QtWidgets.QListView(parent=self.home_body)
+        self.notifications_center.setObjectName("notifications_center")
+        self.verticalLayout_81.addWidget(self.notifications_center)
         self.verticalLayout_82.addWidget(self.home_body)
         self.verticalLayout_3.addWidget(self.home_frame)
         self.current_active_tab.addWidget(self.home_tab)
@@ -822,7 +453,10 @@ class Ui_InvestoPinoyGUI(object):
 "}\n"
 "#clients_hmo_add_client_individual_frame,\n"
 "#clients_hmo_add_client_corporate_frame,\n"
-"#clients_non_life_add_client_frame {\n"
+"#clients_non_life_add_client_frame,\n"
+"#clients_non_life_view_policy_frame,\n"
+"#clients_hmo_view_policy_individual_frame,\n"
+"#clients_hmo_view_policy_corporate_frame {\n"
 "    background-color: #E0DEE8;\n"
 "    border: 1px solid black;\n"
 "    border-radius: 10%;\n"
@@ -830,12 +464,18 @@ class Ui_InvestoPinoyGUI(object):
 "}\n"
 "#clients_hmo_add_client_individual_upper_frame,\n"
 "#clients_hmo_add_client_corporate_upper_frame,\n"
-"#clients_non_life_add_client_upper_frame {\n"
+"#clients_non_life_add_client_upper_frame,\n"
+"#clients_non_life_view_policy_upper_frame,\n"
+"#clients_hmo_view_policy_individual_upper_frame,\n"
+"#clients_hmo_view_policy_corporate_upper_frame {\n"
 "    background-color: rgba(255, 255, 255, 0.5);\n"
 "}\n"
 "#clients_hmo_add_client_individual_lower_frame,\n"
 "#clients_hmo_add_client_corporate_lower_frame,\n"
-"#clients_non_life_add_client_lower_frame {\n"
+"#clients_non_life_add_client_lower_frame,\n"
+"#clients_non_life_view_policy_lower_frame,\n"
+"#clients_hmo_view_policy_individual_lower_frame,\n"
+"#clients_hmo_view_policy_corporate_lower_frame {\n"
 "    background-color: #E0DEE8;\n"
 "}\n"
 "#clients_hmo_dashboard_table,\n"
@@ -847,7 +487,9 @@ class Ui_InvestoPinoyGUI(object):
 "}\n"
 "#clients_hmo_add_client_individual_frame QLabel,\n"
 "#clients_hmo_add_client_corporate_frame QLabel,\n"
-"#clients_non_life_add_client_frame QLabel {\n"
+"#clients_non_life_add_client_frame QLabel,\n"
+"#clients_non_life_view_policy_frame QLabel,\n"
+"#clients_hmo_view_policy_frame QLabel {\n"
 "    color: black;\n"
 "}\n"
 "QLineEdit,\n"
@@ -927,7 +569,7 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_search_layout.setObjectName("clients_search_layout")
         self.clients_search_icon = QtWidgets.QLabel(parent=self.clients_search_container)
         self.clients_search_icon.setText("")
-        self.clients_search_icon.setPixmap(QtGui.QPixmap("QtGUI\\asset/search_icon.png"))
+        self.clients_search_icon.setPixmap(QtGui.QPixmap("QtGUI/asset/search_icon.png"))
         self.clients_search_icon.setObjectName("clients_search_icon")
         self.clients_search_layout.addWidget(self.clients_search_icon)
         self.clients_search_edit = QtWidgets.QLineEdit(parent=self.clients_search_container)
@@ -943,10 +585,10 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_search_edit.setObjectName("clients_search_edit")
         self.clients_search_layout.addWidget(self.clients_search_edit)
         self.clients_header_layout.addWidget(self.clients_search_container)
-        spacerItem3 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.clients_header_layout.addItem(spacerItem3)
+        spacerItem1 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.clients_header_layout.addItem(spacerItem1)
         self.verticalLayout_18.addWidget(self.clients_header_container)
-        self.clients_non_life_dashboard_table = QtWidgets.QTableWidget(parent=self.clients_non_life_dashboard_frame)
+        self.clients_non_life_dashboard_table = QtWidgets.QTableView(parent=self.clients_non_life_dashboard_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -1118,28 +760,7 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_non_life_dashboard_table.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
         self.clients_non_life_dashboard_table.setAutoScroll(False)
         self.clients_non_life_dashboard_table.setAutoScrollMargin(16)
-        self.clients_non_life_dashboard_table.setRowCount(1)
-        self.clients_non_life_dashboard_table.setColumnCount(4)
         self.clients_non_life_dashboard_table.setObjectName("clients_non_life_dashboard_table")
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setKerning(True)
-        item.setFont(font)
-        self.clients_non_life_dashboard_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_non_life_dashboard_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_non_life_dashboard_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_non_life_dashboard_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_non_life_dashboard_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_non_life_dashboard_table.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_non_life_dashboard_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_non_life_dashboard_table.setItem(0, 3, item)
         self.clients_non_life_dashboard_table.horizontalHeader().setCascadingSectionResizes(False)
         self.clients_non_life_dashboard_table.horizontalHeader().setDefaultSectionSize(89)
         self.clients_non_life_dashboard_table.horizontalHeader().setMinimumSectionSize(50)
@@ -1148,8 +769,20 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_18.addWidget(self.clients_non_life_dashboard_table)
         self.clients_non_life_dashboard_button_container = QtWidgets.QHBoxLayout()
         self.clients_non_life_dashboard_button_container.setObjectName("clients_non_life_dashboard_button_container")
-        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.clients_non_life_dashboard_button_container.addItem(spacerItem4)
+        self.clients_non_life_dashboard_record_payment_button = QtWidgets.QPushButton(parent=self.clients_non_life_dashboard_frame)
+        self.clients_non_life_dashboard_record_payment_button.setObjectName("clients_non_life_dashboard_record_payment_button")
+        self.clients_non_life_dashboard_button_container.addWidget(self.clients_non_life_dashboard_record_payment_button)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.clients_non_life_dashboard_button_container.addItem(spacerItem2)
+        self.export_clients_nonlife_csv_button = QtWidgets.QPushButton(parent=self.clients_non_life_dashboard_frame)
+        self.export_clients_nonlife_csv_button.setObjectName("export_clients_nonlife_csv_button")
+        self.clients_non_life_dashboard_button_container.addWidget(self.export_clients_nonlife_csv_button)
+        self.export_clients_nonlife_xls_button = QtWidgets.QPushButton(parent=self.clients_non_life_dashboard_frame)
+        self.export_clients_nonlife_xls_button.setObjectName("export_clients_nonlife_xls_button")
+        self.clients_non_life_dashboard_button_container.addWidget(self.export_clients_nonlife_xls_button)
+        self.export_clients_nonlife_pdf_button = QtWidgets.QPushButton(parent=self.clients_non_life_dashboard_frame)
+        self.export_clients_nonlife_pdf_button.setObjectName("export_clients_nonlife_pdf_button")
+        self.clients_non_life_dashboard_button_container.addWidget(self.export_clients_nonlife_pdf_button)
         self.clients_non_life_dashboard_archive_button = QtWidgets.QPushButton(parent=self.clients_non_life_dashboard_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -1358,14 +991,198 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_13.addWidget(self.clients_non_life_add_client_lower_frame)
         self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_2.setObjectName("horizontalLayout_2")
-        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_2.addItem(spacerItem5)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem3)
         self.clients_non_life_add_client_submit_push_button = QtWidgets.QPushButton(parent=self.clients_non_life_add_client_frame)
         self.clients_non_life_add_client_submit_push_button.setObjectName("clients_non_life_add_client_submit_push_button")
         self.horizontalLayout_2.addWidget(self.clients_non_life_add_client_submit_push_button)
         self.verticalLayout_13.addLayout(self.horizontalLayout_2)
         self.verticalLayout_11.addWidget(self.clients_non_life_add_client_frame)
         self.clients_non_life_tab_widget.addTab(self.clients_non_life_add_client_tab, "")
+        self.clients_non_life_view_policy_tab = QtWidgets.QWidget()
+        self.clients_non_life_view_policy_tab.setObjectName("clients_non_life_view_policy_tab")
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout(self.clients_non_life_view_policy_tab)
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.clients_non_life_view_policy_frame = QtWidgets.QFrame(parent=self.clients_non_life_view_policy_tab)
+        self.clients_non_life_view_policy_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_non_life_view_policy_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_non_life_view_policy_frame.setObjectName("clients_non_life_view_policy_frame")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.clients_non_life_view_policy_frame)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.clients_non_life_view_policy_upper_frame = QtWidgets.QFrame(parent=self.clients_non_life_view_policy_frame)
+        self.clients_non_life_view_policy_upper_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_non_life_view_policy_upper_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_non_life_view_policy_upper_frame.setObjectName("clients_non_life_view_policy_upper_frame")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.clients_non_life_view_policy_upper_frame)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.verticalLayout_53 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_53.setObjectName("verticalLayout_53")
+        self.clients_non_life_view_policy_contact_number_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_contact_number_label.setObjectName("clients_non_life_view_policy_contact_number_label")
+        self.verticalLayout_53.addWidget(self.clients_non_life_view_policy_contact_number_label)
+        self.clients_non_life_view_policy_contact_number_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_contact_number_line_edit.setObjectName("clients_non_life_view_policy_contact_number_line_edit")
+        self.verticalLayout_53.addWidget(self.clients_non_life_view_policy_contact_number_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_53, 1, 0, 1, 1)
+        self.verticalLayout_54 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_54.setObjectName("verticalLayout_54")
+        self.clients_non_life_view_policy_assured_name_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_assured_name_label.setObjectName("clients_non_life_view_policy_assured_name_label")
+        self.verticalLayout_54.addWidget(self.clients_non_life_view_policy_assured_name_label)
+        self.clients_non_life_view_policy_assured_name_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_assured_name_line_edit.setObjectName("clients_non_life_view_policy_assured_name_line_edit")
+        self.verticalLayout_54.addWidget(self.clients_non_life_view_policy_assured_name_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_54, 0, 0, 1, 1)
+        self.verticalLayout_55 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_55.setObjectName("verticalLayout_55")
+        self.clients_non_life_view_policy_email_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_email_label.setObjectName("clients_non_life_view_policy_email_label")
+        self.verticalLayout_55.addWidget(self.clients_non_life_view_policy_email_label)
+        self.clients_non_life_view_policy_email_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_email_line_edit.setObjectName("clients_non_life_view_policy_email_line_edit")
+        self.verticalLayout_55.addWidget(self.clients_non_life_view_policy_email_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_55, 2, 0, 1, 1)
+        self.verticalLayout_60 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_60.setObjectName("verticalLayout_60")
+        self.clients_non_life_view_policy_birthday_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_birthday_label.setObjectName("clients_non_life_view_policy_birthday_label")
+        self.verticalLayout_60.addWidget(self.clients_non_life_view_policy_birthday_label)
+        self.clients_non_life_view_policy_birthday_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_birthday_line_edit.setObjectName("clients_non_life_view_policy_birthday_line_edit")
+        self.verticalLayout_60.addWidget(self.clients_non_life_view_policy_birthday_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_60, 3, 0, 1, 1)
+        self.verticalLayout_61 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_61.setObjectName("verticalLayout_61")
+        self.clients_non_life_view_policy_inception_date_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_inception_date_label.setObjectName("clients_non_life_view_policy_inception_date_label")
+        self.verticalLayout_61.addWidget(self.clients_non_life_view_policy_inception_date_label)
+        self.clients_non_life_view_policy_inception_date_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_inception_date_line_edit.setObjectName("clients_non_life_view_policy_inception_date_line_edit")
+        self.verticalLayout_61.addWidget(self.clients_non_life_view_policy_inception_date_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_61, 0, 1, 1, 1)
+        self.verticalLayout_62 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_62.setObjectName("verticalLayout_62")
+        self.clients_non_life_view_policy_expiry_date_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_expiry_date_label.setObjectName("clients_non_life_view_policy_expiry_date_label")
+        self.verticalLayout_62.addWidget(self.clients_non_life_view_policy_expiry_date_label)
+        self.clients_non_life_view_policy_expiry_date_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_expiry_date_line_edit.setObjectName("clients_non_life_view_policy_expiry_date_line_edit")
+        self.verticalLayout_62.addWidget(self.clients_non_life_view_policy_expiry_date_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_62, 1, 1, 1, 1)
+        self.verticalLayout_63 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_63.setObjectName("verticalLayout_63")
+        self.clients_non_life_view_policy_net_premium_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_net_premium_label.setObjectName("clients_non_life_view_policy_net_premium_label")
+        self.verticalLayout_63.addWidget(self.clients_non_life_view_policy_net_premium_label)
+        self.clients_non_life_view_policy_net_premium_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_net_premium_line_edit.setObjectName("clients_non_life_view_policy_net_premium_line_edit")
+        self.verticalLayout_63.addWidget(self.clients_non_life_view_policy_net_premium_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_63, 2, 1, 1, 1)
+        self.verticalLayout_64 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_64.setObjectName("verticalLayout_64")
+        self.clients_non_life_view_policy_gross_premium_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_gross_premium_label.setObjectName("clients_non_life_view_policy_gross_premium_label")
+        self.verticalLayout_64.addWidget(self.clients_non_life_view_policy_gross_premium_label)
+        self.clients_non_life_view_policy_gross_premium_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_gross_premium_line_edit.setObjectName("clients_non_life_view_policy_gross_premium_line_edit")
+        self.verticalLayout_64.addWidget(self.clients_non_life_view_policy_gross_premium_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_64, 3, 1, 1, 1)
+        self.verticalLayout_65 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_65.setObjectName("verticalLayout_65")
+        self.clients_non_life_view_policy_policy_number_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_policy_number_label.setObjectName("clients_non_life_view_policy_policy_number_label")
+        self.verticalLayout_65.addWidget(self.clients_non_life_view_policy_policy_number_label)
+        self.clients_non_life_view_policy_policy_number_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_policy_number_line_edit.setObjectName("clients_non_life_view_policy_policy_number_line_edit")
+        self.verticalLayout_65.addWidget(self.clients_non_life_view_policy_policy_number_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_65, 0, 2, 1, 1)
+        self.verticalLayout_66 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_66.setObjectName("verticalLayout_66")
+        self.clients_non_life_view_policy_agent_code_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_agent_code_label.setObjectName("clients_non_life_view_policy_agent_code_label")
+        self.verticalLayout_66.addWidget(self.clients_non_life_view_policy_agent_code_label)
+        self.clients_non_life_view_policy_agent_code_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_agent_code_line_edit.setObjectName("clients_non_life_view_policy_agent_code_line_edit")
+        self.verticalLayout_66.addWidget(self.clients_non_life_view_policy_agent_code_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_66, 1, 2, 1, 1)
+        self.verticalLayout_67 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_67.setObjectName("verticalLayout_67")
+        self.clients_non_life_view_policy_payment_invoice_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_payment_invoice_label.setObjectName("clients_non_life_view_policy_payment_invoice_label")
+        self.verticalLayout_67.addWidget(self.clients_non_life_view_policy_payment_invoice_label)
+        self.clients_non_life_view_policy_payment_invoice_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_payment_invoice_line_edit.setObjectName("clients_non_life_view_policy_payment_invoice_line_edit")
+        self.verticalLayout_67.addWidget(self.clients_non_life_view_policy_payment_invoice_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_67, 2, 2, 1, 1)
+        self.verticalLayout_68 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_68.setObjectName("verticalLayout_68")
+        self.clients_non_life_view_policy_commission_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_commission_label.setObjectName("clients_non_life_view_policy_commission_label")
+        self.verticalLayout_68.addWidget(self.clients_non_life_view_policy_commission_label)
+        self.clients_non_life_view_policy_commission_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_commission_line_edit.setReadOnly(False)
+        self.clients_non_life_view_policy_commission_line_edit.setObjectName("clients_non_life_view_policy_commission_line_edit")
+        self.verticalLayout_68.addWidget(self.clients_non_life_view_policy_commission_line_edit)
+        self.gridLayout_4.addLayout(self.verticalLayout_68, 3, 2, 1, 1)
+        self.verticalLayout_14.addWidget(self.clients_non_life_view_policy_upper_frame)
+        self.clients_non_life_view_policy_lower_frame = QtWidgets.QFrame(parent=self.clients_non_life_view_policy_frame)
+        self.clients_non_life_view_policy_lower_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_non_life_view_policy_lower_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_non_life_view_policy_lower_frame.setObjectName("clients_non_life_view_policy_lower_frame")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.clients_non_life_view_policy_lower_frame)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.verticalLayout_48 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_48.setObjectName("verticalLayout_48")
+        self.clients_non_life_view_policy_insurance_type_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_insurance_type_label.setObjectName("clients_non_life_view_policy_insurance_type_label")
+        self.verticalLayout_48.addWidget(self.clients_non_life_view_policy_insurance_type_label)
+        self.clients_non_life_view_policy_insurance_type_combo_box = QtWidgets.QComboBox(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_insurance_type_combo_box.setObjectName("clients_non_life_view_policy_insurance_type_combo_box")
+        self.clients_non_life_view_policy_insurance_type_combo_box.addItem("")
+        self.clients_non_life_view_policy_insurance_type_combo_box.addItem("")
+        self.verticalLayout_48.addWidget(self.clients_non_life_view_policy_insurance_type_combo_box)
+        self.gridLayout_3.addLayout(self.verticalLayout_48, 0, 1, 1, 1)
+        self.verticalLayout_50 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_50.setObjectName("verticalLayout_50")
+        self.clients_non_life_view_policy_insurance_company_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_insurance_company_label.setObjectName("clients_non_life_view_policy_insurance_company_label")
+        self.verticalLayout_50.addWidget(self.clients_non_life_view_policy_insurance_company_label)
+        self.clients_non_life_view_policy_insurance_company_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_insurance_company_line_edit.setObjectName("clients_non_life_view_policy_insurance_company_line_edit")
+        self.verticalLayout_50.addWidget(self.clients_non_life_view_policy_insurance_company_line_edit)
+        self.gridLayout_3.addLayout(self.verticalLayout_50, 0, 2, 1, 1)
+        self.verticalLayout_51 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_51.setObjectName("verticalLayout_51")
+        self.clients_non_life_view_policy_amount_covered_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_amount_covered_label.setObjectName("clients_non_life_view_policy_amount_covered_label")
+        self.verticalLayout_51.addWidget(self.clients_non_life_view_policy_amount_covered_label)
+        self.clients_non_life_view_policy_amount_covered_line_edit = QtWidgets.QLineEdit(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_amount_covered_line_edit.setObjectName("clients_non_life_view_policy_amount_covered_line_edit")
+        self.verticalLayout_51.addWidget(self.clients_non_life_view_policy_amount_covered_line_edit)
+        self.gridLayout_3.addLayout(self.verticalLayout_51, 0, 3, 1, 1)
+        self.verticalLayout_52 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_52.setObjectName("verticalLayout_52")
+        self.clients_non_life_view_policy_notes_label = QtWidgets.QLabel(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_notes_label.setObjectName("clients_non_life_view_policy_notes_label")
+        self.verticalLayout_52.addWidget(self.clients_non_life_view_policy_notes_label)
+        self.clients_non_life_view_policy_notes_text_edit = QtWidgets.QTextEdit(parent=self.clients_non_life_view_policy_lower_frame)
+        self.clients_non_life_view_policy_notes_text_edit.setObjectName("clients_non_life_view_policy_notes_text_edit")
+        self.verticalLayout_52.addWidget(self.clients_non_life_view_policy_notes_text_edit)
+        self.gridLayout_3.addLayout(self.verticalLayout_52, 2, 2, 1, 2)
+        self.verticalLayout_14.addWidget(self.clients_non_life_view_policy_lower_frame)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem4)
+        self.clients_non_life_view_policy_edit_push_button = QtWidgets.QPushButton(parent=self.clients_non_life_view_policy_frame)
+        self.clients_non_life_view_policy_edit_push_button.setObjectName("clients_non_life_view_policy_edit_push_button")
+        self.horizontalLayout_5.addWidget(self.clients_non_life_view_policy_edit_push_button)
+        self.clients_non_life_view_policy_update_push_button = QtWidgets.QPushButton(parent=self.clients_non_life_view_policy_frame)
+        self.clients_non_life_view_policy_update_push_button.setObjectName("clients_non_life_view_policy_update_push_button")
+        self.horizontalLayout_5.addWidget(self.clients_non_life_view_policy_update_push_button)
+        self.verticalLayout_14.addLayout(self.horizontalLayout_5)
+        self.verticalLayout_15.addWidget(self.clients_non_life_view_policy_frame)
+        self.clients_non_life_tab_widget.addTab(self.clients_non_life_view_policy_tab, "")
         self.verticalLayout_10.addWidget(self.clients_non_life_tab_widget)
         self.verticalLayout_7.addWidget(self.clients_non_life_frame)
         self.clients_tab_widget.addTab(self.clients_non_life_tab, "")
@@ -1428,7 +1245,7 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_hmo_search_layout.setObjectName("clients_hmo_search_layout")
         self.clients_hmo_search_icon = QtWidgets.QLabel(parent=self.clients_hmo_search_container)
         self.clients_hmo_search_icon.setText("")
-        self.clients_hmo_search_icon.setPixmap(QtGui.QPixmap("QtGUI\\asset/search_icon.png"))
+        self.clients_hmo_search_icon.setPixmap(QtGui.QPixmap("QtGUI/asset/search_icon.png"))
         self.clients_hmo_search_icon.setObjectName("clients_hmo_search_icon")
         self.clients_hmo_search_layout.addWidget(self.clients_hmo_search_icon)
         self.clients_hmo_search_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_search_container)
@@ -1444,10 +1261,10 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_hmo_search_edit.setObjectName("clients_hmo_search_edit")
         self.clients_hmo_search_layout.addWidget(self.clients_hmo_search_edit)
         self.clients_hmo_header_layout.addWidget(self.clients_hmo_search_container)
-        spacerItem6 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.clients_hmo_header_layout.addItem(spacerItem6)
+        spacerItem5 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.clients_hmo_header_layout.addItem(spacerItem5)
         self.verticalLayout_21.addWidget(self.clients_hmo_header_container)
-        self.clients_hmo_dashboard_table = QtWidgets.QTableWidget(parent=self.clients_hmo_dashboard_frame)
+        self.clients_hmo_dashboard_table = QtWidgets.QTableView(parent=self.clients_hmo_dashboard_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -1619,28 +1436,7 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_hmo_dashboard_table.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
         self.clients_hmo_dashboard_table.setAutoScroll(False)
         self.clients_hmo_dashboard_table.setAutoScrollMargin(16)
-        self.clients_hmo_dashboard_table.setRowCount(1)
-        self.clients_hmo_dashboard_table.setColumnCount(4)
         self.clients_hmo_dashboard_table.setObjectName("clients_hmo_dashboard_table")
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setKerning(True)
-        item.setFont(font)
-        self.clients_hmo_dashboard_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_hmo_dashboard_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_hmo_dashboard_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_hmo_dashboard_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_hmo_dashboard_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_hmo_dashboard_table.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_hmo_dashboard_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.clients_hmo_dashboard_table.setItem(0, 3, item)
         self.clients_hmo_dashboard_table.horizontalHeader().setCascadingSectionResizes(False)
         self.clients_hmo_dashboard_table.horizontalHeader().setDefaultSectionSize(89)
         self.clients_hmo_dashboard_table.horizontalHeader().setMinimumSectionSize(50)
@@ -1649,8 +1445,20 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_21.addWidget(self.clients_hmo_dashboard_table)
         self.clients_hmo_dashboard_button_container = QtWidgets.QHBoxLayout()
         self.clients_hmo_dashboard_button_container.setObjectName("clients_hmo_dashboard_button_container")
-        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.clients_hmo_dashboard_button_container.addItem(spacerItem7)
+        self.clients_hmo_dashboard_record_payment_button = QtWidgets.QPushButton(parent=self.clients_hmo_dashboard_frame)
+        self.clients_hmo_dashboard_record_payment_button.setObjectName("clients_hmo_dashboard_record_payment_button")
+        self.clients_hmo_dashboard_button_container.addWidget(self.clients_hmo_dashboard_record_payment_button)
+        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.clients_hmo_dashboard_button_container.addItem(spacerItem6)
+        self.export_clients_hmo_individual_csv_button = QtWidgets.QPushButton(parent=self.clients_hmo_dashboard_frame)
+        self.export_clients_hmo_individual_csv_button.setObjectName("export_clients_hmo_individual_csv_button")
+        self.clients_hmo_dashboard_button_container.addWidget(self.export_clients_hmo_individual_csv_button)
+        self.export_clients_hmo_individual_xls_button = QtWidgets.QPushButton(parent=self.clients_hmo_dashboard_frame)
+        self.export_clients_hmo_individual_xls_button.setObjectName("export_clients_hmo_individual_xls_button")
+        self.clients_hmo_dashboard_button_container.addWidget(self.export_clients_hmo_individual_xls_button)
+        self.export_clients_hmo_individual_pdf_button = QtWidgets.QPushButton(parent=self.clients_hmo_dashboard_frame)
+        self.export_clients_hmo_individual_pdf_button.setObjectName("export_clients_hmo_individual_pdf_button")
+        self.clients_hmo_dashboard_button_container.addWidget(self.export_clients_hmo_individual_pdf_button)
         self.clients_hmo_dashboard_archive_button = QtWidgets.QPushButton(parent=self.clients_hmo_dashboard_frame)
         self.clients_hmo_dashboard_archive_button.setObjectName("clients_hmo_dashboard_archive_button")
         self.clients_hmo_dashboard_button_container.addWidget(self.clients_hmo_dashboard_archive_button)
@@ -1846,8 +1654,8 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_84.addWidget(self.clients_hmo_add_client_individual_lower_frame)
         self.horizontalLayout_15 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_15.setObjectName("horizontalLayout_15")
-        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_15.addItem(spacerItem8)
+        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_15.addItem(spacerItem7)
         self.clients_hmo_add_client_individual_submit_push_button = QtWidgets.QPushButton(parent=self.clients_hmo_add_client_individual_frame)
         self.clients_hmo_add_client_individual_submit_push_button.setObjectName("clients_hmo_add_client_individual_submit_push_button")
         self.horizontalLayout_15.addWidget(self.clients_hmo_add_client_individual_submit_push_button)
@@ -2007,8 +1815,8 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_118.addWidget(self.clients_hmo_add_client_corporate_lower_frame)
         self.horizontalLayout_16 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_16.setObjectName("horizontalLayout_16")
-        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_16.addItem(spacerItem9)
+        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_16.addItem(spacerItem8)
         self.clients_hmo_add_client_corporate_submit_push_button = QtWidgets.QPushButton(parent=self.clients_hmo_add_client_corporate_frame)
         self.clients_hmo_add_client_corporate_submit_push_button.setObjectName("clients_hmo_add_client_corporate_submit_push_button")
         self.horizontalLayout_16.addWidget(self.clients_hmo_add_client_corporate_submit_push_button)
@@ -2018,6 +1826,349 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_30.addWidget(self.clients_hmo_add_client_tab_widget)
         self.verticalLayout_29.addWidget(self.clients_hmo_add_client_frame)
         self.clients_hmo_tab_widget.addTab(self.clients_hmo_add_client_tab, "")
+        self.clients_hmo_view_policy_tab = QtWidgets.QWidget()
+        self.clients_hmo_view_policy_tab.setObjectName("clients_hmo_view_policy_tab")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.clients_hmo_view_policy_tab)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.clients_hmo_view_policy_frame = QtWidgets.QFrame(parent=self.clients_hmo_view_policy_tab)
+        self.clients_hmo_view_policy_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_hmo_view_policy_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_hmo_view_policy_frame.setObjectName("clients_hmo_view_policy_frame")
+        self.verticalLayout_69 = QtWidgets.QVBoxLayout(self.clients_hmo_view_policy_frame)
+        self.verticalLayout_69.setObjectName("verticalLayout_69")
+        self.clients_hmo_view_policy_tab_widget = QtWidgets.QTabWidget(parent=self.clients_hmo_view_policy_frame)
+        self.clients_hmo_view_policy_tab_widget.setObjectName("clients_hmo_view_policy_tab_widget")
+        self.clients_hmo_view_policy_individual_tab = QtWidgets.QWidget()
+        self.clients_hmo_view_policy_individual_tab.setObjectName("clients_hmo_view_policy_individual_tab")
+        self.verticalLayout_221 = QtWidgets.QVBoxLayout(self.clients_hmo_view_policy_individual_tab)
+        self.verticalLayout_221.setObjectName("verticalLayout_221")
+        self.clients_hmo_view_policy_individual_frame = QtWidgets.QFrame(parent=self.clients_hmo_view_policy_individual_tab)
+        self.clients_hmo_view_policy_individual_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_hmo_view_policy_individual_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_hmo_view_policy_individual_frame.setObjectName("clients_hmo_view_policy_individual_frame")
+        self.verticalLayout_222 = QtWidgets.QVBoxLayout(self.clients_hmo_view_policy_individual_frame)
+        self.verticalLayout_222.setObjectName("verticalLayout_222")
+        self.clients_hmo_view_policy_individual_upper_frame = QtWidgets.QFrame(parent=self.clients_hmo_view_policy_individual_frame)
+        self.clients_hmo_view_policy_individual_upper_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_hmo_view_policy_individual_upper_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_hmo_view_policy_individual_upper_frame.setObjectName("clients_hmo_view_policy_individual_upper_frame")
+        self.gridLayout_21 = QtWidgets.QGridLayout(self.clients_hmo_view_policy_individual_upper_frame)
+        self.gridLayout_21.setObjectName("gridLayout_21")
+        self.verticalLayout_223 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_223.setObjectName("verticalLayout_223")
+        self.clients_hmo_view_policy_individual_gross_premium_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_gross_premium_label.setObjectName("clients_hmo_view_policy_individual_gross_premium_label")
+        self.verticalLayout_223.addWidget(self.clients_hmo_view_policy_individual_gross_premium_label)
+        self.clients_hmo_view_policy_individual_gross_premium_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_gross_premium_line_edit.setObjectName("clients_hmo_view_policy_individual_gross_premium_line_edit")
+        self.verticalLayout_223.addWidget(self.clients_hmo_view_policy_individual_gross_premium_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_223, 3, 2, 1, 1)
+        self.verticalLayout_224 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_224.setObjectName("verticalLayout_224")
+        self.clients_hmo_view_policy_individual_assured_name_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_assured_name_label.setObjectName("clients_hmo_view_policy_individual_assured_name_label")
+        self.verticalLayout_224.addWidget(self.clients_hmo_view_policy_individual_assured_name_label)
+        self.clients_hmo_view_policy_individual_assured_name_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_assured_name_line_edit.setObjectName("clients_hmo_view_policy_individual_assured_name_line_edit")
+        self.verticalLayout_224.addWidget(self.clients_hmo_view_policy_individual_assured_name_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_224, 0, 0, 1, 1)
+        self.verticalLayout_225 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_225.setObjectName("verticalLayout_225")
+        self.clients_hmo_view_policy_individual_policy_number_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_policy_number_label.setObjectName("clients_hmo_view_policy_individual_policy_number_label")
+        self.verticalLayout_225.addWidget(self.clients_hmo_view_policy_individual_policy_number_label)
+        self.clients_hmo_view_policy_individual_policy_number_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_policy_number_line_edit.setObjectName("clients_hmo_view_policy_individual_policy_number_line_edit")
+        self.verticalLayout_225.addWidget(self.clients_hmo_view_policy_individual_policy_number_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_225, 0, 2, 1, 1)
+        self.verticalLayout_226 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_226.setObjectName("verticalLayout_226")
+        self.clients_hmo_view_policy_individual_net_premium_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_net_premium_label.setObjectName("clients_hmo_view_policy_individual_net_premium_label")
+        self.verticalLayout_226.addWidget(self.clients_hmo_view_policy_individual_net_premium_label)
+        self.clients_hmo_view_policy_individual_net_premium_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_net_premium_line_edit.setObjectName("clients_hmo_view_policy_individual_net_premium_line_edit")
+        self.verticalLayout_226.addWidget(self.clients_hmo_view_policy_individual_net_premium_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_226, 2, 2, 1, 1)
+        self.verticalLayout_227 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_227.setObjectName("verticalLayout_227")
+        self.clients_hmo_view_policy_individual_mbl_abl_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_mbl_abl_label.setObjectName("clients_hmo_view_policy_individual_mbl_abl_label")
+        self.verticalLayout_227.addWidget(self.clients_hmo_view_policy_individual_mbl_abl_label)
+        self.clients_hmo_view_policy_individual_mbl_abl_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_mbl_abl_line_edit.setObjectName("clients_hmo_view_policy_individual_mbl_abl_line_edit")
+        self.verticalLayout_227.addWidget(self.clients_hmo_view_policy_individual_mbl_abl_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_227, 1, 2, 1, 1)
+        self.verticalLayout_228 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_228.setObjectName("verticalLayout_228")
+        self.clients_hmo_view_policy_individual_contact_number_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_contact_number_label.setObjectName("clients_hmo_view_policy_individual_contact_number_label")
+        self.verticalLayout_228.addWidget(self.clients_hmo_view_policy_individual_contact_number_label)
+        self.clients_hmo_view_policy_individual_contact_number_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_contact_number_line_edit.setObjectName("clients_hmo_view_policy_individual_contact_number_line_edit")
+        self.verticalLayout_228.addWidget(self.clients_hmo_view_policy_individual_contact_number_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_228, 1, 0, 1, 1)
+        self.verticalLayout_229 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_229.setObjectName("verticalLayout_229")
+        self.clients_hmo_view_policy_individual_email_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_email_label.setObjectName("clients_hmo_view_policy_individual_email_label")
+        self.verticalLayout_229.addWidget(self.clients_hmo_view_policy_individual_email_label)
+        self.clients_hmo_view_policy_individual_email_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_email_line_edit.setObjectName("clients_hmo_view_policy_individual_email_line_edit")
+        self.verticalLayout_229.addWidget(self.clients_hmo_view_policy_individual_email_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_229, 2, 0, 1, 1)
+        self.verticalLayout_230 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_230.setObjectName("verticalLayout_230")
+        self.clients_hmo_view_policy_individual_birthday_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_birthday_label.setObjectName("clients_hmo_view_policy_individual_birthday_label")
+        self.verticalLayout_230.addWidget(self.clients_hmo_view_policy_individual_birthday_label)
+        self.clients_hmo_view_policy_individual_birthday_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_birthday_line_edit.setObjectName("clients_hmo_view_policy_individual_birthday_line_edit")
+        self.verticalLayout_230.addWidget(self.clients_hmo_view_policy_individual_birthday_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_230, 3, 0, 1, 1)
+        self.verticalLayout_231 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_231.setObjectName("verticalLayout_231")
+        self.clients_hmo_view_policy_individual_expiry_date_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_expiry_date_label.setObjectName("clients_hmo_view_policy_individual_expiry_date_label")
+        self.verticalLayout_231.addWidget(self.clients_hmo_view_policy_individual_expiry_date_label)
+        self.clients_hmo_view_policy_individual_expiry_date_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_expiry_date_line_edit.setObjectName("clients_hmo_view_policy_individual_expiry_date_line_edit")
+        self.verticalLayout_231.addWidget(self.clients_hmo_view_policy_individual_expiry_date_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_231, 2, 1, 1, 1)
+        self.verticalLayout_232 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_232.setObjectName("verticalLayout_232")
+        self.clients_hmo_view_policy_individual_agent_code_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_agent_code_label.setObjectName("clients_hmo_view_policy_individual_agent_code_label")
+        self.verticalLayout_232.addWidget(self.clients_hmo_view_policy_individual_agent_code_label)
+        self.clients_hmo_view_policy_individual_agent_code_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_agent_code_line_edit.setObjectName("clients_hmo_view_policy_individual_agent_code_line_edit")
+        self.verticalLayout_232.addWidget(self.clients_hmo_view_policy_individual_agent_code_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_232, 3, 1, 1, 1)
+        self.verticalLayout_233 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_233.setObjectName("verticalLayout_233")
+        self.clients_hmo_view_policy_individual_inception_date_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_inception_date_label.setObjectName("clients_hmo_view_policy_individual_inception_date_label")
+        self.verticalLayout_233.addWidget(self.clients_hmo_view_policy_individual_inception_date_label)
+        self.clients_hmo_view_policy_individual_inception_date_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_inception_date_line_edit.setObjectName("clients_hmo_view_policy_individual_inception_date_line_edit")
+        self.verticalLayout_233.addWidget(self.clients_hmo_view_policy_individual_inception_date_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_233, 1, 1, 1, 1)
+        self.verticalLayout_234 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_234.setObjectName("verticalLayout_234")
+        self.clients_hmo_view_policy_individual_hmo_company_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_hmo_company_label.setObjectName("clients_hmo_view_policy_individual_hmo_company_label")
+        self.verticalLayout_234.addWidget(self.clients_hmo_view_policy_individual_hmo_company_label)
+        self.clients_hmo_view_policy_individual_hmo_company_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_hmo_company_line_edit.setObjectName("clients_hmo_view_policy_individual_hmo_company_line_edit")
+        self.verticalLayout_234.addWidget(self.clients_hmo_view_policy_individual_hmo_company_line_edit)
+        self.gridLayout_21.addLayout(self.verticalLayout_234, 0, 1, 1, 1)
+        self.verticalLayout_222.addWidget(self.clients_hmo_view_policy_individual_upper_frame)
+        self.clients_hmo_view_policy_individual_lower_frame = QtWidgets.QFrame(parent=self.clients_hmo_view_policy_individual_frame)
+        self.clients_hmo_view_policy_individual_lower_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_hmo_view_policy_individual_lower_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_hmo_view_policy_individual_lower_frame.setObjectName("clients_hmo_view_policy_individual_lower_frame")
+        self.gridLayout_22 = QtWidgets.QGridLayout(self.clients_hmo_view_policy_individual_lower_frame)
+        self.gridLayout_22.setObjectName("gridLayout_22")
+        self.verticalLayout_235 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_235.setObjectName("verticalLayout_235")
+        self.verticalLayout_236 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_236.setObjectName("verticalLayout_236")
+        self.clients_hmo_view_policy_individual_commission_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_lower_frame)
+        self.clients_hmo_view_policy_individual_commission_label.setObjectName("clients_hmo_view_policy_individual_commission_label")
+        self.verticalLayout_236.addWidget(self.clients_hmo_view_policy_individual_commission_label)
+        self.clients_hmo_view_policy_individual_commission_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_individual_lower_frame)
+        self.clients_hmo_view_policy_individual_commission_line_edit.setReadOnly(False)
+        self.clients_hmo_view_policy_individual_commission_line_edit.setObjectName("clients_hmo_view_policy_individual_commission_line_edit")
+        self.verticalLayout_236.addWidget(self.clients_hmo_view_policy_individual_commission_line_edit)
+        self.verticalLayout_235.addLayout(self.verticalLayout_236)
+        self.clients_hmo_view_policy_individual_notes_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_individual_lower_frame)
+        self.clients_hmo_view_policy_individual_notes_label.setObjectName("clients_hmo_view_policy_individual_notes_label")
+        self.verticalLayout_235.addWidget(self.clients_hmo_view_policy_individual_notes_label)
+        self.clients_hmo_view_policy_individual_notes_text_edit = QtWidgets.QTextEdit(parent=self.clients_hmo_view_policy_individual_lower_frame)
+        self.clients_hmo_view_policy_individual_notes_text_edit.setObjectName("clients_hmo_view_policy_individual_notes_text_edit")
+        self.verticalLayout_235.addWidget(self.clients_hmo_view_policy_individual_notes_text_edit)
+        self.gridLayout_22.addLayout(self.verticalLayout_235, 1, 1, 1, 2)
+        self.verticalLayout_222.addWidget(self.clients_hmo_view_policy_individual_lower_frame)
+        self.horizontalLayout_23 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_23.setObjectName("horizontalLayout_23")
+        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_23.addItem(spacerItem9)
+        self.clients_hmo_view_policy_individual_edit_push_button = QtWidgets.QPushButton(parent=self.clients_hmo_view_policy_individual_frame)
+        self.clients_hmo_view_policy_individual_edit_push_button.setObjectName("clients_hmo_view_policy_individual_edit_push_button")
+        self.horizontalLayout_23.addWidget(self.clients_hmo_view_policy_individual_edit_push_button)
+        self.clients_hmo_view_policy_individual_update_push_button = QtWidgets.QPushButton(parent=self.clients_hmo_view_policy_individual_frame)
+        self.clients_hmo_view_policy_individual_update_push_button.setObjectName("clients_hmo_view_policy_individual_update_push_button")
+        self.horizontalLayout_23.addWidget(self.clients_hmo_view_policy_individual_update_push_button)
+        self.verticalLayout_222.addLayout(self.horizontalLayout_23)
+        self.verticalLayout_221.addWidget(self.clients_hmo_view_policy_individual_frame)
+        self.clients_hmo_view_policy_tab_widget.addTab(self.clients_hmo_view_policy_individual_tab, "")
+        self.clients_hmo_view_policy_corporate_tab = QtWidgets.QWidget()
+        self.clients_hmo_view_policy_corporate_tab.setObjectName("clients_hmo_view_policy_corporate_tab")
+        self.verticalLayout_237 = QtWidgets.QVBoxLayout(self.clients_hmo_view_policy_corporate_tab)
+        self.verticalLayout_237.setObjectName("verticalLayout_237")
+        self.clients_hmo_view_policy_corporate_frame = QtWidgets.QFrame(parent=self.clients_hmo_view_policy_corporate_tab)
+        self.clients_hmo_view_policy_corporate_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_hmo_view_policy_corporate_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_hmo_view_policy_corporate_frame.setObjectName("clients_hmo_view_policy_corporate_frame")
+        self.verticalLayout_238 = QtWidgets.QVBoxLayout(self.clients_hmo_view_policy_corporate_frame)
+        self.verticalLayout_238.setObjectName("verticalLayout_238")
+        self.clients_hmo_view_policy_corporate_upper_frame = QtWidgets.QFrame(parent=self.clients_hmo_view_policy_corporate_frame)
+        self.clients_hmo_view_policy_corporate_upper_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_hmo_view_policy_corporate_upper_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_hmo_view_policy_corporate_upper_frame.setObjectName("clients_hmo_view_policy_corporate_upper_frame")
+        self.gridLayout_23 = QtWidgets.QGridLayout(self.clients_hmo_view_policy_corporate_upper_frame)
+        self.gridLayout_23.setObjectName("gridLayout_23")
+        self.verticalLayout_239 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_239.setObjectName("verticalLayout_239")
+        self.clients_hmo_view_policy_corporate_hmo_company_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_hmo_company_label.setObjectName("clients_hmo_view_policy_corporate_hmo_company_label")
+        self.verticalLayout_239.addWidget(self.clients_hmo_view_policy_corporate_hmo_company_label)
+        self.clients_hmo_view_policy_corporate_hmo_company_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_hmo_company_line_edit.setObjectName("clients_hmo_view_policy_corporate_hmo_company_line_edit")
+        self.verticalLayout_239.addWidget(self.clients_hmo_view_policy_corporate_hmo_company_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_239, 0, 1, 1, 1)
+        self.verticalLayout_240 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_240.setObjectName("verticalLayout_240")
+        self.clients_hmo_view_policy_corporate_policy_number_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_policy_number_label.setObjectName("clients_hmo_view_policy_corporate_policy_number_label")
+        self.verticalLayout_240.addWidget(self.clients_hmo_view_policy_corporate_policy_number_label)
+        self.clients_hmo_view_policy_corporate_policy_number_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_policy_number_line_edit.setObjectName("clients_hmo_view_policy_corporate_policy_number_line_edit")
+        self.verticalLayout_240.addWidget(self.clients_hmo_view_policy_corporate_policy_number_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_240, 0, 2, 1, 1)
+        self.verticalLayout_241 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_241.setObjectName("verticalLayout_241")
+        self.clients_hmo_view_policy_corporate_company_name_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_company_name_label.setObjectName("clients_hmo_view_policy_corporate_company_name_label")
+        self.verticalLayout_241.addWidget(self.clients_hmo_view_policy_corporate_company_name_label)
+        self.clients_hmo_view_policy_corporate_company_name_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_company_name_line_edit.setObjectName("clients_hmo_view_policy_corporate_company_name_line_edit")
+        self.verticalLayout_241.addWidget(self.clients_hmo_view_policy_corporate_company_name_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_241, 0, 0, 1, 1)
+        self.verticalLayout_242 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_242.setObjectName("verticalLayout_242")
+        self.clients_hmo_view_policy_corporate_email_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_email_label.setObjectName("clients_hmo_view_policy_corporate_email_label")
+        self.verticalLayout_242.addWidget(self.clients_hmo_view_policy_corporate_email_label)
+        self.clients_hmo_view_policy_corporate_email_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_email_line_edit.setObjectName("clients_hmo_view_policy_corporate_email_line_edit")
+        self.verticalLayout_242.addWidget(self.clients_hmo_view_policy_corporate_email_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_242, 3, 0, 1, 1)
+        self.verticalLayout_243 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_243.setObjectName("verticalLayout_243")
+        self.clients_hmo_view_policy_corporate_contact_number_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_contact_number_label.setObjectName("clients_hmo_view_policy_corporate_contact_number_label")
+        self.verticalLayout_243.addWidget(self.clients_hmo_view_policy_corporate_contact_number_label)
+        self.clients_hmo_view_policy_corporate_contact_number_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_contact_number_line_edit.setObjectName("clients_hmo_view_policy_corporate_contact_number_line_edit")
+        self.verticalLayout_243.addWidget(self.clients_hmo_view_policy_corporate_contact_number_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_243, 2, 0, 1, 1)
+        self.verticalLayout_244 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_244.setObjectName("verticalLayout_244")
+        self.clients_hmo_view_policy_corporate_number_of_enrollees_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_number_of_enrollees_label.setObjectName("clients_hmo_view_policy_corporate_number_of_enrollees_label")
+        self.verticalLayout_244.addWidget(self.clients_hmo_view_policy_corporate_number_of_enrollees_label)
+        self.clients_hmo_view_policy_corporate_number_of_enrollees_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_number_of_enrollees_line_edit.setObjectName("clients_hmo_view_policy_corporate_number_of_enrollees_line_edit")
+        self.verticalLayout_244.addWidget(self.clients_hmo_view_policy_corporate_number_of_enrollees_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_244, 1, 0, 1, 1)
+        self.verticalLayout_245 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_245.setObjectName("verticalLayout_245")
+        self.clients_hmo_view_policy_corporate_inception_date_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_inception_date_label.setObjectName("clients_hmo_view_policy_corporate_inception_date_label")
+        self.verticalLayout_245.addWidget(self.clients_hmo_view_policy_corporate_inception_date_label)
+        self.clients_hmo_view_policy_corporate_inception_date_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_inception_date_line_edit.setObjectName("clients_hmo_view_policy_corporate_inception_date_line_edit")
+        self.verticalLayout_245.addWidget(self.clients_hmo_view_policy_corporate_inception_date_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_245, 1, 1, 1, 1)
+        self.verticalLayout_246 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_246.setObjectName("verticalLayout_246")
+        self.clients_hmo_view_policy_corporate_expiry_date_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_expiry_date_label.setObjectName("clients_hmo_view_policy_corporate_expiry_date_label")
+        self.verticalLayout_246.addWidget(self.clients_hmo_view_policy_corporate_expiry_date_label)
+        self.clients_hmo_view_policy_corporate_expiry_date_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_expiry_date_line_edit.setObjectName("clients_hmo_view_policy_corporate_expiry_date_line_edit")
+        self.verticalLayout_246.addWidget(self.clients_hmo_view_policy_corporate_expiry_date_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_246, 2, 1, 1, 1)
+        self.verticalLayout_247 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_247.setObjectName("verticalLayout_247")
+        self.clients_hmo_view_policy_corporate_agent_code_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_agent_code_label.setObjectName("clients_hmo_view_policy_corporate_agent_code_label")
+        self.verticalLayout_247.addWidget(self.clients_hmo_view_policy_corporate_agent_code_label)
+        self.clients_hmo_view_policy_corporate_agent_code_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_agent_code_line_edit.setObjectName("clients_hmo_view_policy_corporate_agent_code_line_edit")
+        self.verticalLayout_247.addWidget(self.clients_hmo_view_policy_corporate_agent_code_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_247, 3, 1, 1, 1)
+        self.verticalLayout_248 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_248.setObjectName("verticalLayout_248")
+        self.clients_hmo_view_policy_corporate_mbl_abl_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_mbl_abl_label.setObjectName("clients_hmo_view_policy_corporate_mbl_abl_label")
+        self.verticalLayout_248.addWidget(self.clients_hmo_view_policy_corporate_mbl_abl_label)
+        self.clients_hmo_view_policy_corporate_mbl_abl_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_mbl_abl_line_edit.setObjectName("clients_hmo_view_policy_corporate_mbl_abl_line_edit")
+        self.verticalLayout_248.addWidget(self.clients_hmo_view_policy_corporate_mbl_abl_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_248, 1, 2, 1, 1)
+        self.verticalLayout_249 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_249.setObjectName("verticalLayout_249")
+        self.clients_hmo_view_policy_corporate_net_premium_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_net_premium_label.setObjectName("clients_hmo_view_policy_corporate_net_premium_label")
+        self.verticalLayout_249.addWidget(self.clients_hmo_view_policy_corporate_net_premium_label)
+        self.clients_hmo_view_policy_corporate_net_premium_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_net_premium_line_edit.setObjectName("clients_hmo_view_policy_corporate_net_premium_line_edit")
+        self.verticalLayout_249.addWidget(self.clients_hmo_view_policy_corporate_net_premium_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_249, 2, 2, 1, 1)
+        self.verticalLayout_250 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_250.setObjectName("verticalLayout_250")
+        self.clients_hmo_view_policy_corporate_gross_premium_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_gross_premium_label.setObjectName("clients_hmo_view_policy_corporate_gross_premium_label")
+        self.verticalLayout_250.addWidget(self.clients_hmo_view_policy_corporate_gross_premium_label)
+        self.clients_hmo_view_policy_corporate_gross_premium_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_gross_premium_line_edit.setObjectName("clients_hmo_view_policy_corporate_gross_premium_line_edit")
+        self.verticalLayout_250.addWidget(self.clients_hmo_view_policy_corporate_gross_premium_line_edit)
+        self.gridLayout_23.addLayout(self.verticalLayout_250, 3, 2, 1, 1)
+        self.verticalLayout_238.addWidget(self.clients_hmo_view_policy_corporate_upper_frame)
+        self.clients_hmo_view_policy_corporate_lower_frame = QtWidgets.QFrame(parent=self.clients_hmo_view_policy_corporate_frame)
+        self.clients_hmo_view_policy_corporate_lower_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.clients_hmo_view_policy_corporate_lower_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.clients_hmo_view_policy_corporate_lower_frame.setObjectName("clients_hmo_view_policy_corporate_lower_frame")
+        self.gridLayout_24 = QtWidgets.QGridLayout(self.clients_hmo_view_policy_corporate_lower_frame)
+        self.gridLayout_24.setObjectName("gridLayout_24")
+        self.verticalLayout_251 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_251.setObjectName("verticalLayout_251")
+        self.verticalLayout_252 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_252.setObjectName("verticalLayout_252")
+        self.clients_hmo_view_policy_corporate_commission_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_lower_frame)
+        self.clients_hmo_view_policy_corporate_commission_label.setObjectName("clients_hmo_view_policy_corporate_commission_label")
+        self.verticalLayout_252.addWidget(self.clients_hmo_view_policy_corporate_commission_label)
+        self.clients_hmo_view_policy_corporate_commission_line_edit = QtWidgets.QLineEdit(parent=self.clients_hmo_view_policy_corporate_lower_frame)
+        self.clients_hmo_view_policy_corporate_commission_line_edit.setReadOnly(False)
+        self.clients_hmo_view_policy_corporate_commission_line_edit.setObjectName("clients_hmo_view_policy_corporate_commission_line_edit")
+        self.verticalLayout_252.addWidget(self.clients_hmo_view_policy_corporate_commission_line_edit)
+        self.verticalLayout_251.addLayout(self.verticalLayout_252)
+        self.clients_hmo_view_policy_corporate_notes_label = QtWidgets.QLabel(parent=self.clients_hmo_view_policy_corporate_lower_frame)
+        self.clients_hmo_view_policy_corporate_notes_label.setObjectName("clients_hmo_view_policy_corporate_notes_label")
+        self.verticalLayout_251.addWidget(self.clients_hmo_view_policy_corporate_notes_label)
+        self.clients_hmo_view_policy_corporate_notes_text_edit = QtWidgets.QTextEdit(parent=self.clients_hmo_view_policy_corporate_lower_frame)
+        self.clients_hmo_view_policy_corporate_notes_text_edit.setObjectName("clients_hmo_view_policy_corporate_notes_text_edit")
+        self.verticalLayout_251.addWidget(self.clients_hmo_view_policy_corporate_notes_text_edit)
+        self.gridLayout_24.addLayout(self.verticalLayout_251, 1, 1, 1, 2)
+        self.verticalLayout_238.addWidget(self.clients_hmo_view_policy_corporate_lower_frame)
+        self.horizontalLayout_24 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_24.setObjectName("horizontalLayout_24")
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_24.addItem(spacerItem10)
+        self.clients_hmo_view_policy_corporate_edit_push_button = QtWidgets.QPushButton(parent=self.clients_hmo_view_policy_corporate_frame)
+        self.clients_hmo_view_policy_corporate_edit_push_button.setObjectName("clients_hmo_view_policy_corporate_edit_push_button")
+        self.horizontalLayout_24.addWidget(self.clients_hmo_view_policy_corporate_edit_push_button)
+        self.clients_hmo_view_policy_corporate_update_push_button = QtWidgets.QPushButton(parent=self.clients_hmo_view_policy_corporate_frame)
+        self.clients_hmo_view_policy_corporate_update_push_button.setObjectName("clients_hmo_view_policy_corporate_update_push_button")
+        self.horizontalLayout_24.addWidget(self.clients_hmo_view_policy_corporate_update_push_button)
+        self.verticalLayout_238.addLayout(self.horizontalLayout_24)
+        self.verticalLayout_237.addWidget(self.clients_hmo_view_policy_corporate_frame)
+        self.clients_hmo_view_policy_tab_widget.addTab(self.clients_hmo_view_policy_corporate_tab, "")
+        self.verticalLayout_69.addWidget(self.clients_hmo_view_policy_tab_widget)
+        self.verticalLayout_8.addWidget(self.clients_hmo_view_policy_frame)
+        self.clients_hmo_tab_widget.addTab(self.clients_hmo_view_policy_tab, "")
         self.verticalLayout_31.addWidget(self.clients_hmo_tab_widget)
         self.verticalLayout_9.addWidget(self.clients_hmo_frame)
         self.clients_tab_widget.addTab(self.clients_hmo_tab, "")
@@ -2068,8 +2219,8 @@ class Ui_InvestoPinoyGUI(object):
 "    color: black;\n"
 "}")
         self.companies_tab.setObjectName("companies_tab")
-        self.verticalLayout_781 = QtWidgets.QVBoxLayout(self.companies_tab)
-        self.verticalLayout_781.setObjectName("verticalLayout_781")
+        self.verticalLayout_78 = QtWidgets.QVBoxLayout(self.companies_tab)
+        self.verticalLayout_78.setObjectName("verticalLayout_78")
         self.companies_frame = QtWidgets.QFrame(parent=self.companies_tab)
         self.companies_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.companies_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
@@ -2080,14 +2231,14 @@ class Ui_InvestoPinoyGUI(object):
         self.companies_tab_widget.setObjectName("companies_tab_widget")
         self.companies_non_life_tab = QtWidgets.QWidget()
         self.companies_non_life_tab.setObjectName("companies_non_life_tab")
-        self.verticalLayout_791 = QtWidgets.QVBoxLayout(self.companies_non_life_tab)
-        self.verticalLayout_791.setObjectName("verticalLayout_791")
+        self.verticalLayout_79 = QtWidgets.QVBoxLayout(self.companies_non_life_tab)
+        self.verticalLayout_79.setObjectName("verticalLayout_79")
         self.companies_non_life_frame = QtWidgets.QFrame(parent=self.companies_non_life_tab)
         self.companies_non_life_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.companies_non_life_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
         self.companies_non_life_frame.setObjectName("companies_non_life_frame")
-        self.verticalLayout_801 = QtWidgets.QVBoxLayout(self.companies_non_life_frame)
-        self.verticalLayout_801.setObjectName("verticalLayout_801")
+        self.verticalLayout_80 = QtWidgets.QVBoxLayout(self.companies_non_life_frame)
+        self.verticalLayout_80.setObjectName("verticalLayout_80")
         self.companies_non_life_tab_widget = QtWidgets.QTabWidget(parent=self.companies_non_life_frame)
         self.companies_non_life_tab_widget.setObjectName("companies_non_life_tab_widget")
         self.companies_non_life_dashboard_tab = QtWidgets.QWidget()
@@ -2100,7 +2251,7 @@ class Ui_InvestoPinoyGUI(object):
         self.companies_non_life_dashboard_frame.setObjectName("companies_non_life_dashboard_frame")
         self.verticalLayout_821 = QtWidgets.QVBoxLayout(self.companies_non_life_dashboard_frame)
         self.verticalLayout_821.setObjectName("verticalLayout_821")
-        self.companies_non_life_dashboard_table = QtWidgets.QTableWidget(parent=self.companies_non_life_dashboard_frame)
+        self.companies_non_life_dashboard_table = QtWidgets.QTableView(parent=self.companies_non_life_dashboard_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -2272,36 +2423,7 @@ class Ui_InvestoPinoyGUI(object):
         self.companies_non_life_dashboard_table.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
         self.companies_non_life_dashboard_table.setAutoScroll(False)
         self.companies_non_life_dashboard_table.setAutoScrollMargin(16)
-        self.companies_non_life_dashboard_table.setRowCount(2)
-        self.companies_non_life_dashboard_table.setColumnCount(4)
         self.companies_non_life_dashboard_table.setObjectName("companies_non_life_dashboard_table")
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setKerning(True)
-        item.setFont(font)
-        self.companies_non_life_dashboard_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(0, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(1, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(1, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(1, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_non_life_dashboard_table.setItem(1, 3, item)
         self.companies_non_life_dashboard_table.horizontalHeader().setCascadingSectionResizes(False)
         self.companies_non_life_dashboard_table.horizontalHeader().setDefaultSectionSize(89)
         self.companies_non_life_dashboard_table.horizontalHeader().setMinimumSectionSize(50)
@@ -2334,8 +2456,8 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_821.addLayout(self.companies_non_life_dashboard_container)
         self.verticalLayout_811.addWidget(self.companies_non_life_dashboard_frame)
         self.companies_non_life_tab_widget.addTab(self.companies_non_life_dashboard_tab, "")
-        self.verticalLayout_801.addWidget(self.companies_non_life_tab_widget)
-        self.verticalLayout_791.addWidget(self.companies_non_life_frame)
+        self.verticalLayout_80.addWidget(self.companies_non_life_tab_widget)
+        self.verticalLayout_79.addWidget(self.companies_non_life_frame)
         self.companies_tab_widget.addTab(self.companies_non_life_tab, "")
         self.companies_hmo_tab = QtWidgets.QWidget()
         self.companies_hmo_tab.setObjectName("companies_hmo_tab")
@@ -2357,9 +2479,9 @@ class Ui_InvestoPinoyGUI(object):
         self.companies_hmo_dashboard_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.companies_hmo_dashboard_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
         self.companies_hmo_dashboard_frame.setObjectName("companies_hmo_dashboard_frame")
-        self.verticalLayout_831 = QtWidgets.QVBoxLayout(self.companies_hmo_dashboard_frame)
-        self.verticalLayout_831.setObjectName("verticalLayout_831")
-        self.companies_hmo_dashboard_table = QtWidgets.QTableWidget(parent=self.companies_hmo_dashboard_frame)
+        self.verticalLayout_83 = QtWidgets.QVBoxLayout(self.companies_hmo_dashboard_frame)
+        self.verticalLayout_83.setObjectName("verticalLayout_83")
+        self.companies_hmo_dashboard_table = QtWidgets.QTableView(parent=self.companies_hmo_dashboard_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -2531,42 +2653,13 @@ class Ui_InvestoPinoyGUI(object):
         self.companies_hmo_dashboard_table.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
         self.companies_hmo_dashboard_table.setAutoScroll(False)
         self.companies_hmo_dashboard_table.setAutoScrollMargin(16)
-        self.companies_hmo_dashboard_table.setRowCount(2)
-        self.companies_hmo_dashboard_table.setColumnCount(4)
         self.companies_hmo_dashboard_table.setObjectName("companies_hmo_dashboard_table")
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setKerning(True)
-        item.setFont(font)
-        self.companies_hmo_dashboard_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(0, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(1, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(1, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(1, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.companies_hmo_dashboard_table.setItem(1, 3, item)
         self.companies_hmo_dashboard_table.horizontalHeader().setCascadingSectionResizes(False)
         self.companies_hmo_dashboard_table.horizontalHeader().setDefaultSectionSize(89)
         self.companies_hmo_dashboard_table.horizontalHeader().setMinimumSectionSize(50)
         self.companies_hmo_dashboard_table.horizontalHeader().setSortIndicatorShown(True)
         self.companies_hmo_dashboard_table.horizontalHeader().setStretchLastSection(False)
-        self.verticalLayout_831.addWidget(self.companies_hmo_dashboard_table)
+        self.verticalLayout_83.addWidget(self.companies_hmo_dashboard_table)
         self.companies_hmo_dashboard_container = QtWidgets.QFormLayout()
         self.companies_hmo_dashboard_container.setRowWrapPolicy(QtWidgets.QFormLayout.RowWrapPolicy.DontWrapRows)
         self.companies_hmo_dashboard_container.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -2590,14 +2683,14 @@ class Ui_InvestoPinoyGUI(object):
         self.companies_hmo_dashboard_count.setWordWrap(False)
         self.companies_hmo_dashboard_count.setObjectName("companies_hmo_dashboard_count")
         self.companies_hmo_dashboard_container.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.companies_hmo_dashboard_count)
-        self.verticalLayout_831.addLayout(self.companies_hmo_dashboard_container)
+        self.verticalLayout_83.addLayout(self.companies_hmo_dashboard_container)
         self.verticalLayout_103.addWidget(self.companies_hmo_dashboard_frame)
         self.companies_hmo_tab_widget.addTab(self.companies_hmo_dashboard_tab, "")
         self.verticalLayout_102.addWidget(self.companies_hmo_tab_widget)
         self.verticalLayout_101.addWidget(self.companies_hmo_frame)
         self.companies_tab_widget.addTab(self.companies_hmo_tab, "")
         self.verticalLayout_107.addWidget(self.companies_tab_widget)
-        self.verticalLayout_781.addWidget(self.companies_frame)
+        self.verticalLayout_78.addWidget(self.companies_frame)
         self.current_active_tab.addWidget(self.companies_tab)
         self.collection_tab = QtWidgets.QWidget()
         self.collection_tab.setStyleSheet("#collection_frame{\n"
@@ -2977,7 +3070,7 @@ class Ui_InvestoPinoyGUI(object):
         self.client_payments_frame.setObjectName("client_payments_frame")
         self.verticalLayout_25 = QtWidgets.QVBoxLayout(self.client_payments_frame)
         self.verticalLayout_25.setObjectName("verticalLayout_25")
-        self.client_payments_table = QtWidgets.QTableWidget(parent=self.client_payments_frame)
+        self.client_payments_table = QtWidgets.QTableView(parent=self.client_payments_frame)
         palette = QtGui.QPalette()
         brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
         brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
@@ -3143,42 +3236,7 @@ class Ui_InvestoPinoyGUI(object):
         self.client_payments_table.setMidLineWidth(0)
         self.client_payments_table.setAutoScroll(False)
         self.client_payments_table.setAutoScrollMargin(16)
-        self.client_payments_table.setColumnCount(7)
         self.client_payments_table.setObjectName("client_payments_table")
-        self.client_payments_table.setRowCount(2)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setKerning(True)
-        item.setFont(font)
-        self.client_payments_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setHorizontalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(0, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(0, 6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(1, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(1, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(1, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.client_payments_table.setItem(1, 6, item)
         self.client_payments_table.horizontalHeader().setCascadingSectionResizes(False)
         self.client_payments_table.horizontalHeader().setDefaultSectionSize(89)
         self.client_payments_table.horizontalHeader().setMinimumSectionSize(50)
@@ -3221,47 +3279,23 @@ class Ui_InvestoPinoyGUI(object):
         self.company_expenses_frame.setObjectName("company_expenses_frame")
         self.verticalLayout_27 = QtWidgets.QVBoxLayout(self.company_expenses_frame)
         self.verticalLayout_27.setObjectName("verticalLayout_27")
-        self.company_expenses_table = QtWidgets.QTableWidget(parent=self.company_expenses_frame)
+        self.company_expenses_table = QtWidgets.QTableView(parent=self.company_expenses_frame)
         self.company_expenses_table.setStyleSheet("#company_expenses_table {\n"
 "    color: black;\n"
 "}")
         self.company_expenses_table.setObjectName("company_expenses_table")
-        self.company_expenses_table.setColumnCount(5)
-        self.company_expenses_table.setRowCount(2)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(0, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(0, 4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(1, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(1, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(1, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(1, 3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.company_expenses_table.setItem(1, 4, item)
         self.company_expenses_table.horizontalHeader().setDefaultSectionSize(92)
         self.company_expenses_table.horizontalHeader().setSortIndicatorShown(True)
         self.company_expenses_table.horizontalHeader().setStretchLastSection(False)
         self.verticalLayout_27.addWidget(self.company_expenses_table)
+        self.company_expenses_button_container = QtWidgets.QHBoxLayout()
+        self.company_expenses_button_container.setObjectName("company_expenses_button_container")
+        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.company_expenses_button_container.addItem(spacerItem11)
+        self.company_expenses_add_expense_push_button = QtWidgets.QPushButton(parent=self.company_expenses_frame)
+        self.company_expenses_add_expense_push_button.setObjectName("company_expenses_add_expense_push_button")
+        self.company_expenses_button_container.addWidget(self.company_expenses_add_expense_push_button)
+        self.verticalLayout_27.addLayout(self.company_expenses_button_container)
         self.company_expenses_container = QtWidgets.QFormLayout()
         self.company_expenses_container.setRowWrapPolicy(QtWidgets.QFormLayout.RowWrapPolicy.DontWrapRows)
         self.company_expenses_container.setLabelAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -3569,7 +3603,7 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_search_layout.setObjectName("archives_search_layout")
         self.archives_search_icon = QtWidgets.QLabel(parent=self.archives_search_container)
         self.archives_search_icon.setText("")
-        self.archives_search_icon.setPixmap(QtGui.QPixmap("QtGUI\\asset/search_icon.png"))
+        self.archives_search_icon.setPixmap(QtGui.QPixmap("QtGUI/asset/search_icon.png"))
         self.archives_search_icon.setObjectName("archives_search_icon")
         self.archives_search_layout.addWidget(self.archives_search_icon)
         self.archives_search_edit = QtWidgets.QLineEdit(parent=self.archives_search_container)
@@ -3585,10 +3619,10 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_search_edit.setObjectName("archives_search_edit")
         self.archives_search_layout.addWidget(self.archives_search_edit)
         self.archives_header_layout.addWidget(self.archives_search_container)
-        spacerItem10 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.archives_header_layout.addItem(spacerItem10)
+        spacerItem12 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.archives_header_layout.addItem(spacerItem12)
         self.verticalLayout_59.addWidget(self.archives_header_container)
-        self.archives_non_life_dashboard_table = QtWidgets.QTableWidget(parent=self.archives_non_life_dashboard_frame)
+        self.archives_non_life_dashboard_table = QtWidgets.QTableView(parent=self.archives_non_life_dashboard_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -3760,28 +3794,7 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_non_life_dashboard_table.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
         self.archives_non_life_dashboard_table.setAutoScroll(False)
         self.archives_non_life_dashboard_table.setAutoScrollMargin(16)
-        self.archives_non_life_dashboard_table.setRowCount(1)
-        self.archives_non_life_dashboard_table.setColumnCount(4)
         self.archives_non_life_dashboard_table.setObjectName("archives_non_life_dashboard_table")
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setKerning(True)
-        item.setFont(font)
-        self.archives_non_life_dashboard_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_non_life_dashboard_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_non_life_dashboard_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_non_life_dashboard_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_non_life_dashboard_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_non_life_dashboard_table.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_non_life_dashboard_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_non_life_dashboard_table.setItem(0, 3, item)
         self.archives_non_life_dashboard_table.horizontalHeader().setCascadingSectionResizes(False)
         self.archives_non_life_dashboard_table.horizontalHeader().setDefaultSectionSize(89)
         self.archives_non_life_dashboard_table.horizontalHeader().setMinimumSectionSize(50)
@@ -3793,8 +3806,8 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_non_life_dashboard_restore_button = QtWidgets.QPushButton(parent=self.archives_non_life_dashboard_frame)
         self.archives_non_life_dashboard_restore_button.setObjectName("archives_non_life_dashboard_restore_button")
         self.archives_non_life_dashboard_button_container.addWidget(self.archives_non_life_dashboard_restore_button)
-        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.archives_non_life_dashboard_button_container.addItem(spacerItem11)
+        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.archives_non_life_dashboard_button_container.addItem(spacerItem13)
         self.archives_non_life_dashboard_delete_button = QtWidgets.QPushButton(parent=self.archives_non_life_dashboard_frame)
         self.archives_non_life_dashboard_delete_button.setObjectName("archives_non_life_dashboard_delete_button")
         self.archives_non_life_dashboard_button_container.addWidget(self.archives_non_life_dashboard_delete_button)
@@ -3887,7 +3900,7 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_hmo_search_layout.setObjectName("archives_hmo_search_layout")
         self.archives_hmo_search_icon = QtWidgets.QLabel(parent=self.archives_hmo_search_container)
         self.archives_hmo_search_icon.setText("")
-        self.archives_hmo_search_icon.setPixmap(QtGui.QPixmap("QtGUI\\asset/search_icon.png"))
+        self.archives_hmo_search_icon.setPixmap(QtGui.QPixmap("QtGUI/asset/search_icon.png"))
         self.archives_hmo_search_icon.setObjectName("archives_hmo_search_icon")
         self.archives_hmo_search_layout.addWidget(self.archives_hmo_search_icon)
         self.archives_hmo_search_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_search_container)
@@ -3903,10 +3916,10 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_hmo_search_edit.setObjectName("archives_hmo_search_edit")
         self.archives_hmo_search_layout.addWidget(self.archives_hmo_search_edit)
         self.archives_hmo_header_layout.addWidget(self.archives_hmo_search_container)
-        spacerItem12 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.archives_hmo_header_layout.addItem(spacerItem12)
+        spacerItem14 = QtWidgets.QSpacerItem(434, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.archives_hmo_header_layout.addItem(spacerItem14)
         self.verticalLayout_126.addWidget(self.archives_hmo_header_container)
-        self.archives_hmo_dashboard_table = QtWidgets.QTableWidget(parent=self.archives_hmo_dashboard_frame)
+        self.archives_hmo_dashboard_table = QtWidgets.QTableView(parent=self.archives_hmo_dashboard_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -4078,28 +4091,7 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_hmo_dashboard_table.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContents)
         self.archives_hmo_dashboard_table.setAutoScroll(False)
         self.archives_hmo_dashboard_table.setAutoScrollMargin(16)
-        self.archives_hmo_dashboard_table.setRowCount(1)
-        self.archives_hmo_dashboard_table.setColumnCount(4)
         self.archives_hmo_dashboard_table.setObjectName("archives_hmo_dashboard_table")
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setKerning(True)
-        item.setFont(font)
-        self.archives_hmo_dashboard_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_hmo_dashboard_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_hmo_dashboard_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_hmo_dashboard_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_hmo_dashboard_table.setItem(0, 0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_hmo_dashboard_table.setItem(0, 1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_hmo_dashboard_table.setItem(0, 2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.archives_hmo_dashboard_table.setItem(0, 3, item)
         self.archives_hmo_dashboard_table.horizontalHeader().setCascadingSectionResizes(False)
         self.archives_hmo_dashboard_table.horizontalHeader().setDefaultSectionSize(89)
         self.archives_hmo_dashboard_table.horizontalHeader().setMinimumSectionSize(50)
@@ -4111,8 +4103,8 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_hmo_dashboard_restore_button = QtWidgets.QPushButton(parent=self.archives_hmo_dashboard_frame)
         self.archives_hmo_dashboard_restore_button.setObjectName("archives_hmo_dashboard_restore_button")
         self.archives_hmo_dashboard_button_container.addWidget(self.archives_hmo_dashboard_restore_button)
-        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.archives_hmo_dashboard_button_container.addItem(spacerItem13)
+        spacerItem15 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.archives_hmo_dashboard_button_container.addItem(spacerItem15)
         self.archives_hmo_dashboard_delete_button = QtWidgets.QPushButton(parent=self.archives_hmo_dashboard_frame)
         self.archives_hmo_dashboard_delete_button.setObjectName("archives_hmo_dashboard_delete_button")
         self.archives_hmo_dashboard_button_container.addWidget(self.archives_hmo_dashboard_delete_button)
@@ -4149,6 +4141,310 @@ class Ui_InvestoPinoyGUI(object):
         self.verticalLayout_2.addWidget(self.archives_tab_widget)
         self.verticalLayout_17.addWidget(self.archives_frame)
         self.current_active_tab.addWidget(self.archives_tab)
+        self.account_tab = QtWidgets.QWidget()
+        self.account_tab.setObjectName("account_tab")
+        self.verticalLayout_28 = QtWidgets.QVBoxLayout(self.account_tab)
+        self.verticalLayout_28.setObjectName("verticalLayout_28")
+        self.account_frame = QtWidgets.QFrame(parent=self.account_tab)
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+        self.account_frame.setPalette(palette)
+        self.account_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.account_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.account_frame.setObjectName("account_frame")
+        self.archives_frame_2 = QtWidgets.QFrame(parent=self.account_frame)
+        self.archives_frame_2.setGeometry(QtCore.QRect(20, 30, 1091, 541))
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(149, 148, 155))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 127))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Accent, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(149, 148, 155))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 127))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Accent, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(149, 148, 155))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116, 127))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Accent, brush)
+        self.archives_frame_2.setPalette(palette)
+        self.archives_frame_2.setStyleSheet("")
+        self.archives_frame_2.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.archives_frame_2.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.archives_frame_2.setObjectName("archives_frame_2")
+        self.verticalLayout_20 = QtWidgets.QVBoxLayout(self.archives_frame_2)
+        self.verticalLayout_20.setObjectName("verticalLayout_20")
+        self.archives_hmo_dashboard_frame_2 = QtWidgets.QFrame(parent=self.archives_frame_2)
+        self.archives_hmo_dashboard_frame_2.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.archives_hmo_dashboard_frame_2.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.archives_hmo_dashboard_frame_2.setObjectName("archives_hmo_dashboard_frame_2")
+        self.verticalLayout_130 = QtWidgets.QVBoxLayout(self.archives_hmo_dashboard_frame_2)
+        self.verticalLayout_130.setObjectName("verticalLayout_130")
+        self.verticalLayout_49 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_49.setObjectName("verticalLayout_49")
+        self.label_2 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        font = QtGui.QFont()
+        font.setPointSize(20)
+        font.setBold(True)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_49.addWidget(self.label_2)
+        self.verticalLayout_130.addLayout(self.verticalLayout_49)
+        self.account_formLayout = QtWidgets.QFormLayout()
+        self.account_formLayout.setObjectName("account_formLayout")
+        self.label_3 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_3.setObjectName("label_3")
+        self.account_formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_3)
+        self.label_4 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_4.setObjectName("label_4")
+        self.account_formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_4)
+        self.label_5 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_5.setObjectName("label_5")
+        self.account_formLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_5)
+        self.label_6 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_6.setObjectName("label_6")
+        self.account_formLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_6)
+        self.label_7 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_7.setObjectName("label_7")
+        self.account_formLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_7)
+        self.account_full_name_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_full_name_line_edit.setObjectName("account_full_name_line_edit")
+        self.account_formLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_full_name_line_edit)
+        self.account_username_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_username_line_edit.setReadOnly(True)
+        self.account_username_line_edit.setObjectName("account_username_line_edit")
+        self.account_formLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_username_line_edit)
+        self.account_agent_number_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_agent_number_line_edit.setObjectName("account_agent_number_line_edit")
+        self.account_formLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_agent_number_line_edit)
+        self.account_email_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_email_line_edit.setObjectName("account_email_line_edit")
+        self.account_formLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_email_line_edit)
+        self.account_contact_number_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_contact_number_line_edit.setObjectName("account_contact_number_line_edit")
+        self.account_formLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_contact_number_line_edit)
+        self.verticalLayout_130.addLayout(self.account_formLayout)
+        self.archives_hmo_dashboard_button_container_2 = QtWidgets.QHBoxLayout()
+        self.archives_hmo_dashboard_button_container_2.setObjectName("archives_hmo_dashboard_button_container_2")
+        self.account_edit_button = QtWidgets.QPushButton(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_edit_button.setObjectName("account_edit_button")
+        self.archives_hmo_dashboard_button_container_2.addWidget(self.account_edit_button)
+        self.account_save_button = QtWidgets.QPushButton(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_save_button.setEnabled(False)
+        self.account_save_button.setObjectName("account_save_button")
+        self.archives_hmo_dashboard_button_container_2.addWidget(self.account_save_button)
+        spacerItem16 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.archives_hmo_dashboard_button_container_2.addItem(spacerItem16)
+        self.verticalLayout_130.addLayout(self.archives_hmo_dashboard_button_container_2)
+        self.label_8 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.verticalLayout_130.addWidget(self.label_8)
+        self.account_formLayout_2 = QtWidgets.QFormLayout()
+        self.account_formLayout_2.setObjectName("account_formLayout_2")
+        self.label_9 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_9.setObjectName("label_9")
+        self.account_formLayout_2.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_9)
+        self.account_old_password_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_old_password_line_edit.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.account_old_password_line_edit.setObjectName("account_old_password_line_edit")
+        self.account_formLayout_2.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_old_password_line_edit)
+        self.label_10 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_10.setObjectName("label_10")
+        self.account_formLayout_2.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_10)
+        self.account_new_password_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_new_password_line_edit.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.account_new_password_line_edit.setObjectName("account_new_password_line_edit")
+        self.account_formLayout_2.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_new_password_line_edit)
+        self.label_11 = QtWidgets.QLabel(parent=self.archives_hmo_dashboard_frame_2)
+        self.label_11.setObjectName("label_11")
+        self.account_formLayout_2.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_11)
+        self.account_confirm_password_line_edit = QtWidgets.QLineEdit(parent=self.archives_hmo_dashboard_frame_2)
+        self.account_confirm_password_line_edit.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.account_confirm_password_line_edit.setObjectName("account_confirm_password_line_edit")
+        self.account_formLayout_2.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.account_confirm_password_line_edit)
+        self.verticalLayout_130.addLayout(self.account_formLayout_2)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.change_password_button = QtWidgets.QPushButton(parent=self.archives_hmo_dashboard_frame_2)
+        self.change_password_button.setObjectName("change_password_button")
+        self.horizontalLayout_3.addWidget(self.change_password_button)
+        spacerItem17 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem17)
+        self.verticalLayout_130.addLayout(self.horizontalLayout_3)
+        self.verticalLayout_20.addWidget(self.archives_hmo_dashboard_frame_2)
+        self.verticalLayout_28.addWidget(self.account_frame)
+        self.current_active_tab.addWidget(self.account_tab)
         self.horizontalLayout.addWidget(self.current_active_tab)
 
         self.retranslateUi(InvestoPinoyGUI)
@@ -4157,6 +4453,7 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_non_life_tab_widget.setCurrentIndex(0)
         self.clients_hmo_tab_widget.setCurrentIndex(0)
         self.clients_hmo_add_client_tab_widget.setCurrentIndex(0)
+        self.clients_hmo_view_policy_tab_widget.setCurrentIndex(0)
         self.companies_tab_widget.setCurrentIndex(0)
         self.companies_non_life_tab_widget.setCurrentIndex(0)
         self.companies_hmo_tab_widget.setCurrentIndex(0)
@@ -4177,36 +4474,12 @@ class Ui_InvestoPinoyGUI(object):
         self.navigation_archives_button.setText(_translate("InvestoPinoyGUI", "Archives"))
         self.navigation_account_button.setText(_translate("InvestoPinoyGUI", "Account"))
         self.navigation_logout_button.setText(_translate("InvestoPinoyGUI", "Log out"))
-        self.search_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Search"))
-        self.user_button.setText(_translate("InvestoPinoyGUI", "John Doe"))
-        self.home_welcome.setText(_translate("InvestoPinoyGUI", "Welcome to InvestoPinoy"))
-        self.home_info.setText(_translate("InvestoPinoyGUI", "Are you ready to eliminate inefficiencies and take your insurance operations to the next level?"))
-        self.popup_label.setText(_translate("InvestoPinoyGUI", "Popup Notification"))
-        self.recent_act_label.setText(_translate("InvestoPinoyGUI", "Recent Activity"))
-        self.activity_label_4.setText(_translate("InvestoPinoyGUI", "A new insurance request has arrived."))
-        self.activity_label_2.setText(_translate("InvestoPinoyGUI", "A new insurance request has arrived."))
-        self.activity_label_3.setText(_translate("InvestoPinoyGUI", "A new insurance request has arrived."))
-        self.activity_label.setText(_translate("InvestoPinoyGUI", "A new insurance request has arrived."))
+        self.notifications_label.setText(_translate("InvestoPinoyGUI", "Notifications"))
         self.clients_search_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Search Clients"))
-        item = self.clients_non_life_dashboard_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Assured Name"))
-        item = self.clients_non_life_dashboard_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Type of Insurance"))
-        item = self.clients_non_life_dashboard_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Policy Number"))
-        item = self.clients_non_life_dashboard_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
-        __sortingEnabled = self.clients_non_life_dashboard_table.isSortingEnabled()
-        self.clients_non_life_dashboard_table.setSortingEnabled(False)
-        item = self.clients_non_life_dashboard_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Philip Dunphy"))
-        item = self.clients_non_life_dashboard_table.item(0, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Motor"))
-        item = self.clients_non_life_dashboard_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "MO-0011223344"))
-        item = self.clients_non_life_dashboard_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "02/14/26"))
-        self.clients_non_life_dashboard_table.setSortingEnabled(__sortingEnabled)
+        self.clients_non_life_dashboard_record_payment_button.setText(_translate("InvestoPinoyGUI", "Record Payment"))
+        self.export_clients_nonlife_csv_button.setText(_translate("InvestoPinoyGUI", "Export as CSV"))
+        self.export_clients_nonlife_xls_button.setText(_translate("InvestoPinoyGUI", "Export as Excel"))
+        self.export_clients_nonlife_pdf_button.setText(_translate("InvestoPinoyGUI", "Export as PDF"))
         self.clients_non_life_dashboard_archive_button.setText(_translate("InvestoPinoyGUI", "Archive"))
         self.clients_non_life_dashboard_count.setText(_translate("InvestoPinoyGUI", "0"))
         self.clients_non_life_dashboard_label.setText(_translate("InvestoPinoyGUI", "Results"))
@@ -4247,27 +4520,49 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_non_life_add_client_notes_text_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Add Notes"))
         self.clients_non_life_add_client_submit_push_button.setText(_translate("InvestoPinoyGUI", "Submit"))
         self.clients_non_life_tab_widget.setTabText(self.clients_non_life_tab_widget.indexOf(self.clients_non_life_add_client_tab), _translate("InvestoPinoyGUI", "Add Policy"))
+        self.clients_non_life_view_policy_contact_number_label.setText(_translate("InvestoPinoyGUI", "Contact Number"))
+        self.clients_non_life_view_policy_contact_number_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Contact Number"))
+        self.clients_non_life_view_policy_assured_name_label.setText(_translate("InvestoPinoyGUI", "Assured Name"))
+        self.clients_non_life_view_policy_assured_name_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Assured Name"))
+        self.clients_non_life_view_policy_email_label.setText(_translate("InvestoPinoyGUI", "Email"))
+        self.clients_non_life_view_policy_email_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Email Address"))
+        self.clients_non_life_view_policy_birthday_label.setText(_translate("InvestoPinoyGUI", "Birthday"))
+        self.clients_non_life_view_policy_birthday_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_non_life_view_policy_inception_date_label.setText(_translate("InvestoPinoyGUI", "Inception Date"))
+        self.clients_non_life_view_policy_inception_date_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_non_life_view_policy_expiry_date_label.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
+        self.clients_non_life_view_policy_expiry_date_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_non_life_view_policy_net_premium_label.setText(_translate("InvestoPinoyGUI", "Net Premium"))
+        self.clients_non_life_view_policy_net_premium_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Net Premium"))
+        self.clients_non_life_view_policy_gross_premium_label.setText(_translate("InvestoPinoyGUI", "Gross Premium"))
+        self.clients_non_life_view_policy_gross_premium_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Gross Premium"))
+        self.clients_non_life_view_policy_policy_number_label.setText(_translate("InvestoPinoyGUI", "Policy Number"))
+        self.clients_non_life_view_policy_policy_number_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Policy Number"))
+        self.clients_non_life_view_policy_agent_code_label.setText(_translate("InvestoPinoyGUI", "Agent Code"))
+        self.clients_non_life_view_policy_agent_code_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Agent Code"))
+        self.clients_non_life_view_policy_payment_invoice_label.setText(_translate("InvestoPinoyGUI", "Payment Invoice"))
+        self.clients_non_life_view_policy_payment_invoice_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Payment Invoice"))
+        self.clients_non_life_view_policy_commission_label.setText(_translate("InvestoPinoyGUI", "Commission"))
+        self.clients_non_life_view_policy_commission_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Commission"))
+        self.clients_non_life_view_policy_insurance_type_label.setText(_translate("InvestoPinoyGUI", "Type of Insurance"))
+        self.clients_non_life_view_policy_insurance_type_combo_box.setPlaceholderText(_translate("InvestoPinoyGUI", "Select Insurance Type"))
+        self.clients_non_life_view_policy_insurance_type_combo_box.setItemText(0, _translate("InvestoPinoyGUI", "Motor"))
+        self.clients_non_life_view_policy_insurance_type_combo_box.setItemText(1, _translate("InvestoPinoyGUI", "Fire"))
+        self.clients_non_life_view_policy_insurance_company_label.setText(_translate("InvestoPinoyGUI", "Insurance Company"))
+        self.clients_non_life_view_policy_insurance_company_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Select Insurance Company"))
+        self.clients_non_life_view_policy_amount_covered_label.setText(_translate("InvestoPinoyGUI", "Amount Covered"))
+        self.clients_non_life_view_policy_amount_covered_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Amount Covered"))
+        self.clients_non_life_view_policy_notes_label.setText(_translate("InvestoPinoyGUI", "Client"))
+        self.clients_non_life_view_policy_notes_text_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Add Notes"))
+        self.clients_non_life_view_policy_edit_push_button.setText(_translate("InvestoPinoyGUI", "Edit"))
+        self.clients_non_life_view_policy_update_push_button.setText(_translate("InvestoPinoyGUI", "Update"))
+        self.clients_non_life_tab_widget.setTabText(self.clients_non_life_tab_widget.indexOf(self.clients_non_life_view_policy_tab), _translate("InvestoPinoyGUI", "View Policy"))
         self.clients_tab_widget.setTabText(self.clients_tab_widget.indexOf(self.clients_non_life_tab), _translate("InvestoPinoyGUI", "Non-Life Clients"))
         self.clients_hmo_search_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Search HMO Clients"))
-        item = self.clients_hmo_dashboard_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Assured Name"))
-        item = self.clients_hmo_dashboard_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Type of HMO"))
-        item = self.clients_hmo_dashboard_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Policy Number"))
-        item = self.clients_hmo_dashboard_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
-        __sortingEnabled = self.clients_hmo_dashboard_table.isSortingEnabled()
-        self.clients_hmo_dashboard_table.setSortingEnabled(False)
-        item = self.clients_hmo_dashboard_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Philip Dunphy"))
-        item = self.clients_hmo_dashboard_table.item(0, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Individual"))
-        item = self.clients_hmo_dashboard_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "MO-0011223344"))
-        item = self.clients_hmo_dashboard_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "02/14/26"))
-        self.clients_hmo_dashboard_table.setSortingEnabled(__sortingEnabled)
+        self.clients_hmo_dashboard_record_payment_button.setText(_translate("InvestoPinoyGUI", "Record Payment"))
+        self.export_clients_hmo_individual_csv_button.setText(_translate("InvestoPinoyGUI", "Export as CSV"))
+        self.export_clients_hmo_individual_xls_button.setText(_translate("InvestoPinoyGUI", "Export as Excel"))
+        self.export_clients_hmo_individual_pdf_button.setText(_translate("InvestoPinoyGUI", "Export as PDF"))
         self.clients_hmo_dashboard_archive_button.setText(_translate("InvestoPinoyGUI", "Archive"))
         self.clients_hmo_dashboard_count.setText(_translate("InvestoPinoyGUI", "0"))
         self.clients_hmo_dashboard_label.setText(_translate("InvestoPinoyGUI", "Results"))
@@ -4333,161 +4628,86 @@ class Ui_InvestoPinoyGUI(object):
         self.clients_hmo_add_client_corporate_submit_push_button.setText(_translate("InvestoPinoyGUI", "Submit"))
         self.clients_hmo_add_client_tab_widget.setTabText(self.clients_hmo_add_client_tab_widget.indexOf(self.clients_hmo_add_client_corporate_tab), _translate("InvestoPinoyGUI", "Corporate"))
         self.clients_hmo_tab_widget.setTabText(self.clients_hmo_tab_widget.indexOf(self.clients_hmo_add_client_tab), _translate("InvestoPinoyGUI", "Add Policy"))
+        self.clients_hmo_view_policy_individual_gross_premium_label.setText(_translate("InvestoPinoyGUI", "Gross Premium"))
+        self.clients_hmo_view_policy_individual_gross_premium_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Gross Premium"))
+        self.clients_hmo_view_policy_individual_assured_name_label.setText(_translate("InvestoPinoyGUI", "Assured Name"))
+        self.clients_hmo_view_policy_individual_assured_name_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Assured Name"))
+        self.clients_hmo_view_policy_individual_policy_number_label.setText(_translate("InvestoPinoyGUI", "Policy Number"))
+        self.clients_hmo_view_policy_individual_policy_number_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Policy Number"))
+        self.clients_hmo_view_policy_individual_net_premium_label.setText(_translate("InvestoPinoyGUI", "Net Premium"))
+        self.clients_hmo_view_policy_individual_net_premium_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Net Premium"))
+        self.clients_hmo_view_policy_individual_mbl_abl_label.setText(_translate("InvestoPinoyGUI", "MBL/ABL"))
+        self.clients_hmo_view_policy_individual_mbl_abl_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter MBL/ABL"))
+        self.clients_hmo_view_policy_individual_contact_number_label.setText(_translate("InvestoPinoyGUI", "Contact Number"))
+        self.clients_hmo_view_policy_individual_contact_number_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Contact Number"))
+        self.clients_hmo_view_policy_individual_email_label.setText(_translate("InvestoPinoyGUI", "Email"))
+        self.clients_hmo_view_policy_individual_email_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Email Address"))
+        self.clients_hmo_view_policy_individual_birthday_label.setText(_translate("InvestoPinoyGUI", "Birthday"))
+        self.clients_hmo_view_policy_individual_birthday_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_hmo_view_policy_individual_expiry_date_label.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
+        self.clients_hmo_view_policy_individual_expiry_date_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_hmo_view_policy_individual_agent_code_label.setText(_translate("InvestoPinoyGUI", "Agent Code"))
+        self.clients_hmo_view_policy_individual_agent_code_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Agent Code"))
+        self.clients_hmo_view_policy_individual_inception_date_label.setText(_translate("InvestoPinoyGUI", "Inception Date"))
+        self.clients_hmo_view_policy_individual_inception_date_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_hmo_view_policy_individual_hmo_company_label.setText(_translate("InvestoPinoyGUI", "HMO Company"))
+        self.clients_hmo_view_policy_individual_hmo_company_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter HMO Company"))
+        self.clients_hmo_view_policy_individual_commission_label.setText(_translate("InvestoPinoyGUI", "Commission"))
+        self.clients_hmo_view_policy_individual_commission_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Commission"))
+        self.clients_hmo_view_policy_individual_notes_label.setText(_translate("InvestoPinoyGUI", "Client"))
+        self.clients_hmo_view_policy_individual_notes_text_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Add Notes"))
+        self.clients_hmo_view_policy_individual_edit_push_button.setText(_translate("InvestoPinoyGUI", "Edit"))
+        self.clients_hmo_view_policy_individual_update_push_button.setText(_translate("InvestoPinoyGUI", "Update"))
+        self.clients_hmo_view_policy_tab_widget.setTabText(self.clients_hmo_view_policy_tab_widget.indexOf(self.clients_hmo_view_policy_individual_tab), _translate("InvestoPinoyGUI", "Individual"))
+        self.clients_hmo_view_policy_corporate_hmo_company_label.setText(_translate("InvestoPinoyGUI", "HMO Company"))
+        self.clients_hmo_view_policy_corporate_hmo_company_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter HMO Company"))
+        self.clients_hmo_view_policy_corporate_policy_number_label.setText(_translate("InvestoPinoyGUI", "Policy Number"))
+        self.clients_hmo_view_policy_corporate_policy_number_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Policy Number"))
+        self.clients_hmo_view_policy_corporate_company_name_label.setText(_translate("InvestoPinoyGUI", "Company Name"))
+        self.clients_hmo_view_policy_corporate_company_name_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Company Name"))
+        self.clients_hmo_view_policy_corporate_email_label.setText(_translate("InvestoPinoyGUI", "Email"))
+        self.clients_hmo_view_policy_corporate_email_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Email Address"))
+        self.clients_hmo_view_policy_corporate_contact_number_label.setText(_translate("InvestoPinoyGUI", "Contact Number"))
+        self.clients_hmo_view_policy_corporate_contact_number_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Contact Number"))
+        self.clients_hmo_view_policy_corporate_number_of_enrollees_label.setText(_translate("InvestoPinoyGUI", "Number of Enrollees"))
+        self.clients_hmo_view_policy_corporate_number_of_enrollees_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Number of Enrollees"))
+        self.clients_hmo_view_policy_corporate_inception_date_label.setText(_translate("InvestoPinoyGUI", "Inception Date"))
+        self.clients_hmo_view_policy_corporate_inception_date_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_hmo_view_policy_corporate_expiry_date_label.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
+        self.clients_hmo_view_policy_corporate_expiry_date_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "YYYY/MM/DD"))
+        self.clients_hmo_view_policy_corporate_agent_code_label.setText(_translate("InvestoPinoyGUI", "Agent Code"))
+        self.clients_hmo_view_policy_corporate_agent_code_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Agent Code"))
+        self.clients_hmo_view_policy_corporate_mbl_abl_label.setText(_translate("InvestoPinoyGUI", "MBL/ABL"))
+        self.clients_hmo_view_policy_corporate_mbl_abl_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter MBL/ABL"))
+        self.clients_hmo_view_policy_corporate_net_premium_label.setText(_translate("InvestoPinoyGUI", "Net Premium"))
+        self.clients_hmo_view_policy_corporate_net_premium_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Net Premium"))
+        self.clients_hmo_view_policy_corporate_gross_premium_label.setText(_translate("InvestoPinoyGUI", "Gross Premium"))
+        self.clients_hmo_view_policy_corporate_gross_premium_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Gross Premium"))
+        self.clients_hmo_view_policy_corporate_commission_label.setText(_translate("InvestoPinoyGUI", "Commission"))
+        self.clients_hmo_view_policy_corporate_commission_line_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Enter Commission"))
+        self.clients_hmo_view_policy_corporate_notes_label.setText(_translate("InvestoPinoyGUI", "Client"))
+        self.clients_hmo_view_policy_corporate_notes_text_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Add Notes"))
+        self.clients_hmo_view_policy_corporate_edit_push_button.setText(_translate("InvestoPinoyGUI", "Edit"))
+        self.clients_hmo_view_policy_corporate_update_push_button.setText(_translate("InvestoPinoyGUI", "Update"))
+        self.clients_hmo_view_policy_tab_widget.setTabText(self.clients_hmo_view_policy_tab_widget.indexOf(self.clients_hmo_view_policy_corporate_tab), _translate("InvestoPinoyGUI", "Corporate"))
+        self.clients_hmo_tab_widget.setTabText(self.clients_hmo_tab_widget.indexOf(self.clients_hmo_view_policy_tab), _translate("InvestoPinoyGUI", "View Policy"))
         self.clients_tab_widget.setTabText(self.clients_tab_widget.indexOf(self.clients_hmo_tab), _translate("InvestoPinoyGUI", "HMO Clients"))
-        item = self.companies_non_life_dashboard_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Assured Name"))
-        item = self.companies_non_life_dashboard_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Type of Insurance"))
-        item = self.companies_non_life_dashboard_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Insurance Company"))
-        item = self.companies_non_life_dashboard_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
-        __sortingEnabled = self.companies_non_life_dashboard_table.isSortingEnabled()
-        self.companies_non_life_dashboard_table.setSortingEnabled(False)
-        item = self.companies_non_life_dashboard_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Gloria Pritchett"))
-        item = self.companies_non_life_dashboard_table.item(0, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Fire (Residential)"))
-        item = self.companies_non_life_dashboard_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "Mercantile Insurance"))
-        item = self.companies_non_life_dashboard_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "2028/10/14"))
-        item = self.companies_non_life_dashboard_table.item(1, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Philip Dunphy"))
-        item = self.companies_non_life_dashboard_table.item(1, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Motor"))
-        item = self.companies_non_life_dashboard_table.item(1, 2)
-        item.setText(_translate("InvestoPinoyGUI", "Philippine British Insurance"))
-        item = self.companies_non_life_dashboard_table.item(1, 3)
-        item.setText(_translate("InvestoPinoyGUI", "2026/02/14"))
-        self.companies_non_life_dashboard_table.setSortingEnabled(__sortingEnabled)
         self.companies_non_life_dashboard_count.setText(_translate("InvestoPinoyGUI", "0"))
         self.companies_non_life_dashboard_label.setText(_translate("InvestoPinoyGUI", "Results"))
         self.companies_non_life_tab_widget.setTabText(self.companies_non_life_tab_widget.indexOf(self.companies_non_life_dashboard_tab), _translate("InvestoPinoyGUI", "Dashboard"))
         self.companies_tab_widget.setTabText(self.companies_tab_widget.indexOf(self.companies_non_life_tab), _translate("InvestoPinoyGUI", "Non-Life Clients"))
-        item = self.companies_hmo_dashboard_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Assured Name"))
-        item = self.companies_hmo_dashboard_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Type of HMO"))
-        item = self.companies_hmo_dashboard_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Insurance Company"))
-        item = self.companies_hmo_dashboard_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
-        __sortingEnabled = self.companies_hmo_dashboard_table.isSortingEnabled()
-        self.companies_hmo_dashboard_table.setSortingEnabled(False)
-        item = self.companies_hmo_dashboard_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Perry-Scavo Firm"))
-        item = self.companies_hmo_dashboard_table.item(0, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Corporate"))
-        item = self.companies_hmo_dashboard_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "Maxicare"))
-        item = self.companies_hmo_dashboard_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "2029/10/18"))
-        item = self.companies_hmo_dashboard_table.item(1, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Philip Dunphy"))
-        item = self.companies_hmo_dashboard_table.item(1, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Individual"))
-        item = self.companies_hmo_dashboard_table.item(1, 2)
-        item.setText(_translate("InvestoPinoyGUI", "Icare"))
-        item = self.companies_hmo_dashboard_table.item(1, 3)
-        item.setText(_translate("InvestoPinoyGUI", "2027/08/07"))
-        self.companies_hmo_dashboard_table.setSortingEnabled(__sortingEnabled)
         self.companies_hmo_dashboard_label.setText(_translate("InvestoPinoyGUI", "Results"))
         self.companies_hmo_dashboard_count.setText(_translate("InvestoPinoyGUI", "0"))
         self.companies_hmo_tab_widget.setTabText(self.companies_hmo_tab_widget.indexOf(self.companies_hmo_dashboard_tab), _translate("InvestoPinoyGUI", "Dashboard"))
         self.companies_tab_widget.setTabText(self.companies_tab_widget.indexOf(self.companies_hmo_tab), _translate("InvestoPinoyGUI", "HMO Clients"))
-        item = self.client_payments_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Client Name"))
-        item = self.client_payments_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Policy Number"))
-        item = self.client_payments_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Amount Paid"))
-        item = self.client_payments_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Payment Method"))
-        item = self.client_payments_table.horizontalHeaderItem(4)
-        item.setText(_translate("InvestoPinoyGUI", "Total Premium Due"))
-        item = self.client_payments_table.horizontalHeaderItem(5)
-        item.setText(_translate("InvestoPinoyGUI", "Status"))
-        item = self.client_payments_table.horizontalHeaderItem(6)
-        item.setText(_translate("InvestoPinoyGUI", "Date"))
-        __sortingEnabled = self.client_payments_table.isSortingEnabled()
-        self.client_payments_table.setSortingEnabled(False)
-        item = self.client_payments_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Juan Dela Cruz"))
-        item = self.client_payments_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "500.00"))
-        item = self.client_payments_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "Cash"))
-        item = self.client_payments_table.item(0, 6)
-        item.setText(_translate("InvestoPinoyGUI", "2025/02/03"))
-        item = self.client_payments_table.item(1, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Maria Clara"))
-        item = self.client_payments_table.item(1, 2)
-        item.setText(_translate("InvestoPinoyGUI", "300.00"))
-        item = self.client_payments_table.item(1, 3)
-        item.setText(_translate("InvestoPinoyGUI", "Bank Transfer"))
-        item = self.client_payments_table.item(1, 6)
-        item.setText(_translate("InvestoPinoyGUI", "2024/11/26"))
-        self.client_payments_table.setSortingEnabled(__sortingEnabled)
         self.client_payments_count.setText(_translate("InvestoPinoyGUI", "0"))
         self.client_payments_label.setText(_translate("InvestoPinoyGUI", "Results"))
         self.collection_tab_widget.setTabText(self.collection_tab_widget.indexOf(self.client_payments_tab), _translate("InvestoPinoyGUI", "Client Payments"))
-        item = self.company_expenses_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Amount"))
-        item = self.company_expenses_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Expense Category"))
-        item = self.company_expenses_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Payment Method"))
-        item = self.company_expenses_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Department"))
-        item = self.company_expenses_table.horizontalHeaderItem(4)
-        item.setText(_translate("InvestoPinoyGUI", "Date"))
-        __sortingEnabled = self.company_expenses_table.isSortingEnabled()
-        self.company_expenses_table.setSortingEnabled(False)
-        item = self.company_expenses_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "5,000.00"))
-        item = self.company_expenses_table.item(0, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Office Supplies"))
-        item = self.company_expenses_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "Cash"))
-        item = self.company_expenses_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "Admin"))
-        item = self.company_expenses_table.item(0, 4)
-        item.setText(_translate("InvestoPinoyGUI", "2025/02/14"))
-        item = self.company_expenses_table.item(1, 0)
-        item.setText(_translate("InvestoPinoyGUI", "10,000.00"))
-        item = self.company_expenses_table.item(1, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Utilities"))
-        item = self.company_expenses_table.item(1, 2)
-        item.setText(_translate("InvestoPinoyGUI", "Bank Transfer"))
-        item = self.company_expenses_table.item(1, 3)
-        item.setText(_translate("InvestoPinoyGUI", "IT"))
-        item = self.company_expenses_table.item(1, 4)
-        item.setText(_translate("InvestoPinoyGUI", "2025/01/25"))
-        self.company_expenses_table.setSortingEnabled(__sortingEnabled)
+        self.company_expenses_add_expense_push_button.setText(_translate("InvestoPinoyGUI", "Add Expense"))
         self.company_expenses_count.setText(_translate("InvestoPinoyGUI", "0"))
         self.company_expenses_label.setText(_translate("InvestoPinoyGUI", "Results"))
         self.collection_tab_widget.setTabText(self.collection_tab_widget.indexOf(self.company_expenses_tab), _translate("InvestoPinoyGUI", "Company Expenses"))
         self.archives_search_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Search Archives"))
-        item = self.archives_non_life_dashboard_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Assured Name"))
-        item = self.archives_non_life_dashboard_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Type of Insurance"))
-        item = self.archives_non_life_dashboard_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Policy Number"))
-        item = self.archives_non_life_dashboard_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
-        __sortingEnabled = self.archives_non_life_dashboard_table.isSortingEnabled()
-        self.archives_non_life_dashboard_table.setSortingEnabled(False)
-        item = self.archives_non_life_dashboard_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Philip Dunphy"))
-        item = self.archives_non_life_dashboard_table.item(0, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Motor"))
-        item = self.archives_non_life_dashboard_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "MO-0011223344"))
-        item = self.archives_non_life_dashboard_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "02/14/26"))
-        self.archives_non_life_dashboard_table.setSortingEnabled(__sortingEnabled)
         self.archives_non_life_dashboard_restore_button.setText(_translate("InvestoPinoyGUI", "Restore"))
         self.archives_non_life_dashboard_delete_button.setText(_translate("InvestoPinoyGUI", "Delete"))
         self.archives_non_life_dashboard_count.setText(_translate("InvestoPinoyGUI", "0"))
@@ -4495,28 +4715,26 @@ class Ui_InvestoPinoyGUI(object):
         self.archives_non_life_tab_widget.setTabText(self.archives_non_life_tab_widget.indexOf(self.archives_non_life_dashboard_tab), _translate("InvestoPinoyGUI", "Dashboard"))
         self.archives_tab_widget.setTabText(self.archives_tab_widget.indexOf(self.archives_non_life_tab), _translate("InvestoPinoyGUI", "Non-Life Clients"))
         self.archives_hmo_search_edit.setPlaceholderText(_translate("InvestoPinoyGUI", "Search HMO Archives"))
-        item = self.archives_hmo_dashboard_table.horizontalHeaderItem(0)
-        item.setText(_translate("InvestoPinoyGUI", "Assured Name"))
-        item = self.archives_hmo_dashboard_table.horizontalHeaderItem(1)
-        item.setText(_translate("InvestoPinoyGUI", "Type of HMO"))
-        item = self.archives_hmo_dashboard_table.horizontalHeaderItem(2)
-        item.setText(_translate("InvestoPinoyGUI", "Policy Number"))
-        item = self.archives_hmo_dashboard_table.horizontalHeaderItem(3)
-        item.setText(_translate("InvestoPinoyGUI", "Expiry Date"))
-        __sortingEnabled = self.archives_hmo_dashboard_table.isSortingEnabled()
-        self.archives_hmo_dashboard_table.setSortingEnabled(False)
-        item = self.archives_hmo_dashboard_table.item(0, 0)
-        item.setText(_translate("InvestoPinoyGUI", "Philip Dunphy"))
-        item = self.archives_hmo_dashboard_table.item(0, 1)
-        item.setText(_translate("InvestoPinoyGUI", "Individual"))
-        item = self.archives_hmo_dashboard_table.item(0, 2)
-        item.setText(_translate("InvestoPinoyGUI", "MO-0011223344"))
-        item = self.archives_hmo_dashboard_table.item(0, 3)
-        item.setText(_translate("InvestoPinoyGUI", "02/14/26"))
-        self.archives_hmo_dashboard_table.setSortingEnabled(__sortingEnabled)
         self.archives_hmo_dashboard_restore_button.setText(_translate("InvestoPinoyGUI", "Restore"))
         self.archives_hmo_dashboard_delete_button.setText(_translate("InvestoPinoyGUI", "Delete"))
         self.archives_hmo_dashboard_count.setText(_translate("InvestoPinoyGUI", "0"))
         self.archives_hmo_dashboard_label.setText(_translate("InvestoPinoyGUI", "Results"))
         self.archives_hmo_tab_widget.setTabText(self.archives_hmo_tab_widget.indexOf(self.archives_hmo_dashboard_tab), _translate("InvestoPinoyGUI", "Dashboard"))
         self.archives_tab_widget.setTabText(self.archives_tab_widget.indexOf(self.archives_hmo_tab), _translate("InvestoPinoyGUI", "HMO Clients"))
+        self.label_2.setText(_translate("InvestoPinoyGUI", "Account Details"))
+        self.label_3.setText(_translate("InvestoPinoyGUI", "Full Name"))
+        self.label_4.setText(_translate("InvestoPinoyGUI", "Username"))
+        self.label_5.setText(_translate("InvestoPinoyGUI", "Agent Number"))
+        self.label_6.setText(_translate("InvestoPinoyGUI", "Email"))
+        self.label_7.setText(_translate("InvestoPinoyGUI", "Contact Number"))
+        self.account_edit_button.setText(_translate("InvestoPinoyGUI", "Edit"))
+        self.account_save_button.setText(_translate("InvestoPinoyGUI", "Save"))
+        self.label_8.setText(_translate("InvestoPinoyGUI", "Change Password"))
+        self.label_9.setText(_translate("InvestoPinoyGUI", "Old Password"))
+        self.label_10.setText(_translate("InvestoPinoyGUI", "New Password"))
+        self.label_11.setText(_translate("InvestoPinoyGUI", "Confirm Password"))
+        self.change_password_button.setText(_translate("InvestoPinoyGUI", "Change Password"))
+
+
+# sha1 of form.ui this module was generated from, checked by ui_loader.py
+UI_SOURCE_SHA1 = "0e1237862e3c5045d319ba94723f7ccfaf5bb1a5"
@@ -1,174 +1,236 @@
-# -*- coding: utf-8 -*-
+# Form implementation generated from reading ui file 'QtGUI/login.ui'
+#
+# Created by: PyQt6 UI code generator 6.8.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
 
-################################################################################
-## Form generated from reading UI file 'login.ui'
-##
-## Created by: Qt User Interface Compiler version 6.8.2
-##
-## WARNING! All changes made in this file will be lost when recompiling UI file!
-################################################################################
 
-from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
-    QMetaObject, QObject, QPoint, QRect,
-    QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QFrame, QHBoxLayout, QLabel,
-    QLineEdit, QPushButton, QSizePolicy, QSpacerItem,
-    QVBoxLayout, QWidget)
+from PyQt6 import QtCore, QtGui, QtWidgets
+
 
 class Ui_Form(object):
     def setupUi(self, Form):
-        if not Form.objectName():
-            Form.setObjectName(u"Form")
+        Form.setObjectName("Form")
         Form.resize(960, 540)
-        palette = QPalette()
-        brush = QBrush(QColor(0, 0, 0, 255))
-        brush.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.WindowText, brush)
-        brush1 = QBrush(QColor(224, 222, 232, 255))
-        brush1.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.Button, brush1)
-        brush2 = QBrush(QColor(255, 255, 255, 255))
-        brush2.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.Light, brush2)
-        brush3 = QBrush(QColor(239, 238, 243, 255))
-        brush3.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.Midlight, brush3)
-        brush4 = QBrush(QColor(112, 111, 116, 255))
-        brush4.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.Dark, brush4)
-        brush5 = QBrush(QColor(149, 148, 155, 255))
-        brush5.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.Mid, brush5)
-        palette.setBrush(QPalette.Active, QPalette.Text, brush)
-        palette.setBrush(QPalette.Active, QPalette.BrightText, brush2)
-        palette.setBrush(QPalette.Active, QPalette.ButtonText, brush)
-        palette.setBrush(QPalette.Active, QPalette.Base, brush2)
-        palette.setBrush(QPalette.Active, QPalette.Window, brush1)
-        palette.setBrush(QPalette.Active, QPalette.Shadow, brush)
-        palette.setBrush(QPalette.Active, QPalette.AlternateBase, brush3)
-        brush6 = QBrush(QColor(255, 255, 220, 255))
-        brush6.setStyle(Qt.SolidPattern)
-        palette.setBrush(QPalette.Active, QPalette.ToolTipBase, brush6)
-        palette.setBrush(QPalette.Active, QPalette.ToolTipText, brush)
-        brush7 = QBrush(QColor(0, 0, 0, 127))
-        brush7.setStyle(Qt.SolidPattern)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
-        palette.setBrush(QPalette.Active, QPalette.PlaceholderText, brush7)
-#endif
-        palette.setBrush(QPalette.Active, QPalette.Accent, brush2)
-        palette.setBrush(QPalette.Inactive, QPalette.WindowText, brush)
-        palette.setBrush(QPalette.Inactive, QPalette.Button, brush1)
-        palette.setBrush(QPalette.Inactive, QPalette.Light, brush2)
-        palette.setBrush(QPalette.Inactive, QPalette.Midlight, brush3)
-        palette.setBrush(QPalette.Inactive, QPalette.Dark, brush4)
-        palette.setBrush(QPalette.Inactive, QPalette.Mid, brush5)
-        palette.setBrush(QPalette.Inactive, QPalette.Text, brush)
-        palette.setBrush(QPalette.Inactive, QPalette.BrightText, brush2)
-        palette.setBrush(QPalette.Inactive, QPalette.ButtonText, brush)
-        palette.setBrush(QPalette.Inactive, QPalette.Base, brush2)
-        palette.setBrush(QPalette.Inactive, QPalette.Window, brush1)
-        palette.setBrush(QPalette.Inactive, QPalette.Shadow, brush)
-        palette.setBrush(QPalette.Inactive, QPalette.AlternateBase, brush3)
-        palette.setBrush(QPalette.Inactive, QPalette.ToolTipBase, brush6)
-        palette.setBrush(QPalette.Inactive, QPalette.ToolTipText, brush)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
-        palette.setBrush(QPalette.Inactive, QPalette.PlaceholderText, brush7)
-#endif
-        palette.setBrush(QPalette.Inactive, QPalette.Accent, brush2)
-        palette.setBrush(QPalette.Disabled, QPalette.WindowText, brush4)
-        palette.setBrush(QPalette.Disabled, QPalette.Button, brush1)
-        palette.setBrush(QPalette.Disabled, QPalette.Light, brush2)
-        palette.setBrush(QPalette.Disabled, QPalette.Midlight, brush3)
-        palette.setBrush(QPalette.Disabled, QPalette.Dark, brush4)
-        palette.setBrush(QPalette.Disabled, QPalette.Mid, brush5)
-        palette.setBrush(QPalette.Disabled, QPalette.Text, brush4)
-        palette.setBrush(QPalette.Disabled, QPalette.BrightText, brush2)
-        palette.setBrush(QPalette.Disabled, QPalette.ButtonText, brush4)
-        palette.setBrush(QPalette.Disabled, QPalette.Base, brush1)
-        palette.setBrush(QPalette.Disabled, QPalette.Window, brush1)
-        palette.setBrush(QPalette.Disabled, QPalette.Shadow, brush)
-        palette.setBrush(QPalette.Disabled, QPalette.AlternateBase, brush1)
-        palette.setBrush(QPalette.Disabled, QPalette.ToolTipBase, brush6)
-        palette.setBrush(QPalette.Disabled, QPalette.ToolTipText, brush)
-        brush8 = QBrush(QColor(112, 111, 116, 127))
-        brush8.setStyle(Qt.SolidPattern)
-#if QT_VERSION >= QT_VERSION_CHECK(5, 12, 0)
-        palette.setBrush(QPalette.Disabled, QPalette.PlaceholderText, brush8)
-#endif
-        palette.setBrush(QPalette.Disabled, QPalette.Accent, brush2)
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(149, 148, 155))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 127))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Accent, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(149, 148, 155))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 127))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Accent, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Light, brush)
+        brush = QtGui.QBrush(QtGui.QColor(239, 238, 243))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Midlight, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Dark, brush)
+        brush = QtGui.QBrush(QtGui.QColor(149, 148, 155))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Mid, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.BrightText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Shadow, brush)
+        brush = QtGui.QBrush(QtGui.QColor(224, 222, 232))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.AlternateBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 220))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ToolTipBase, brush)
+        brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ToolTipText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(112, 111, 116, 127))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Accent, brush)
         Form.setPalette(palette)
-        font = QFont()
-        font.setFamilies([u"Segoe UI"])
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
         font.setBold(True)
         Form.setFont(font)
-        Form.setStyleSheet(u"")
-        self.horizontalLayout = QHBoxLayout(Form)
-        self.horizontalLayout.setObjectName(u"horizontalLayout")
-        self.frame = QFrame(Form)
-        self.frame.setObjectName(u"frame")
-        self.frame.setStyleSheet(u"#frame {\n"
-"	border: 10px solid white;\n"
-"	border-radius: 50%;\n"
+        Form.setStyleSheet("")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(Form)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.frame = QtWidgets.QFrame(parent=Form)
+        self.frame.setStyleSheet("#frame {\n"
+"    border: 10px solid white;\n"
+"    border-radius: 50%;\n"
+"}\n"
+"QLineEdit {\n"
+"    color: white;\n"
 "}")
-        self.frame.setFrameShape(QFrame.Shape.StyledPanel)
-        self.frame.setFrameShadow(QFrame.Shadow.Raised)
-        self.verticalLayout = QVBoxLayout(self.frame)
-        self.verticalLayout.setObjectName(u"verticalLayout")
-        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
-        self.verticalLayout.addItem(self.verticalSpacer_2)
-
-        self.login_header = QLabel(self.frame)
-        self.login_header.setObjectName(u"login_header")
-        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        self.frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.frame.setObjectName("frame")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.frame)
+        self.verticalLayout.setObjectName("verticalLayout")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.login_header = QtWidgets.QLabel(parent=self.frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
         sizePolicy.setHeightForWidth(self.login_header.sizePolicy().hasHeightForWidth())
         self.login_header.setSizePolicy(sizePolicy)
-        font1 = QFont()
-        font1.setFamilies([u"Futura"])
-        font1.setBold(True)
-        self.login_header.setFont(font1)
-        self.login_header.setStyleSheet(u"font-size: 36px;\n"
+        font = QtGui.QFont()
+        font.setFamily("Futura")
+        font.setPointSize(-1)
+        font.setBold(True)
+        self.login_header.setFont(font)
+        self.login_header.setStyleSheet("font-size: 36px;\n"
 "color: #432d60;")
-        self.login_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.login_header.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.login_header.setWordWrap(True)
-
+        self.login_header.setObjectName("login_header")
         self.verticalLayout.addWidget(self.login_header)
-
-        self.login_header_2 = QLabel(self.frame)
-        self.login_header_2.setObjectName(u"login_header_2")
-        font2 = QFont()
-        font2.setFamilies([u"Al Nile"])
-        font2.setPointSize(18)
-        font2.setBold(True)
-        self.login_header_2.setFont(font2)
-        self.login_header_2.setStyleSheet(u"color: #706a7a;")
-        self.login_header_2.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.login_header_2 = QtWidgets.QLabel(parent=self.frame)
+        font = QtGui.QFont()
+        font.setFamily("Al Nile")
+        font.setPointSize(18)
+        font.setBold(True)
+        self.login_header_2.setFont(font)
+        self.login_header_2.setStyleSheet("color: #706a7a;")
+        self.login_header_2.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.login_header_2.setWordWrap(True)
-
+        self.login_header_2.setObjectName("login_header_2")
         self.verticalLayout.addWidget(self.login_header_2)
-
-        self.verticalSpacer = QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
-
-        self.verticalLayout.addItem(self.verticalSpacer)
-
-        self.horizontalLayout_4 = QHBoxLayout()
-        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
-        self.login_username = QLineEdit(self.frame)
-        self.login_username.setObjectName(u"login_username")
-        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        sizePolicy1.setHorizontalStretch(0)
-        sizePolicy1.setVerticalStretch(0)
-        sizePolicy1.setHeightForWidth(self.login_username.sizePolicy().hasHeightForWidth())
-        self.login_username.setSizePolicy(sizePolicy1)
-        self.login_username.setMinimumSize(QSize(200, 0))
+        spacerItem1 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.verticalLayout.addItem(spacerItem1)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.login_username = QtWidgets.QLineEdit(parent=self.frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.login_username.sizePolicy().hasHeightForWidth())
+        self.login_username.setSizePolicy(sizePolicy)
+        self.login_username.setMinimumSize(QtCore.QSize(200, 0))
         self.login_username.setAutoFillBackground(False)
-        self.login_username.setStyleSheet(u"QLineEdit {\n"
+        self.login_username.setStyleSheet("QLineEdit {\n"
 "    background-color: rgba(60, 54, 82, 204);\n"
 "    border: 2px solid transparent;\n"
 "}\n"
@@ -176,22 +238,22 @@ class Ui_Form(object):
 "    border: 2px solid rgba(60,54,82,204);\n"
 "}\n"
 "QLineFocus:focus {\n"
-"	border: 2px solid black;\n"
+"    border: 2px solid black;\n"
 "}")
-
+        self.login_username.setText("")
+        self.login_username.setObjectName("login_username")
         self.horizontalLayout_4.addWidget(self.login_username)
-
-
         self.verticalLayout.addLayout(self.horizontalLayout_4)
-
-        self.horizontalLayout_3 = QHBoxLayout()
-        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
-        self.login_password = QLineEdit(self.frame)
-        self.login_password.setObjectName(u"login_password")
-        sizePolicy1.setHeightForWidth(self.login_password.sizePolicy().hasHeightForWidth())
-        self.login_password.setSizePolicy(sizePolicy1)
-        self.login_password.setMinimumSize(QSize(200, 0))
-        self.login_password.setStyleSheet(u"QLineEdit {\n"
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.login_password = QtWidgets.QLineEdit(parent=self.frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.login_password.sizePolicy().hasHeightForWidth())
+        self.login_password.setSizePolicy(sizePolicy)
+        self.login_password.setMinimumSize(QtCore.QSize(200, 0))
+        self.login_password.setStyleSheet("QLineEdit {\n"
 "    background-color: rgba(60, 54, 82, 204);\n"
 "    border: 2px solid transparent;\n"
 "}\n"
@@ -199,76 +261,87 @@ class Ui_Form(object):
 "    border: 2px solid rgba(60,54,82,204);\n"
 "}\n"
 "QLineFocus:focus {\n"
-"	border: 2px solid black;\n"
+"    border: 2px solid black;\n"
 "}")
-        self.login_password.setEchoMode(QLineEdit.EchoMode.Password)
-
+        self.login_password.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
+        self.login_password.setPlaceholderText("")
+        self.login_password.setObjectName("login_password")
         self.horizontalLayout_3.addWidget(self.login_password)
-
-
         self.verticalLayout.addLayout(self.horizontalLayout_3)
-
-        self.horizontalLayout_2 = QHBoxLayout()
-        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
-        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-
-        self.horizontalLayout_2.addItem(self.horizontalSpacer)
-
-        self.login_button = QPushButton(self.frame)
-        self.login_button.setObjectName(u"login_button")
-        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
-        sizePolicy2.setHorizontalStretch(0)
-        sizePolicy2.setVerticalStretch(0)
-        sizePolicy2.setHeightForWidth(self.login_button.sizePolicy().hasHeightForWidth())
-        self.login_button.setSizePolicy(sizePolicy2)
-        self.login_button.setMinimumSize(QSize(100, 25))
-        font3 = QFont()
-        font3.setBold(True)
-        self.login_button.setFont(font3)
-        self.login_button.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
-        self.login_button.setStyleSheet(u"QPushButton\n"
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem2)
+        self.login_button = QtWidgets.QPushButton(parent=self.frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.login_button.sizePolicy().hasHeightForWidth())
+        self.login_button.setSizePolicy(sizePolicy)
+        self.login_button.setMinimumSize(QtCore.QSize(100, 25))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.login_button.setFont(font)
+        self.login_button.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.login_button.setStyleSheet("QPushButton\n"
 "{\n"
-"	background-color: rgb(60,54,82);\n"
-"	border: 1px solid white;\n"
-"	border-radius: 5px;\n"
+"    background-color: rgb(60,54,82);\n"
+"    border: 1px solid white;\n"
+"    border-radius: 5px;\n"
+"    color: white;\n"
 "}\n"
 "QPushButton::hover\n"
 "{\n"
-"	background-color: rgba(60,54,82,204);\n"
+"    background-color: rgba(60,54,82,204);\n"
 "}")
+        self.login_button.setDefault(False)
         self.login_button.setFlat(False)
-
+        self.login_button.setObjectName("login_button")
         self.horizontalLayout_2.addWidget(self.login_button)
-
-        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-
-        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
-
-
+        self.register_button = QtWidgets.QPushButton(parent=self.frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.register_button.sizePolicy().hasHeightForWidth())
+        self.register_button.setSizePolicy(sizePolicy)
+        self.register_button.setMinimumSize(QtCore.QSize(100, 25))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.register_button.setFont(font)
+        self.register_button.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.register_button.setStyleSheet("QPushButton\n"
+"{\n"
+"    background-color: rgb(60,54,82);\n"
+"    border: 1px solid white;\n"
+"    border-radius: 5px;\n"
+"    color: white;\n"
+"}\n"
+"QPushButton::hover\n"
+"{\n"
+"    background-color: rgba(60,54,82,204);\n"
+"}")
+        self.register_button.setDefault(False)
+        self.register_button.setFlat(False)
+        self.register_button.setObjectName("register_button")
+        self.horizontalLayout_2.addWidget(self.register_button)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem3)
         self.verticalLayout.addLayout(self.horizontalLayout_2)
-
-        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-
-        self.verticalLayout.addItem(self.verticalSpacer_3)
-
-
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout.addItem(spacerItem4)
         self.horizontalLayout.addWidget(self.frame)
 
-
         self.retranslateUi(Form)
-
-        self.login_button.setDefault(False)
-
-
-        QMetaObject.connectSlotsByName(Form)
-    # setupUi
+        QtCore.QMetaObject.connectSlotsByName(Form)
 
     def retranslateUi(self, Form):
-        Form.setWindowTitle(QCoreApplication.translate("Form", u"Form", None))
-        self.login_header.setText(QCoreApplication.translate("Form", u"INVESTOPINOY", None))
-        self.login_header_2.setText(QCoreApplication.translate("Form", u"INSURANCE MANAGEMENT SYSTEM", None))
-        self.login_username.setText("")
-        self.login_password.setPlaceholderText("")
-        self.login_button.setText(QCoreApplication.translate("Form", u"Login", None))
-    # retranslateUi
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.login_header.setText(_translate("Form", "INVESTOPINOY"))
+        self.login_header_2.setText(_translate("Form", "INSURANCE MANAGEMENT SYSTEM"))
+        self.login_button.setText(_translate("Form", "Login"))
+        self.register_button.setText(_translate("Form", "Register"))
+
 
+# sha1 of login.ui this module was generated from, checked by ui_loader.py
+UI_SOURCE_SHA1 = "6f2a71a1721beeac51486e3e379a95c438e62e9b"
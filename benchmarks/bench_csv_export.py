@@ -0,0 +1,66 @@
+"""
+Compare the old CSV export (SELECT ... WHERE id IN (%s, ...), fetchall, csv.writer)
+against the COPY TO STDOUT export the dashboards use now.
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment). Both exports write the active clients_nonlife book to a
+temporary file; time and peak Python memory are reported for each.
+
+Usage (from the repository root):
+    python benchmarks/bench_csv_export.py
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import db_func
+from exports.csv_export import export_policies_to_csv
+
+
+def old_export(path):
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT id FROM clients_nonlife WHERE status = 'active'")
+        ids = [row[0] for row in cursor.fetchall()]
+        # one placeholder per id, the way fetch_clients_nonlife_by_ids() built it
+        placeholders = ','.join(['%s'] * len(ids))
+        cursor.execute(f"SELECT * FROM clients_nonlife WHERE id IN ({placeholders})", ids)
+        rows = cursor.fetchall()
+        headers = [desc[0] for desc in cursor.description]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def new_export(path):
+    export_policies_to_csv("clients_nonlife", path, "active")
+
+
+def measure(export, path):
+    tracemalloc.start()
+    started = time.perf_counter()
+    export(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    with open(path, encoding="utf-8") as f:
+        rows = sum(1 for _ in f) - 1
+    return elapsed, peak, rows
+
+
+def main():
+    db_func.get_pool().warm()
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, export in [("fetchall + csv.writer", old_export), ("COPY TO STDOUT", new_export)]:
+            elapsed, peak, rows = measure(export, os.path.join(tmp, "export.csv"))
+            print(f"{name:22} {rows:9d} rows {elapsed * 1000:9.1f} ms  peak {peak / 1024 / 1024:7.1f} MiB")
+    db_func.close_pool()
+
+
+if __name__ == "__main__":
+    main()
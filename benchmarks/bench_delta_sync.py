@@ -0,0 +1,86 @@
+"""
+Compare refreshing a fully loaded dashboard table by reloading it with
+refreshing it through its updated_at watermark (db_func.fetch_table_changes()
+and RecordTableModel.patch_records()).
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment) with migrations/0004_updated_at_indexes.sql and
+migrations/0008_deleted_rows.sql applied. The table is the non-life table of
+the clients tab. For each --changed count that many rows are edited, then
+the full reload (query + model reset) and the delta refresh (watermark +
+changed rows + patch) are timed, both including the model update. The edits
+are stamped past the watermark plus the DELTA_SYNC_OVERLAP window, as if the
+last refresh was a while ago, and run in one transaction that is rolled back
+at the end.
+
+Usage (from the repository root):
+    python benchmarks/bench_delta_sync.py
+    python benchmarks/bench_delta_sync.py --changed 1 50 500 --repeat 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import db_func
+from table_model import RecordTableModel, SearchFilterProxyModel
+
+
+def timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--changed", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    table = db_func.DASHBOARD_TABLES["clients"][0]
+    model = RecordTableModel(["id", "assured_name", "type_of_insurance", "policy_number", "expiry_date"])
+    proxy = SearchFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        try:
+            cursor.execute(table.watermark_query)
+            watermark = cursor.fetchone()[0]
+            since = watermark + timedelta(seconds=db_func.DELTA_SYNC_OVERLAP)
+
+            def full_reload():
+                cursor.execute(table.watermark_query)
+                cursor.execute(table.query)
+                model.set_records(cursor.fetchall())
+
+            def delta_refresh():
+                cursor.execute(table.watermark_query)
+                cursor.execute(table.changes_query, {"since": since, "overlap": db_func.DELTA_SYNC_OVERLAP})
+                model.patch_records([(row[:-1], row[-1]) for row in cursor.fetchall()], table.key_columns)
+
+            full_reload()
+            print(f"{model.rowCount()} rows in {table.table_name}")
+            for changed in sorted(args.changed):
+                cursor.execute("""
+                    UPDATE clients_nonlife SET assured_name = assured_name || '.',
+                                               updated_at = %s + interval '1 second'
+                    WHERE id IN (SELECT id FROM clients_nonlife WHERE status = 'active' ORDER BY id LIMIT %s)
+                """, (since, changed))
+                full_ms = timed(full_reload, args.repeat)
+                delta_ms = timed(delta_refresh, args.repeat)
+                print(f"{changed:6} changed   full reload {full_ms:8.2f} ms   delta {delta_ms:8.2f} ms"
+                      f"   ({full_ms / delta_ms:.0f}x)")
+        finally:
+            conn.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare ways of fetching a set of rows by id: one placeholder per id
+(IN (%s, %s, ...), what the export helpers used to build), a single int[]
+parameter unnested WITH ORDINALITY, and a COPY-loaded temp table. The last
+two are db_func.ids_relation() as an export of selected rows runs it, through
+db_func.policy_export_query().
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment). The ids are up to --ids active clients_nonlife ids in random
+order, so the order-preserving paths have to do real work.
+
+Usage (from the repository root):
+    python benchmarks/bench_fetch_by_ids.py
+    python benchmarks/bench_fetch_by_ids.py --ids 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import db_func
+
+
+def in_list(ids):
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        placeholders = ','.join(['%s'] * len(ids))
+        cursor.execute(f"SELECT * FROM clients_nonlife WHERE id IN ({placeholders}) AND status = 'active'", ids)
+        return cursor.fetchall()
+
+
+def with_threshold(threshold):
+    def fetch(ids):
+        db_func.IDS_TEMP_TABLE_THRESHOLD = threshold
+        with db_func.get_connection() as conn, conn.cursor() as cursor:
+            query, params = db_func.policy_export_query(cursor, "clients_nonlife", "active", ids)
+            cursor.execute(query, params)
+            return cursor.fetchall()
+    return fetch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ids", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    db_func.get_pool().warm()
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT id FROM clients_nonlife WHERE status = 'active'")
+        all_ids = [row[0] for row in cursor.fetchall()]
+    ids = random.sample(all_ids, min(args.ids, len(all_ids)))
+
+    for name, fetch, ordered in [
+        ("IN (%s, ...)", in_list, False),
+        ("= ANY(int[]) ordinality", with_threshold(len(ids)), True),
+        ("COPY temp table", with_threshold(0), True),
+    ]:
+        best = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            rows = fetch(ids)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        in_order = [row[0] for row in rows] == ids if ordered else "n/a"
+        print(f"{name:26} {len(ids):7d} ids -> {len(rows):7d} rows {best * 1000:9.1f} ms  on-screen order: {in_order}")
+    db_func.close_pool()
+
+
+if __name__ == "__main__":
+    main()
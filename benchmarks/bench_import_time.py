@@ -0,0 +1,74 @@
+"""
+Cold-start import time of src/app.py, measured with python -X importtime,
+checked against a budget.
+
+No database needed. Each run imports app in a fresh Python process (after
+one warm-up run that writes the .pyc files, as an installed app has them)
+and reads the cumulative time of the top-level `app` import. The median of
+--runs is compared with --budget-ms, and none of DEFERRED_MODULES may be
+imported at all. Exits 1 when either check fails, so it can gate CI.
+
+Usage (from the repository root):
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --budget-ms 200 --top 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# cold start went from ~360 ms to ~155 ms once the exports were deferred; leave headroom for slower machines
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "250"))
+
+# only imported when an export of that format runs, see exports/__init__.py
+DEFERRED_MODULES = ("openpyxl", "reportlab")
+
+
+def import_times():
+    """{module: (self us, cumulative us)} of one `import app` in a fresh process."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app"], cwd=SRC, env=env,
+                            capture_output=True, text=True, check=True).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    import_times()
+    runs = [import_times() for _ in range(args.runs)]
+    total_ms = statistics.median(times["app"][1] for times in runs) / 1000
+
+    print(f"import app: {total_ms:.1f} ms (median of {args.runs}), budget {args.budget_ms:.0f} ms")
+    print("slowest cumulative imports of the last run:")
+    last = sorted(runs[-1].items(), key=lambda item: item[1][1], reverse=True)
+    for module, (_, cumulative_us) in last[1:args.top + 1]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    failed = False
+    deferred = sorted({module for module in runs[-1] if module.split(".")[0] in DEFERRED_MODULES})
+    if deferred:
+        print("FAIL: imported at startup but meant to be deferred: " + ", ".join(deferred[:5]))
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: {total_ms:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare the two ways of deciding Paid vs Partial when a payment is recorded:
+SUM(amount_paid) over the policy's payment history (what the Record Payment
+buttons used to run) and the policy_balances upsert record_payment() runs
+now (migrations/0003_policy_balances.sql).
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment) with the migration applied. For each --history size a fake
+policy gets that many payments, then --payments more are timed each way.
+Everything runs in one transaction that is rolled back at the end.
+
+Usage (from the repository root):
+    python benchmarks/bench_payment_status.py
+    python benchmarks/bench_payment_status.py --history 10 1000 100000
+"""
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import db_func
+
+POLICY_NUMBER = "BENCH-PAYMENT-STATUS"
+
+
+def sum_status(cursor, amount):
+    cursor.execute("SELECT COALESCE(SUM(amount_paid), 0) FROM client_payments WHERE policy_number = %s",
+                   (POLICY_NUMBER,))
+    return cursor.fetchone()[0] + amount
+
+
+def ledger_status(cursor, amount):
+    cursor.execute("""
+        INSERT INTO policy_balances (policy_number, total_paid, payment_count)
+        VALUES (%s, %s, 1)
+        ON CONFLICT (policy_number) DO UPDATE
+        SET total_paid = policy_balances.total_paid + EXCLUDED.total_paid,
+            payment_count = policy_balances.payment_count + 1
+        RETURNING total_paid
+    """, (POLICY_NUMBER, amount))
+    return cursor.fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=int, nargs="+", default=[10, 1000, 100_000])
+    parser.add_argument("--payments", type=int, default=200)
+    args = parser.parse_args()
+
+    amount = Decimal("1.00")
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        try:
+            written = 0
+            for history in sorted(args.history):
+                cursor.execute("""
+                    INSERT INTO client_payments (policy_number, payment_date, payment_method, status, amount_paid)
+                    SELECT %s, CURRENT_DATE, 'Cash', 'Partial', %s FROM generate_series(1, %s)
+                """, (POLICY_NUMBER, amount, history - written))
+                written = history
+                cursor.execute("ANALYZE client_payments")
+
+                for name, status in [("SUM over history", sum_status), ("policy_balances upsert", ledger_status)]:
+                    started = time.perf_counter()
+                    for _ in range(args.payments):
+                        status(cursor, amount)
+                    elapsed = time.perf_counter() - started
+                    print(f"{name:24} history {history:7d}  {elapsed / args.payments * 1000:7.3f} ms per payment")
+        finally:
+            conn.rollback()
+    db_func.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare the old PDF export (one Table over every row, a Paragraph per cell)
+against the chunked report the dashboards use now.
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment). Both exports write the active clients_nonlife book with the
+non-life report columns to a temporary file; time and peak Python memory
+are reported for each.
+
+Usage (from the repository root):
+    python benchmarks/bench_pdf_export.py
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+import db_func
+from exports.pdf_export import export_policies_to_pdf
+
+EXPORT_COLUMNS = [
+    ("Assured Name", "assured_name"),
+    ("Contact No.", "contact_number"),
+    ("Email", "email"),
+    ("Type of Insurance", "type_of_insurance"),
+    ("Insurance Company", "insurance_company"),
+    ("Inception Date", "inception_date"),
+    ("Expiry Date", "expiry_date"),
+    ("Policy Number", "policy_number"),
+    ("Gross Premium", "gross_premium"),
+    ("Commission", "commission"),
+    ("Coverage", "amount_covered"),
+]
+
+
+def old_export(path):
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT * FROM clients_nonlife WHERE status = 'active' ORDER BY id")
+        rows = cursor.fetchall()
+        headers = [desc[0] for desc in cursor.description]
+
+    header_index_map = {header: i for i, header in enumerate(headers)}
+    filtered_headers = [label for label, _ in EXPORT_COLUMNS]
+    filtered_rows = [[row[header_index_map[col]] for _, col in EXPORT_COLUMNS] for row in rows]
+
+    doc = SimpleDocTemplate(path, pagesize=landscape(A4))
+    col_width = (landscape(A4)[0] - 72) / len(filtered_headers)
+    styles = getSampleStyleSheet()
+    cell_style = styles["BodyText"]
+    cell_style.fontSize = 5
+    cell_style.leading = 7
+
+    table_data = [filtered_headers]
+    for row in filtered_rows:
+        table_data.append([Paragraph(str(cell), cell_style) for cell in row])
+
+    table = Table(table_data, colWidths=[col_width] * len(filtered_headers), repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+        ('FONTSIZE', (0, 0), (-1, -1), 5),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ]))
+    doc.build([Paragraph("Client Non-Life", styles["Title"]), Spacer(1, 7), table])
+
+
+def new_export(path):
+    export_policies_to_pdf("clients_nonlife", path, export_columns=EXPORT_COLUMNS)
+
+
+def measure(export, path):
+    # tracing slows reportlab down, so time and memory get separate runs
+    started = time.perf_counter()
+    export(path)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    export(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    db_func.get_pool().warm()
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, export in [("one Table, Paragraphs", old_export), ("chunked Tables", new_export)]:
+            elapsed, peak = measure(export, os.path.join(tmp, "export.pdf"))
+            print(f"{name:22} {elapsed * 1000:9.1f} ms  peak {peak / 1024 / 1024:7.1f} MiB")
+    db_func.close_pool()
+
+
+if __name__ == "__main__":
+    main()
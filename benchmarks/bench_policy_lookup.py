@@ -0,0 +1,105 @@
+"""
+Compare policy lookups against the three client tables with the same lookups
+through the `policies` view (migrations/0002_policies_view.sql).
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment) with the migration applied. Two workloads are timed:
+
+- the Collection tab's payment listing, three LEFT JOINs + COALESCE before,
+  one LEFT JOIN LATERAL on the view now;
+- --lookups HMO premiums read one at a time, individual-then-corporate
+  probing by policy number before, db_func.fetch_policy_premium() by table
+  and id (what Record Payment runs since rows are keyed by id) now.
+
+Usage (from the repository root):
+    python benchmarks/bench_policy_lookup.py
+    python benchmarks/bench_policy_lookup.py --lookups 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import db_func
+
+OLD_CLIENT_PAYMENTS_QUERY = """
+    SELECT
+        COALESCE(cnl.assured_name, chmi.assured_name, chmc.company_name) AS client_name,
+        cp.policy_number,
+        cp.amount_paid,
+        cp.payment_method,
+        COALESCE(cnl.gross_premium, chmi.gross_premium, chmc.gross_premium) AS total_premium_due,
+        cp.status,
+        cp.payment_date
+    FROM client_payments cp
+    LEFT JOIN clients_nonlife cnl ON cp.policy_number = cnl.policy_number
+    LEFT JOIN clients_hmo_individual chmi ON cp.policy_number = chmi.policy_number
+    LEFT JOIN clients_hmo_corporate chmc ON cp.policy_number = chmc.policy_number
+    ORDER BY cp.payment_date DESC
+"""
+
+
+def payments(query):
+    def run(_):
+        with db_func.get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(query)
+            return len(cursor.fetchall())
+    return run
+
+
+def old_lookups(policy_numbers):
+    # one pooled connection per lookup, as a click of Record Payment takes
+    found = 0
+    for policy_number in policy_numbers:
+        with db_func.get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT gross_premium FROM clients_hmo_individual WHERE policy_number = %s", (policy_number,))
+            result = cursor.fetchone()
+            if result is None:
+                cursor.execute("SELECT gross_premium FROM clients_hmo_corporate WHERE policy_number = %s", (policy_number,))
+                result = cursor.fetchone()
+            found += result is not None
+    return found
+
+
+def new_lookups(policies):
+    return sum(db_func.fetch_policy_premium(table_name, policy_id) is not None for table_name, policy_id in policies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    db_func.get_pool().warm()
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT 'clients_hmo_individual', id, policy_number FROM clients_hmo_individual
+            UNION ALL
+            SELECT 'clients_hmo_corporate', id, policy_number FROM clients_hmo_corporate
+        """)
+        hmo_policies = random.choices(cursor.fetchall(), k=args.lookups)
+    policy_numbers = [policy[2] for policy in hmo_policies]
+    policy_ids = [policy[:2] for policy in hmo_policies]
+
+    for name, run, arg in [
+        ("payments, 3 LEFT JOINs", payments(OLD_CLIENT_PAYMENTS_QUERY), None),
+        ("payments, policies view", payments(db_func.CLIENT_PAYMENTS_QUERY), None),
+        ("HMO lookup, probe tables", old_lookups, policy_numbers),
+        ("HMO lookup, by id", new_lookups, policy_ids),
+    ]:
+        best = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            rows = run(arg)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{name:26} {rows:7d} rows {best * 1000:9.1f} ms")
+    db_func.close_pool()
+
+
+if __name__ == "__main__":
+    main()
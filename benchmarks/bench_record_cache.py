@@ -0,0 +1,71 @@
+"""
+What opening a policy in the View Policy pane costs with and without the
+record cache: the old lookup by policy_number, the by-id query a cache miss
+runs (db_func.fetch_policy_details()), and a cache hit.
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment). --policies non-life policies are opened --repeat times each;
+medians per open are reported. Only the lookup is timed, not filling the
+widgets, which is the same in every case.
+
+Usage (from the repository root):
+    python benchmarks/bench_record_cache.py
+    python benchmarks/bench_record_cache.py --policies 200 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import db_func
+from record_cache import RecordCache
+
+
+def by_policy_number(policy_number):
+    # what handle_nonlife_row_double_click ran before the cache
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(f"{db_func.POLICY_DETAIL_QUERIES['clients_nonlife']} WHERE policy_number = %s",
+                       (policy_number,))
+        return cursor.fetchone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--policies", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with db_func.get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT id, policy_number FROM clients_nonlife WHERE status = 'active' ORDER BY id LIMIT %s",
+                       (args.policies,))
+        policies = cursor.fetchall()
+
+    cache = RecordCache(size=len(policies))
+    window = type("Window", (), {"record_cache": cache})()
+
+    def time_each(open_policy):
+        times = []
+        for _ in range(args.repeat):
+            for policy in policies:
+                started = time.perf_counter()
+                open_policy(policy)
+                times.append(time.perf_counter() - started)
+        return statistics.median(times) * 1000
+
+    def open_cold(policy):
+        cache.clear()
+        return db_func.policy_details(window, "clients_nonlife", policy[0])
+
+    print(f"{'by policy_number':20} {time_each(lambda policy: by_policy_number(policy[1])):8.3f} ms per open")
+    print(f"{'cache miss (by id)':20} {time_each(open_cold):8.3f} ms per open")
+    # what the prefetch around the current row leaves behind
+    cache.put_many(db_func.fetch_policy_details({"clients_nonlife": [policy[0] for policy in policies]}))
+    hit_ms = time_each(lambda policy: db_func.policy_details(window, "clients_nonlife", policy[0]))
+    print(f"{'cache hit':20} {hit_ms:8.3f} ms per open")
+
+
+if __name__ == "__main__":
+    main()
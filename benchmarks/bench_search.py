@@ -0,0 +1,104 @@
+"""
+Compare the old dashboard search (scan every cell, setRowHidden row by row)
+against the trigram index + SearchFilterProxyModel the tables use now.
+
+The queries replay someone typing a name and then a policy number, one
+keystroke at a time. The old path paid the full scan on every keystroke; the
+new one builds the index once per load and answers each query from it (and the
+debounce timer in the app only runs the last query of a burst).
+
+Usage (from the repository root):
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --rows 100000 --old-limit 3
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+HEADERS = ["ID", "Assured Name", "Type of Insurance", "Policy Number", "Expiry Date"]
+
+
+def synthetic_rows(count):
+    # same shape as the clients_nonlife dashboard query
+    start = date(2025, 1, 1)
+    types = ["Motor", "Fire", "Marine", "Travel", "Personal Accident"]
+    return [
+        (i, f"Client {i:07d}", types[i % len(types)], f"NL-{i:09d}", start + timedelta(days=i % 730))
+        for i in range(1, count + 1)
+    ]
+
+
+def typed(text):
+    return [text[:end] for end in range(1, len(text) + 1)]
+
+
+def old_search(table, model, text):
+    # what on_search_text_changed used to do on every keystroke
+    from table_model import format_cell
+
+    for row in range(model.rowCount()):
+        match = False
+        for col in range(model.columnCount()):
+            cell = format_cell(model.value(row, col))
+            if cell and text in cell.lower():
+                match = True
+                break
+        table.setRowHidden(row, not match)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--old-limit", type=int, default=3,
+                        help="keystrokes to time on the old full scan, it is slow")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication, QTableView
+    from table_model import RecordTableModel, attach_model, search_table, visible_row_count
+
+    app = QApplication(sys.argv[:1])
+    rows = synthetic_rows(args.rows)
+    queries = typed("client 00042") + typed("nl-0000099")
+
+    # old: plain model, rows hidden one by one
+    old_table = QTableView()
+    old_model = RecordTableModel(HEADERS, old_table)
+    old_table.setModel(old_model)
+    old_model.set_records(rows)
+    started = time.perf_counter()
+    for text in queries[:args.old_limit]:
+        old_search(old_table, old_model, text)
+    old_per_query = (time.perf_counter() - started) / max(args.old_limit, 1)
+
+    # new: index built on the first search, then one proxy pass per query
+    new_table = QTableView()
+    new_model = attach_model(new_table, HEADERS)
+    new_model.set_records(rows)
+
+    started = time.perf_counter()
+    new_table.model()._search_index()
+    build = time.perf_counter() - started
+
+    timings = []
+    for text in queries:
+        started = time.perf_counter()
+        search_table(new_table, text)
+        timings.append(time.perf_counter() - started)
+        matches = visible_row_count(new_table)
+
+    print(f"rows: {args.rows}, keystrokes: {len(queries)}")
+    print(f"old full scan:      {old_per_query * 1000:9.1f} ms per keystroke")
+    print(f"index build (once): {build * 1000:9.1f} ms")
+    print(f"indexed search:     {sum(timings) / len(timings) * 1000:9.1f} ms per keystroke (worst {max(timings) * 1000:.1f} ms)")
+    print(f"last query '{queries[-1]}' matched {matches} rows")
+    print(f"speedup per keystroke x{old_per_query / max(sum(timings) / len(timings), 1e-9):.0f}")
+    del old_table, new_table, app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare building the main window and login widgets with uic.loadUi() (parsing
+QtGUI/form.ui and login.ui at runtime) against the pyuic6 modules generated
+by src/build_ui.py.
+
+No database needed. Every run is a fresh Python process on the offscreen Qt
+platform, so "first" includes importing (or parsing) the form the way an app
+launch does; "again" rebuilds it in the same process, the way logging out and
+back in does. Medians over --runs processes are reported.
+
+Usage (from the repository root):
+    python benchmarks/bench_startup_ui.py
+    python benchmarks/bench_startup_ui.py --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, sys.argv[2])
+from PyQt6.QtWidgets import QApplication, QWidget
+app = QApplication([])
+import ui_loader
+times = []
+for _ in range(2):
+    started = time.perf_counter()
+    ui_loader.setup_ui(QWidget(), "form.ui", sys.argv[1])
+    ui_loader.setup_ui(QWidget(), "login.ui", sys.argv[1])
+    times.append(time.perf_counter() - started)
+print(json.dumps(times))
+"""
+
+
+def run(mode):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    # an installed app imports the generated modules from their .pyc
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    output = subprocess.run([sys.executable, "-c", CHILD, mode, SRC], env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # the first compiled run also writes the modules' .pyc, keep it out of the numbers
+    run("compiled")
+    for mode in ("uic", "compiled"):
+        results = [run(mode) for _ in range(args.runs)]
+        first = statistics.median(r[0] for r in results)
+        again = statistics.median(r[1] for r in results)
+        print(f"{mode:9} first {first * 1000:8.1f} ms   again {again * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
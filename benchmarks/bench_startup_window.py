@@ -0,0 +1,88 @@
+"""
+Time from constructing MainWindow to its first paint, to the notifications
+being on screen, and to every tab being prefetched.
+
+Needs the database from src/.env (or HOST/USER/PASSWORD/DATABASE_NAME in the
+environment). Every run is a fresh Python process on the offscreen Qt
+platform; --connect-delay adds that many seconds to every new database
+connection, to see how a slow or remote server shows up (it should only move
+the notifications and prefetch times, never the first paint).
+
+Usage (from the repository root):
+    python benchmarks/bench_startup_window.py
+    python benchmarks/bench_startup_window.py --connect-delay 0.5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, "src")
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+import db_func
+delay = float(sys.argv[1])
+if delay:
+    open_connection = db_func.open_connection
+    db_func.open_connection = lambda: (time.sleep(delay), open_connection())[1]
+import app as app_module
+
+times = {}
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and "first_paint" not in times:
+            times["first_paint"] = time.perf_counter() - started
+        return False
+
+first_paint = FirstPaint()
+app_module.QWidget.showMaximized = lambda self: (self.installEventFilter(first_paint), self.show())
+started = time.perf_counter()
+window = app_module.MainWindow("bench")
+times["constructed"] = time.perf_counter() - started
+window.lazy_tabs.prefetched.connect(lambda: times.setdefault("prefetched", time.perf_counter() - started))
+
+deadline = time.perf_counter() + 30
+while "prefetched" not in times and time.perf_counter() < deadline:
+    app.processEvents()
+    if "notifications" not in times and window.notification_model.rowCount():
+        times["notifications"] = time.perf_counter() - started
+    time.sleep(0.001)
+window.close()
+print(json.dumps(times))
+"""
+
+STAGES = ["constructed", "first_paint", "notifications", "prefetched"]
+
+
+def run(delay):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    output = subprocess.run([sys.executable, "-c", CHILD, str(delay)], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--connect-delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    run(args.connect_delay)     # compiles the UI modules' .pyc
+    results = [run(args.connect_delay) for _ in range(args.runs)]
+    for stage in STAGES:
+        values = [r[stage] for r in results if stage in r]
+        median = f"{statistics.median(values) * 1000:8.1f} ms" if values else "     n/a"
+        print(f"{stage:14} {median}")
+
+
+if __name__ == "__main__":
+    main()
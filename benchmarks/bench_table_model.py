@@ -0,0 +1,120 @@
+"""
+Compare filling a dashboard table the old way (one QTableWidgetItem per cell)
+against the RecordTableModel used by the QTableViews.
+
+Each (path, row count) pair runs in its own process so the memory numbers are
+not polluted by the previous run.
+
+Usage (from the repository root):
+    python benchmarks/bench_table_model.py
+    python benchmarks/bench_table_model.py --rows 10000 100000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+HEADERS = ["ID", "Assured Name", "Type of Insurance", "Policy Number", "Expiry Date"]
+
+
+def rss_bytes():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def synthetic_rows(count):
+    # same shape as the clients_nonlife dashboard query
+    start = date(2025, 1, 1)
+    types = ["Motor", "Fire", "Marine", "Travel", "Personal Accident"]
+    return [
+        (i, f"Client {i:07d}", types[i % len(types)], f"NL-{i:09d}", start + timedelta(days=i % 730))
+        for i in range(1, count + 1)
+    ]
+
+
+def fill_widget(rows):
+    from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
+    from PyQt6.QtCore import Qt
+
+    table = QTableWidget(0, len(HEADERS))
+    table.setHorizontalHeaderLabels(HEADERS)
+    table.setSortingEnabled(False)
+    table.setRowCount(len(rows))
+    for row_idx, row_data in enumerate(rows):
+        for col_idx, cell_data in enumerate(row_data):
+            item = QTableWidgetItem(str(cell_data))
+            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            table.setItem(row_idx, col_idx, item)
+    table.setSortingEnabled(True)
+    return table
+
+
+def fill_model(rows):
+    from PyQt6.QtWidgets import QTableView
+    from table_model import attach_model
+
+    table = QTableView()
+    model = attach_model(table, HEADERS)
+    table.setSortingEnabled(False)
+    model.set_records(rows)
+    table.setSortingEnabled(True)
+    return table
+
+
+def run_case(path, count):
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    rows = synthetic_rows(count)
+
+    before = rss_bytes()
+    started = time.perf_counter()
+    table = fill_widget(rows) if path == "widget" else fill_model(rows)
+    elapsed = time.perf_counter() - started
+    after = rss_bytes()
+
+    memory = "n/a" if before is None else f"{(after - before) / 1024 / 1024:.1f}"
+    print(f"{path},{count},{elapsed:.3f},{memory}")
+    del table, app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--case", nargs=2, metavar=("PATH", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        run_case(args.case[0], int(args.case[1]))
+        return
+
+    print(f"{'rows':>8}  {'path':<16} {'fill (s)':>9}  {'memory (MB)':>11}")
+    for count in args.rows:
+        results = {}
+        for path in ("widget", "model"):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--case", path, str(count)],
+                capture_output=True, text=True, check=True
+            ).stdout.strip().splitlines()[-1]
+            _, _, elapsed, memory = output.split(",")
+            results[path] = float(elapsed)
+            label = "QTableWidget" if path == "widget" else "RecordTableModel"
+            print(f"{count:>8}  {label:<16} {elapsed:>9}  {memory:>11}")
+        print(f"{'':>8}  speedup x{results['widget'] / max(results['model'], 1e-9):.1f}")
+
+
+if __name__ == "__main__":
+    main()
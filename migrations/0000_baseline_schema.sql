@@ -0,0 +1,111 @@
+-- The tables the app was written against, for setting up a new database.
+--
+-- These were created by hand before the migrations existed; this file
+-- records them as db_func.py uses them so `python src/migrate.py` can build
+-- a database from nothing. On an existing database every statement is a
+-- no-op, nothing is altered. Column order matters for the HMO tables: the
+-- View Policy panes read their SELECT * rows by position. Later migrations
+-- add the indexes, views, policy_balances and triggers. Safe to run more
+-- than once.
+
+CREATE TABLE IF NOT EXISTS clients_nonlife (
+    id serial PRIMARY KEY,
+    assured_name text NOT NULL,
+    contact_number text,
+    email text,
+    birthday date,
+    inception_date date,
+    expiry_date date NOT NULL,
+    net_premium numeric(12,2),
+    gross_premium numeric(12,2),
+    policy_number text NOT NULL,
+    agent_code text,
+    payment_invoice text,
+    commission numeric(12,2),
+    type_of_insurance text NOT NULL,
+    insurance_company text,
+    amount_covered numeric(14,2),
+    client_notes text,
+    status text NOT NULL DEFAULT 'active',
+    created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS clients_hmo_individual (
+    id serial PRIMARY KEY,
+    assured_name text NOT NULL,
+    contact_number text,
+    email text,
+    birthday date,
+    hmo_company text,
+    inception_date date,
+    expiry_date date NOT NULL,
+    agent_code text,
+    policy_number text NOT NULL,
+    mbl_abl text,
+    net_premium numeric(12,2),
+    gross_premium numeric(12,2),
+    commission numeric(12,2),
+    status text NOT NULL DEFAULT 'active',
+    client_notes text,
+    created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS clients_hmo_corporate (
+    id serial PRIMARY KEY,
+    company_name text NOT NULL,
+    number_of_enrollees integer,
+    contact_number text,
+    email text,
+    hmo_company text,
+    inception_date date,
+    expiry_date date NOT NULL,
+    agent_code text,
+    policy_number text NOT NULL,
+    mbl_abl text,
+    net_premium numeric(12,2),
+    gross_premium numeric(12,2),
+    commission numeric(12,2),
+    status text NOT NULL DEFAULT 'active',
+    client_notes text,
+    created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS client_payments (
+    id serial PRIMARY KEY,
+    policy_number text NOT NULL,
+    payment_date date NOT NULL,
+    payment_method text,
+    status text,
+    amount_paid numeric(12,2) NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS company_expenses (
+    id serial PRIMARY KEY,
+    amount numeric(12,2) NOT NULL,
+    expense_category text,
+    payment_method text,
+    department text,
+    expense_date date NOT NULL
+);
+
+-- the ON CONFLICT (policy_number) of the dismissal queue needs the primary key
+CREATE TABLE IF NOT EXISTS dismissed_notifications (
+    policy_number text PRIMARY KEY,
+    dismissed_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- new accounts wait for an admin to set status to 'approved' before they can log in
+CREATE TABLE IF NOT EXISTS users (
+    id serial PRIMARY KEY,
+    username text NOT NULL UNIQUE,
+    password_hash text NOT NULL,
+    email text,
+    status text NOT NULL DEFAULT 'pending',
+    full_name text,
+    agent_number text,
+    contact_number text
+);
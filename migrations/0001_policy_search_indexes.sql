@@ -0,0 +1,29 @@
+-- Trigram indexes behind server-side dashboard search (SEARCH_MODE=server/auto).
+--
+-- The search queries in db_func.py match with col ILIKE '%text%', which a
+-- gin_trgm_ops index can answer without scanning the table. Safe to run more
+-- than once. On a busy database create the indexes by hand with
+-- CREATE INDEX CONCURRENTLY instead, it cannot run inside a transaction.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS clients_nonlife_assured_name_trgm_idx
+    ON clients_nonlife USING gin (assured_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS clients_nonlife_policy_number_trgm_idx
+    ON clients_nonlife USING gin (policy_number gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS clients_nonlife_insurance_company_trgm_idx
+    ON clients_nonlife USING gin (insurance_company gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS clients_hmo_individual_assured_name_trgm_idx
+    ON clients_hmo_individual USING gin (assured_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS clients_hmo_individual_policy_number_trgm_idx
+    ON clients_hmo_individual USING gin (policy_number gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS clients_hmo_individual_hmo_company_trgm_idx
+    ON clients_hmo_individual USING gin (hmo_company gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS clients_hmo_corporate_company_name_trgm_idx
+    ON clients_hmo_corporate USING gin (company_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS clients_hmo_corporate_policy_number_trgm_idx
+    ON clients_hmo_corporate USING gin (policy_number gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS clients_hmo_corporate_hmo_company_trgm_idx
+    ON clients_hmo_corporate USING gin (hmo_company gin_trgm_ops);
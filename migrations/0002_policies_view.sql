@@ -0,0 +1,31 @@
+-- One `policies` view over the three client tables, looked up by policy_number.
+--
+-- Payments, notifications and the HMO dashboard find a policy by its number
+-- without knowing which client table it lives in. The view tags every row
+-- with a policy_kind; a WHERE policy_number = ... (and policy_kind = ...) on
+-- it is pushed down into each UNION ALL branch, so with the indexes below a
+-- lookup is one btree probe per table and branches of another kind are
+-- skipped outright. Being a plain view it is never stale. Safe to run more
+-- than once.
+
+CREATE INDEX IF NOT EXISTS clients_nonlife_policy_number_idx
+    ON clients_nonlife (policy_number);
+CREATE INDEX IF NOT EXISTS clients_hmo_individual_policy_number_idx
+    ON clients_hmo_individual (policy_number);
+CREATE INDEX IF NOT EXISTS clients_hmo_corporate_policy_number_idx
+    ON clients_hmo_corporate (policy_number);
+CREATE INDEX IF NOT EXISTS client_payments_policy_number_idx
+    ON client_payments (policy_number);
+
+CREATE OR REPLACE VIEW policies AS
+    SELECT 'nonlife'::text AS policy_kind, id, policy_number, assured_name AS client_name,
+           gross_premium, expiry_date, status
+    FROM clients_nonlife
+    UNION ALL
+    SELECT 'hmo_individual'::text, id, policy_number, assured_name,
+           gross_premium, expiry_date, status
+    FROM clients_hmo_individual
+    UNION ALL
+    SELECT 'hmo_corporate'::text, id, policy_number, company_name,
+           gross_premium, expiry_date, status
+    FROM clients_hmo_corporate;
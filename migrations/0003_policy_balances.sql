@@ -0,0 +1,33 @@
+-- Running total paid per policy, kept next to client_payments.
+--
+-- Recording a payment used to SUM every earlier payment of the policy to
+-- decide between Paid and Partial, which grows with the payment history
+-- and lets two agents paying the same policy at once both read the old
+-- total. db_func.record_payment() now bumps the policy's row here with an
+-- upsert in the same transaction as the payment insert: the row lock makes
+-- concurrent payments of one policy queue up, and the new total comes back
+-- from the same statement.
+--
+-- The INSERT ... SELECT at the end is the backfill of existing payments; it
+-- is the same statement db_func.backfill_policy_balances() runs, so running
+-- this file again just re-syncs every total. Safe to run more than once;
+-- src/migrate.py runs it as one transaction, which LOCK TABLE needs.
+
+CREATE TABLE IF NOT EXISTS policy_balances (
+    policy_number text PRIMARY KEY,
+    total_paid numeric NOT NULL DEFAULT 0,
+    payment_count integer NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- keep payments from being recorded between the SUM and the upsert
+LOCK TABLE client_payments IN SHARE MODE;
+INSERT INTO policy_balances (policy_number, total_paid, payment_count)
+SELECT policy_number, COALESCE(SUM(amount_paid), 0), COUNT(*)
+FROM client_payments
+WHERE policy_number IS NOT NULL
+GROUP BY policy_number
+ON CONFLICT (policy_number) DO UPDATE
+SET total_paid = EXCLUDED.total_paid,
+    payment_count = EXCLUDED.payment_count,
+    updated_at = CURRENT_TIMESTAMP;
@@ -0,0 +1,19 @@
+-- Indexes behind the dashboards' delta refreshes.
+--
+-- Once a dashboard table is fully loaded, refreshing it only fetches the rows
+-- whose updated_at is newer than the last load (db_func.fetch_table_changes())
+-- and reads the new watermark with max(updated_at). Both are an index range
+-- scan with these, instead of a sequential scan of the whole client table.
+-- The defaults make sure newly inserted rows carry a timestamp too. Safe to
+-- run more than once.
+
+ALTER TABLE clients_nonlife ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE clients_hmo_individual ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE clients_hmo_corporate ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS clients_nonlife_updated_at_idx
+    ON clients_nonlife (updated_at);
+CREATE INDEX IF NOT EXISTS clients_hmo_individual_updated_at_idx
+    ON clients_hmo_individual (updated_at);
+CREATE INDEX IF NOT EXISTS clients_hmo_corporate_updated_at_idx
+    ON clients_hmo_corporate (updated_at);
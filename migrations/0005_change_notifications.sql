@@ -0,0 +1,60 @@
+-- Tell every running app when a row it may be showing changes.
+--
+-- Several agents work against the same database. Each of these triggers
+-- sends a small NOTIFY on the row_changes channel per row written, with a
+-- JSON payload {"table": ..., "id": ..., "op": "insert" | "update" | "delete"}.
+-- The app LISTENs on its own connection (src/change_feed.py) and patches the
+-- tables on screen, so changes made elsewhere show up without polling.
+-- Notifications are only delivered once the writing transaction commits, and
+-- duplicates within one transaction are folded into one by the server.
+--
+-- The trigger argument names the column sent as "id"; dismissed_notifications
+-- has no id and is keyed by policy_number. Safe to run more than once.
+
+CREATE OR REPLACE FUNCTION notify_row_change() RETURNS trigger AS $$
+DECLARE
+    changed_row jsonb;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed_row := to_jsonb(OLD);
+    ELSE
+        changed_row := to_jsonb(NEW);
+    END IF;
+    PERFORM pg_notify('row_changes', jsonb_build_object(
+        'table', TG_TABLE_NAME,
+        'id', changed_row ->> TG_ARGV[0],
+        'op', lower(TG_OP)
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS clients_nonlife_notify ON clients_nonlife;
+CREATE TRIGGER clients_nonlife_notify
+    AFTER INSERT OR UPDATE OR DELETE ON clients_nonlife
+    FOR EACH ROW EXECUTE FUNCTION notify_row_change('id');
+
+DROP TRIGGER IF EXISTS clients_hmo_individual_notify ON clients_hmo_individual;
+CREATE TRIGGER clients_hmo_individual_notify
+    AFTER INSERT OR UPDATE OR DELETE ON clients_hmo_individual
+    FOR EACH ROW EXECUTE FUNCTION notify_row_change('id');
+
+DROP TRIGGER IF EXISTS clients_hmo_corporate_notify ON clients_hmo_corporate;
+CREATE TRIGGER clients_hmo_corporate_notify
+    AFTER INSERT OR UPDATE OR DELETE ON clients_hmo_corporate
+    FOR EACH ROW EXECUTE FUNCTION notify_row_change('id');
+
+DROP TRIGGER IF EXISTS client_payments_notify ON client_payments;
+CREATE TRIGGER client_payments_notify
+    AFTER INSERT OR UPDATE OR DELETE ON client_payments
+    FOR EACH ROW EXECUTE FUNCTION notify_row_change('id');
+
+DROP TRIGGER IF EXISTS company_expenses_notify ON company_expenses;
+CREATE TRIGGER company_expenses_notify
+    AFTER INSERT OR UPDATE OR DELETE ON company_expenses
+    FOR EACH ROW EXECUTE FUNCTION notify_row_change('id');
+
+DROP TRIGGER IF EXISTS dismissed_notifications_notify ON dismissed_notifications;
+CREATE TRIGGER dismissed_notifications_notify
+    AFTER INSERT OR UPDATE OR DELETE ON dismissed_notifications
+    FOR EACH ROW EXECUTE FUNCTION notify_row_change('policy_number');
@@ -0,0 +1,23 @@
+-- One row per policy number in each client table.
+--
+-- Row actions (archive, restore, delete, payments, View Policy and its
+-- Update buttons) now go by the primary key id. Policy numbers are still how
+-- payments, balances, dismissals and the `policies` view find a policy, so
+-- they get unique indexes, which replace the plain ones from
+-- migrations/0002_policies_view.sql and stop a second row with the same
+-- number from being added.
+--
+-- Fails if a table already holds duplicates; list them with
+--     SELECT policy_number, count(*) FROM clients_nonlife GROUP BY 1 HAVING count(*) > 1;
+-- and resolve them first. Safe to run more than once.
+
+CREATE UNIQUE INDEX IF NOT EXISTS clients_nonlife_policy_number_key
+    ON clients_nonlife (policy_number);
+CREATE UNIQUE INDEX IF NOT EXISTS clients_hmo_individual_policy_number_key
+    ON clients_hmo_individual (policy_number);
+CREATE UNIQUE INDEX IF NOT EXISTS clients_hmo_corporate_policy_number_key
+    ON clients_hmo_corporate (policy_number);
+
+DROP INDEX IF EXISTS clients_nonlife_policy_number_idx;
+DROP INDEX IF EXISTS clients_hmo_individual_policy_number_idx;
+DROP INDEX IF EXISTS clients_hmo_corporate_policy_number_idx;
@@ -0,0 +1,41 @@
+-- Indexes shaped after the queries the app runs most.
+--
+-- Every dashboard, the notification center and the exports filter the
+-- client tables on status, but most rows are active and a plain status
+-- index would rarely be chosen. Partial indexes only hold the rows a query
+-- can want:
+--   * active rows by (expiry_date, policy_number), the order the
+--     notification center shows them in and pages through; status is the
+--     index predicate, a leading status column would only repeat it
+--   * archived rows by id, so the archives tab, its count and the archive
+--     export read the few archived rows instead of the whole table
+-- Payments are looked up per policy and read in payment_date order, so the
+-- payment index gets the date as a second column and replaces the plain
+-- policy_number index from migrations/0002_policies_view.sql.
+--
+-- users.username is looked up on every login; databases that predate
+-- migrations/0000_baseline_schema.sql may lack its unique constraint, the
+-- index below has the name the constraint would have and is skipped where
+-- it exists. Fails if two accounts share a username. Safe to run more than
+-- once.
+
+CREATE INDEX IF NOT EXISTS clients_nonlife_active_expiry_idx
+    ON clients_nonlife (expiry_date, policy_number) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS clients_hmo_individual_active_expiry_idx
+    ON clients_hmo_individual (expiry_date, policy_number) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS clients_hmo_corporate_active_expiry_idx
+    ON clients_hmo_corporate (expiry_date, policy_number) WHERE status = 'active';
+
+CREATE INDEX IF NOT EXISTS clients_nonlife_archived_idx
+    ON clients_nonlife (id) WHERE status = 'archived';
+CREATE INDEX IF NOT EXISTS clients_hmo_individual_archived_idx
+    ON clients_hmo_individual (id) WHERE status = 'archived';
+CREATE INDEX IF NOT EXISTS clients_hmo_corporate_archived_idx
+    ON clients_hmo_corporate (id) WHERE status = 'archived';
+
+CREATE INDEX IF NOT EXISTS client_payments_policy_number_payment_date_idx
+    ON client_payments (policy_number, payment_date);
+DROP INDEX IF EXISTS client_payments_policy_number_idx;
+
+CREATE UNIQUE INDEX IF NOT EXISTS users_username_key
+    ON users (username);
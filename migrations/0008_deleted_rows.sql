@@ -0,0 +1,48 @@
+-- Remember client rows deleted outright, for the dashboards' delta refreshes.
+--
+-- A refresh of a fully loaded dashboard only fetches the rows whose
+-- updated_at is past its watermark (see migrations/0004_updated_at_indexes.sql),
+-- but a deleted row leaves no updated_at behind. The app itself only ever
+-- moves policies to status 'deleted'; rows removed by hand or by another
+-- tool are recorded here by a statement-level trigger instead, and
+-- db_func.fetch_table_changes() reads them alongside the changed rows. Both
+-- that read and the watermark (newest updated_at or deleted_at) are index
+-- lookups, so a refresh no longer has to count the whole table.
+--
+-- TRUNCATE is not recorded; reopen the app after truncating a client table.
+-- Hard deletes are rare, so the table stays small. Safe to run more than once.
+
+CREATE TABLE IF NOT EXISTS deleted_rows (
+    table_name text NOT NULL,
+    id integer NOT NULL,
+    deleted_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS deleted_rows_table_name_deleted_at_idx
+    ON deleted_rows (table_name, deleted_at);
+
+CREATE OR REPLACE FUNCTION record_deleted_rows() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO deleted_rows (table_name, id)
+    SELECT TG_TABLE_NAME, id FROM deleted;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS clients_nonlife_deleted_rows ON clients_nonlife;
+CREATE TRIGGER clients_nonlife_deleted_rows
+    AFTER DELETE ON clients_nonlife
+    REFERENCING OLD TABLE AS deleted
+    FOR EACH STATEMENT EXECUTE FUNCTION record_deleted_rows();
+
+DROP TRIGGER IF EXISTS clients_hmo_individual_deleted_rows ON clients_hmo_individual;
+CREATE TRIGGER clients_hmo_individual_deleted_rows
+    AFTER DELETE ON clients_hmo_individual
+    REFERENCING OLD TABLE AS deleted
+    FOR EACH STATEMENT EXECUTE FUNCTION record_deleted_rows();
+
+DROP TRIGGER IF EXISTS clients_hmo_corporate_deleted_rows ON clients_hmo_corporate;
+CREATE TRIGGER clients_hmo_corporate_deleted_rows
+    AFTER DELETE ON clients_hmo_corporate
+    REFERENCING OLD TABLE AS deleted
+    FOR EACH STATEMENT EXECUTE FUNCTION record_deleted_rows();
@@ -1,24 +1,24 @@
 import os
 import sys
 import db_func
-import csv
+import table_model
+from query_executor import QueryExecutor
+from search_backend import create_search_backend
+from notification_model import PAGED_BUCKET, attach_notification_model
+from dismissal_queue import DismissalQueue
+from export_jobs import ExportJob, ExportJobQueue, ExportJobsPanel
+from ui_loader import setup_ui
+from lazy_tabs import LazyTabs
+from change_feed import ChangeFeed
+from record_cache import RecordCache
 from PyQt6.QtWidgets import (
    QApplication, QWidget, QHeaderView,
-   QAbstractItemView, QMessageBox, QSizePolicy,
-   QTableWidget, QLabel, QFrame,
+   QAbstractItemView, QMessageBox, QTableView,
    QPushButton, QHBoxLayout, QVBoxLayout,
    QFileDialog, QFormLayout, QLineEdit,
    QComboBox, QDateEdit, QDialog
 )
-from PyQt6.QtCore import QMetaObject, QDate
-from PyQt6 import uic
-from datetime import datetime
-from openpyxl import Workbook
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from PyQt6.QtCore import QMetaObject, QDate, QTimer
 from decimal import Decimal
 
 if sys.platform.startswith('linux'):
@@ -31,6 +31,15 @@ elif sys.platform.startswith('darwin'):
 else:
     print("Unknown operating system")
 
+# milliseconds of no typing before the search runs
+SEARCH_DEBOUNCE_MS = 250
+
+NONLIFE_HEADERS = ["ID", "Assured Name", "Type of Insurance", "Policy Number", "Expiry Date"]
+HMO_HEADERS = ["ID", "Assured Name", "Type of HMO", "Policy Number", "Expiry Date"]
+
+# page of current_active_tab -> its tab in db_func.DASHBOARD_TABLES
+NAVIGATION_TABS = {1: "clients", 2: "companies", 3: "collection", 4: "archives"}
+
 # Monkey-patch to disable auto-connections globally
 QMetaObject.connectSlotsByName = lambda *args, **kwargs: None
 
@@ -40,10 +49,15 @@ class LoginPage(QWidget):
         self.initUI()
 
     def initUI(self):
-        uic.loadUi("QtGUI/login.ui", self)
+        setup_ui(self, "login.ui")
+        self.query_executor = QueryExecutor(self, max_threads=1)
         self.login_button.clicked.connect(self.on_login)
         self.register_button.clicked.connect(self.on_register)
 
+    def set_buttons_enabled(self, enabled):
+        self.login_button.setEnabled(enabled)
+        self.register_button.setEnabled(enabled)
+
     def on_login(self):
         username = self.login_username.text().strip()
         password = self.login_password.text().strip()
@@ -52,15 +66,25 @@ class LoginPage(QWidget):
             QMessageBox.warning(self, "Login", "Username and password are required.")
             return
 
-        if db_func.login_user(username, password):
+        # bcrypt and the round trip run in the background, the window keeps repainting
+        self.set_buttons_enabled(False)
+        self.query_executor.submit(
+            "login", db_func.login_user, username, password,
+            on_result=lambda success: self.on_login_finished(username, success),
+            on_error=lambda e: self.on_login_finished(username, False)
+        )
+
+    def on_login_finished(self, username, success):
+        self.set_buttons_enabled(True)
+
+        if success:
             QMessageBox.information(self, "Login", "Login successful!")
 
             # Launch main window
             self.main_window = MainWindow(current_username=username)
             self.main_window.show()
             self.close()  # close login window
-        
-        if not db_func.login_user(username, password):
+        else:
             QMessageBox.warning(self, "Login", "Invalid credentials or account not yet approved.")
 
     def on_register(self):
@@ -71,7 +95,17 @@ class LoginPage(QWidget):
             QMessageBox.warning(self, "Register", "Username and password are required.")
             return
 
-        if db_func.register_user(username, password, email=None):
+        self.set_buttons_enabled(False)
+        self.query_executor.submit(
+            "register", db_func.register_user, username, password, email=None,
+            on_result=self.on_register_finished,
+            on_error=lambda e: self.on_register_finished(False)
+        )
+
+    def on_register_finished(self, success):
+        self.set_buttons_enabled(True)
+
+        if success:
             QMessageBox.information(self, "Register", "Registration will be reviewed!")
         else:
             QMessageBox.warning(self, "Register", "Registration failed. Username may already exist.")
@@ -131,15 +165,52 @@ class AddExpenseDialog(QDialog):
 class MainWindow(QWidget):
     def __init__(self, current_username=None):
         super().__init__()
-        uic.loadUi("QtGUI/form.ui", self)
+        setup_ui(self, "form.ui")
         self.current_username = current_username
+
+        # each navigation tab is set up when first opened, or prefetched once the window has painted
+        self.lazy_tabs = LazyTabs(self.current_active_tab, self)
+        setups = {
+            "clients": self.setup_clients_tab,
+            "companies": self.setup_companies_tab,
+            "collection": self.setup_collection_tab,
+            "archives": self.setup_archives_tab,
+        }
+        for index, tab in NAVIGATION_TABS.items():
+            self.lazy_tabs.register(index, setups[tab], self.tab_prefetch(index, tab))
+
+        # database work runs here, results come back to the GUI thread through signals
+        # no more workers than connections they can check out, the rest is kept for the GUI thread
+        self.query_executor = QueryExecutor(self, max_threads=db_func.POOL_MAX_SIZE - db_func.POOL_MAIN_THREAD_RESERVE)
+        # policies opened in the View Policy panes, and the rows around the current one
+        self.record_cache = RecordCache()
+        # client table -> id of the policy its View Policy pane shows, the Update buttons write to it
+        self.viewed_policy_ids = {}
+
+        # notification cards are painted by a delegate, only the ones on screen
+        self.notification_model = attach_notification_model(self.notifications_center)
+        # exports run on their own workers, several at once, listed in the Exports panel
+        self.export_jobs = ExportJobQueue(self)
+        self.export_jobs_panel = ExportJobsPanel(self.export_jobs, self)
+        self.export_jobs.failed.connect(self.on_export_failed)
+
+        self.dismissal_queue = DismissalQueue(self.query_executor, self)
+        self.notification_model.dismissed.connect(self.dismissal_queue.add)
+        self.notification_model.load_more_requested.connect(self.load_more_notifications)
         self.showMaximized()
         
-        # connect to DB
-        db_func.connect()
-
+        # the notifications load opens the pool's first connection on a worker,
+        # so the window paints without waiting on the server
         self.load_expiring_policies_grouped(self)
 
+        # rows other workstations write are patched into what is on screen, see change_feed.py
+        self.change_feed = ChangeFeed(self)
+        self.change_feed.changed.connect(self.on_remote_changes)
+        self.lazy_tabs.first_painted.connect(self.change_feed.start)
+
+        # paged tables give their server cursor back when their tab is left
+        self.current_active_tab.currentChanged.connect(self.release_hidden_table_sources)
+
         # connect button to function
         self.navigation_home_button.clicked.connect(self.on_home_button_clicked)
         self.navigation_clients_button.clicked.connect(self.on_clients_button_clicked)
@@ -155,25 +226,32 @@ class MainWindow(QWidget):
         self.clients_hmo_search_edit.textChanged.connect(self.on_search_text_changed)
         self.archives_search_edit.textChanged.connect(self.on_search_text_changed)
         self.archives_hmo_search_edit.textChanged.connect(self.on_search_text_changed)
+
+        # search once typing pauses instead of on every keystroke
+        self.search_backend = create_search_backend()
+        self.pending_search_text = ""
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search)
         
         # add client buttons
         self.clients_non_life_add_client_submit_push_button.clicked.connect(self.on_clients_non_life_add_client_submit_push_button_clicked)
         self.clients_hmo_add_client_individual_submit_push_button.clicked.connect(self.on_clients_hmo_add_client_individual_submit_push_button_clicked)
         self.clients_hmo_add_client_corporate_submit_push_button.clicked.connect(self.on_clients_hmo_add_client_corporate_submit_push_button_clicked)
 
-        # set view policy fields to read only
-        self.set_view_policy_fields_readonly(True)
-        self.set_hmo_individual_view_policy_fields_readonly(True)
-        self.set_hmo_corporate_view_policy_fields_readonly(True)
-
         # allow view policy fields to be edited
         self.clients_non_life_view_policy_edit_push_button.clicked.connect(self.on_clients_non_life_view_policy_edit_push_button_clicked)
         self.clients_hmo_view_policy_individual_edit_push_button.clicked.connect(self.on_clients_hmo_view_policy_individual_edit_push_button_clicked)
         self.clients_hmo_view_policy_corporate_edit_push_button.clicked.connect(self.on_clients_hmo_view_policy_corporate_edit_push_button_clicked)
 
         # client table row double click handlers
-        self.clients_non_life_dashboard_table.cellDoubleClicked.connect(self.on_clients_non_life_dashboard_table_row_double_clicked)
-        self.clients_hmo_dashboard_table.cellDoubleClicked.connect(self.on_clients_hmo_dashboard_table_cell_double_clicked)
+        self.clients_non_life_dashboard_table.doubleClicked.connect(
+            lambda index: self.on_clients_non_life_dashboard_table_row_double_clicked(
+                table_model.source_row(self.clients_non_life_dashboard_table, index), index.column()))
+        self.clients_hmo_dashboard_table.doubleClicked.connect(
+            lambda index: self.on_clients_hmo_dashboard_table_cell_double_clicked(
+                table_model.source_row(self.clients_hmo_dashboard_table, index), index.column()))
 
         # update policy details button
         self.clients_non_life_view_policy_update_push_button.clicked.connect(self.on_clients_non_life_view_policy_update_push_button_clicked)
@@ -205,44 +283,6 @@ class MainWindow(QWidget):
         self.archives_non_life_dashboard_delete_button.clicked.connect(self.on_archives_non_life_dashboard_delete_button_clicked)
         self.archives_hmo_dashboard_delete_button.clicked.connect(self.on_archives_hmo_dashboard_delete_button_clicked)
 
-        # REVISE: move to separate functions later
-        # resize cols to header/content
-        self.archives_non_life_dashboard_table.resizeColumnsToContents()
-        self.archives_non_life_dashboard_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.archives_hmo_dashboard_table.resizeColumnsToContents()
-        self.archives_hmo_dashboard_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.clients_non_life_dashboard_table.resizeColumnsToContents()
-        self.clients_non_life_dashboard_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.clients_hmo_dashboard_table.resizeColumnsToContents()
-        self.clients_hmo_dashboard_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.companies_non_life_dashboard_table.resizeColumnsToContents()
-        self.companies_non_life_dashboard_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.companies_hmo_dashboard_table.resizeColumnsToContents()
-        self.companies_hmo_dashboard_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.client_payments_table.resizeColumnsToContents()
-        self.client_payments_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.company_expenses_table.resizeColumnsToContents()
-        self.company_expenses_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-        # sort data when header is clicked
-        self.archives_non_life_dashboard_table.setSortingEnabled(True)
-        self.archives_hmo_dashboard_table.setSortingEnabled(True)
-        self.client_payments_table.setSortingEnabled(True)
-        self.company_expenses_table.setSortingEnabled(True)
-        self.clients_non_life_dashboard_table.setSortingEnabled(True)
-        self.clients_hmo_dashboard_table.setSortingEnabled(True)
-        
-        # REVISE: move to separate functions later
-        # display result count per table
-        self.archives_non_life_dashboard_count.setText( str(self.archives_non_life_dashboard_table.rowCount()) )
-        self.archives_hmo_dashboard_count.setText( str(self.archives_hmo_dashboard_table.rowCount()) )
-        self.client_payments_count.setText( str(self.client_payments_table.rowCount()) )
-        self.company_expenses_count.setText( str(self.company_expenses_table.rowCount()) )
-        self.clients_hmo_dashboard_count.setText( str(self.clients_hmo_dashboard_table.rowCount()) )
-        self.clients_non_life_dashboard_count.setText( str(self.clients_non_life_dashboard_table.rowCount()) )
-        self.companies_hmo_dashboard_count.setText( str(self.companies_hmo_dashboard_table.rowCount()) )
-        self.companies_non_life_dashboard_count.setText( str(self.companies_non_life_dashboard_table.rowCount()) )
-    
         # edit account buttons
         self.account_edit_button.clicked.connect(self.enable_account_editing)
         self.account_save_button.clicked.connect(self.save_account_changes)
@@ -265,6 +305,101 @@ class MainWindow(QWidget):
         #self.export_clients_hmo_corporate_pdf_button.clicked.connect(self.export_clients_hmo_corporate_to_pdf)
 
 
+    def setup_dashboard_table(self, table_view, headers, stretch_section, sortable=True):
+        # every dashboard table is a QTableView backed by a RecordTableModel
+        table_model.attach_model(table_view, headers, self.query_executor)
+        # resize cols to header/content
+        table_view.resizeColumnsToContents()
+        table_view.horizontalHeader().setSectionResizeMode(stretch_section, QHeaderView.ResizeMode.Stretch)
+        # sort data when header is clicked
+        table_view.setSortingEnabled(sortable)
+
+    def setup_clients_tab(self):
+        self.setup_dashboard_table(self.clients_non_life_dashboard_table, NONLIFE_HEADERS, 1)
+        self.setup_dashboard_table(self.clients_hmo_dashboard_table, HMO_HEADERS, 1)
+        self.clients_non_life_dashboard_count.setText("0")
+        self.clients_hmo_dashboard_count.setText("0")
+
+        # details of the rows near the current one are cached before they are double-clicked
+        self.clients_non_life_dashboard_table.selectionModel().currentRowChanged.connect(
+            lambda: db_func.prefetch_policy_details(self, self.clients_non_life_dashboard_table, False))
+        self.clients_hmo_dashboard_table.selectionModel().currentRowChanged.connect(
+            lambda: db_func.prefetch_policy_details(self, self.clients_hmo_dashboard_table, True))
+
+        # set view policy fields to read only
+        self.set_view_policy_fields_readonly(True)
+        self.set_hmo_individual_view_policy_fields_readonly(True)
+        self.set_hmo_corporate_view_policy_fields_readonly(True)
+
+    def setup_companies_tab(self):
+        self.setup_dashboard_table(self.companies_non_life_dashboard_table,
+                                   ["ID", "Assured Name", "Type of Insurance", "Insurance Company", "Expiry Date"], 1, False)
+        self.setup_dashboard_table(self.companies_hmo_dashboard_table,
+                                   ["ID", "Assured Name", "Type of HMO", "Insurance Company", "Expiry Date"], 1, False)
+        self.companies_non_life_dashboard_count.setText("0")
+        self.companies_hmo_dashboard_count.setText("0")
+
+    def setup_collection_tab(self):
+        self.setup_dashboard_table(self.client_payments_table,
+                                   ["Client Name", "Policy Number", "Amount Paid", "Payment Method", "Total Premium Due", "Status", "Date"], 1)
+        table_model.attach_model(self.company_expenses_table, ["Amount", "Expense Category", "Payment Method", "Department", "Date"])
+        self.company_expenses_table.resizeColumnsToContents()
+        self.company_expenses_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.company_expenses_table.setSortingEnabled(True)
+        self.client_payments_count.setText("0")
+        self.company_expenses_count.setText("0")
+
+    def setup_archives_tab(self):
+        self.setup_dashboard_table(self.archives_non_life_dashboard_table, NONLIFE_HEADERS, 0)
+        self.setup_dashboard_table(self.archives_hmo_dashboard_table, HMO_HEADERS, 0)
+        self.archives_non_life_dashboard_count.setText("0")
+        self.archives_hmo_dashboard_count.setText("0")
+
+    def tab_prefetch(self, index, tab):
+        return lambda done: db_func.prefetch_dashboard_tables(self, tab, lambda: self.lazy_tabs.visited(index), done)
+
+    def release_hidden_table_sources(self, index):
+        current_tab = self.current_active_tab.widget(index)
+        for tab_index in range(self.current_active_tab.count()):
+            tab = self.current_active_tab.widget(tab_index)
+            if tab is current_tab:
+                continue
+            for table in tab.findChildren(QTableView):
+                model = table_model.source_model(table)
+                if isinstance(model, table_model.RecordTableModel):
+                    model.release_source()
+
+    def closeEvent(self, event):
+        # write pending dismissals, then drop queued loads and let running queries hand their connections back
+        self.dismissal_queue.flush_now()
+        self.change_feed.stop()
+        self.export_jobs.shutdown()
+        self.query_executor.shutdown()
+        super().closeEvent(event)
+
+    def on_remote_changes(self, changes):
+        """
+        Update the page on screen after other workstations changed rows it shows.
+
+        Hidden pages are left alone, opening one refreshes it anyway.
+        """
+        for table, ids in changes.items():
+            if table in db_func.POLICY_DETAIL_QUERIES:
+                # notifications carry ids as text
+                self.record_cache.invalidate(table, None if ids is None else [int(i) for i in ids])
+
+        if self.query_executor.is_busy(db_func.TAB_LOAD):
+            # a load already in flight may have read the rows before the change, apply it after
+            self.change_feed.requeue(changes)
+            return
+
+        index = self.current_active_tab.currentIndex()
+        tab = NAVIGATION_TABS.get(index)
+        if index == 0 and any(table in db_func.NOTIFICATION_TABLES for table in changes):
+            self.load_expiring_policies_grouped(self)
+        elif tab is not None and any(tab in db_func.TABLE_TABS.get(table, ()) for table in changes):
+            db_func.sync_dashboard_tables(self, tab)
+
     #### Navigation Tab Button Functions
     def on_home_button_clicked(self):
         self.current_active_tab.setCurrentIndex(0)
@@ -272,7 +407,7 @@ class MainWindow(QWidget):
 
     def on_clients_button_clicked(self):
         self.current_active_tab.setCurrentIndex(1)
-        db_func.fetch_client_table_data(self)
+        db_func.refresh_client_tables(self)
 
     def on_clients_non_life_dashboard_table_row_double_clicked(self, row, column):
         db_func.handle_nonlife_row_double_click(self, row, column)
@@ -321,12 +456,11 @@ class MainWindow(QWidget):
         
     def on_companies_button_clicked(self):
         self.current_active_tab.setCurrentIndex(2)
-        db_func.fetch_company_table_data(self)
+        db_func.refresh_company_tables(self)
       
     def on_collection_button_clicked(self):
         self.current_active_tab.setCurrentIndex(3)
-        db_func.fetch_all_client_payments(self)
-        db_func.fetch_company_expenses(self)
+        db_func.refresh_collection_tables(self)
 
     def on_company_expenses_add_expense_push_button_clicked(self):
         dialog = AddExpenseDialog(self)
@@ -337,7 +471,7 @@ class MainWindow(QWidget):
       
     def on_archives_button_clicked(self):
         self.current_active_tab.setCurrentIndex(4)
-        db_func.fetch_archive_table_data(self)
+        db_func.refresh_archive_tables(self)
 
     def on_archives_non_life_dashboard_restore_button_clicked(self):
         db_func.restore_nonlife_client(self)
@@ -355,109 +489,60 @@ class MainWindow(QWidget):
         """Update the result count labels for all tables based on visible rows."""
         try:
             # Archives tables
-            if hasattr(self, 'archives_non_life_dashboard_table'):
-                visible_archives_nonlife = sum(1 for row in range(self.archives_non_life_dashboard_table.rowCount()) 
-                                             if not self.archives_non_life_dashboard_table.isRowHidden(row))
+            if self.archives_non_life_dashboard_table.model() is not None:
+                visible_archives_nonlife = table_model.visible_row_count(self.archives_non_life_dashboard_table)
                 self.archives_non_life_dashboard_count.setText(str(visible_archives_nonlife))
             
-            if hasattr(self, 'archives_hmo_dashboard_table'):
-                visible_archives_hmo = sum(1 for row in range(self.archives_hmo_dashboard_table.rowCount()) 
-                                         if not self.archives_hmo_dashboard_table.isRowHidden(row))
+            if self.archives_hmo_dashboard_table.model() is not None:
+                visible_archives_hmo = table_model.visible_row_count(self.archives_hmo_dashboard_table)
                 self.archives_hmo_dashboard_count.setText(str(visible_archives_hmo))
             
             # Client tables
-            if hasattr(self, 'clients_non_life_dashboard_table'):
-                visible_clients_nonlife = sum(1 for row in range(self.clients_non_life_dashboard_table.rowCount()) 
-                                            if not self.clients_non_life_dashboard_table.isRowHidden(row))
+            if self.clients_non_life_dashboard_table.model() is not None:
+                visible_clients_nonlife = table_model.visible_row_count(self.clients_non_life_dashboard_table)
                 self.clients_non_life_dashboard_count.setText(str(visible_clients_nonlife))
             
-            if hasattr(self, 'clients_hmo_dashboard_table'):
-                visible_clients_hmo = sum(1 for row in range(self.clients_hmo_dashboard_table.rowCount()) 
-                                        if not self.clients_hmo_dashboard_table.isRowHidden(row))
+            if self.clients_hmo_dashboard_table.model() is not None:
+                visible_clients_hmo = table_model.visible_row_count(self.clients_hmo_dashboard_table)
                 self.clients_hmo_dashboard_count.setText(str(visible_clients_hmo))
             
             # Company tables
-            if hasattr(self, 'companies_non_life_dashboard_table'):
-                visible_companies_nonlife = sum(1 for row in range(self.companies_non_life_dashboard_table.rowCount()) 
-                                              if not self.companies_non_life_dashboard_table.isRowHidden(row))
+            if self.companies_non_life_dashboard_table.model() is not None:
+                visible_companies_nonlife = table_model.visible_row_count(self.companies_non_life_dashboard_table)
                 self.companies_non_life_dashboard_count.setText(str(visible_companies_nonlife))
             
-            if hasattr(self, 'companies_hmo_dashboard_table'):
-                visible_companies_hmo = sum(1 for row in range(self.companies_hmo_dashboard_table.rowCount()) 
-                                          if not self.companies_hmo_dashboard_table.isRowHidden(row))
+            if self.companies_hmo_dashboard_table.model() is not None:
+                visible_companies_hmo = table_model.visible_row_count(self.companies_hmo_dashboard_table)
                 self.companies_hmo_dashboard_count.setText(str(visible_companies_hmo))
             
             # Collection tables
-            if hasattr(self, 'client_payments_table'):
-                visible_client_payments = sum(1 for row in range(self.client_payments_table.rowCount()) 
-                                            if not self.client_payments_table.isRowHidden(row))
+            if self.client_payments_table.model() is not None:
+                visible_client_payments = table_model.visible_row_count(self.client_payments_table)
                 self.client_payments_count.setText(str(visible_client_payments))
             
-            if hasattr(self, 'company_expenses_table'):
-                visible_company_expenses = sum(1 for row in range(self.company_expenses_table.rowCount()) 
-                                             if not self.company_expenses_table.isRowHidden(row))
+            if self.company_expenses_table.model() is not None:
+                visible_company_expenses = table_model.visible_row_count(self.company_expenses_table)
                 self.company_expenses_count.setText(str(visible_company_expenses))
         except AttributeError as e:
             # Some tables might not be loaded yet
             pass
 
     def on_search_text_changed(self, text):
-        """Filter visible table rows based on the search text."""
+        """Remember the search text and (re)start the debounce timer."""
         # Get the sender widget to determine which search box triggered this
         sender = self.sender()
-        
-        # Determine the search text based on the current widget or sender
-        if sender:
-            text = sender.text().strip().lower()
-        else:
-            text = text.strip().lower()
-            
+        self.pending_search_text = sender.text() if sender else text
+        self.search_timer.start()
+
+    def apply_search(self):
+        """Search the tables of the current tab, in memory or on the server (SEARCH_MODE)."""
+        text = self.pending_search_text.strip().lower()
         current_tab = self.current_active_tab.currentWidget()
-        current_tab_index = self.current_active_tab.currentIndex()
-        
-        # Debug: Print current tab info
-        print(f"Search triggered on tab index: {current_tab_index}")
-        
-        # If search text is empty, show all rows
-        if not text:
-            tables = current_tab.findChildren(QTableWidget)
-            print(f"Clearing search - found {len(tables)} tables")
-            for table in tables:
-                for row in range(table.rowCount()):
-                    table.setRowHidden(row, False)
-            self.update_table_counts()
-            return
-        
+
         # Search through all tables in the current tab
-        tables = current_tab.findChildren(QTableWidget)
+        tables = current_tab.findChildren(QTableView)
         print(f"Searching '{text}' - found {len(tables)} tables")
-        
-        # If no tables found, return early (like home tab)
-        if not tables:
-            print("No tables found in current tab")
-            return
-            
-        for table in tables:
-            print(f"Searching table: {table.objectName()} with {table.rowCount()} rows")
-            # Only search if table is visible and has data
-            if table.isVisible() and table.rowCount() > 0:
-                hidden_count = 0
-                for row in range(table.rowCount()):
-                    match = False
-                    # Search through all columns for the text
-                    for col in range(table.columnCount()):
-                        item = table.item(row, col)
-                        if item and item.text() and text in item.text().lower():
-                            match = True
-                            break
-                    # Hide row if no match found
-                    table.setRowHidden(row, not match)
-                    if not match:
-                        hidden_count += 1
-                print(f"Hidden {hidden_count} rows in {table.objectName()}")
-        
-        # Update the counts after filtering
-        self.update_table_counts()
+        self.search_backend.search(self, tables, text)
 
     
     def on_account_button_clicked(self):
@@ -574,446 +659,105 @@ class MainWindow(QWidget):
         ]:
             widget.setReadOnly(readonly)
 
-    def create_section_label(self, text):
-        label = QLabel(text)
-        label.setStyleSheet("font-weight: bold; font-size: 18px; margin-top: 20px; margin-bottom: 10px;")
-        return label
-
-    def create_notification_card(self, policy_number, client_name, expiry_date, color):
-        frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {color};
-                border: 1px solid #aaa;
-                border-radius: 6px;
-                padding: 10px;
-            }}
-        """)
-        frame_layout = QHBoxLayout(frame)
-
-        days_left = (expiry_date - datetime.now().date()).days
-        message = f"Policy number {policy_number} insured to {client_name} is about to expire on {expiry_date}."
-        if days_left <= 0:
-            message = f"Policy number {policy_number} insured to {client_name} expired on {expiry_date}."
-
-        label = QLabel(message)
-        label.setWordWrap(True)
-        label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-
-        dismiss_button = QPushButton("Dismiss")
-        dismiss_button.setFixedWidth(80)
-
-        def dismiss_policy():
-            try:
-                conn = db_func.connect()
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO dismissed_notifications (policy_number, dismissed_at)
-                    VALUES (%s, CURRENT_TIMESTAMP)
-                    ON CONFLICT (policy_number) DO NOTHING;
-                """, (policy_number,))
-                conn.commit()
-                cursor.close()
-                conn.close()
-            except Exception as e:
-                print(f"❌ Failed to insert dismissed policy: {e}")
-            finally:
-                frame.setParent(None)
-
-        dismiss_button.clicked.connect(dismiss_policy)
-
-        frame_layout.addWidget(label)
-        frame_layout.addStretch()
-        frame_layout.addWidget(dismiss_button)
-
-        return frame
-    
     def load_expiring_policies_grouped(self, ui):
-        try:
-            conn = db_func.connect()
-            cursor = conn.cursor()
-
-            self.clear_notifications()
-
-            queries = [
-                # Non-Life
-                """
-                SELECT policy_number, assured_name AS client_name, expiry_date
-                FROM clients_nonlife
-                WHERE status = 'active'
-                  AND policy_number NOT IN (
-                      SELECT policy_number FROM dismissed_notifications
-                  )
-                """,
-                # HMO Individual
-                """
-                SELECT policy_number, assured_name AS client_name, expiry_date
-                FROM clients_hmo_individual
-                WHERE status = 'active'
-                  AND policy_number NOT IN (
-                      SELECT policy_number FROM dismissed_notifications
-                  )
-                """,
-                # HMO Corporate
-                """
-                SELECT policy_number, company_name AS client_name, expiry_date
-                FROM clients_hmo_corporate
-                WHERE status = 'active'
-                  AND policy_number NOT IN (
-                      SELECT policy_number FROM dismissed_notifications
-                  )
-                """
-            ]
-
-            all_results = []
-            for query in queries:
-                cursor.execute(query)
-                all_results.extend(cursor.fetchall())
-
-            all_results.sort(key=lambda row: row[2])
-
-            # Get layout inside notifications scroll area
-            layout = ui.notifications_center.findChild(QWidget, "scrollAreaWidgetContents").layout()
-
-            # Group policies
-            grouped = {"Expired Policies": [], "This Week": [], "Next Week": [], "This Month": [], "Upcoming Months": []}
-
-            for policy_number, client_name, expiry_date in all_results:
-                days_left = (expiry_date - datetime.now().date()).days
-                if days_left <= 0:
-                    grouped["Expired Policies"].append((policy_number, client_name, expiry_date))
-                elif days_left <= 7:
-                    grouped["This Week"].append((policy_number, client_name, expiry_date))
-                elif 8 <= days_left <= 14:
-                    grouped["Next Week"].append((policy_number, client_name, expiry_date))
-                elif 15 <= days_left <= 30:
-                    grouped["This Month"].append((policy_number, client_name, expiry_date))
-                else:
-                    grouped["Upcoming Months"].append((policy_number, client_name, expiry_date))
-
-            for category, items in grouped.items():
-                if not items:
-                    continue
-
-                layout.addWidget(self.create_section_label(category))
-
-                for policy_number, client_name, expiry_date in items:
-                    color = {
-                        "Expired Policies": "#ebadad",
-                        "This Week": "#ffcccc",
-                        "Next Week": "#fff0cc",
-                        "This Month": "#e0f0ff"
-                    }.get(category, "#ffffff")
-
-                    card = self.create_notification_card(policy_number, client_name, expiry_date, color)
-                    layout.addWidget(card)
-
-            cursor.close()
-            conn.close()
-
-        except Exception as e:
-            print("Error loading grouped notifications:", e)
-
-    def clear_notifications(self):
-        container = self.notifications_center.widget()
-        if container is not None:
-            layout = container.layout()
-            if layout is not None:
-                while layout.count():
-                    item = layout.takeAt(0)
-                    widget = item.widget()
-                    if widget is not None:
-                        widget.deleteLater()
-    
-    def get_visible_row_ids(self, table_widget, id_column=0):
-        ids = []
-        for row in range(table_widget.rowCount()):
-            if not table_widget.isRowHidden(row):
-                item = table_widget.item(row, id_column)
-                if item:
-                    ids.append(item.text())
-        return ids
-    
-    def export_clients_nonlife_to_csv(self):
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Save CSV", "clients-nonlife.csv", "CSV Files (*.csv)"
+        self.query_executor.submit(
+            db_func.TAB_LOAD, db_func.fetch_expiring_policies,
+            on_result=lambda result: ui.notification_model.set_notifications(*result, hidden=ui.dismissal_queue.pending()),
+            on_error=lambda e: print("Error loading grouped notifications:", e)
         )
 
-        if not path:
-            return  # User canceled
+    def load_more_notifications(self):
+        bucket = PAGED_BUCKET
+        after = self.notification_model.last_notification(bucket)
+        self.query_executor.submit(
+            "notifications_more", db_func.fetch_upcoming_policies, after,
+            on_result=lambda rows: self.notification_model.append_notifications(bucket, rows),
+            on_error=lambda e: (self.notification_model.append_notifications(bucket, None),
+                                print("Error loading more notifications:", e))
+        )
 
-        try:
-            #print("search for ids")
-            ids = self.get_visible_row_ids(self.clients_non_life_dashboard_table, id_column=0)
-            #print("Exporting the following client IDs:", ids)
-            if not ids:
-                QMessageBox.information(self, "No Data", "No visible rows to export.")
-                return
-            
-            rows, headers = db_func.fetch_clients_nonlife_by_ids(ids)
+    def get_visible_row_ids(self, table_view, id_column=0, hmo_type=None):
+        """
+        Ids of the rows a dashboard shows, in on-screen order.
+
+        Args:
+            hmo_type (str): On HMO dashboards, only rows of this type ("Individual" or "Corporate").
+        """
+        model = table_model.source_model(table_view)
+        model.fetch_all()
+        rows = table_model.visible_rows(table_view)
+        if hmo_type is not None:
+            rows = [row for row in rows if model.value(row, 2) == hmo_type]
+        return [model.value(row, id_column) for row in rows]
+
+    def get_export_row_ids(self, table_view, hmo_type=None):
+        """
+        Ids to export from a dashboard, None when it shows its whole book and the export can select by status.
+
+        Args:
+            hmo_type (str): On HMO dashboards, only rows of this type ("Individual" or "Corporate").
+        """
+        if not self.search_backend.is_searched(table_view):
+            return None
+        return self.get_visible_row_ids(table_view, hmo_type=hmo_type)
 
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(rows)
+    def queue_export(self, export_format, table_name, table_view, dialog_title, default_name, file_filter, hmo_type=None):
+        """
+        Ask for a target file and queue an export of the rows a dashboard shows.
 
-            QMessageBox.information(self, "Export Complete", f"CSV exported to:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Export failed:\n{e}")
-        
-    def export_clients_nonlife_to_xls(self):
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Save Excel File", "clients-nonlife.xlsx", "Excel Files (*.xlsx)"
-        )
+        The export runs in the background on the export job queue; the Exports
+        panel shows its progress and can cancel it.
+        """
+        path, _ = QFileDialog.getSaveFileName(self, dialog_title, default_name, file_filter)
 
         if not path:
             return  # user canceled
 
         try:
-            ids = self.get_visible_row_ids(self.clients_non_life_dashboard_table, id_column=0)
-            if not ids:
+            # None exports the whole active book without pulling its ids through the GUI
+            ids = self.get_export_row_ids(table_view, hmo_type=hmo_type)
+            if ids is not None and not ids:
                 QMessageBox.information(self, "No Data", "No visible rows to export.")
                 return
-            
-            rows, headers = db_func.fetch_clients_nonlife_by_ids(ids)
-
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Clients"
-
-            # Write headers
-            ws.append(headers)
-
-            # Write data rows
-            for row in rows:
-                ws.append(row)
-
-            wb.save(path)
-            QMessageBox.information(self, "Export Successful", f"Excel file saved:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "Export Failed", f"Error:\n{e}")
-    
-    def export_clients_nonlife_to_pdf(self):
-        ids = self.get_visible_row_ids(self.clients_non_life_dashboard_table, id_column=0)
-        if not ids:
-            QMessageBox.information(self, "No Data", "No visible rows to export.")
             return
-            
-        rows, headers = db_func.fetch_clients_nonlife_by_ids(ids)
-        
-        export_columns = [
-            ("Assured Name", "assured_name"),
-            ("Contact No.", "contact_number"),
-            ("Email", "email"),
-            ("Type of Insurance", "type_of_insurance"),
-            ("Insurance Company", "insurance_company"),
-            ("Inception Date", "inception_date"),
-            ("Expiry Date", "expiry_date"),
-            ("Policy Number", "policy_number"),
-            ("Gross Premium", "gross_premium"),
-            ("Commission", "commission"),
-            ("Coverage", "amount_covered"),
-        ]
-
-        # Map header to column index
-        header_index_map = {header: i for i, header in enumerate(headers)}
-
-        # Build filtered headers and data rows
-        filtered_headers = [label for label, _ in export_columns]
-        filtered_rows = [
-            [row[header_index_map[col]] for _, col in export_columns]
-            for row in rows
-        ]
-
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Save PDF", "clients-nonlife.pdf", "PDF Files (*.pdf)"
-        )
 
-        if not path:
-            return
+        # a whole-book export follows the dashboard's sort, searched ones are already in on-screen order
+        order_by = db_func.export_sort_order(table_view, table_name) if ids is None else None
+        self.export_jobs.submit(ExportJob(export_format, table_name, path, ids, order_by=order_by))
 
-        try:
-            doc = SimpleDocTemplate(path, pagesize=landscape(A4))
-            page_width, _ = landscape(A4)
-            usable_width = page_width - 72  # 0.5 inch margins left & right
-            col_width = usable_width / len(filtered_headers)
-            col_widths = [col_width] * len(filtered_headers)
-
-            styles = getSampleStyleSheet()
-            cell_style = styles["BodyText"]
-            cell_style.fontSize = 5
-            cell_style.leading = 7
-
-            table_data = [filtered_headers]
-            for row in filtered_rows:
-                table_data.append([Paragraph(str(cell), cell_style) for cell in row])
-
-            table = Table(table_data, colWidths=col_widths, repeatRows=1)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 5),
-                ('LEFTPADDING', (0, 0), (-1, -1), 2),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-                ('TOPPADDING', (0, 0), (-1, -1), 2),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-            ]))
-
-            elements = [
-                Paragraph("Client HMO Individual", styles["Title"]),
-                Spacer(1, 7),
-                table
-            ]
-            doc.build(elements)
-
-            QMessageBox.information(self, "Export Successful", f"PDF saved to:\n{path}")
+    def on_export_failed(self, job_id):
+        state = self.export_jobs.jobs[self.export_jobs.index_of(job_id)]
+        QMessageBox.critical(self, "Export Failed", f"Could not write {state.job.path}:\n{state.error}")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Export Failed", f"Error:\n{e}")
-
-    def export_clients_hmo_individual_to_csv(self):
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Save CSV", "clients-hmo-ind.csv", "CSV Files (*.csv)"
-        )
+    def export_clients_nonlife_to_csv(self):
+        self.queue_export("csv", "clients_nonlife", self.clients_non_life_dashboard_table,
+                          "Save CSV", "clients-nonlife.csv", "CSV Files (*.csv)")
 
-        if not path:
-            return  # User canceled
+    def export_clients_nonlife_to_xls(self):
+        self.queue_export("xlsx", "clients_nonlife", self.clients_non_life_dashboard_table,
+                          "Save Excel File", "clients-nonlife.xlsx", "Excel Files (*.xlsx)")
 
-        try:
-            #print("search for ids")
-            ids = self.get_visible_row_ids(self.clients_hmo_dashboard_table, id_column=0)
-            #print("Exporting the following client IDs:", ids)
-            if not ids:
-                QMessageBox.information(self, "No Data", "No visible rows to export.")
-                return
-            
-            rows, headers = db_func.fetch_clients_hmo_individual_by_ids(ids)
+    def export_clients_nonlife_to_pdf(self):
+        self.queue_export("pdf", "clients_nonlife", self.clients_non_life_dashboard_table,
+                          "Save PDF", "clients-nonlife.pdf", "PDF Files (*.pdf)")
 
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(rows)
+    def export_clients_hmo_individual_to_csv(self):
+        self.queue_export("csv", "clients_hmo_individual", self.clients_hmo_dashboard_table,
+                          "Save CSV", "clients-hmo-ind.csv", "CSV Files (*.csv)", hmo_type="Individual")
 
-            QMessageBox.information(self, "Export Complete", f"CSV exported to:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Export failed:\n{e}")
-        
     def export_clients_hmo_individual_to_xls(self):
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Save Excel File", "clients-hmo-ind.xlsx", "Excel Files (*.xlsx)"
-        )
-
-        if not path:
-            return  # user canceled
-
-        try:
-            ids = self.get_visible_row_ids(self.clients_hmo_dashboard_table, id_column=0)
-            if not ids:
-                QMessageBox.information(self, "No Data", "No visible rows to export.")
-                return
-            
-            rows, headers = db_func.fetch_clients_hmo_individual_by_ids(ids)
-
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Clients"
+        self.queue_export("xlsx", "clients_hmo_individual", self.clients_hmo_dashboard_table,
+                          "Save Excel File", "clients-hmo-ind.xlsx", "Excel Files (*.xlsx)", hmo_type="Individual")
 
-            # Write headers
-            ws.append(headers)
-
-            # Write data rows
-            for row in rows:
-                ws.append(row)
-
-            wb.save(path)
-            QMessageBox.information(self, "Export Successful", f"Excel file saved:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Export Failed", f"Error:\n{e}")
-    
     def export_clients_hmo_individual_to_pdf(self):
-        ids = self.get_visible_row_ids(self.clients_hmo_dashboard_table, id_column=0)
-        if not ids:
-            QMessageBox.information(self, "No Data", "No visible rows to export.")
-            return
-        
-        rows, headers = db_func.fetch_clients_hmo_individual_by_ids(ids)
-
-        export_columns = [
-            ("Assured Name", "assured_name"),
-            ("Contact No.", "contact_number"),
-            ("Email", "email"),
-            ("HMO Company", "hmo_company"),
-            ("Inception Date", "inception_date"),
-            ("Expiry Date", "expiry_date"),
-            ("Policy Number", "policy_number"),
-            ("Gross Premium", "gross_premium"),
-            ("Commission", "commission"),
-        ]
-
-        # Map header to column index
-        header_index_map = {header: i for i, header in enumerate(headers)}
-
-        # Build filtered headers and data rows
-        filtered_headers = [label for label, _ in export_columns]
-        filtered_rows = [
-            [row[header_index_map[col]] for _, col in export_columns]
-            for row in rows
-        ]
-
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Save PDF", "clients-hmo-ind.pdf", "PDF Files (*.pdf)"
-        )
-
-        if not path:
-            return
-
-        try:
-            doc = SimpleDocTemplate(path, pagesize=landscape(A4))
-            page_width, _ = landscape(A4)
-            usable_width = page_width - 72  # 0.5 inch margins left & right
-            col_width = usable_width / len(filtered_headers)
-            col_widths = [col_width] * len(filtered_headers)
-
-            styles = getSampleStyleSheet()
-            cell_style = styles["BodyText"]
-            cell_style.fontSize = 5
-            cell_style.leading = 7
-
-            table_data = [filtered_headers]
-            for row in filtered_rows:
-                table_data.append([Paragraph(str(cell), cell_style) for cell in row])
-
-            table = Table(table_data, colWidths=col_widths, repeatRows=1)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 5),
-                ('LEFTPADDING', (0, 0), (-1, -1), 2),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-                ('TOPPADDING', (0, 0), (-1, -1), 2),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-            ]))
-
-            elements = [
-                Paragraph("Client HMO Individual", styles["Title"]),
-                Spacer(1, 7),
-                table
-            ]
-            doc.build(elements)
-
-            QMessageBox.information(self, "Export Successful", f"PDF saved to:\n{path}")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Export Failed", f"Error:\n{e}")
+        self.queue_export("pdf", "clients_hmo_individual", self.clients_hmo_dashboard_table,
+                          "Save PDF", "clients-hmo-ind.pdf", "PDF Files (*.pdf)", hmo_type="Individual")
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(db_func.close_pool)
     login_page = LoginPage()
     login_page.show()
     sys.exit(app.exec())
@@ -0,0 +1,25 @@
+"""
+Rebuild policy_balances from client_payments.
+
+migrations/0003_policy_balances.sql already backfills once when it creates
+the table; run this again after payments were imported or corrected outside
+the app. Payments wait while it runs, the totals are written in one
+transaction.
+
+Usage (from the repository root):
+    python src/backfill_policy_balances.py
+"""
+import time
+
+import db_func
+
+
+def main():
+    started = time.perf_counter()
+    count = db_func.backfill_policy_balances()
+    print(f"Backfilled {count} policy balances in {time.perf_counter() - started:.2f}s")
+    db_func.close_pool()
+
+
+if __name__ == "__main__":
+    main()
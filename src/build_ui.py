@@ -0,0 +1,73 @@
+"""
+Regenerate the pyuic6 modules in QtGUI/ from the .ui files.
+
+The app builds its windows from these modules (see ui_loader.py) and falls
+back to parsing the .ui files whenever a module is missing or stale, so run
+this after every change made in Qt Designer and commit the result. Only
+forms whose .ui file changed are rebuilt.
+
+Usage (from the repository root):
+    python src/build_ui.py            rebuild the out-of-date modules
+    python src/build_ui.py --force    rebuild all of them
+    python src/build_ui.py --check    exit 1 if any module is out of date
+"""
+import argparse
+import io
+import os
+import sys
+
+from PyQt6 import uic
+
+from ui_loader import UI_DIR, UI_FORMS, ui_source_hash
+
+
+def module_hash(module_path: str):
+    """UI_SOURCE_SHA1 stamped at the end of a generated module, None if there is none."""
+    if not os.path.exists(module_path):
+        return None
+    # older modules were generated on Windows and aren't all UTF-8
+    with open(module_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("UI_SOURCE_SHA1 = "):
+                return line.split("=", 1)[1].strip().strip('"')
+    return None
+
+
+def build(ui_file: str, module_path: str):
+    source_hash = ui_source_hash(ui_file)
+    code = io.StringIO()
+    # paths inside the form (pixmaps) come out relative to the repository root, like the app's own
+    uic.compileUi(os.path.join(UI_DIR, ui_file), code)
+    with open(module_path, "w", encoding="utf-8") as f:
+        f.write(code.getvalue())
+        f.write(f"\n\n# sha1 of {ui_file} this module was generated from, checked by ui_loader.py\n")
+        f.write(f'UI_SOURCE_SHA1 = "{source_hash}"\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    stale = []
+    for ui_file, (module_name, _) in UI_FORMS.items():
+        module_path = os.path.join(UI_DIR, module_name + ".py")
+        up_to_date = module_hash(module_path) == ui_source_hash(ui_file)
+        if args.check:
+            if not up_to_date:
+                stale.append(module_path)
+            continue
+        if up_to_date and not args.force:
+            print(f"{module_path} is up to date")
+            continue
+        build(ui_file, module_path)
+        print(f"{module_path} rebuilt from {ui_file}")
+
+    if stale:
+        print("Out of date: " + ", ".join(stale))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
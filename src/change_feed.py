@@ -0,0 +1,131 @@
+import json
+import os
+import select
+import threading
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+import db_func
+
+# channel the triggers of migrations/0005_change_notifications.sql notify on
+CHANGE_CHANNEL = "row_changes"
+# wait this long after a notification so a burst of them (a bulk archive) is handled once
+CHANGE_FEED_DEBOUNCE_MS = int(os.getenv("CHANGE_FEED_DEBOUNCE_MS", "300"))
+# reconnect delay while the database is unreachable, doubled per failure up to the max
+CHANGE_FEED_RETRY_S = float(os.getenv("CHANGE_FEED_RETRY_S", "5"))
+CHANGE_FEED_RETRY_MAX_S = float(os.getenv("CHANGE_FEED_RETRY_MAX_S", "300"))
+# set to 0 to turn the listener off, e.g. against a server without the triggers
+CHANGE_FEED_ENABLED = os.getenv("CHANGE_FEED", "1") != "0"
+
+
+class ChangeFeed(QObject):
+    """
+    Listens for rows other workstations write and reports them in batches.
+
+    A background thread holds its own connection (not a pooled one, it never
+    goes idle) with LISTEN on CHANGE_CHANNEL and hands every notification to
+    the GUI thread. Notifications are collected until none arrived for
+    CHANGE_FEED_DEBOUNCE_MS, then `changed` is emitted once with
+    {table: set of ids}. While the connection is down nothing is heard, so
+    after a reconnect every table is reported as changed with ids None.
+    """
+
+    changed = pyqtSignal(dict)
+    _received = pyqtSignal(str)
+    _missed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._changes = {}          # table -> set of ids, None when any row may have changed
+        self._stopping = threading.Event()
+        self._thread = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(CHANGE_FEED_DEBOUNCE_MS)
+        self.timer.timeout.connect(self._flush)
+        self._received.connect(self._on_received)
+        self._missed.connect(self._on_missed)
+
+    def start(self):
+        if not CHANGE_FEED_ENABLED or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._listen, name="change-feed", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the listener to close its connection; it notices within a second."""
+        self._stopping.set()
+        self.timer.stop()
+
+    def requeue(self, changes):
+        """Report changes again with the next batch, e.g. when they could not be applied yet."""
+        for table, ids in changes.items():
+            self._add(table, ids)
+        self.timer.start()
+
+    #### GUI thread
+    def _on_received(self, payload):
+        try:
+            change = json.loads(payload)
+            self._add(change["table"], {change["id"]})
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring malformed change notification {payload!r}: {e}")
+            return
+        self.timer.start()
+
+    def _on_missed(self):
+        for table in db_func.TABLE_TABS:
+            self._add(table, None)
+        self.timer.start()
+
+    def _add(self, table, ids):
+        known = self._changes.get(table, set())
+        if ids is None or known is None:
+            self._changes[table] = None
+        else:
+            self._changes[table] = known | ids
+
+    def _flush(self):
+        changes, self._changes = self._changes, {}
+        if changes:
+            self.changed.emit(changes)
+
+    #### Listener thread
+    def _listen(self):
+        retry_s = CHANGE_FEED_RETRY_S
+        connected_before = False
+        while not self._stopping.is_set():
+            conn = None
+            try:
+                conn = db_func.open_connection()
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANGE_CHANNEL}")
+                retry_s = CHANGE_FEED_RETRY_S
+                if connected_before:
+                    self._emit(self._missed)
+                connected_before = True
+                # wake up every second to notice stop()
+                while not self._stopping.is_set():
+                    if not select.select([conn], [], [], 1.0)[0]:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._emit(self._received, conn.notifies.pop(0).payload)
+            except Exception as e:
+                if self._stopping.is_set():
+                    break
+                print(f"Change feed lost the database, reconnecting in {retry_s:g}s: {e}")
+                self._stopping.wait(retry_s)
+                retry_s = min(retry_s * 2, CHANGE_FEED_RETRY_MAX_S)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+    def _emit(self, signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # the window was closed while the listener was still running
+            self._stopping.set()
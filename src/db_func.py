@@ -1,111 +1,553 @@
 import psycopg2
+import psycopg2.extras
+import io
 import os
 import bcrypt
 import re
+import threading
+from collections import namedtuple
 from datetime import datetime
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem, QHeaderView, QInputDialog
+from PyQt6.QtWidgets import QMessageBox, QHeaderView, QInputDialog
 from PyQt6.QtCore import Qt
 from dotenv import load_dotenv
 from decimal import Decimal
+from db_pool import ConnectionPool
+from paged_query import PagedQuery
+from table_model import selected_rows as selected_table_rows, source_model, source_row
 
 load_dotenv()
 
 # set the PASSWORD environment variable in .env
 dbPass = os.getenv("PASSWORD")
 
-# connect to db, return connection if successful else error
-def connect():
-    try:
-        connection = psycopg2.connect(
-            dbname=os.getenv("DATABASE_NAME"),
-            host=os.getenv("HOST"),
-            user=os.getenv("USER"),
-            password=dbPass
-        )
-        return connection
-    except Exception as e:
-        QMessageBox.critical(None, "Error", f"Error connecting to database: {e}")
+# pool sizing, override in .env if the defaults don't fit
+POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "5"))
+POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "300"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# connections only the GUI thread checks out, so a save or update never waits behind
+# background queries and the paged dashboard cursors holding the rest of the pool
+POOL_MAIN_THREAD_RESERVE = int(os.getenv("DB_POOL_MAIN_THREAD_RESERVE", "1"))
+
+# rows fetched per scroll step on the dashboard tables, 0 loads whole tables at once
+DASHBOARD_PAGE_SIZE = int(os.getenv("DASHBOARD_PAGE_SIZE", "200"))
+
+# rows changed this many seconds before a table's watermark are fetched again on the next refresh,
+# so a transaction that committed after a later one still shows up (its updated_at is its start time)
+DELTA_SYNC_OVERLAP = float(os.getenv("DELTA_SYNC_OVERLAP", "30"))
+
+# notifications shown per bucket, "Load more" pages Upcoming Months by the same amount
+NOTIFICATION_BUCKET_LIMIT = int(os.getenv("NOTIFICATION_BUCKET_LIMIT", "50"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# open a brand-new connection (full TCP + auth handshake), raises on failure
+def open_connection():
+    return psycopg2.connect(
+        dbname=os.getenv("DATABASE_NAME"),
+        host=os.getenv("HOST"),
+        user=os.getenv("USER"),
+        password=dbPass
+    )
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                open_connection,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                max_idle=POOL_MAX_IDLE,
+                timeout=POOL_TIMEOUT,
+                main_thread_reserve=POOL_MAIN_THREAD_RESERVE
+            )
+        return _pool
+
+def get_connection():
+    """
+    Check out a pooled connection for a with-block.
+
+    Usage:
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(...)
+            conn.commit()
+
+    Anything left uncommitted is rolled back when the connection goes back to the pool.
+    """
+    return get_pool().connection()
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            print("Connection pool stats:", _pool.stats())
+            _pool.close()
+            _pool = None
+
+# one dashboard table: where its rows go, which label shows the count, the SELECT that fills it
+# and, for client tables, the ranked SELECT used when searching on the server plus the queries
+# behind delta refreshes: the rows changed since a watermark, the current watermark, and the
+# columns that identify a record among the rows; table_columns maps each client table shown to
+# its column (or computed expression) per dashboard column, so exports can sort like the header
+DashboardTable = namedtuple("DashboardTable", "table_name count_name query page_size hide_id_column search_query"
+                            " changes_query watermark_query key_columns table_columns",
+                            defaults=(None, None, None, (0,), None))
+
+def table_query(db_table_name: str, columns_to_display: list, condition = ''):
+    column_list = ', '.join(columns_to_display)
+    return f"SELECT {column_list} FROM {db_table_name} {condition}"
+
+# both HMO tables in one result, so they can share a single server-side cursor
+def hmo_union_query(individual_columns: list, corporate_columns: list, condition = ''):
+    return (
+        f"SELECT {', '.join(individual_columns)} FROM clients_hmo_individual {condition}"
+        f" UNION ALL "
+        f"SELECT {', '.join(corporate_columns)} FROM clients_hmo_corporate {condition}"
+    )
+
+# tables holding policies; a table name from a caller is only spliced into SQL after checking it is one of these
+CLIENT_TABLES = ("clients_nonlife", "clients_hmo_individual", "clients_hmo_corporate")
+
+# text columns the dashboard search matches, trigram-indexed by migrations/0001_policy_search_indexes.sql
+SEARCH_COLUMNS = {
+    "clients_nonlife": ["assured_name", "policy_number", "insurance_company"],
+    "clients_hmo_individual": ["assured_name", "policy_number", "hmo_company"],
+    "clients_hmo_corporate": ["company_name", "policy_number", "hmo_company"],
+}
+
+def search_condition(db_table_name: str):
+    return "(" + " OR ".join(f"{column} ILIKE %(pattern)s" for column in SEARCH_COLUMNS[db_table_name]) + ")"
+
+def search_rank(db_table_name: str):
+    # exact policy number first, then name/policy prefixes, then name/policy substrings, then company matches
+    name_column = SEARCH_COLUMNS[db_table_name][0]
+    return (
+        f"CASE WHEN lower(policy_number) = %(text)s THEN 0"
+        f" WHEN lower({name_column}) LIKE %(prefix)s OR lower(policy_number) LIKE %(prefix)s THEN 1"
+        f" WHEN {name_column} ILIKE %(pattern)s OR policy_number ILIKE %(pattern)s THEN 2"
+        f" ELSE 3 END AS search_rank"
+    )
+
+def search_params(text: str):
+    """Parameters for a search_query; LIKE wildcards typed by the user match literally."""
+    text = text.strip().lower()
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return {"text": text, "prefix": f"{escaped}%", "pattern": f"%{escaped}%"}
+
+# rows of a client table touched after %(since)s, whatever their status; `visible` says whether
+# the row still belongs on the dashboard (archiving one moves it from clients to archives)
+CHANGED_SINCE = "WHERE updated_at > %(since)s - %(overlap)s * interval '1 second'"
+
+def changed_columns(columns: list, status: str):
+    return columns + [f"status = '{status}' AS visible"]
+
+# rows of a client table deleted outright after %(since)s (migrations/0008_deleted_rows.sql), shaped
+# like its changed rows: the id and computed columns filled in so the record key matches, never visible
+def deleted_since(db_table_name: str, columns: list):
+    shaped = [column if column == "id" or not column.isidentifier() else f"NULL AS {column}" for column in columns]
+    return (f"SELECT {', '.join(shaped)}, false AS visible FROM deleted_rows"
+            f" WHERE table_name = '{db_table_name}' AND deleted_at > %(since)s - %(overlap)s * interval '1 second'")
+
+# newest change to a client table, an update or a delete; two index lookups whatever the table size
+def watermark_expression(db_table_name: str):
+    return (f"greatest((SELECT max(updated_at) FROM {db_table_name}),"
+            f" (SELECT max(deleted_at) FROM deleted_rows WHERE table_name = '{db_table_name}'))")
+
+def nonlife_dashboard_table(table_name: str, count_name: str, columns: list, status: str):
+    condition = f"WHERE status = '{status}'"
+    search_query = table_query("clients_nonlife", columns + [search_rank("clients_nonlife")],
+                               f"{condition} AND {search_condition('clients_nonlife')}")
+    return DashboardTable(table_name, count_name, table_query("clients_nonlife", columns, condition),
+                          DASHBOARD_PAGE_SIZE, True, f"{search_query} ORDER BY search_rank, 2",
+                          table_query("clients_nonlife", changed_columns(columns, status), CHANGED_SINCE)
+                          + " UNION ALL " + deleted_since("clients_nonlife", columns),
+                          f"SELECT {watermark_expression('clients_nonlife')}",
+                          table_columns={"clients_nonlife": columns})
+
+def hmo_dashboard_table(table_name: str, count_name: str, individual_columns: list, corporate_columns: list, status: str):
+    condition = f"WHERE status = '{status}'"
+    search_query = (
+        table_query("clients_hmo_individual", individual_columns + [search_rank("clients_hmo_individual")],
+                    f"{condition} AND {search_condition('clients_hmo_individual')}")
+        + " UNION ALL "
+        + table_query("clients_hmo_corporate", corporate_columns + [search_rank("clients_hmo_corporate")],
+                      f"{condition} AND {search_condition('clients_hmo_corporate')}")
+    )
+    # ids are only unique per table, the type column tells the two apart
+    return DashboardTable(table_name, count_name, hmo_union_query(individual_columns, corporate_columns, condition),
+                          DASHBOARD_PAGE_SIZE, True, f"{search_query} ORDER BY search_rank, 2",
+                          hmo_union_query(changed_columns(individual_columns, status),
+                                          changed_columns(corporate_columns, status), CHANGED_SINCE)
+                          + " UNION ALL " + deleted_since("clients_hmo_individual", individual_columns)
+                          + " UNION ALL " + deleted_since("clients_hmo_corporate", corporate_columns),
+                          f"SELECT greatest({watermark_expression('clients_hmo_individual')},"
+                          f" {watermark_expression('clients_hmo_corporate')})",
+                          (2, 0), {"clients_hmo_individual": individual_columns,
+                                   "clients_hmo_corporate": corporate_columns})
+
+# payments joined to whichever client table holds the policy through the `policies` view
+# (migrations/0002_policies_view.sql); a number used in two client tables still gives one row
+# per payment, taken from the first table in the order the three-way COALESCE used to check them
+CLIENT_PAYMENTS_QUERY = """
+    SELECT 
+        p.client_name,
+        cp.policy_number,
+        cp.amount_paid,
+        cp.payment_method,
+        p.gross_premium AS total_premium_due,
+        cp.status,
+        cp.payment_date
+    FROM client_payments cp
+    LEFT JOIN LATERAL (
+        SELECT client_name, gross_premium
+        FROM policies
+        WHERE policies.policy_number = cp.policy_number
+        ORDER BY array_position(ARRAY['nonlife', 'hmo_individual', 'hmo_corporate'], policy_kind)
+        LIMIT 1
+    ) p ON true
+    ORDER BY cp.payment_date DESC
+"""
+
+# tables loaded together when a navigation tab is opened
+DASHBOARD_TABLES = {
+    "clients": [
+        nonlife_dashboard_table("clients_non_life_dashboard_table", "clients_non_life_dashboard_count",
+                                ["id", "assured_name", "type_of_insurance", "policy_number", "expiry_date"], "active"),
+        hmo_dashboard_table("clients_hmo_dashboard_table", "clients_hmo_dashboard_count",
+                            ["id", "assured_name", "'Individual' AS type_of_hmo", "policy_number", "expiry_date"],
+                            ["id", "company_name", "'Corporate' AS type_of_hmo", "policy_number", "expiry_date"], "active"),
+    ],
+    "companies": [
+        nonlife_dashboard_table("companies_non_life_dashboard_table", "companies_non_life_dashboard_count",
+                                ["id", "assured_name", "type_of_insurance", "insurance_company", "expiry_date"], "active"),
+        hmo_dashboard_table("companies_hmo_dashboard_table", "companies_hmo_dashboard_count",
+                            ["id", "assured_name", "'Individual' AS type_of_hmo", "hmo_company", "expiry_date"],
+                            ["id", "company_name", "'Corporate' AS type_of_hmo", "hmo_company", "expiry_date"], "active"),
+    ],
+    "collection": [
+        DashboardTable("client_payments_table", "client_payments_count", CLIENT_PAYMENTS_QUERY, 0, False),
+        DashboardTable("company_expenses_table", "company_expenses_count",
+                       table_query("company_expenses", ["amount", "expense_category", "payment_method", "department", "expense_date"]),
+                       0, False),
+    ],
+    "archives": [
+        nonlife_dashboard_table("archives_non_life_dashboard_table", "archives_non_life_dashboard_count",
+                                ["id", "assured_name", "type_of_insurance", "policy_number", "expiry_date"], "archived"),
+        hmo_dashboard_table("archives_hmo_dashboard_table", "archives_hmo_dashboard_count",
+                            ["id", "assured_name", "'Individual' AS type_of_hmo", "policy_number", "expiry_date"],
+                            ["id", "company_name", "'Corporate' AS type_of_hmo", "policy_number", "expiry_date"], "archived"),
+    ],
+}
+
+# tabs whose tables read each database table, see change_feed.py; payments show the client's name and premium
+TABLE_TABS = {
+    "clients_nonlife": ("clients", "companies", "archives", "collection"),
+    "clients_hmo_individual": ("clients", "companies", "archives", "collection"),
+    "clients_hmo_corporate": ("clients", "companies", "archives", "collection"),
+    "client_payments": ("collection",),
+    "company_expenses": ("collection",),
+    "dismissed_notifications": (),
+}
+
+def find_dashboard_table(table_name: str):
+    """(tab, DashboardTable) of a table view's objectName, (None, None) for tables that aren't dashboards."""
+    for tab, tables in DASHBOARD_TABLES.items():
+        for table in tables:
+            if table.table_name == table_name:
+                return tab, table
+    return None, None
+
+# executor key shared by every tab load, so opening a tab cancels the load of the one just left
+TAB_LOAD = "tab"
+
+def fetch_query_rows(query: str, params=None, page_size: int = 0, order_by=None):
+    """
+    Run a SELECT without touching any widget, safe to call from a worker thread.
+
+    Args:
+        page_size (int): Stream the rows through a server-side cursor this many at a time, 0 loads everything.
+        order_by (tuple): (column_index, descending) to open the cursor with, see table_sort_order().
+
+    Returns:
+        (rows, source): with page_size set, rows is only the first page and source is the open
+        PagedQuery the model keeps pulling from as the user scrolls; otherwise source is None.
+    """
+    if page_size:
+        source = PagedQuery(get_pool(), query, params, page_size, order_by)
+        return source.open(), source
+
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(query, params)
+        return cursor.fetchall(), None
+
+def table_sort_order(qt_table_view):
+    # open the cursor already sorted the way the header says, so re-enabling sorting is a no-op
+    header = qt_table_view.horizontalHeader()
+    if header.sortIndicatorSection() < 0:
+        return None
+    return (header.sortIndicatorSection(), header.sortIndicatorOrder() == Qt.SortOrder.DescendingOrder)
+
+def export_sort_order(qt_table_view, table_name: str):
+    """
+    (column name, descending) ordering an export of a client table the way a dashboard's header sorts it.
+
+    None when the dashboard isn't sorted or is sorted by a computed column (the HMO type), the
+    export then goes by id.
+    """
+    order = table_sort_order(qt_table_view)
+    _, table = find_dashboard_table(qt_table_view.objectName())
+    if order is None or table is None or not table.table_columns or table_name not in table.table_columns:
         return None
-    
+    column = table.table_columns[table_name][order[0]]
+    if not column.isidentifier():
+        return None
+    return column, order[1]
+
+def show_query_rows(qt_table_view, rows, source=None, clear_rows: bool = True, hide_id_column: bool = True):
+    """
+    Put rows returned by fetch_query_rows() into a table view. GUI thread only.
+
+    Args:
+        qt_table_view (QTableView): The Qt table view whose RecordTableModel receives the rows.
+        clear_rows (bool): Replace the current rows; pass False to append to what is already loaded.
+    """
+    if hide_id_column:
+        qt_table_view.setColumnHidden(0, True)
+
+    model = source_model(qt_table_view)
+    qt_table_view.setSortingEnabled(False)  # Freeze sort order
+
+    # Rows go straight into the model, cells are only rendered when painted
+    if source is not None:
+        model.set_source(source, rows)
+    elif clear_rows:
+        model.set_records(rows)
+    else:
+        model.append_records(rows)
 
-def load_table_data(db_table_name: str, qt_table_widget, columns_to_display: list, condition = '', clear_rows: bool = True):
+    header = qt_table_view.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+
+    qt_table_view.setSortingEnabled(True)  # Re-enable sorting 
+
+def fetch_table_watermark(table: DashboardTable):
+    """Newest change (updated_at or deleted_at) behind a dashboard table, None without a watermark_query."""
+    if table.watermark_query is None:
+        return None
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(table.watermark_query)
+        return cursor.fetchone()[0]
+
+def fetch_table_total(table: DashboardTable):
+    """Rows of a dashboard table's query; counts the table, so only for tables still paging."""
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM ({table.query}) AS counted")
+        return cursor.fetchone()[0]
+
+def fetch_table_changes(table: DashboardTable, since):
+    """(row, visible) pairs of the rows behind a dashboard table changed or deleted after the watermark `since`."""
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(table.changes_query, {"since": since, "overlap": DELTA_SYNC_OVERLAP})
+        return [(row[:-1], row[-1]) for row in cursor.fetchall()]
+
+def fetch_dashboard_tables(tab: str, sort_orders: dict, search_text: str = None, table_names=None, task=None,
+                           since=None, paging=()):
     """
-    Generalized function to load client data from a PostgreSQL table into a Qt table.
+    Fetch the tables of a navigation tab (see DASHBOARD_TABLES), meant to run in a worker.
 
     Args:
-        db_table_name (str): Name of the PostgreSQL table (e.g., "clients_nonlife").
-        qt_table_widget (QTableWidget): The Qt table widget where data will be loaded.
-        columns_to_display (list): List of column names to fetch from the database and show in the table.
+        tab (str): Key of DASHBOARD_TABLES, e.g. "clients".
+        sort_orders (dict): table_name -> table_sort_order(), read on the GUI thread beforehand.
+        search_text (str): Fetch only the rows matching this text, ranked, through each table's search_query.
+        table_names (list): Only fetch these tables of the tab.
+        task (QueryTask): Reports progress per table and stops early once cancelled.
+        since (dict): table_name -> watermark of tables to patch; only the rows changed after it
+            are fetched for those, see delta_sync_watermarks().
+        paging (set): Tables of `since` still paging, whose new row count is fetched as well.
+
+    Returns:
+        list: (table_name, rows, source, watermark, delta, total) per table, for show_dashboard_tables().
+        For tables in `since`, delta is True and rows are (row, visible) changes instead of the
+        table's rows; total is the row count of a paging table after the changes, else None.
     """
+    since = since or {}
+    tables = [table for table in DASHBOARD_TABLES[tab] if table_names is None or table.table_name in table_names]
+    results = []
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        # Generate SQL query
-        column_list = ', '.join(columns_to_display)
-        query = f"SELECT {column_list} FROM {db_table_name}"
-        query += f" {condition}"
-        cursor.execute(query)
-        records = cursor.fetchall()
-        if db_table_name != "company_expenses":
-            qt_table_widget.setColumnHidden(0, True)
-
-        qt_table_widget.setSortingEnabled(False)  # Freeze sort order
-
-        # Clear existing rows
-        if clear_rows:
-            qt_table_widget.setRowCount(0)
-        row_count = qt_table_widget.rowCount()
-        qt_table_widget.setRowCount(row_count + len(records))
-
-        # Populate the table
-        for row_idx, row_data in enumerate(records):
-            for col_idx, cell_data in enumerate(row_data):
-                item = QTableWidgetItem(str(cell_data))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)  # Make item read-only
-                qt_table_widget.setItem(row_idx + row_count, col_idx, item)
-
-        header = qt_table_widget.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        
-        qt_table_widget.setSortingEnabled(True)  # Re-enable sorting 
-
-        cursor.close()
-        conn.close()
+        for table in tables:
+            if task is not None and task.is_cancelled():
+                break
+            if search_text:
+                # keep the rank order, the user can still re-sort by clicking a header
+                rows, source = fetch_query_rows(table.search_query, search_params(search_text), page_size=table.page_size)
+                results.append((table.table_name, rows, source, None, False, None))
+            elif table.table_name in since:
+                # read before the rows, so anything committed in between is fetched again next time
+                watermark = fetch_table_watermark(table)
+                changes = fetch_table_changes(table, since[table.table_name])
+                total = fetch_table_total(table) if table.table_name in paging else None
+                results.append((table.table_name, changes, None, watermark, True, total))
+            else:
+                watermark = fetch_table_watermark(table)
+                rows, source = fetch_query_rows(table.query, page_size=table.page_size,
+                                                order_by=sort_orders.get(table.table_name))
+                results.append((table.table_name, rows, source, watermark, False, None))
+            if task is not None:
+                task.report_progress(len(results), len(tables))
+    except Exception:
+        close_dashboard_tables(results)
+        raise
+    return results
+
+def close_dashboard_tables(results):
+    # results of a load nobody is waiting for anymore, hand their cursors' connections back
+    for _, _, source, _, _, _ in results:
+        if source is not None:
+            source.close()
+
+def show_dashboard_tables(self, tab: str, results, ranked: bool = False):
+    tables = {table.table_name: table for table in DASHBOARD_TABLES[tab]}
+    for table_name, rows, source, watermark, delta, total in results:
+        table = tables[table_name]
+        qt_table_view = getattr(self, table_name)
+        model = source_model(qt_table_view)
+        if delta and model.canFetchMore():
+            # still paging: patch the loaded rows, the cursor brings the rest; the watermark stays
+            # put so the rows it returns are patched too once the table is complete
+            model.patch_records(rows, table.key_columns, total)
+            watermark = model.watermark
+        elif delta:
+            # rows re-fetched for the overlap window and still the same leave the model alone
+            updated, inserted, _ = model.patch_records(rows, table.key_columns)
+            header = qt_table_view.horizontalHeader()
+            if (updated or inserted) and header.sortIndicatorSection() >= 0:
+                # changed and appended rows take their place in the current order
+                model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        else:
+            if ranked:
+                # no sort indicator, so re-enabling sorting leaves the rows in rank order
+                qt_table_view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+            show_query_rows(qt_table_view, rows, source, hide_id_column=table.hide_id_column)
+        model.watermark = watermark
+        getattr(self, table.count_name).setText( str( model.total_rows() ) )
+
+def delta_sync_watermarks(self, tab: str, patch_partial: bool = False):
+    """
+    table_name -> watermark of the tab's tables a refresh can patch instead of reloading.
 
-    except Exception as e:
-        print(f"Error loading data from '{db_table_name}': {e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def fetch_client_table_data(self):
-    load_table_data("clients_nonlife", self.clients_non_life_dashboard_table, ["id", "assured_name", "type_of_insurance", "policy_number", "expiry_date"], "WHERE status = 'active'")
-    load_table_data("clients_hmo_individual", self.clients_hmo_dashboard_table, ["id", "assured_name", "'Individual' AS type_of_hmo", "policy_number", "expiry_date"], "WHERE status = 'active'")
-    load_table_data("clients_hmo_corporate", self.clients_hmo_dashboard_table, ["id", "company_name", "'Corporate' AS type_of_hmo", "policy_number", "expiry_date"], "WHERE status = 'active'", False)
-    self.clients_non_life_dashboard_count.setText( str(self.clients_non_life_dashboard_table.rowCount()) )
-    self.clients_hmo_dashboard_count.setText( str(self.clients_hmo_dashboard_table.rowCount()) )
-
-def fetch_company_table_data(self):
-    load_table_data("clients_nonlife", self.companies_non_life_dashboard_table, ["id", "assured_name", "type_of_insurance", "insurance_company", "expiry_date"], "WHERE status = 'active'")
-    load_table_data("clients_hmo_individual", self.companies_hmo_dashboard_table, ["id", "assured_name", "'Individual' AS type_of_hmo", "hmo_company", "expiry_date"], "WHERE status = 'active'")
-    load_table_data("clients_hmo_corporate", self.companies_hmo_dashboard_table, ["id", "company_name", "'Corporate' AS type_of_hmo", "hmo_company", "expiry_date"], "WHERE status = 'active'", False)
-    self.companies_non_life_dashboard_count.setText( str(self.companies_non_life_dashboard_table.rowCount()) )
-    self.companies_hmo_dashboard_count.setText( str(self.companies_hmo_dashboard_table.rowCount()) )
-
-def fetch_archive_table_data(self):
-    load_table_data("clients_nonlife", self.archives_non_life_dashboard_table, ["id", "assured_name", "type_of_insurance", "policy_number", "expiry_date"], "WHERE status = 'archived'")
-    load_table_data("clients_hmo_individual", self.archives_hmo_dashboard_table, ["id", "assured_name", "'Individual' AS type_of_hmo", "policy_number", "expiry_date"], "WHERE status = 'archived'")
-    load_table_data("clients_hmo_corporate", self.archives_hmo_dashboard_table, ["id", "company_name", "'Corporate' AS type_of_hmo", "policy_number", "expiry_date"], "WHERE status = 'archived'", False)
-    self.archives_non_life_dashboard_count.setText( str(self.archives_non_life_dashboard_table.rowCount()) )
-    self.archives_hmo_dashboard_count.setText( str(self.archives_hmo_dashboard_table.rowCount()) )
+    Only tables holding every row of their dashboard query qualify: a partially
+    paged table reloads (one page) anyway, and one showing server search results
+    has no watermark and is replaced by its dashboard rows.
+
+    Args:
+        patch_partial (bool): Also patch the loaded rows of tables still paging, so the
+            user's scroll position survives.
+    """
+    since = {}
+    for table in DASHBOARD_TABLES[tab]:
+        if table.changes_query is None:
+            continue
+        qt_table_view = getattr(self, table.table_name)
+        model = source_model(qt_table_view)
+        if model.watermark is None or not (model.is_complete() or patch_partial and model.canFetchMore()):
+            continue
+        since[table.table_name] = model.watermark
+    return since
+
+def refresh_dashboard_tables(self, tab: str, table_names=None, since=None):
+    """
+    Reload the tables of a navigation tab in the background; the window stays responsive meanwhile.
+
+    Tables already fully loaded only fetch the rows changed since their last load or refresh
+    and are patched in place, so the cost follows how much changed rather than the table size.
+
+    Args:
+        table_names (list): Only refresh these tables of the tab.
+        since (dict): Watermarks to patch from instead of delta_sync_watermarks().
+    """
+    if since is None:
+        since = delta_sync_watermarks(self, tab)
+    paging = {table_name for table_name in since if source_model(getattr(self, table_name)).canFetchMore()}
+    sort_orders = {
+        table.table_name: table_sort_order(getattr(self, table.table_name))
+        for table in DASHBOARD_TABLES[tab] if table.page_size
+    }
+    self.query_executor.submit(
+        TAB_LOAD, fetch_dashboard_tables, tab, sort_orders, None, table_names, since=since, paging=paging,
+        on_result=lambda results: show_dashboard_tables(self, tab, results),
+        on_error=lambda e: print(f"Error loading {tab} tables: {e}"),
+        on_discard=close_dashboard_tables,
+        pass_task=True
+    )
+
+def sync_dashboard_tables(self, tab: str):
+    """
+    Bring a tab's tables up to date after another workstation changed their rows (see change_feed.py).
+
+    Unlike a refresh, tables still paging are patched where they are instead of going
+    back to page one, and tables showing server search results are left alone.
+    """
+    since = delta_sync_watermarks(self, tab, patch_partial=True)
+    table_names = [table.table_name for table in DASHBOARD_TABLES[tab]
+                   if table.table_name in since or table.changes_query is None]
+    if table_names:
+        refresh_dashboard_tables(self, tab, table_names, since)
+
+def prefetch_dashboard_tables(self, tab: str, visited, done):
+    """
+    Load a navigation tab's tables before its first visit so it opens with rows on screen.
+
+    Meant as a LazyTabs prefetch. The tables are shown, then their server cursors
+    are closed right away so hidden tabs hold no pooled connection; opening the
+    tab reloads it as usual.
+
+    Args:
+        visited (callable): True once the user opened the tab, its own load then wins.
+        done (callable): Called once the prefetch settled, whatever the outcome.
+    """
+    def show(results):
+        if visited():
+            close_dashboard_tables(results)
+        else:
+            show_dashboard_tables(self, tab, results)
+            for table in DASHBOARD_TABLES[tab]:
+                source_model(getattr(self, table.table_name)).release_source()
+        done()
+
+    self.query_executor.submit(
+        f"prefetch_{tab}", fetch_dashboard_tables, tab, {},
+        on_result=show,
+        on_error=lambda e: (print(f"Error prefetching {tab} tables: {e}"), done()),
+        on_discard=lambda results: (close_dashboard_tables(results), done()),
+        pass_task=True
+    )
+
+def search_dashboard_tables(self, tab: str, table_names: list, text: str):
+    """Replace the rows of the given tables with their server-side search results, best matches first."""
+    self.query_executor.submit(
+        TAB_LOAD, fetch_dashboard_tables, tab, {}, text, table_names,
+        on_result=lambda results: show_dashboard_tables(self, tab, results, ranked=True),
+        on_error=lambda e: print(f"Error searching {tab} tables: {e}"),
+        on_discard=close_dashboard_tables,
+        pass_task=True
+    )
+
+def refresh_client_tables(self):
+    refresh_dashboard_tables(self, "clients")
+
+def refresh_company_tables(self):
+    refresh_dashboard_tables(self, "companies")
+
+def refresh_collection_tables(self):
+    refresh_dashboard_tables(self, "collection")
+
+def refresh_archive_tables(self):
+    refresh_dashboard_tables(self, "archives")
 
 def insert_nonlife_client(self):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
         # Extract values from widgets
         name = self.clients_non_life_add_client_assured_name_line_edit.text()
         contact = self.clients_non_life_add_client_contact_number_line_edit.text()
@@ -165,38 +607,30 @@ def insert_nonlife_client(self):
             return
 
         # Insert into database
-        cursor.execute("""
-            INSERT INTO clients_nonlife (
-                assured_name, contact_number, email, birthday,
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO clients_nonlife (
+                    assured_name, contact_number, email, birthday,
+                    inception_date, expiry_date, net_premium, gross_premium,
+                    policy_number, agent_code, payment_invoice, commission,
+                    type_of_insurance, insurance_company, amount_covered, client_notes
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (
+                name, contact, email, birthday,
                 inception_date, expiry_date, net_premium, gross_premium,
                 policy_number, agent_code, payment_invoice, commission,
-                type_of_insurance, insurance_company, amount_covered, client_notes
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            name, contact, email, birthday,
-            inception_date, expiry_date, net_premium, gross_premium,
-            policy_number, agent_code, payment_invoice, commission,
-            insurance_type, insurance_company, amount_covered, notes
-        ))
-        conn.commit()
-        cursor.close()
-        conn.close()
+                insurance_type, insurance_company, amount_covered, notes
+            ))
+            conn.commit()
 
-        fetch_client_table_data(self)
+        refresh_client_tables(self)
         QMessageBox.information(self, "Success", "Client added successfully!")
 
     except Exception as e:
         QMessageBox.critical(self, "Database Error", f"Failed to insert client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
 
 def insert_hmo_individual_client(self):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
         # Extract values from widgets
         name = self.clients_hmo_add_client_individual_assured_name_line_edit.text()
         contact = self.clients_hmo_add_client_individual_contact_number_line_edit.text()
@@ -253,38 +687,30 @@ def insert_hmo_individual_client(self):
             return
 
         # Insert into database
-        cursor.execute("""
-            INSERT INTO clients_hmo_individual (
-                assured_name, contact_number, email, birthday, hmo_company,
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO clients_hmo_individual (
+                    assured_name, contact_number, email, birthday, hmo_company,
+                    inception_date, expiry_date, agent_code, policy_number,
+                    mbl_abl, net_premium, gross_premium, commission,
+                    client_notes
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (
+                name, contact, email, birthday, hmo_company,
                 inception_date, expiry_date, agent_code, policy_number,
                 mbl_abl, net_premium, gross_premium, commission,
-                client_notes
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            name, contact, email, birthday, hmo_company,
-            inception_date, expiry_date, agent_code, policy_number,
-            mbl_abl, net_premium, gross_premium, commission,
-            notes
-        ))
-        conn.commit()
-        cursor.close()
-        conn.close()
+                notes
+            ))
+            conn.commit()
 
-        fetch_client_table_data(self)  # You can define this to refresh the client list
+        refresh_client_tables(self)  # You can define this to refresh the client list
         QMessageBox.information(self, "Success", "HMO Individual client added successfully!")
 
     except Exception as e:
         QMessageBox.critical(self, "Database Error", f"Failed to insert client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
 
 def insert_hmo_corporate_client(self):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
         # Extract values from widgets
         company_name = self.clients_hmo_add_client_corporate_company_name_line_edit.text()
         number_of_enrollees = self.clients_hmo_add_client_corporate_number_of_enrollees_line_edit.text()
@@ -343,363 +769,184 @@ def insert_hmo_corporate_client(self):
             return
 
         # Insert into database
-        cursor.execute("""
-            INSERT INTO clients_hmo_corporate (
-                company_name, number_of_enrollees, contact_number, email,
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO clients_hmo_corporate (
+                    company_name, number_of_enrollees, contact_number, email,
+                    hmo_company, inception_date, expiry_date, agent_code,
+                    policy_number, mbl_abl, net_premium, gross_premium,
+                    commission, client_notes
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (
+                company_name, number_of_enrollees, contact, email,
                 hmo_company, inception_date, expiry_date, agent_code,
                 policy_number, mbl_abl, net_premium, gross_premium,
-                commission, client_notes
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            company_name, number_of_enrollees, contact, email,
-            hmo_company, inception_date, expiry_date, agent_code,
-            policy_number, mbl_abl, net_premium, gross_premium,
-            commission, notes
-        ))
+                commission, notes
+            ))
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
 
-        fetch_client_table_data(self)  # Refresh table view, if defined
+        refresh_client_tables(self)  # Refresh table view, if defined
         QMessageBox.information(self, "Success", "HMO Corporate client added successfully!")
 
     except Exception as e:
         QMessageBox.critical(self, "Database Error", f"Failed to insert corporate client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def archive_nonlife_client(self):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
-        
-        selected_rows = self.clients_non_life_dashboard_table.selectionModel().selectedRows()
-        if not selected_rows:
-            QMessageBox.warning(self, "No Selection", "Please select a row to archive.")
-            return
-
-        for model_index in selected_rows:
-            row = model_index.row()
-            policy_number_item = self.clients_non_life_dashboard_table.item(row, 3)  # Assuming column 3 is policy_number
-
-            if not policy_number_item:
-                continue
-
-            policy_number = policy_number_item.text().strip()
-
-            if not policy_number:
-                QMessageBox.warning(self, "Missing Info", "Cannot archive without a valid policy number.")
-                return
-
-            # Update DB
-            cursor.execute("""
-                UPDATE clients_nonlife
-                SET status = 'archived', updated_at = CURRENT_TIMESTAMP
-                WHERE policy_number = %s
-            """, (policy_number,))
-            conn.commit()
 
-        cursor.close()
-        conn.close()
+# statuses a policy can be moved to from the dashboards
+POLICY_STATUSES = ("active", "archived", "deleted")
 
-        QMessageBox.information(self, "Success", "Selected client(s) archived.")
-        fetch_client_table_data(self)
+# HMO dashboards mix both tables, the type column says which one a row came from
+HMO_TYPE_TABLES = {"individual": "clients_hmo_individual", "corporate": "clients_hmo_corporate"}
 
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to archive client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def archive_hmo_client(self):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        selected_rows = self.clients_hmo_dashboard_table.selectionModel().selectedRows()
-        if not selected_rows:
-            QMessageBox.warning(self, "No Selection", "Please select a row to archive.")
-            return
+def set_policy_status(ids_by_table: dict, status: str):
+    """
+    Move policies to a new status with one UPDATE per table, all in one transaction.
 
-        for model_index in selected_rows:
-            row = model_index.row()
-            type_item = self.clients_hmo_dashboard_table.item(row, 2)  # Type column
-            policy_number_item = self.clients_hmo_dashboard_table.item(row, 3)  # Policy number column
+    Args:
+        ids_by_table (dict): Client table name -> list of row ids.
+        status (str): One of POLICY_STATUSES.
 
-            if not type_item or not policy_number_item:
+    Returns:
+        dict: Client table name -> number of rows updated.
+    """
+    if status not in POLICY_STATUSES:
+        raise ValueError(f"Unknown policy status: {status}")
+    for table_name in ids_by_table:
+        if table_name not in CLIENT_TABLES:
+            raise ValueError(f"Not a client table: {table_name}")
+
+    counts = {}
+    with get_connection() as conn, conn.cursor() as cursor:
+        for table_name, ids in ids_by_table.items():
+            if not ids:
                 continue
-
-            hmo_type = type_item.text().strip().lower()
-            policy_number = policy_number_item.text().strip()
-
-            if not policy_number:
-                QMessageBox.warning(self, "Missing Info", "Missing policy number in selected row.")
-                return
-
-            # Determine target table
-            if hmo_type == "individual":
-                table_name = "clients_hmo_individual"
-            elif hmo_type == "corporate":
-                table_name = "clients_hmo_corporate"
-            else:
-                QMessageBox.warning(self, "Unknown Type", f"Unrecognized HMO type: {hmo_type}")
-                return
-
-            # Update the correct table
             cursor.execute(f"""
                 UPDATE {table_name}
-                SET status = 'archived', updated_at = CURRENT_TIMESTAMP
-                WHERE policy_number = %s
-            """, (policy_number,))
-            conn.commit()
-
-        cursor.close()
-        conn.close()
-
-        QMessageBox.information(self, "Success", "Selected HMO client(s) archived.")
-        fetch_client_table_data(self)
+                SET status = %s, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ANY(%s)
+            """, (status, list(ids)))
+            counts[table_name] = cursor.rowcount
+        conn.commit()
+    return counts
 
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to archive HMO client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
+def row_policy(model, row: int, hmo: bool):
+    """
+    (client table, id) of a dashboard row.
 
-def restore_nonlife_client(self):
+    Args:
+        hmo (bool): The row is on an HMO dashboard, column 2 holds Individual/Corporate.
+    """
+    if not hmo:
+        return "clients_nonlife", model.value(row, 0)
+    hmo_type = str(model.value(row, 2)).strip().lower()
+    if hmo_type not in HMO_TYPE_TABLES:
+        raise ValueError(f"Unrecognized HMO type: {hmo_type}")
+    return HMO_TYPE_TABLES[hmo_type], model.value(row, 0)
+
+def selected_policy_ids(table_view, hmo: bool):
+    """Ids of the selected dashboard rows grouped by the client table they live in."""
+    model = source_model(table_view)
+    ids_by_table = {}
+    for row in selected_table_rows(table_view):
+        table_name, policy_id = row_policy(model, row, hmo)
+        ids_by_table.setdefault(table_name, []).append(policy_id)
+    return ids_by_table
+
+def transition_selected_policies(self, table_view, hmo: bool, status: str, action: str, message: str, refresh):
+    """Shared body of the archive/restore/delete buttons: one bulk status change for the whole selection."""
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        selected_rows = self.archives_non_life_dashboard_table.selectionModel().selectedRows()
-        if not selected_rows:
-            QMessageBox.warning(self, "No Selection", "Please select a row to restore.")
+        ids_by_table = selected_policy_ids(table_view, hmo)
+        if not ids_by_table:
+            QMessageBox.warning(self, "No Selection", f"Please select a row to {action}.")
             return
 
-        for model_index in selected_rows:
-            row = model_index.row()
-            policy_number_item = self.archives_non_life_dashboard_table.item(row, 3)  # Column 3 = policy number
-
-            if not policy_number_item:
-                continue
-
-            policy_number = policy_number_item.text().strip()
-
-            if not policy_number:
-                QMessageBox.warning(self, "Missing Info", "Missing policy number in selected row.")
-                return
-
-            cursor.execute("""
-                UPDATE clients_nonlife
-                SET status = 'active', updated_at = CURRENT_TIMESTAMP
-                WHERE policy_number = %s
-            """, (policy_number,))
-            conn.commit()
-
-        cursor.close()
-        conn.close()
+        counts = set_policy_status(ids_by_table, status)
+        for table_name, ids in ids_by_table.items():
+            self.record_cache.invalidate(table_name, ids)
 
-        QMessageBox.information(self, "Success", "Client(s) restored.")
-        fetch_archive_table_data(self)
+        QMessageBox.information(self, "Success", f"{sum(counts.values())} {message}")
+        refresh(self)
 
     except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to restore client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def delete_nonlife_client(self):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        selected_rows = self.archives_non_life_dashboard_table.selectionModel().selectedRows()
-        if not selected_rows:
-            QMessageBox.warning(self, "No Selection", "Please select a row to delete.")
-            return
+        QMessageBox.critical(self, "Error", f"Failed to {action} {'HMO ' if hmo else ''}client:\n{e}")
 
-        for model_index in selected_rows:
-            row = model_index.row()
-            policy_number_item = self.archives_non_life_dashboard_table.item(row, 3)  # Column 3 = policy number
-
-            if not policy_number_item:
-                continue
-
-            policy_number = policy_number_item.text().strip()
-
-            if not policy_number:
-                QMessageBox.warning(self, "Missing Info", "Missing policy number in selected row.")
-                return
-
-            cursor.execute("""
-                UPDATE clients_nonlife
-                SET status = 'deleted', updated_at = CURRENT_TIMESTAMP
-                WHERE policy_number = %s
-            """, (policy_number,))
-            conn.commit()
+def archive_nonlife_client(self):
+    transition_selected_policies(self, self.clients_non_life_dashboard_table, False, "archived",
+                                 "archive", "client(s) archived.", refresh_client_tables)
 
-        cursor.close()
-        conn.close()
+def archive_hmo_client(self):
+    transition_selected_policies(self, self.clients_hmo_dashboard_table, True, "archived",
+                                 "archive", "HMO client(s) archived.", refresh_client_tables)
 
-        QMessageBox.information(self, "Success", "Client(s) marked as deleted.")
-        fetch_archive_table_data(self)
+def restore_nonlife_client(self):
+    transition_selected_policies(self, self.archives_non_life_dashboard_table, False, "active",
+                                 "restore", "client(s) restored.", refresh_archive_tables)
 
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to delete client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
+def delete_nonlife_client(self):
+    transition_selected_policies(self, self.archives_non_life_dashboard_table, False, "deleted",
+                                 "delete", "client(s) marked as deleted.", refresh_archive_tables)
 
 def restore_hmo_client(self):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        selected_rows = self.archives_hmo_dashboard_table.selectionModel().selectedRows()
-        if not selected_rows:
-            QMessageBox.warning(self, "No Selection", "Please select a row to restore.")
-            return
-
-        for model_index in selected_rows:
-            row = model_index.row()
-            policy_number_item = self.archives_hmo_dashboard_table.item(row, 3)  # Column 3 = policy number
-
-            if not policy_number_item:
-                continue
-
-            policy_number = policy_number_item.text().strip()
-
-            if not policy_number:
-                QMessageBox.warning(self, "Missing Info", "Missing policy number in selected row.")
-                return
-
-            # Restore from both individual and corporate tables
-            for table in ("clients_hmo_individual", "clients_hmo_corporate"):
-                cursor.execute(f"""
-                    UPDATE {table}
-                    SET status = 'active', updated_at = CURRENT_TIMESTAMP
-                    WHERE policy_number = %s
-                """, (policy_number,))
-            conn.commit()
-
-        cursor.close()
-        conn.close()
-
-        QMessageBox.information(self, "Success", "HMO client(s) restored.")
-        fetch_archive_table_data(self)
-
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to restore HMO client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
+    transition_selected_policies(self, self.archives_hmo_dashboard_table, True, "active",
+                                 "restore", "HMO client(s) restored.", refresh_archive_tables)
 
 def delete_hmo_client(self):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        selected_rows = self.archives_hmo_dashboard_table.selectionModel().selectedRows()
-        if not selected_rows:
-            QMessageBox.warning(self, "No Selection", "Please select a row to delete.")
-            return
-
-        for model_index in selected_rows:
-            row = model_index.row()
-            policy_number_item = self.archives_hmo_dashboard_table.item(row, 3)  # Column 3 = policy number
-
-            if not policy_number_item:
-                continue
-
-            policy_number = policy_number_item.text().strip()
-
-            if not policy_number:
-                QMessageBox.warning(self, "Missing Info", "Missing policy number in selected row.")
-                return
-
-            # Soft-delete in both HMO tables
-            for table in ("clients_hmo_individual", "clients_hmo_corporate"):
-                cursor.execute(f"""
-                    UPDATE {table}
-                    SET status = 'deleted', updated_at = CURRENT_TIMESTAMP
-                    WHERE policy_number = %s
-                """, (policy_number,))
-            conn.commit()
-
-        cursor.close()
-        conn.close()
-
-        QMessageBox.information(self, "Success", "HMO client(s) marked as deleted.")
-        fetch_archive_table_data(self)
-
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to delete HMO client:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def record_policy_payment_nonlife(self):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        selected_rows = self.clients_non_life_dashboard_table.selectionModel().selectedRows()
-        if not selected_rows:
-            QMessageBox.warning(self, "No Selection", "Please select a policy row.")
-            return
-
-        row = selected_rows[0].row()
-        policy_number = self.clients_non_life_dashboard_table.item(row, 3).text().strip()
-
-        # Get gross premium from clients_nonlife
-        cursor.execute("""
-            SELECT gross_premium
-            FROM clients_nonlife
-            WHERE policy_number = %s
-        """, (policy_number,))
-        result = cursor.fetchone()
-
-        if not result:
-            QMessageBox.critical(self, "Not Found", "Policy not found in clients_nonlife.")
-            return
-
-        gross_premium = result[0] or 0
-
-        # Prompt for amount paid
-        amount_paid, ok = QInputDialog.getDouble(self, "Payment", "Enter amount paid:")
-        if not ok:
-            return
+    transition_selected_policies(self, self.archives_hmo_dashboard_table, True, "deleted",
+                                 "delete", "HMO client(s) marked as deleted.", refresh_archive_tables)
+
+# recompute every policy's running total from client_payments (also the backfill in
+# migrations/0003_policy_balances.sql); the lock keeps payments out until it commits
+BACKFILL_POLICY_BALANCES_QUERY = """
+    LOCK TABLE client_payments IN SHARE MODE;
+    INSERT INTO policy_balances (policy_number, total_paid, payment_count)
+    SELECT policy_number, COALESCE(SUM(amount_paid), 0), COUNT(*)
+    FROM client_payments
+    WHERE policy_number IS NOT NULL
+    GROUP BY policy_number
+    ON CONFLICT (policy_number) DO UPDATE
+    SET total_paid = EXCLUDED.total_paid,
+        payment_count = EXCLUDED.payment_count,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+def backfill_policy_balances():
+    """
+    Rebuild policy_balances from the payment history, e.g. after payments were edited by hand.
 
-        amount_paid = Decimal(str(amount_paid))
+    Returns:
+        int: Number of policies whose balance was written.
+    """
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(BACKFILL_POLICY_BALANCES_QUERY)
+        count = cursor.rowcount
+        conn.commit()
+    return count
 
-        # Prompt for payment method
-        payment_methods = ["Cash", "Bank Transfer", "GCash", "Check", "Others"]
-        method, ok = QInputDialog.getItem(self, "Payment Method", "Select payment method:", payment_methods, 0, False)
-        if not ok or not method:
-            return
+def record_payment(policy_number: str, amount_paid: Decimal, method: str, payment_date, gross_premium: Decimal):
+    """
+    Insert a payment and bump the policy's running total in one transaction.
 
-        payment_date = datetime.now().date()
+    The upsert on policy_balances locks the policy's row until commit, so two
+    payments of the same policy are counted one after the other, and returns
+    the new total, so deciding Paid or Partial never reads the payment history.
 
-        # Calculate total paid so far for this policy
+    Returns:
+        str: "Paid" once the total covers gross_premium, "Partial" otherwise.
+    """
+    with get_connection() as conn, conn.cursor() as cursor:
         cursor.execute("""
-            SELECT COALESCE(SUM(amount_paid), 0)
-            FROM client_payments
-            WHERE policy_number = %s
-        """, (policy_number,))
-        total_paid_before = cursor.fetchone()[0] or 0
-        total_paid_after = total_paid_before + amount_paid
+            INSERT INTO policy_balances (policy_number, total_paid, payment_count)
+            VALUES (%s, %s, 1)
+            ON CONFLICT (policy_number) DO UPDATE
+            SET total_paid = policy_balances.total_paid + EXCLUDED.total_paid,
+                payment_count = policy_balances.payment_count + 1,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING total_paid
+        """, (policy_number, amount_paid))
+        total_paid_after = cursor.fetchone()[0]
 
         status = "Paid" if total_paid_after >= gross_premium else "Partial"
 
-        # Insert new payment
         cursor.execute("""
             INSERT INTO client_payments (
                 policy_number,
@@ -711,48 +958,31 @@ def record_policy_payment_nonlife(self):
         ))
 
         conn.commit()
-        QMessageBox.information(self, "Success", f"Payment recorded. Status: {status}")
-
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to record payment:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def record_policy_payment_hmo(self):
+    return status
+
+def fetch_policy_premium(table_name: str, policy_id):
+    """(policy_number, gross_premium) of a client table row by primary key, None if it is gone."""
+    if table_name not in CLIENT_TABLES:
+        raise ValueError(f"Not a client table: {table_name}")
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(f"SELECT policy_number, gross_premium FROM {table_name} WHERE id = %s", (policy_id,))
+        return cursor.fetchone()
+
+def record_policy_payment(self, table_view, hmo: bool, not_found: str):
+    """Shared body of the Record Payment buttons: ask for the amount and method, then insert the payment."""
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        selected_rows = self.clients_hmo_dashboard_table.selectionModel().selectedRows()
+        selected_rows = selected_table_rows(table_view)
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select a policy row.")
             return
 
-        row = selected_rows[0].row()
-        policy_number = self.clients_hmo_dashboard_table.item(row, 3).text().strip()
-
-        # Try fetching from individual first
-        cursor.execute("""
-            SELECT gross_premium FROM clients_hmo_individual
-            WHERE policy_number = %s
-        """, (policy_number,))
-        result = cursor.fetchone()
-
-        if result is None:
-            # Try corporate instead
-            cursor.execute("""
-                SELECT gross_premium FROM clients_hmo_corporate
-                WHERE policy_number = %s
-            """, (policy_number,))
-            result = cursor.fetchone()
-
-        if not result:
-            QMessageBox.critical(self, "Not Found", "Policy not found in HMO clients.")
+        policy = fetch_policy_premium(*row_policy(source_model(table_view), selected_rows[0], hmo))
+        if not policy:
+            QMessageBox.critical(self, "Not Found", not_found)
             return
 
-        gross_premium = result[0] or Decimal("0.00")
+        policy_number = policy[0]
+        gross_premium = policy[1] or Decimal("0.00")
 
         # Prompt for amount paid
         amount_paid, ok = QInputDialog.getDouble(self, "Payment", "Enter amount paid:")
@@ -769,116 +999,43 @@ def record_policy_payment_hmo(self):
 
         payment_date = datetime.now().date()
 
-        # Calculate total paid so far for this policy
-        cursor.execute("""
-            SELECT COALESCE(SUM(amount_paid), 0)
-            FROM client_payments
-            WHERE policy_number = %s
-        """, (policy_number,))
-        total_paid_before = cursor.fetchone()[0] or Decimal("0.00")
-        if not isinstance(total_paid_before, Decimal):
-            total_paid_before = Decimal(str(total_paid_before))
-
-        total_paid_after = total_paid_before + amount_paid
-        status = "Paid" if total_paid_after >= gross_premium else "Partial"
-
-        # Insert new payment
-        cursor.execute("""
-            INSERT INTO client_payments (
-                policy_number,
-                payment_date, payment_method, status, amount_paid
-            ) VALUES (%s, %s, %s, %s, %s)
-        """, (
-            policy_number,
-            payment_date, method, status, amount_paid
-        ))
-
-        conn.commit()
+        status = record_payment(policy_number, amount_paid, method, payment_date, gross_premium)
         QMessageBox.information(self, "Success", f"Payment recorded. Status: {status}")
 
     except Exception as e:
         QMessageBox.critical(self, "Error", f"Failed to record payment:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def fetch_all_client_payments(self):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT 
-                COALESCE(cnl.assured_name, chmi.assured_name, chmc.company_name) AS client_name,
-                cp.policy_number,
-                cp.amount_paid,
-                cp.payment_method,
-                COALESCE(cnl.gross_premium, chmi.gross_premium, chmc.gross_premium) AS total_premium_due,
-                cp.status,
-                cp.payment_date
-            FROM client_payments cp
-            LEFT JOIN clients_nonlife cnl ON cp.policy_number = cnl.policy_number
-            LEFT JOIN clients_hmo_individual chmi ON cp.policy_number = chmi.policy_number
-            LEFT JOIN clients_hmo_corporate chmc ON cp.policy_number = chmc.policy_number
-            ORDER BY cp.payment_date DESC
-        """)
-
-        rows = cursor.fetchall()
-
-        # Clear existing rows
-        self.client_payments_table.setRowCount(0)
-        self.client_payments_table.setRowCount(len(rows))
-
-        self.client_payments_table.setSortingEnabled(False)  # Freeze sort order
-
-        for row_index, row_data in enumerate(rows):
-            for col_index, value in enumerate(row_data):
-                item = QTableWidgetItem(str(value) if value is not None else "")
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.client_payments_table.setItem(row_index, col_index, item)
-
-        self.client_payments_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.client_payments_count.setText( str(self.client_payments_table.rowCount()) )
-
-        self.client_payments_table.setSortingEnabled(True)  # Re-enable sorting
-
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to fetch client payments:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
+def record_policy_payment_nonlife(self):
+    record_policy_payment(self, self.clients_non_life_dashboard_table, False,
+                          "Policy not found in clients_nonlife.")
 
+def record_policy_payment_hmo(self):
+    record_policy_payment(self, self.clients_hmo_dashboard_table, True,
+                          "Policy not found in HMO clients.")
 
 def register_user(username, password, email=None):
     try:
-        conn = connect()
-        cursor = conn.cursor()
         password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
-        cursor.execute("""
-            INSERT INTO users (username, password_hash, email, status)
-            VALUES (%s, %s, %s, 'pending')
-        """, (username, password_hash, email))
-        conn.commit()
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO users (username, password_hash, email, status)
+                VALUES (%s, %s, %s, 'pending')
+            """, (username, password_hash, email))
+            conn.commit()
         return True
     except Exception as e:
         print("Registration error:", e)
         return False
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
 
 def login_user(username, password):
+    row = None
     try:
-        conn = connect()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT password_hash, status FROM users WHERE username = %s
-        """, (username,))
-        row = cursor.fetchone()
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT password_hash, status FROM users WHERE username = %s
+            """, (username,))
+            row = cursor.fetchone()
 
         if row is None:
             print("Username not found:", username)
@@ -905,122 +1062,159 @@ def login_user(username, password):
         else:
             print("Username not found")
         return False
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
 
-def load_user_account(self, username):
-    try:
-        conn = connect()
-        cursor = conn.cursor()
+def fetch_user_account(username):
+    with get_connection() as conn, conn.cursor() as cursor:
         cursor.execute("""
             SELECT full_name, username, agent_number, email, contact_number
             FROM users
             WHERE username = %s
         """, (username,))
-        user = cursor.fetchone()
-        if user:
-            self.account_full_name_line_edit.setText(user[0] or "")
-            self.account_username_line_edit.setText(user[1] or "")
-            self.account_agent_number_line_edit.setText(user[2] or "")
-            self.account_email_line_edit.setText(user[3] or "")
-            self.account_contact_number_line_edit.setText(user[4] or "")
-        cursor.close()
-        conn.close()
-    except Exception as e:
-        QMessageBox.critical(self, "Error", f"Failed to load account:\n{e}")
+        return cursor.fetchone()
+
+def show_user_account(self, user):
+    if user:
+        self.account_full_name_line_edit.setText(user[0] or "")
+        self.account_username_line_edit.setText(user[1] or "")
+        self.account_agent_number_line_edit.setText(user[2] or "")
+        self.account_email_line_edit.setText(user[3] or "")
+        self.account_contact_number_line_edit.setText(user[4] or "")
+
+def load_user_account(self, username):
+    self.query_executor.submit(
+        TAB_LOAD, fetch_user_account, username,
+        on_result=lambda user: show_user_account(self, user),
+        on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to load account:\n{e}")
+    )
 
 def save_user_account(self, username):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE users
-            SET full_name = %s,
-                agent_number = %s,
-                email = %s,
-                contact_number = %s
-            WHERE username = %s
-        """, (
-            self.account_full_name_line_edit.text(),
-            self.account_agent_number_line_edit.text(),
-            self.account_email_line_edit.text(),
-            self.account_contact_number_line_edit.text(),
-            username
-        ))
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                UPDATE users
+                SET full_name = %s,
+                    agent_number = %s,
+                    email = %s,
+                    contact_number = %s
+                WHERE username = %s
+            """, (
+                self.account_full_name_line_edit.text(),
+                self.account_agent_number_line_edit.text(),
+                self.account_email_line_edit.text(),
+                self.account_contact_number_line_edit.text(),
+                username
+            ))
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
     except Exception as e:
         QMessageBox.critical(self, "Error", f"Failed to save account:\n{e}")
 
 def change_user_password(username, old_password, new_password):
     try:
-        conn = connect()
-        cursor = conn.cursor()
+        with get_connection() as conn, conn.cursor() as cursor:
+            # Get old password hash
+            cursor.execute("SELECT password_hash FROM users WHERE username = %s", (username,))
+            row = cursor.fetchone()
+            if not row:
+                return False
 
-        # Get old password hash
-        cursor.execute("SELECT password_hash FROM users WHERE username = %s", (username,))
-        row = cursor.fetchone()
-        if not row:
-            return False
-
-        stored_hash = row[0]
-        if isinstance(stored_hash, str):
-            stored_hash = stored_hash.encode()
+            stored_hash = row[0]
+            if isinstance(stored_hash, str):
+                stored_hash = stored_hash.encode()
 
-        if not bcrypt.checkpw(old_password.encode(), stored_hash):
-            return False  # old password doesn't match
+            if not bcrypt.checkpw(old_password.encode(), stored_hash):
+                return False  # old password doesn't match
 
-        # Hash new password
-        new_hash = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt()).decode()
+            # Hash new password
+            new_hash = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt()).decode()
 
-        # Update password in DB
-        cursor.execute("UPDATE users SET password_hash = %s WHERE username = %s", (new_hash, username))
-        conn.commit()
+            # Update password in DB
+            cursor.execute("UPDATE users SET password_hash = %s WHERE username = %s", (new_hash, username))
+            conn.commit()
         return True
 
     except Exception as e:
         print("Change password error:", e)
         return False
 
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
+# rows the View Policy panes show, by client table; fetch_policy_details() adds the WHERE
+POLICY_DETAIL_QUERIES = {
+    "clients_nonlife": """
+        SELECT id,
+            assured_name, contact_number, email, birthday,
+            inception_date, expiry_date, net_premium, gross_premium,
+            policy_number, agent_code, payment_invoice, commission,
+            type_of_insurance, insurance_company, amount_covered, client_notes
+        FROM clients_nonlife
+    """,
+    "clients_hmo_individual": "SELECT id, * FROM clients_hmo_individual",
+    "clients_hmo_corporate": "SELECT id, * FROM clients_hmo_corporate",
+}
+
+# rows above and below the current one whose details are fetched before they are double-clicked
+POLICY_PREFETCH_ROWS = int(os.getenv("POLICY_PREFETCH_ROWS", "10"))
+
+def fetch_policy_details(ids_by_table: dict):
+    """{(client table, id): View Policy row} for the given ids, one query per table. Safe on a worker thread."""
+    records = {}
+    with get_connection() as conn, conn.cursor() as cursor:
+        for table_name, ids in ids_by_table.items():
+            if not ids:
+                continue
+            cursor.execute(f"{POLICY_DETAIL_QUERIES[table_name]} WHERE id = ANY(%s)", (list(ids),))
+            for row in cursor.fetchall():
+                records[(table_name, row[0])] = row[1:]
+    return records
+
+def policy_details(self, table_name: str, policy_id):
+    """View Policy row of a policy from the record cache, read from the database on a miss."""
+    data = self.record_cache.get(table_name, policy_id)
+    if data is None:
+        data = fetch_policy_details({table_name: [policy_id]}).get((table_name, policy_id))
+        if data is not None:
+            self.record_cache.put(table_name, policy_id, data)
+    return data
+
+def prefetch_policy_details(self, table_view, hmo: bool):
+    """
+    Cache the details of the rows around the current one in the background, so
+    double-clicking any of them fills the View Policy pane without a query.
+    """
+    proxy = table_view.model()
+    current = table_view.currentIndex()
+    if proxy is None or not current.isValid():
+        return
+    model = source_model(table_view)
+    first = max(current.row() - POLICY_PREFETCH_ROWS, 0)
+    last = min(current.row() + POLICY_PREFETCH_ROWS, proxy.rowCount() - 1)
+
+    ids_by_table = {}
+    for proxy_row in range(first, last + 1):
+        try:
+            key = row_policy(model, source_row(table_view, proxy.index(proxy_row, 0)), hmo)
+        except ValueError:
+            continue
+        if key not in self.record_cache:
+            ids_by_table.setdefault(key[0], []).append(key[1])
+    if not ids_by_table:
+        return
+
+    generation = self.record_cache.generation()
+    self.query_executor.submit(
+        "policy_details", fetch_policy_details, ids_by_table,
+        on_result=lambda records: self.record_cache.put_many(records, generation),
+        on_error=lambda e: print(f"Error prefetching policy details: {e}")
+    )
 
 def handle_nonlife_row_double_click(self, row, column):
     try:
-        policy_number_item = self.clients_non_life_dashboard_table.item(row, 3)  # Assuming col 3 is policy_number
-        if not policy_number_item:
-            return
-
-        policy_number = policy_number_item.text().strip()
-        if not policy_number:
-            return
-
-        # Fetch policy data
-        conn = connect()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                assured_name, contact_number, email, birthday,
-                inception_date, expiry_date, net_premium, gross_premium,
-                policy_number, agent_code, payment_invoice, commission,
-                type_of_insurance, insurance_company, amount_covered, client_notes
-            FROM clients_nonlife
-            WHERE policy_number = %s
-        """, (policy_number,))
-        data = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        table_name, policy_id = row_policy(source_model(self.clients_non_life_dashboard_table), row, False)
+        data = policy_details(self, table_name, policy_id)
 
         if not data:
             QMessageBox.warning(self, "Not Found", "Client not found in database.")
             return
+        self.viewed_policy_ids[table_name] = policy_id
 
         # Populate the View Policy fields (replace these with your actual field variable names)
         self.clients_non_life_view_policy_assured_name_line_edit.setText(data[0] or "")
@@ -1048,19 +1242,14 @@ def handle_nonlife_row_double_click(self, row, column):
 
 def handle_hmo_row_double_click(self, row, column):
     try:
-        policy_number_item = self.clients_hmo_dashboard_table.item(row, 3)
-        if not policy_number_item:
-            return
-
-        policy_number = policy_number_item.text().strip()
-
-        conn = connect()
-        cursor = conn.cursor()
-
-        # Try individual first
-        cursor.execute("SELECT * FROM clients_hmo_individual WHERE policy_number = %s", (policy_number,))
-        result = cursor.fetchone()
-
+        table_name, policy_id = row_policy(source_model(self.clients_hmo_dashboard_table), row, True)
+        data = policy_details(self, table_name, policy_id)
+        if data:
+            self.viewed_policy_ids[table_name] = policy_id
+        individual = data if table_name == "clients_hmo_individual" else None
+        corporate = data if table_name == "clients_hmo_corporate" else None
+
+        result = individual
         if result:
             self.clients_hmo_tab_widget.setCurrentIndex(2)
             self.clients_hmo_view_policy_tab_widget.setCurrentIndex(0)  # Individual tab
@@ -1081,10 +1270,7 @@ def handle_hmo_row_double_click(self, row, column):
             self.clients_hmo_view_policy_individual_notes_text_edit.setPlainText(result[15] or "")
             return
 
-        # Try corporate if not individual
-        cursor.execute("SELECT * FROM clients_hmo_corporate WHERE policy_number = %s", (policy_number,))
-        result = cursor.fetchone()
-
+        result = corporate
         if result:
             self.clients_hmo_tab_widget.setCurrentIndex(2)
             self.clients_hmo_view_policy_tab_widget.setCurrentIndex(1)  # Corporate tab
@@ -1105,16 +1291,9 @@ def handle_hmo_row_double_click(self, row, column):
             self.clients_hmo_view_policy_corporate_notes_text_edit.setPlainText(result[15] or "")
     except Exception as e:
         QMessageBox.critical(self, "Error", f"Failed to fetch policy:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
 
 def update_nonlife_policy(self):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
         # Extract updated values from View Policy fields
         name = self.clients_non_life_view_policy_assured_name_line_edit.text()
         contact = self.clients_non_life_view_policy_contact_number_line_edit.text()
@@ -1173,54 +1352,55 @@ def update_nonlife_policy(self):
                 QMessageBox.warning(self, "Invalid Email", "Please enter a valid email address.")
                 return
 
+        policy_id = self.viewed_policy_ids.get("clients_nonlife")
+        if policy_id is None:
+            QMessageBox.warning(self, "No Policy", "Double-click a policy on the dashboard first.")
+            return
+
         # Perform update
-        cursor.execute("""
-            UPDATE clients_nonlife
-            SET
-                assured_name = %s,
-                contact_number = %s,
-                email = %s,
-                birthday = %s,
-                inception_date = %s,
-                expiry_date = %s,
-                net_premium = %s,
-                gross_premium = %s,
-                agent_code = %s,
-                payment_invoice = %s,
-                commission = %s,
-                type_of_insurance = %s,
-                insurance_company = %s,
-                amount_covered = %s,
-                client_notes = %s,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE policy_number = %s
-        """, (
-            name, contact, email, birthday,
-            inception_date, expiry_date, net_premium, gross_premium,
-            agent_code, payment_invoice, commission, insurance_type,
-            insurance_company, amount_covered, notes,
-            policy_number
-        ))
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                UPDATE clients_nonlife
+                SET
+                    assured_name = %s,
+                    contact_number = %s,
+                    email = %s,
+                    birthday = %s,
+                    inception_date = %s,
+                    expiry_date = %s,
+                    net_premium = %s,
+                    gross_premium = %s,
+                    agent_code = %s,
+                    payment_invoice = %s,
+                    commission = %s,
+                    type_of_insurance = %s,
+                    insurance_company = %s,
+                    amount_covered = %s,
+                    client_notes = %s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = %s
+            """, (
+                name, contact, email, birthday,
+                inception_date, expiry_date, net_premium, gross_premium,
+                agent_code, payment_invoice, commission, insurance_type,
+                insurance_company, amount_covered, notes,
+                policy_id
+            ))
 
-        conn.commit()
+            conn.commit()
+        # the View Policy pane reads the cache, drop the old version
+        self.record_cache.invalidate("clients_nonlife", [policy_id])
         QMessageBox.information(self, "Success", "Policy updated successfully.")
-        fetch_client_table_data(self)
+        refresh_client_tables(self)
 
         # Optionally make fields read-only again
         self.set_view_policy_fields_readonly(True)
 
     except Exception as e:
         QMessageBox.critical(self, "Error", f"Failed to update policy:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
 
 def update_hmo_individual_policy(self):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
         # Extract values from individual view policy widgets
         name = self.clients_hmo_view_policy_individual_assured_name_line_edit.text().strip()
         contact = self.clients_hmo_view_policy_individual_contact_number_line_edit.text().strip()
@@ -1260,38 +1440,39 @@ def update_hmo_individual_policy(self):
         gross = parse_float(gross)
         commission = parse_float(commission)
 
+        policy_id = self.viewed_policy_ids.get("clients_hmo_individual")
+        if policy_id is None:
+            QMessageBox.warning(self, "No Policy", "Double-click a policy on the dashboard first.")
+            return
+
         # Perform update
-        cursor.execute("""
-            UPDATE clients_hmo_individual
-            SET assured_name=%s, contact_number=%s, email=%s, birthday=%s,
-                inception_date=%s, expiry_date=%s, agent_code=%s,
-                mbl_abl=%s, net_premium=%s, gross_premium=%s, commission=%s,
-                client_notes=%s, hmo_company=%s
-            WHERE policy_number=%s
-        """, (
-            name, contact, email, birthday, inception, expiry, agent_code,
-            mbl_abl, net, gross, commission, notes, hmo_company, policy_number
-        ))
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                UPDATE clients_hmo_individual
+                SET assured_name=%s, contact_number=%s, email=%s, birthday=%s,
+                    inception_date=%s, expiry_date=%s, agent_code=%s,
+                    mbl_abl=%s, net_premium=%s, gross_premium=%s, commission=%s,
+                    client_notes=%s, hmo_company=%s, updated_at = CURRENT_TIMESTAMP
+                WHERE id=%s
+            """, (
+                name, contact, email, birthday, inception, expiry, agent_code,
+                mbl_abl, net, gross, commission, notes, hmo_company, policy_id
+            ))
 
-        conn.commit()
+            conn.commit()
+        # the View Policy pane reads the cache, drop the old version
+        self.record_cache.invalidate("clients_hmo_individual", [policy_id])
         QMessageBox.information(self, "Updated", "Policy updated successfully.")
-        fetch_client_table_data(self)
+        refresh_client_tables(self)
 
         # Optionally make fields read-only again
         self.set_hmo_individual_view_policy_fields_readonly(True)
 
     except Exception as e:
         QMessageBox.critical(self, "Error", f"Update failed:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
 
 def update_hmo_corporate_policy(self):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
         # Extract values from corporate view policy widgets
         name = self.clients_hmo_view_policy_corporate_company_name_line_edit.text().strip()
         contact = self.clients_hmo_view_policy_corporate_contact_number_line_edit.text().strip()
@@ -1330,140 +1511,208 @@ def update_hmo_corporate_policy(self):
         gross = parse_float(gross)
         commission = parse_float(commission)
 
-        cursor.execute("""
-            UPDATE clients_hmo_corporate
-            SET company_name=%s, contact_number=%s, email=%s, number_of_enrollees=%s,
-                inception_date=%s, expiry_date=%s, agent_code=%s, mbl_abl=%s,
-                net_premium=%s, gross_premium=%s, commission=%s, client_notes=%s,
-                hmo_company=%s
-            WHERE policy_number=%s
-        """, (
-            name, contact, email, enrollees, inception, expiry, agent_code,
-            mbl_abl, net, gross, commission, notes, hmo_company, policy_number
-        ))
+        policy_id = self.viewed_policy_ids.get("clients_hmo_corporate")
+        if policy_id is None:
+            QMessageBox.warning(self, "No Policy", "Double-click a policy on the dashboard first.")
+            return
 
-        conn.commit()
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                UPDATE clients_hmo_corporate
+                SET company_name=%s, contact_number=%s, email=%s, number_of_enrollees=%s,
+                    inception_date=%s, expiry_date=%s, agent_code=%s, mbl_abl=%s,
+                    net_premium=%s, gross_premium=%s, commission=%s, client_notes=%s,
+                    hmo_company=%s, updated_at = CURRENT_TIMESTAMP
+                WHERE id=%s
+            """, (
+                name, contact, email, enrollees, inception, expiry, agent_code,
+                mbl_abl, net, gross, commission, notes, hmo_company, policy_id
+            ))
+
+            conn.commit()
+        # the View Policy pane reads the cache, drop the old version
+        self.record_cache.invalidate("clients_hmo_corporate", [policy_id])
         QMessageBox.information(self, "Updated", "Corporate policy updated successfully.")
-        fetch_client_table_data(self)
+        refresh_client_tables(self)
 
         # Optionally make fields read-only again
         self.set_hmo_corporate_view_policy_fields_readonly(True)
 
     except Exception as e:
         QMessageBox.critical(self, "Error", f"Update failed:\n{e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def fetch_company_expenses(self):
-    load_table_data("company_expenses", self.company_expenses_table, ["amount", "expense_category", "payment_method", "department", "expense_date"])
-    self.company_expenses_count.setText( str(self.company_expenses_table.rowCount()) )
 
 def insert_company_expense(self, data):
     try:
-        conn = connect()
-        cursor = conn.cursor()
-
         insert_query = """
             INSERT INTO company_expenses (amount, expense_category, payment_method, department, expense_date)
             VALUES (%s, %s, %s, %s, %s)
         """
-        cursor.execute(insert_query, (
-            data["amount"],
-            data["expense_category"],
-            data["payment_method"],
-            data["department"],
-            data["expense_date"]
-        ))
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(insert_query, (
+                data["amount"],
+                data["expense_category"],
+                data["payment_method"],
+                data["department"],
+                data["expense_date"]
+            ))
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
 
         QMessageBox.information(self, "Success", "Expense added successfully!")
 
-        fetch_company_expenses(self)
+        refresh_collection_tables(self)
 
     except Exception as e:
         QMessageBox.critical(self, "Database Error", f"Failed to insert expense: {e}")
 
-def fetch_clients_nonlife_by_ids(client_ids):
-    if not client_ids:
-        return [], []
+# notification center sections, in display order; the CASE in ACTIVE_NOTIFICATIONS_QUERY returns the index
+NOTIFICATION_BUCKETS = ["Expired Policies", "This Week", "Next Week", "This Month", "Upcoming Months"]
+UPCOMING_BUCKET = NOTIFICATION_BUCKETS.index("Upcoming Months")
+
+# tables the notification center reads, reloaded when another workstation changes them
+NOTIFICATION_TABLES = CLIENT_TABLES + ("dismissed_notifications",)
+
+# active, non-dismissed policies of all three client tables with the bucket computed server-side
+ACTIVE_NOTIFICATIONS_QUERY = """
+    SELECT policy_number, client_name, expiry_date,
+           CASE
+               WHEN expiry_date <= CURRENT_DATE THEN 0
+               WHEN expiry_date <= CURRENT_DATE + 7 THEN 1
+               WHEN expiry_date <= CURRENT_DATE + 14 THEN 2
+               WHEN expiry_date <= CURRENT_DATE + 30 THEN 3
+               ELSE 4
+           END AS bucket
+    FROM policies p
+    WHERE p.status = 'active'
+      AND NOT EXISTS (SELECT 1 FROM dismissed_notifications d WHERE d.policy_number = p.policy_number)
+"""
+
+def fetch_expiring_policies(limit: int = NOTIFICATION_BUCKET_LIMIT):
+    """
+    First `limit` notifications of every bucket, soonest expiry first, in one round trip.
 
-    conn = connect()
-    try:
-        cursor = conn.cursor()
-        #print(len(client_ids))
-        placeholders = ','.join(['%s'] * len(client_ids))
-        #print(placeholders)
-        query = f"SELECT * FROM clients_nonlife WHERE id IN ({placeholders})"
-        #print(query)
-        cursor.execute(query, client_ids)
-        rows = cursor.fetchall()
-        headers = [desc[0] for desc in cursor.description]
-        return rows, headers
-    finally:
-        cursor.close()
-        conn.close()
-
-def fetch_clients_hmo_individual_by_ids(client_ids):
-    if not client_ids:
-        return [], []
-
-    conn = connect()
-    try:
-        cursor = conn.cursor()
-        #print(len(client_ids))
-        placeholders = ','.join(['%s'] * len(client_ids))
-        #print(placeholders)
-        query = f"SELECT * FROM clients_hmo_individual WHERE id IN ({placeholders})"
-        #print(query)
-        cursor.execute(query, client_ids)
-        rows = cursor.fetchall()
-        headers = [desc[0] for desc in cursor.description]
-        return rows, headers
-    finally:
-        cursor.close()
-        conn.close()
-
-def fetch_clients_nonlife_corporate_by_ids(client_ids):
-    if not client_ids:
-        return [], []
-
-    conn = connect()
-    try:
-        cursor = conn.cursor()
-        #print(len(client_ids))
-        placeholders = ','.join(['%s'] * len(client_ids))
-        #print(placeholders)
-        query = f"SELECT * FROM clients_nonlife WHERE id IN ({placeholders})"
-        #print(query)
-        cursor.execute(query, client_ids)
-        rows = cursor.fetchall()
-        headers = [desc[0] for desc in cursor.description]
-        return rows, headers
-    finally:
-        cursor.close()
-        conn.close()
-
-def fetch_clients_hmo_corporate_by_ids(client_ids):
-    if not client_ids:
-        return [], []
-
-    conn = connect()
-    try:
-        cursor = conn.cursor()
-        #print(len(client_ids))
-        placeholders = ','.join(['%s'] * len(client_ids))
-        #print(placeholders)
-        query = f"SELECT * FROM clients_hmo_corporate WHERE id IN ({placeholders})"
-        #print(query)
-        cursor.execute(query, client_ids)
-        rows = cursor.fetchall()
-        headers = [desc[0] for desc in cursor.description]
-        return rows, headers
-    finally:
-        cursor.close()
-        conn.close()
+    Returns:
+        tuple: ({bucket name: [(policy_number, client_name, expiry_date), ...]},
+                {bucket name: total notifications in the bucket})
+    """
+    query = f"""
+        SELECT bucket, policy_number, client_name, expiry_date, bucket_count
+        FROM (
+            SELECT *,
+                   row_number() OVER (PARTITION BY bucket ORDER BY expiry_date, policy_number) AS bucket_row,
+                   count(*) OVER (PARTITION BY bucket) AS bucket_count
+            FROM ({ACTIVE_NOTIFICATIONS_QUERY}) AS notifications
+        ) AS ranked
+        WHERE bucket_row <= %s
+        ORDER BY bucket, bucket_row
+    """
+    grouped = {name: [] for name in NOTIFICATION_BUCKETS}
+    counts = {name: 0 for name in NOTIFICATION_BUCKETS}
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(query, (limit,))
+        for bucket, policy_number, client_name, expiry_date, bucket_count in cursor.fetchall():
+            name = NOTIFICATION_BUCKETS[bucket]
+            grouped[name].append((policy_number, client_name, expiry_date))
+            counts[name] = bucket_count
+    return grouped, counts
+
+def fetch_upcoming_policies(after, limit: int = NOTIFICATION_BUCKET_LIMIT):
+    """
+    Next page of the Upcoming Months bucket for the notification center's "Load more".
+
+    Args:
+        after (tuple): (expiry_date, policy_number) of the last notification already shown.
+    """
+    query = f"""
+        SELECT policy_number, client_name, expiry_date
+        FROM ({ACTIVE_NOTIFICATIONS_QUERY}) AS notifications
+        WHERE bucket = %s AND (expiry_date, policy_number) > (%s, %s)
+        ORDER BY expiry_date, policy_number
+        LIMIT %s
+    """
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(query, (UPCOMING_BUCKET, after[0], after[1], limit))
+        return cursor.fetchall()
+
+def dismiss_notifications(dismissals):
+    """
+    Hide policies from the notification center for good, in one statement.
+
+    Args:
+        dismissals (list): (policy_number, dismissed_at) pairs; policies dismissed before are skipped.
+    """
+    if not dismissals:
+        return
+    with get_connection() as conn, conn.cursor() as cursor:
+        psycopg2.extras.execute_values(cursor, """
+            INSERT INTO dismissed_notifications (policy_number, dismissed_at)
+            VALUES %s
+            ON CONFLICT (policy_number) DO NOTHING;
+        """, dismissals, page_size=len(dismissals))
+        conn.commit()
+
+# id lists longer than this are bulk-loaded into a temp table instead of bound as one array
+IDS_TEMP_TABLE_THRESHOLD = int(os.getenv("IDS_TEMP_TABLE_THRESHOLD", "50000"))
+
+def ids_relation(cursor, ids):
+    """
+    FROM-clause relation `wanted(id, position)` over a list of row ids, position counting from 1 in list order.
+
+    Short lists are bound as a single int[] parameter and unnested WITH ORDINALITY.
+    Long ones are COPY-loaded into a temp table on the cursor's connection, so the
+    SQL text stays small and the planner gets real statistics for the join; the
+    table lives until the transaction ends.
+
+    Returns:
+        tuple: (sql fragment, params) to splice into the query.
+    """
+    ids = list(ids)
+    if len(ids) <= IDS_TEMP_TABLE_THRESHOLD:
+        return "unnest(%s::int[]) WITH ORDINALITY AS wanted(id, position)", (ids,)
+
+    cursor.execute("DROP TABLE IF EXISTS wanted_ids")
+    cursor.execute("CREATE TEMP TABLE wanted_ids (id integer, position bigint) ON COMMIT DROP")
+    cursor.copy_expert(
+        "COPY wanted_ids (id, position) FROM STDIN",
+        io.StringIO("".join(f"{row_id}\t{position}\n" for position, row_id in enumerate(ids, 1)))
+    )
+    cursor.execute("ANALYZE wanted_ids")
+    return "wanted_ids AS wanted", ()
+
+def policy_export_total(cursor, table_name: str, status: str = "active", ids=None):
+    """Rows an export of policy_export_query() will write, for progress reporting."""
+    if ids is not None:
+        return len(ids)
+    cursor.execute(f"SELECT count(*) FROM {table_name} WHERE status = %s", (status,))
+    return cursor.fetchone()[0]
+
+def policy_export_query(cursor, table_name: str, status: str = "active", ids=None, order_by=None):
+    """
+    (query, params) selecting every column of a client table for an export, run it on the same cursor.
+
+    Args:
+        ids (list): Only these rows, in this order (e.g. the matches of a dashboard search as shown);
+            None exports every policy with the status.
+        order_by (tuple): (column name, descending) of a sorted dashboard, see export_sort_order();
+            only used without ids, which are already in on-screen order. None sorts by id.
+    """
+    if table_name not in CLIENT_TABLES:
+        raise ValueError(f"Not a client table: {table_name}")
+    if ids is None:
+        order = "id"
+        if order_by is not None:
+            column, descending = order_by
+            if not column.isidentifier():
+                raise ValueError(f"Not a column name: {column}")
+            # NULLs last either way, like RecordTableModel.sort; ties by id
+            order = f"{column} {'DESC' if descending else 'ASC'} NULLS LAST, id"
+        return f"SELECT * FROM {table_name} WHERE status = %s ORDER BY {order}", (status,)
+    relation, params = ids_relation(cursor, ids)
+    query = f"""
+        SELECT t.*
+        FROM {relation}
+        JOIN {table_name} t ON t.id = wanted.id
+        WHERE t.status = %s
+        ORDER BY wanted.position
+    """
+    return query, params + (status,)
@@ -0,0 +1,261 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from psycopg2 import extensions
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection frees up before the checkout timeout."""
+
+
+class PoolClosed(Exception):
+    """Raised when checking out from a pool that has been closed."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of PostgreSQL connections.
+
+    Connections are opened lazily up to max_size and handed back out LIFO so the
+    warmest connection is reused first. Idle connections are health-checked before
+    reuse and reaped down to min_size once they have been idle for max_idle seconds.
+    The last main_thread_reserve connections only go to the main (GUI) thread, so
+    worker threads and the cursors they leave open can never make it wait for one.
+
+    Args:
+        connect_func (callable): Opens a new psycopg2 connection (one full handshake).
+        min_size (int): Connections kept open even when idle.
+        max_size (int): Hard cap on open connections; extra checkouts wait.
+        max_idle (float): Seconds an idle connection above min_size is kept before reaping.
+        health_check_after (float): Idle seconds after which a connection is pinged before reuse.
+        timeout (float): Seconds a checkout waits for a free connection before PoolTimeout.
+        reap_interval (float): Seconds between background reaper passes (0 disables the thread).
+        main_thread_reserve (int): Connections other threads leave for the main thread.
+    """
+
+    def __init__(self, connect_func, min_size=1, max_size=5, max_idle=300.0,
+                 health_check_after=30.0, timeout=30.0, reap_interval=60.0, main_thread_reserve=0):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+        if main_thread_reserve < 0 or main_thread_reserve >= max_size:
+            raise ValueError(f"Invalid main_thread_reserve={main_thread_reserve} for max_size={max_size}")
+
+        self.connect_func = connect_func
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.health_check_after = health_check_after
+        self.timeout = timeout
+        self.reap_interval = reap_interval
+        self.main_thread_reserve = main_thread_reserve
+
+        self._cond = threading.Condition()
+        self._idle = []         # (connection, last_used) pairs, most recently used last
+        self._size = 0          # open connections, idle + checked out + being opened
+        self._closed = False
+        self._reaper = None
+        self._stop_reaper = threading.Event()
+
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "timeouts": 0,
+            "handshakes": 0,
+            "handshakes_avoided": 0,
+            "health_check_failures": 0,
+            "discarded": 0,
+            "reaped": 0,
+        }
+
+    def getconn(self, timeout=None):
+        """Check out a connection, opening or waiting for one if none are idle."""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        wait_started = None
+        reserve = 0 if threading.current_thread() is threading.main_thread() else self.main_thread_reserve
+
+        with self._cond:
+            self._start_reaper()
+            while True:
+                if self._closed:
+                    raise PoolClosed("Connection pool is closed")
+                # idle connections plus the ones that may still be opened
+                available = len(self._idle) + self.max_size - self._size
+                if self._idle and available > reserve:
+                    conn, last_used = self._idle.pop()
+                    break
+                if available > reserve:
+                    self._size += 1     # reserve the slot; the handshake happens outside the lock
+                    conn, last_used = None, None
+                    break
+
+                if wait_started is None:
+                    wait_started = time.monotonic()
+                    self._stats["waits"] += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    self._stats["timeouts"] += 1
+                    self._stats["wait_time"] += time.monotonic() - wait_started
+                    raise PoolTimeout(f"No database connection available after {timeout:.0f}s")
+
+            self._stats["checkouts"] += 1
+            if wait_started is not None:
+                self._stats["wait_time"] += time.monotonic() - wait_started
+
+        if conn is not None:
+            if self._is_healthy(conn, last_used):
+                with self._cond:
+                    self._stats["handshakes_avoided"] += 1
+                return conn
+            # Reuse the slot of the dead connection for a fresh one
+            with self._cond:
+                self._stats["health_check_failures"] += 1
+                self._stats["discarded"] += 1
+            self._close_quietly(conn)
+
+        return self._open()
+
+    def putconn(self, conn, discard=False):
+        """Return a checked-out connection; broken or discarded ones are closed."""
+        if not discard and not conn.closed:
+            try:
+                # Never hand out a connection in the middle of someone else's transaction
+                if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            if discard or conn.closed or self._closed:
+                self._size -= 1
+                self._stats["discarded"] += 1
+                close_conn = True
+            else:
+                self._idle.append((conn, time.monotonic()))
+                close_conn = False
+            # all waiters: the one woken first may be a worker thread the reserve still keeps waiting
+            self._cond.notify_all()
+
+        if close_conn:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Check out a connection for the duration of a with-block.
+
+        Uncommitted work is rolled back when the block exits, so callers still
+        commit explicitly, exactly as they would with a dedicated connection.
+        """
+        conn = self.getconn(timeout)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def warm(self):
+        """Open connections until at least min_size exist."""
+        opened = []
+        try:
+            while True:
+                with self._cond:
+                    if self._closed or self._size >= self.min_size:
+                        break
+                    self._size += 1
+                opened.append(self._open())
+        finally:
+            for conn in opened:
+                self.putconn(conn)
+
+    def reap(self):
+        """Close connections that have sat idle longer than max_idle, keeping min_size open."""
+        now = time.monotonic()
+        reaped = []
+        with self._cond:
+            keep = []
+            # Oldest first, so the warm end of the LIFO stack survives
+            for conn, last_used in self._idle:
+                if self._size > self.min_size and now - last_used > self.max_idle:
+                    self._size -= 1
+                    reaped.append(conn)
+                else:
+                    keep.append((conn, last_used))
+            self._idle = keep
+            self._stats["reaped"] += len(reaped)
+
+        for conn in reaped:
+            self._close_quietly(conn)
+        return len(reaped)
+
+    def stats(self):
+        """Snapshot of pool counters, useful for sizing min_size/max_size."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["size"] = self._size
+            stats["idle"] = len(self._idle)
+            stats["in_use"] = self._size - len(self._idle)
+            stats["min_size"] = self.min_size
+            stats["max_size"] = self.max_size
+        return stats
+
+    def close(self):
+        """Close idle connections now; checked-out ones are closed when returned."""
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._size -= len(idle)
+            self._idle = []
+            self._cond.notify_all()
+        self._stop_reaper.set()
+
+        for conn in idle:
+            self._close_quietly(conn)
+
+    def _open(self):
+        try:
+            conn = self.connect_func()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            self._stats["handshakes"] += 1
+        return conn
+
+    def _is_healthy(self, conn, last_used):
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.health_check_after:
+            return True
+
+        # Idle long enough that the server or a proxy may have dropped it
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _start_reaper(self):
+        # Called with self._cond held
+        if self._reaper is not None or self.reap_interval <= 0:
+            return
+
+        def run():
+            while not self._stop_reaper.wait(self.reap_interval):
+                self.reap()
+
+        self._reaper = threading.Thread(target=run, name="db-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
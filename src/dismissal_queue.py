@@ -0,0 +1,125 @@
+import json
+import os
+from datetime import datetime
+
+from PyQt6.QtCore import QObject, QTimer
+
+import db_func
+
+# wait this long after a dismissal so a run of clicks goes out as one INSERT
+DISMISS_FLUSH_MS = int(os.getenv("DISMISS_FLUSH_MS", "2000"))
+# retry delay while the database is unreachable, doubled per failure up to the max
+DISMISS_RETRY_MS = int(os.getenv("DISMISS_RETRY_MS", "5000"))
+DISMISS_RETRY_MAX_MS = int(os.getenv("DISMISS_RETRY_MAX_MS", "300000"))
+# dismissals that could not be written yet survive a restart here
+PENDING_DISMISSALS_FILE = os.getenv(
+    "PENDING_DISMISSALS_FILE",
+    os.path.join(os.path.expanduser("~"), ".investopinoy_pending_dismissals.json"),
+)
+
+
+class DismissalQueue(QObject):
+    """
+    Collects notification dismissals and writes them to dismissed_notifications in batches.
+
+    add() only records the policy; the card is already gone from the view. A
+    timer flushes everything queued with one multi-row INSERT on the query
+    executor. If the database can't be reached the batch goes back in the
+    queue, is saved to PENDING_DISMISSALS_FILE and retried with backoff; the
+    file is read back on the next start, so a dismissal is never lost.
+
+    Args:
+        executor (QueryExecutor): Runs the INSERTs off the GUI thread.
+    """
+
+    def __init__(self, executor, parent=None, path=PENDING_DISMISSALS_FILE):
+        super().__init__(parent)
+        self.executor = executor
+        self.path = path
+        self._pending = {}      # policy_number -> dismissed_at, in click order
+        self._in_flight = {}    # the batch currently being written
+        self._retry_ms = DISMISS_RETRY_MS
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+        self._load()
+        if self._pending:
+            self.timer.start(0)
+
+    def add(self, policy_number):
+        self._pending.setdefault(policy_number, datetime.now())
+        if not self.timer.isActive():
+            self.timer.start(DISMISS_FLUSH_MS)
+
+    def pending(self):
+        """Policies dismissed but not written yet, the notification center keeps hiding them."""
+        return set(self._pending) | set(self._in_flight)
+
+    def flush(self):
+        """Write everything queued in the background."""
+        if self._in_flight or not self._pending:
+            return
+        self._in_flight, self._pending = self._pending, {}
+        self.executor.submit(
+            None, db_func.dismiss_notifications, list(self._in_flight.items()),
+            on_result=lambda _: self._flushed(),
+            on_error=self._flush_failed
+        )
+
+    def flush_now(self):
+        """Write everything queued before the app exits; whatever fails is saved for the next start."""
+        self.timer.stop()
+        batch = {**self._in_flight, **self._pending}
+        if not batch:
+            return
+        try:
+            db_func.dismiss_notifications(list(batch.items()))
+        except Exception as e:
+            print(f"❌ Failed to insert dismissed policies, keeping them for the next start: {e}")
+            self._save(batch)
+        else:
+            self._pending.clear()
+            self._in_flight.clear()
+            self._save({})
+
+    def _flushed(self):
+        self._in_flight = {}
+        self._retry_ms = DISMISS_RETRY_MS
+        if self._pending:
+            self.timer.start(DISMISS_FLUSH_MS)
+        else:
+            self._save({})
+
+    def _flush_failed(self, error):
+        print(f"❌ Failed to insert dismissed policies, retrying in {self._retry_ms / 1000:g}s: {error}")
+        # put the batch back in front of anything clicked meanwhile
+        self._pending = {**self._in_flight, **self._pending}
+        self._in_flight = {}
+        self._save(self._pending)
+        self.timer.start(self._retry_ms)
+        self._retry_ms = min(self._retry_ms * 2, DISMISS_RETRY_MAX_MS)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable pending dismissals file {self.path}: {e}")
+            return
+        for policy_number, dismissed_at in saved:
+            self._pending.setdefault(policy_number, datetime.fromisoformat(dismissed_at))
+
+    def _save(self, batch):
+        try:
+            if not batch:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump([[policy_number, dismissed_at.isoformat()] for policy_number, dismissed_at in batch.items()], f)
+        except OSError as e:
+            print(f"Failed to save pending dismissals to {self.path}: {e}")
@@ -0,0 +1,354 @@
+import multiprocessing
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QPushButton, QHeaderView,
+    QStyledItemDelegate, QStyleOptionProgressBar, QStyle, QApplication, QAbstractItemView
+)
+
+import db_func
+from exports import get_writer
+
+# exports allowed to run at the same time, each in its own process with its own database connection
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "2"))
+
+# one export: what to write, from which client table, which rows (None = the whole book) and where;
+# order_by is the (column, descending) a whole-book export is sorted by, None for id order
+ExportJob = namedtuple("ExportJob", "format table_name path ids status order_by", defaults=("active", None))
+
+# job states
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "Queued", "Running", "Done", "Failed", "Cancelled"
+
+
+def run_export_job(job, task=None):
+    """Write one ExportJob. Returns rows written, None when cancelled."""
+    writer = get_writer(job.format)
+    return writer(job.table_name, job.path, job.status, job.ids, order_by=job.order_by, task=task)
+
+
+class ExportTask:
+    """
+    What a writer gets as its task inside an export process.
+
+    Stands in for QueryTask: the cancel flag is an Event shared with the
+    GUI process and progress goes back over the queue's progress queue as
+    (job_id, done, total).
+    """
+
+    def __init__(self, job_id, cancelled, progress):
+        self.job_id = job_id
+        self.cancelled = cancelled
+        self.progress = progress
+
+    def is_cancelled(self):
+        return self.cancelled.is_set()
+
+    def report_progress(self, done, total):
+        self.progress.put((self.job_id, done, total))
+
+
+def init_export_process():
+    # an export process runs one export at a time on its main thread, one connection is all it needs
+    db_func.POOL_MIN_SIZE = db_func.POOL_MAX_SIZE = 1
+    db_func.POOL_MAIN_THREAD_RESERVE = 0
+
+
+def run_export_process(job_id, job, cancelled, progress):
+    """Write one ExportJob in an export process, see ExportJobQueue."""
+    task = ExportTask(job_id, cancelled, progress)
+    if task.is_cancelled():
+        return None
+    task.report_progress(0, len(job.ids) if job.ids is not None else 0)    # shows the job as running
+    return run_export_job(job, task=task)
+
+
+class JobState:
+    def __init__(self, job_id, job):
+        self.job_id = job_id
+        self.job = job
+        self.status = QUEUED
+        self.done = 0
+        self.total = len(job.ids) if job.ids is not None else 0
+        self.started = None
+        self.finished = None
+        self.error = None
+        self.future = None
+        self.cancelled = None           # Event the export process checks between batches
+        self.cancel_requested = False
+
+    def rows_per_second(self):
+        if self.started is None:
+            return 0
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        return self.done / elapsed if elapsed > 0 else 0
+
+
+class ExportJobQueue(QObject):
+    """
+    Runs ExportJobs in the background, EXPORT_WORKERS at a time, and tracks their progress.
+
+    Each job runs in a process of a ProcessPoolExecutor, so a month-end batch
+    formats its XLSX and PDF rows on several cores at once and never holds a
+    connection of the dashboards' pool: every export process opens its own.
+    The processes, and the multiprocessing manager that carries the jobs'
+    cancel flags and progress queue across, start with the first export. Each
+    job keeps a JobState that the ExportJobsModel shows; changed(job_id)
+    fires whenever one moves.
+
+    A job's final state comes from what its writer returned: rows written is
+    Done, None is Cancelled. An error is Failed, or Cancelled when the user had
+    already cancelled the job; either way every job ends in a final state.
+    """
+
+    changed = pyqtSignal(int)
+    about_to_add = pyqtSignal(int)      # row the next job will take in jobs
+    added = pyqtSignal(int)
+    failed = pyqtSignal(int)
+    _progressed = pyqtSignal(int, int, int)     # job_id, done, total; from the progress reader thread
+    _settled = pyqtSignal(int, object, object)  # job_id, rows, error; from the executor's thread
+
+    def __init__(self, parent=None, max_workers=EXPORT_WORKERS):
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self.jobs = []          # JobState per submitted job, in submission order
+        self._next_id = 0
+        self._executor = None
+        self._manager = None
+        self._progress = None
+        self._progressed.connect(self._on_progress)
+        self._settled.connect(self._on_settled)
+
+    def _start(self):
+        # spawn, not fork: a forked copy of the GUI process would inherit its Qt and pool threads mid-flight
+        context = multiprocessing.get_context("spawn")
+        self._manager = context.Manager()
+        self._progress = self._manager.Queue()
+        self._executor = ProcessPoolExecutor(self.max_workers, mp_context=context,
+                                             initializer=init_export_process)
+        threading.Thread(target=self._read_progress, args=(self._progress,), daemon=True).start()
+
+    def _read_progress(self, progress):
+        while True:
+            try:
+                message = progress.get()
+            except (EOFError, OSError):
+                return      # the manager shut down
+            if message is None:
+                return
+            self._emit(self._progressed, *message)
+
+    def submit(self, job):
+        if self._executor is None:
+            self._start()
+        state = JobState(self._next_id, job)
+        self._next_id += 1
+        self.about_to_add.emit(len(self.jobs))
+        self.jobs.append(state)
+
+        state.cancelled = self._manager.Event()
+        state.future = self._executor.submit(run_export_process, state.job_id, job, state.cancelled, self._progress)
+        state.future.add_done_callback(lambda future: self._future_done(state.job_id, future))
+        self.added.emit(state.job_id)
+        return state.job_id
+
+    def _future_done(self, job_id, future):
+        # on the executor's management thread, or right in cancel() for a job no process picked up
+        if future.cancelled():
+            self._emit(self._settled, job_id, None, None)
+        elif future.exception() is not None:
+            self._emit(self._settled, job_id, None, future.exception())
+        else:
+            self._emit(self._settled, job_id, future.result(), None)
+
+    def _on_progress(self, job_id, done, total):
+        state = self._state(job_id)
+        if state is None or state.status not in (QUEUED, RUNNING):
+            return      # a last report queued behind the result
+        if state.status == QUEUED:
+            state.status = RUNNING
+            state.started = time.perf_counter()
+        state.done, state.total = done, total
+        self.changed.emit(job_id)
+
+    def _on_settled(self, job_id, rows, error):
+        state = self._state(job_id)
+        if state is None:
+            return
+        state.finished = time.perf_counter()
+        state.error = error
+        if error is not None and not state.cancel_requested:
+            state.status = FAILED
+        elif rows is None or error is not None:
+            state.status = CANCELLED
+        else:
+            # finished before the writer saw a cancel, the file is written
+            state.status = DONE
+            state.done = state.total = rows
+        self.changed.emit(job_id)
+        if state.status == FAILED:
+            self.failed.emit(job_id)
+
+    def cancel(self, job_id):
+        state = self._state(job_id)
+        if state is None or state.status not in (QUEUED, RUNNING) or state.cancel_requested:
+            return
+        state.cancel_requested = True
+        state.cancelled.set()
+        # a job no process has picked up settles right away, a running one when its writer returns
+        state.future.cancel()
+
+    def clear_finished(self):
+        self.jobs = [state for state in self.jobs if state.status in (QUEUED, RUNNING)]
+
+    def index_of(self, job_id):
+        for i, state in enumerate(self.jobs):
+            if state.job_id == job_id:
+                return i
+        return -1
+
+    def _state(self, job_id):
+        i = self.index_of(job_id)
+        return self.jobs[i] if i >= 0 else None
+
+    def shutdown(self):
+        """Cancel every export and wait for the running ones to stop at their next batch."""
+        if self._executor is None:
+            return
+        for state in self.jobs:
+            if state.status in (QUEUED, RUNNING):
+                state.cancelled.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._progress.put(None)
+        self._manager.shutdown()
+
+    @staticmethod
+    def _emit(signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # the queue was torn down (app quitting) while an export was still reporting
+            pass
+
+
+class ExportJobsModel(QAbstractTableModel):
+    """One row per job of an ExportJobQueue: file, format, status, progress and throughput."""
+
+    HEADERS = ["File", "Format", "Status", "Progress", "Rows/s"]
+    PROGRESS_COLUMN = 3
+
+    def __init__(self, queue, parent=None):
+        super().__init__(parent)
+        self.queue = queue
+        queue.about_to_add.connect(lambda row: self.beginInsertRows(QModelIndex(), row, row))
+        queue.added.connect(lambda _: self.endInsertRows())
+        queue.changed.connect(self._job_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.queue.jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        state = self.queue.jobs[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.UserRole and column == self.PROGRESS_COLUMN:
+            return (state.done, state.total)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return str(state.error) if state.error else state.job.path
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if column == 0:
+            return os.path.basename(state.job.path)
+        if column == 1:
+            return state.job.format.upper()
+        if column == 2:
+            return state.status
+        if column == 3:
+            return f"{state.done:,} / {state.total:,}" if state.total else f"{state.done:,}"
+        if column == 4:
+            return f"{state.rows_per_second():,.0f}" if state.started is not None else ""
+        return None
+
+    def job_id(self, row):
+        return self.queue.jobs[row].job_id
+
+    def _job_changed(self, job_id):
+        row = self.queue.index_of(job_id)
+        if row >= 0:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """Paints the (done, total) of the progress column as a progress bar."""
+
+    def paint(self, painter, option, index):
+        done, total = index.data(Qt.ItemDataRole.UserRole)
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(2, 2, -2, -2)
+        bar.minimum = 0
+        bar.maximum = max(total, 1)
+        bar.progress = min(done, bar.maximum)
+        bar.text = index.data(Qt.ItemDataRole.DisplayRole)
+        bar.textVisible = True
+        bar.state = QStyle.StateFlag.State_Enabled
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, widget)
+
+
+class ExportJobsPanel(QWidget):
+    """Tool window listing export jobs, with Cancel for the selected ones and Clear finished."""
+
+    def __init__(self, queue, parent=None):
+        super().__init__(parent, Qt.WindowType.Tool)
+        self.setWindowTitle("Exports")
+        self.resize(640, 260)
+        self.queue = queue
+        self.model = ExportJobsModel(queue, self)
+
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(ExportJobsModel.PROGRESS_COLUMN, ProgressBarDelegate(self.table))
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.cancel_selected)
+        clear_button = QPushButton("Clear finished")
+        clear_button.clicked.connect(self.clear_finished)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(cancel_button)
+        button_layout.addWidget(clear_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addLayout(button_layout)
+
+        queue.added.connect(lambda _: self.show())
+
+    def cancel_selected(self):
+        for index in self.table.selectionModel().selectedRows():
+            self.queue.cancel(self.model.job_id(index.row()))
+
+    def clear_finished(self):
+        self.model.beginResetModel()
+        self.queue.clear_finished()
+        self.model.endResetModel()
@@ -0,0 +1,25 @@
+"""
+File exports of the client dashboards.
+
+Each writer streams its rows from PostgreSQL straight into the target file and
+runs on the query executor, never on the GUI thread.
+
+The writer modules pull in openpyxl and reportlab, which take longer to import
+than the rest of the app together, so nothing here imports them up front:
+get_writer() imports a format's module the first time an export of that
+format runs, on the executor thread that runs it.
+"""
+import importlib
+
+# export format -> (module, function) writing it, imported on first use
+EXPORT_WRITERS = {
+    "csv": ("exports.csv_export", "export_policies_to_csv"),
+    "xlsx": ("exports.xlsx_export", "export_policies_to_xlsx"),
+    "pdf": ("exports.pdf_export", "export_policies_to_pdf"),
+}
+
+
+def get_writer(export_format: str):
+    """The export_policies_to_* function of a format, importing its module if needed."""
+    module_name, function_name = EXPORT_WRITERS[export_format]
+    return getattr(importlib.import_module(module_name), function_name)
@@ -0,0 +1,89 @@
+import io
+import os
+import tempfile
+
+from db_func import get_connection, policy_export_query, policy_export_total
+
+# write buffer of the target file; COPY hands over one row at a time
+COPY_CHUNK_SIZE = int(os.getenv("EXPORT_COPY_CHUNK_SIZE", str(1024 * 1024)))
+# rows between progress reports
+PROGRESS_EVERY = 5000
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class ProgressFile(io.TextIOBase):
+    """
+    File wrapper handed to copy_expert that counts the rows going through it.
+
+    COPY TO STDOUT calls write() once per row (the header included), which
+    is where progress is reported and a cancelled task aborts the COPY. It is
+    a TextIOBase so psycopg2 hands it decoded text like the real file.
+    """
+
+    def __init__(self, f, task, total):
+        self.f = f
+        self.task = task
+        self.total = total
+        self.rows = -1      # the header row isn't data
+
+    def write(self, data):
+        written = self.f.write(data)
+        self.rows += 1
+        if self.rows % PROGRESS_EVERY == 0 and self.rows:
+            if self.task.is_cancelled():
+                raise ExportCancelled()
+            self.task.report_progress(self.rows, self.total)
+        return written
+
+
+def copy_to_csv(cursor, query: str, params, path: str, chunk_size: int = COPY_CHUNK_SIZE, task=None, total=None):
+    """
+    Write the result of a SELECT to a CSV file with a header row.
+
+    The rows are produced by COPY (...) TO STDOUT on the server and written to
+    the file as they arrive through a chunk_size write buffer, so memory use
+    does not grow with the number of rows and no Python object is created per
+    cell. They go to a temp file next to path that replaces it once the COPY
+    has finished.
+
+    Args:
+        query (str): SELECT to export, with %s / %(name)s placeholders.
+        params: Values for the placeholders; COPY can't take bind parameters so they are inlined with mogrify().
+        task (QueryTask): Gets report_progress(rows written, total) every PROGRESS_EVERY rows;
+            when it is cancelled the COPY is aborted and path is left untouched.
+
+    Returns:
+        int: Rows written, None if the export was cancelled.
+    """
+    copy_sql = cursor.mogrify(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", params)
+    # a cancelled or failed COPY never truncates path or leaves half a CSV there
+    fd, temp_path = tempfile.mkstemp(suffix=".csv.part", prefix=".", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with open(fd, "w", newline="", encoding="utf-8", buffering=chunk_size) as f:
+            if task is None:
+                cursor.copy_expert(copy_sql, f)
+                rows = cursor.rowcount
+            else:
+                target = ProgressFile(f, task, total)
+                cursor.copy_expert(copy_sql, target)
+                rows = target.rows
+        os.replace(temp_path, path)
+        if task is not None:
+            task.report_progress(rows, total)
+        return rows
+    except ExportCancelled:
+        return None
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def export_policies_to_csv(table_name: str, path: str, status: str = "active", ids=None, order_by=None, task=None):
+    """Export a client table's policies (or just the given ids, in order) to CSV, see policy_export_query()."""
+    with get_connection() as conn, conn.cursor() as cursor:
+        query, params = policy_export_query(cursor, table_name, status, ids, order_by)
+        total = policy_export_total(cursor, table_name, status, ids) if task is not None else None
+        return copy_to_csv(cursor, query, params, path, task=task, total=total)
@@ -0,0 +1,209 @@
+import os
+import tempfile
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+from db_func import get_connection, policy_export_query, policy_export_total
+from table_model import format_cell
+
+# rows per Table, about one landscape A4 page at the report's 5pt font
+PDF_ROWS_PER_TABLE = int(os.getenv("EXPORT_PDF_ROWS_PER_TABLE", "45"))
+# rows pulled from the server-side cursor per step
+PDF_FETCH_SIZE = int(os.getenv("EXPORT_PDF_FETCH_SIZE", "2000"))
+# Tables built ahead of the one being laid out
+PDF_TABLES_AHEAD = 2
+
+FONT_SIZE = 5
+# rough width of an average Helvetica glyph relative to the font size, to tell whether a cell needs wrapping
+CHAR_WIDTH = 0.5
+
+PAGE_SIZE = landscape(A4)
+MARGIN = 36     # 0.5 inch left & right
+
+# shared by every chunk's Table, built once
+TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), FONT_SIZE),
+    ('LEFTPADDING', (0, 0), (-1, -1), 2),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 2),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+])
+
+_styles = getSampleStyleSheet()
+CELL_STYLE = _styles["BodyText"].clone("ExportCell", fontSize=FONT_SIZE, leading=7)
+TITLE_STYLE = _styles["Title"]
+
+
+# columns printed by the client reports, as (label, column name)
+REPORT_COLUMNS = {
+    "clients_nonlife": [
+        ("Assured Name", "assured_name"),
+        ("Contact No.", "contact_number"),
+        ("Email", "email"),
+        ("Type of Insurance", "type_of_insurance"),
+        ("Insurance Company", "insurance_company"),
+        ("Inception Date", "inception_date"),
+        ("Expiry Date", "expiry_date"),
+        ("Policy Number", "policy_number"),
+        ("Gross Premium", "gross_premium"),
+        ("Commission", "commission"),
+        ("Coverage", "amount_covered"),
+    ],
+    "clients_hmo_individual": [
+        ("Assured Name", "assured_name"),
+        ("Contact No.", "contact_number"),
+        ("Email", "email"),
+        ("HMO Company", "hmo_company"),
+        ("Inception Date", "inception_date"),
+        ("Expiry Date", "expiry_date"),
+        ("Policy Number", "policy_number"),
+        ("Gross Premium", "gross_premium"),
+        ("Commission", "commission"),
+    ],
+}
+
+REPORT_TITLES = {
+    "clients_nonlife": "Client Non-Life",
+    "clients_hmo_individual": "Client HMO Individual",
+}
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class ReportDocTemplate(SimpleDocTemplate):
+    """
+    SimpleDocTemplate that pulls its Tables from an iterator while it lays them out.
+
+    build() gets the heading only; filterFlowables(), which reportlab calls
+    before every flowable it handles, tops the story up from `tables` so no
+    more than PDF_TABLES_AHEAD Tables exist ahead of the one being placed.
+    """
+
+    def __init__(self, path, tables, **kwargs):
+        super().__init__(path, **kwargs)
+        self.tables = tables
+        self.story = None
+
+    def build(self, flowables, **kwargs):
+        self.story = flowables
+        super().build(flowables, **kwargs)
+
+    def filterFlowables(self, flowables):
+        # also called for reportlab's own lists (page-begin actions), only the story is topped up
+        if flowables is not self.story:
+            return
+        while self.tables is not None and len(flowables) <= PDF_TABLES_AHEAD:
+            table = next(self.tables, None)
+            if table is None:
+                self.tables = None
+                break
+            flowables.append(table)
+
+
+def report_cell(value, max_chars):
+    """Plain string when the text fits its column, a wrapping Paragraph only when it doesn't."""
+    text = format_cell(value)
+    if len(text) <= max_chars:
+        return text
+    return Paragraph(text.replace("&", "&amp;").replace("<", "&lt;"), CELL_STYLE)
+
+
+def export_policies_to_pdf(table_name: str, path: str, status: str = "active", ids=None, order_by=None,
+                           export_columns: list = None, title: str = None, task=None):
+    """
+    Export a client table's policies (or just the given ids, in order) to a landscape PDF report.
+
+    Rows are read from a server-side cursor and cut into Tables of
+    PDF_ROWS_PER_TABLE rows, each with its own header row and the shared
+    TABLE_STYLE, so reportlab lays out many small tables instead of splitting
+    one huge one. Only cells too long for their column become Paragraphs.
+    The Tables are built while the document is laid out, a few ahead of the
+    page being placed, so only the finished pages' compressed drawing
+    operations (which reportlab keeps until it writes the file) grow with the
+    number of rows.
+
+    Args:
+        export_columns (list): (label, column name) pairs to print, in order; defaults to REPORT_COLUMNS.
+        title (str): Report heading; defaults to REPORT_TITLES.
+        task (QueryTask): Gets report_progress(rows handed to the layout, total rows) per Table;
+            when it is cancelled the export stops and path is left untouched.
+
+    Returns:
+        int: Rows written, None if the export was cancelled.
+    """
+    export_columns = export_columns or REPORT_COLUMNS[table_name]
+    title = title or REPORT_TITLES[table_name]
+    usable_width = PAGE_SIZE[0] - 2 * MARGIN
+    col_width = usable_width / len(export_columns)
+    col_widths = [col_width] * len(export_columns)
+    max_chars = int((col_width - 4) / (FONT_SIZE * CHAR_WIDTH))
+    header = [label for label, _ in export_columns]
+    written = 0
+
+    def report_tables(cursor, total):
+        positions = None
+        chunk = []
+        while True:
+            rows = cursor.fetchmany(PDF_FETCH_SIZE)
+            if positions is None:
+                # Map header to column index
+                header_index_map = {desc[0]: i for i, desc in enumerate(cursor.description)}
+                positions = [header_index_map[column] for _, column in export_columns]
+            if not rows:
+                break
+            for row in rows:
+                chunk.append([report_cell(row[i], max_chars) for i in positions])
+                if len(chunk) == PDF_ROWS_PER_TABLE:
+                    yield table_of(chunk, total)
+                    chunk = []
+        if chunk:
+            yield table_of(chunk, total)
+
+    def table_of(chunk, total):
+        # Tables are only asked for as the layout reaches them, so this trails the pages placed
+        nonlocal written
+        if task is not None:
+            if task.is_cancelled():
+                raise ExportCancelled()
+            task.report_progress(written, total)
+        written += len(chunk)
+        return Table([header] + chunk, colWidths=col_widths, style=TABLE_STYLE)
+
+    # the report is built next to path and renamed into place once complete, so a cancelled or
+    # failed export never leaves a partial file at path or replaces an earlier export there
+    fd, temp_path = tempfile.mkstemp(suffix=".pdf.part", prefix=".", dir=os.path.dirname(os.path.abspath(path)))
+    os.close(fd)
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                query, params = policy_export_query(cursor, table_name, status, ids, order_by)
+                total = policy_export_total(cursor, table_name, status, ids)
+
+            with conn.cursor(name="pdf_export") as cursor:
+                cursor.itersize = PDF_FETCH_SIZE
+                cursor.execute(query, params)
+                doc = ReportDocTemplate(temp_path, report_tables(cursor, total), pagesize=PAGE_SIZE,
+                                        leftMargin=MARGIN, rightMargin=MARGIN)
+                try:
+                    doc.build([Paragraph(title, TITLE_STYLE), Spacer(1, 7)])
+                except ExportCancelled:
+                    return None
+
+        os.replace(temp_path, path)
+        if task is not None:
+            task.report_progress(written, total)
+        return written
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,112 @@
+import os
+import tempfile
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+
+from db_func import get_connection, policy_export_query, policy_export_total
+
+# rows pulled from the server-side cursor and written per step
+XLSX_BATCH_SIZE = int(os.getenv("EXPORT_XLSX_BATCH_SIZE", "5000"))
+
+DATE_FORMAT = "yyyy-mm-dd"
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+TIME_FORMAT = "hh:mm:ss"
+AMOUNT_FORMAT = "#,##0.00"
+
+
+class XlsxRowWriter:
+    """
+    Appends database rows to a write-only worksheet as typed cells.
+
+    Dates, timestamps and amounts become real Excel dates and numbers with a
+    number format; everything else is written as is. Excel has no time zones,
+    so timestamptz values are converted to local time first. Formatted cells
+    are only created for the columns that need them, the rest go straight
+    through ws.append().
+    """
+
+    def __init__(self, worksheet):
+        self.ws = worksheet
+
+    def append(self, row):
+        self.ws.append([self.cell(value) for value in row])
+
+    def cell(self, value):
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone().replace(tzinfo=None)
+            return self.formatted(value, DATETIME_FORMAT)
+        if isinstance(value, date):
+            return self.formatted(value, DATE_FORMAT)
+        if isinstance(value, time):
+            return self.formatted(value.replace(tzinfo=None), TIME_FORMAT)
+        if isinstance(value, Decimal):
+            return self.formatted(value, AMOUNT_FORMAT)
+        return value
+
+    def formatted(self, value, number_format):
+        cell = WriteOnlyCell(self.ws, value)
+        cell.number_format = number_format
+        return cell
+
+
+def export_policies_to_xlsx(table_name: str, path: str, status: str = "active", ids=None, order_by=None,
+                            title: str = "Clients", batch_size: int = XLSX_BATCH_SIZE, task=None):
+    """
+    Export a client table's policies (or just the given ids, in order) to an XLSX file.
+
+    Rows are read from a server-side cursor batch_size at a time and written
+    to a write-only workbook, which streams each row to disk as it is
+    appended, so memory stays flat whatever the number of rows.
+
+    Args:
+        task (QueryTask): Gets report_progress(rows written, total rows) after every batch;
+            when it is cancelled the export stops and path is left untouched.
+
+    Returns:
+        int: Rows written, None if the export was cancelled.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    writer = XlsxRowWriter(ws)
+    written = 0
+
+    # the workbook is saved next to path and renamed into place once complete, so a cancelled or
+    # failed export never leaves a partial file at path or replaces an earlier export there
+    fd, temp_path = tempfile.mkstemp(suffix=".xlsx.part", prefix=".", dir=os.path.dirname(os.path.abspath(path)))
+    os.close(fd)
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                query, params = policy_export_query(cursor, table_name, status, ids, order_by)
+                total = policy_export_total(cursor, table_name, status, ids)
+
+            with conn.cursor(name="xlsx_export") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if written == 0:
+                        ws.append([desc[0] for desc in cursor.description])
+                    if not rows:
+                        break
+                    for row in rows:
+                        writer.append(row)
+                    written += len(rows)
+
+                    if task is not None:
+                        if task.is_cancelled():
+                            # finish the sheet's spool of the rows so far, openpyxl deletes it when the app exits
+                            ws.close()
+                            return None
+                        task.report_progress(written, total)
+
+        wb.save(temp_path)
+        os.replace(temp_path, path)
+        return written
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
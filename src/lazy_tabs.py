@@ -0,0 +1,77 @@
+from PyQt6.QtCore import QObject, QEvent, QTimer, pyqtSignal
+
+
+class LazyTabs(QObject):
+    """
+    Sets each page of a QStackedWidget up the first time it is shown instead of at startup.
+
+    A page registers a setup (models, column sizes, anything only that page
+    needs) and optionally a prefetch that loads its first data in the
+    background. Setup runs right before the page first becomes current.
+    Once the window has painted, the prefetches of the pages not opened yet
+    run one at a time, each started once the previous one called its done().
+    """
+
+    first_painted = pyqtSignal()
+    prefetched = pyqtSignal()      # every prefetch has settled
+
+    def __init__(self, stacked_widget, window):
+        super().__init__(window)
+        self.stacked_widget = stacked_widget
+        self._setups = {}
+        self._prefetches = []       # (index, prefetch) in registration order
+        self._ready = set()
+        self._visited = {stacked_widget.currentIndex()}
+        self._painted = False
+        stacked_widget.currentChanged.connect(self._on_current_changed)
+        window.installEventFilter(self)
+
+    def register(self, index, setup=None, prefetch=None):
+        """
+        Args:
+            setup (callable): Called once with no arguments before the page is first used.
+            prefetch (callable): Called with a done() callback after the first paint, unless
+                the page was opened before its turn; must call done() when its load settles.
+        """
+        if setup is not None:
+            self._setups[index] = setup
+        if prefetch is not None:
+            self._prefetches.append((index, prefetch))
+
+    def ensure_setup(self, index):
+        if index in self._ready:
+            return
+        self._ready.add(index)
+        setup = self._setups.get(index)
+        if setup is not None:
+            setup()
+
+    def visited(self, index):
+        """Whether the user has opened the page; a prefetch finishing later must not overwrite its data."""
+        return index in self._visited
+
+    def _on_current_changed(self, index):
+        self._visited.add(index)
+        self.ensure_setup(index)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and not self._painted:
+            self._painted = True
+            obj.removeEventFilter(self)
+            # let the paint finish before any of the deferred work starts
+            QTimer.singleShot(0, self._run_after_paint)
+        return False
+
+    def _run_after_paint(self):
+        self.first_painted.emit()
+        self._prefetch_next()
+
+    def _prefetch_next(self):
+        while self._prefetches:
+            index, prefetch = self._prefetches.pop(0)
+            if index in self._visited:
+                continue
+            self.ensure_setup(index)
+            prefetch(lambda: QTimer.singleShot(0, self._prefetch_next))
+            return
+        self.prefetched.emit()
@@ -0,0 +1,181 @@
+"""
+Apply the files in migrations/ that the database has not run yet.
+
+Files run in the order of the number their name starts with, each in one
+transaction together with its row in schema_migrations, so a failing file
+leaves nothing half applied and stops the run. Every migration is written to
+be safe to run more than once, which is what lets a database set up before
+this table existed adopt them: the first run applies them all and only
+creates what is missing. Another workstation starting a run waits until
+this one finishes. A file edited after it was applied is reported, not run
+again.
+
+A file that creates an extension the server doesn't have (pg_trgm comes
+with the postgresql-contrib package) is checked for before anything runs:
+it is held back, named with the missing extension, and the other files are
+still applied. The run then exits 1; run it again once the extension is
+installed.
+
+Usage (from the repository root):
+    python src/migrate.py            apply pending migrations
+    python src/migrate.py --status   list migrations without applying any
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+
+import db_func
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "migrations")
+
+# pg_advisory_lock key held for the whole run, any constant no other code locks on
+MIGRATION_LOCK_KEY = 740025
+
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version integer PRIMARY KEY,
+        name text NOT NULL,
+        checksum text NOT NULL,
+        applied_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+MIGRATION_FILE = re.compile(r"^(\d+)_\w+\.sql$")
+CREATE_EXTENSION = re.compile(r"CREATE\s+EXTENSION\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE)
+
+
+def migration_files(directory=MIGRATIONS_DIR):
+    """
+    The migration files of a directory, oldest first.
+
+    Returns:
+        list: (version, file name, path) tuples.
+    """
+    files = []
+    for name in os.listdir(directory):
+        match = MIGRATION_FILE.match(name)
+        if match:
+            files.append((int(match.group(1)), name, os.path.join(directory, name)))
+    files.sort()
+    for (version, name, _), (next_version, next_name, _) in zip(files, files[1:]):
+        if version == next_version:
+            raise ValueError(f"{name} and {next_name} have the same version")
+    return files
+
+
+def file_checksum(path):
+    # line endings normalised so a checkout on Windows doesn't look edited
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def required_extensions(path):
+    with open(path, encoding="utf-8") as f:
+        return {name.lower() for name in CREATE_EXTENSION.findall(f.read())}
+
+
+def missing_extensions(cursor, files):
+    """{file name: sorted extensions the server can't install} of the files that create any."""
+    required = {name: required_extensions(path) for _, name, path in files}
+    wanted = set().union(*required.values())
+    if not wanted:
+        return {}
+    cursor.execute("SELECT name FROM pg_available_extensions WHERE name = ANY(%s)", (list(wanted),))
+    available = {row[0] for row in cursor.fetchall()}
+    return {name: sorted(extensions - available) for name, extensions in required.items() if extensions - available}
+
+
+def applied_migrations(cursor):
+    """{version: (name, checksum, applied_at)} of the migrations recorded in schema_migrations."""
+    cursor.execute("SELECT version, name, checksum, applied_at FROM schema_migrations")
+    return {version: (name, checksum, applied_at) for version, name, checksum, applied_at in cursor.fetchall()}
+
+
+def apply_migration(conn, version, name, path):
+    with open(path, encoding="utf-8") as f:
+        sql = f.read()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(sql)
+            cursor.execute("INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)",
+                           (version, name, file_checksum(path)))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def migrate(status_only=False):
+    """
+    Apply the pending migrations, or with status_only just list them.
+
+    Returns:
+        bool: False when a migration failed.
+    """
+    files = migration_files()
+    conn = db_func.open_connection()
+    try:
+        with conn.cursor() as cursor:
+            # session lock, it stays held across the per-file commits
+            cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
+            cursor.execute(SCHEMA_MIGRATIONS_DDL)
+            conn.commit()
+            applied = applied_migrations(cursor)
+
+        for version, name, path in files:
+            if version not in applied:
+                continue
+            applied_name, checksum, applied_at = applied[version]
+            state = f"applied {applied_at:%Y-%m-%d %H:%M}"
+            if checksum != file_checksum(path):
+                state += ", file changed since"
+            if applied_name != name:
+                state += f", as {applied_name}"
+            print(f"  {state:40} {name}")
+
+        pending = [migration for migration in files if migration[0] not in applied]
+        with conn.cursor() as cursor:
+            missing = missing_extensions(cursor, pending)
+        if status_only:
+            for _, name, _ in pending:
+                state = f"pending, needs {', '.join(missing[name])}" if name in missing else "pending"
+                print(f"  {state:40} {name}")
+            return True
+        if not pending:
+            print("Database is up to date.")
+            return True
+
+        for name, extensions in missing.items():
+            print(f"Skipping {name}: the server has no {', '.join(extensions)} extension."
+                  f" Install it (e.g. the postgresql-contrib package) and run again.")
+        pending = [migration for migration in pending if migration[1] not in missing]
+        for version, name, path in pending:
+            started = time.perf_counter()
+            try:
+                apply_migration(conn, version, name, path)
+            except Exception as e:
+                print(f"Failed to apply {name}, stopping: {e}")
+                return False
+            print(f"  {f'applied in {time.perf_counter() - started:.2f}s':40} {name}")
+        print(f"Applied {len(pending)} migration(s).")
+        return not missing
+    finally:
+        # closing the session releases the advisory lock
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--status", action="store_true", help="list migrations without applying any")
+    args = parser.parse_args()
+
+    ok = migrate(status_only=args.status)
+    db_func.close_pool()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
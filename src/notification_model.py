@@ -0,0 +1,271 @@
+from datetime import date
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionButton, QApplication, QListView
+
+# row kinds
+HEADER, CARD, LOAD_MORE = range(3)
+
+KIND_ROLE = Qt.ItemDataRole.UserRole
+COLOR_ROLE = Qt.ItemDataRole.UserRole + 1
+
+NOTIFICATION_COLORS = {
+    "Expired Policies": "#ebadad",
+    "This Week": "#ffcccc",
+    "Next Week": "#fff0cc",
+    "This Month": "#e0f0ff",
+    "Upcoming Months": "#ffffff",
+}
+
+# the only bucket paged further (db_func.fetch_upcoming_policies); the others stop at their limit
+PAGED_BUCKET = "Upcoming Months"
+
+HEADER_HEIGHT = 50
+CARD_HEIGHT = 64
+CARD_SPACING = 6
+BUTTON_WIDTH = 80
+BUTTON_HEIGHT = 28
+PADDING = 10
+
+
+def notification_message(policy_number, client_name, expiry_date):
+    days_left = (expiry_date - date.today()).days
+    if days_left <= 0:
+        return f"Policy number {policy_number} insured to {client_name} expired on {expiry_date}."
+    return f"Policy number {policy_number} insured to {client_name} is about to expire on {expiry_date}."
+
+
+class NotificationListModel(QAbstractListModel):
+    """
+    Rows of the notification center: a header per bucket, a card per policy
+    and a "Load more" row under Upcoming Months while it has more policies.
+
+    Each row is a small tuple; the message is only formatted when the view
+    paints the row, so the cost of a refresh is one list, not a widget tree per
+    policy. Dismissing removes the card and emits dismissed(policy_number) for
+    the caller to record.
+    """
+
+    dismissed = pyqtSignal(str)
+    load_more_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []         # (HEADER, bucket) | (CARD, bucket, policy_number, client_name, expiry_date) | (LOAD_MORE, bucket)
+        self._shown = {}        # bucket -> cards currently in the list
+        self._totals = {}       # bucket -> notifications in the bucket on the server
+        self.loading_more = False
+
+    #### Loading
+    def set_notifications(self, grouped, counts, hidden=()):
+        """
+        Replace the list with fetch_expiring_policies() output.
+
+        Args:
+            hidden (set): Policy numbers to leave out, e.g. dismissals not written to the database yet.
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._shown = {}
+        self._totals = dict(counts)
+        self.loading_more = False
+        for bucket, items in grouped.items():
+            if hidden:
+                kept = [item for item in items if item[0] not in hidden]
+                self._totals[bucket] -= len(items) - len(kept)
+                items = kept
+            if not items:
+                continue
+            self._rows.append((HEADER, bucket))
+            self._rows.extend((CARD, bucket) + tuple(item) for item in items)
+            self._shown[bucket] = len(items)
+            if bucket == PAGED_BUCKET and self._totals[bucket] > len(items):
+                self._rows.append((LOAD_MORE, bucket))
+        self.endResetModel()
+
+    def append_notifications(self, bucket, items):
+        """Insert the next page of a bucket above its "Load more" row, None re-enables it after a failed load."""
+        self.loading_more = False
+        row = self._load_more_row(bucket)
+        if row is None:
+            return
+        if items is None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+        if items:
+            self.beginInsertRows(QModelIndex(), row, row + len(items) - 1)
+            self._rows[row:row] = [(CARD, bucket) + tuple(item) for item in items]
+            self.endInsertRows()
+            self._shown[bucket] += len(items)
+            row += len(items)
+        self._header_changed(bucket)
+
+        if not items or self._shown[bucket] >= self._totals[bucket]:
+            self._remove_row(row)
+        else:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def last_notification(self, bucket):
+        """(expiry_date, policy_number) of the last card of a bucket, the keyset for its next page."""
+        for entry in reversed(self._rows):
+            if entry[0] == CARD and entry[1] == bucket:
+                return entry[4], entry[2]
+        return None
+
+    #### Actions
+    def dismiss(self, row):
+        entry = self._rows[row]
+        if entry[0] != CARD:
+            return
+        bucket, policy_number = entry[1], entry[2]
+        self._remove_row(row)
+        self._shown[bucket] -= 1
+        self._totals[bucket] -= 1
+        if self._totals[bucket] == 0:
+            self._remove_row(self._header_row(bucket))
+        else:
+            self._header_changed(bucket)
+        self.dismissed.emit(policy_number)
+
+    def request_more(self, row):
+        if self._rows[row][0] != LOAD_MORE or self.loading_more:
+            return
+        self.loading_more = True
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        self.load_more_requested.emit()
+
+    #### QAbstractListModel
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._rows[index.row()]
+        kind, bucket = entry[0], entry[1]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if kind == HEADER:
+                shown, total = self._shown[bucket], self._totals[bucket]
+                return bucket if shown == total else f"{bucket} ({shown} of {total})"
+            if kind == CARD:
+                return notification_message(*entry[2:])
+            return "Loading..." if self.loading_more else "Load more"
+        if role == KIND_ROLE:
+            return kind
+        if role == COLOR_ROLE:
+            return NOTIFICATION_COLORS.get(bucket, "#ffffff")
+        return None
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    #### Helpers
+    def _header_row(self, bucket):
+        return self._rows.index((HEADER, bucket))
+
+    def _load_more_row(self, bucket):
+        try:
+            return self._rows.index((LOAD_MORE, bucket))
+        except ValueError:
+            return None
+
+    def _header_changed(self, bucket):
+        index = self.index(self._header_row(bucket))
+        self.dataChanged.emit(index, index)
+
+    def _remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+
+class NotificationDelegate(QStyledItemDelegate):
+    """
+    Paints headers, cards and the "Load more" row of a NotificationListModel.
+
+    The Dismiss and Load more buttons are drawn, not created; a click inside
+    their rectangle is turned into a model call in editorEvent(). Heights are
+    fixed per row kind, so the view never has to measure wrapped text.
+    """
+
+    def sizeHint(self, option, index):
+        kind = index.data(KIND_ROLE)
+        height = HEADER_HEIGHT if kind == HEADER else CARD_HEIGHT + CARD_SPACING
+        return QSize(option.rect.width(), height)
+
+    def card_rect(self, option):
+        return option.rect.adjusted(0, 0, 0, -CARD_SPACING)
+
+    def button_rect(self, option, kind):
+        card = self.card_rect(option)
+        if kind == LOAD_MORE:
+            return QRect(card.left(), card.center().y() - BUTTON_HEIGHT // 2, BUTTON_WIDTH + 40, BUTTON_HEIGHT)
+        return QRect(card.right() - PADDING - BUTTON_WIDTH, card.center().y() - BUTTON_HEIGHT // 2,
+                     BUTTON_WIDTH, BUTTON_HEIGHT)
+
+    def paint(self, painter, option, index):
+        kind = index.data(KIND_ROLE)
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if kind == HEADER:
+            font = QFont(option.font)
+            font.setBold(True)
+            font.setPixelSize(18)
+            painter.setFont(font)
+            painter.drawText(option.rect.adjusted(0, 20, 0, -10),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+        elif kind == CARD:
+            card = self.card_rect(option)
+            painter.setPen(QPen(QColor("#aaa")))
+            painter.setBrush(QColor(index.data(COLOR_ROLE)))
+            painter.drawRoundedRect(card.adjusted(0, 0, -1, -1), 6, 6)
+            text_rect = card.adjusted(PADDING, PADDING, -(2 * PADDING + BUTTON_WIDTH), -PADDING)
+            painter.setPen(option.palette.text().color())
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.TextFlag.TextWordWrap, text)
+            self.draw_button(painter, option, self.button_rect(option, kind), "Dismiss", True)
+        else:
+            model = index.model()
+            self.draw_button(painter, option, self.button_rect(option, kind), text, not model.loading_more)
+
+        painter.restore()
+
+    def draw_button(self, painter, option, rect, text, enabled):
+        button = QStyleOptionButton()
+        button.rect = rect
+        button.text = text
+        button.state = QStyle.StateFlag.State_Enabled if enabled else QStyle.StateFlag.State_None
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        kind = index.data(KIND_ROLE)
+        if kind == HEADER or event.type() != QEvent.Type.MouseButtonRelease:
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        if not self.button_rect(option, kind).contains(event.position().toPoint()):
+            return False
+        if kind == CARD:
+            model.dismiss(index.row())
+        else:
+            model.request_more(index.row())
+        return True
+
+
+def attach_notification_model(view: QListView):
+    """Give a list view a NotificationListModel and its delegate, and return the model."""
+    model = NotificationListModel(view)
+    view.setModel(model)
+    view.setItemDelegate(NotificationDelegate(view))
+    view.setSelectionMode(QListView.SelectionMode.NoSelection)
+    view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+    view.setSpacing(0)
+    view.setStyleSheet("QListView { border: none; background: transparent; }")
+    return model
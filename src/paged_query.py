@@ -0,0 +1,120 @@
+import itertools
+import threading
+
+_cursor_ids = itertools.count(1)
+
+
+class PagedQuery:
+    """
+    A SELECT streamed page by page through a server-side (named) cursor.
+
+    The rows stay on the server until fetch_page() asks for the next page, so
+    neither side materializes the full result. The cursor lives inside a
+    transaction, so a pooled connection is held until the last page has been
+    read or close() is called.
+
+    Pages can be read ahead on a worker thread with fetch_ahead() and picked up
+    on the GUI thread with take_ready(); the cursor is only used by one thread
+    at a time, so fetch_remaining() on the GUI thread waits for a page still on
+    its way and returns it first.
+
+    Args:
+        pool (ConnectionPool): Pool to borrow the connection from.
+        query (str): The SELECT to page through, without ORDER BY.
+        params (tuple): Query parameters.
+        page_size (int): Rows returned by each fetch_page().
+        order_by (tuple): Optional (column_index, descending) applied server-side.
+        total (int): Row count when already known, open() then skips counting.
+    """
+
+    def __init__(self, pool, query, params=None, page_size=200, order_by=None, total=None):
+        self.pool = pool
+        self.query = query
+        self.params = params
+        self.page_size = page_size
+        self.order_by = order_by
+        self.total = total
+        self.exhausted = False
+        self._conn = None
+        self._cursor = None
+        self._ready = []                # rows read by fetch_ahead(), not taken yet
+        self._lock = threading.RLock()
+
+    def open(self):
+        """Count the matching rows unless known and declare the cursor; returns the first page."""
+        self._conn = self.pool.getconn()
+        try:
+            if self.total is None:
+                with self._conn.cursor() as cursor:
+                    cursor.execute(f"SELECT count(*) FROM ({self.query}) AS paged", self.params)
+                    self.total = cursor.fetchone()[0]
+
+            self._cursor = self._conn.cursor(name=f"paged_{next(_cursor_ids)}")
+            self._cursor.itersize = self.page_size
+            self._cursor.execute(self._ordered_query(), self.params)
+        except Exception:
+            self.close()
+            raise
+        return self.fetch_page()
+
+    def fetch_page(self):
+        """Next page of rows; closes the cursor and frees the connection after the last one."""
+        with self._lock:
+            if self.exhausted or self._cursor is None:
+                return []
+
+            try:
+                rows = self._cursor.fetchmany(self.page_size)
+            except Exception:
+                self.close()
+                raise
+            if len(rows) < self.page_size:
+                self.close()
+            return rows
+
+    def fetch_ahead(self, all_pages=False):
+        """Read the next page, or every page left, into the buffer take_ready() empties; for a worker thread."""
+        with self._lock:
+            self._ready.extend(self.fetch_page())
+            while all_pages and not self.exhausted:
+                self._ready.extend(self.fetch_page())
+
+    def take_ready(self):
+        with self._lock:
+            rows, self._ready = self._ready, []
+            return rows
+
+    def fetch_remaining(self):
+        with self._lock:
+            rows = self.take_ready()
+            while not self.exhausted:
+                rows.extend(self.fetch_page())
+            return rows
+
+    def reordered(self, column, descending):
+        """Same query sorted server-side by a result column, not opened yet; this cursor stays open."""
+        return PagedQuery(self.pool, self.query, self.params, self.page_size, (column, descending), self.total)
+
+    def close(self):
+        self.exhausted = True
+        with self._lock:
+            cursor, conn = self._cursor, self._conn
+            self._cursor, self._conn = None, None
+
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        if conn is not None:
+            # ends the transaction the named cursor lived in
+            self.pool.putconn(conn)
+
+    def _ordered_query(self):
+        if self.order_by is None:
+            return self.query
+
+        column, descending = self.order_by
+        direction = "DESC" if descending else "ASC"
+        # NULLs last either way, matching RecordTableModel.sort
+        return f"SELECT * FROM ({self.query}) AS paged ORDER BY {int(column) + 1} {direction} NULLS LAST"
@@ -0,0 +1,154 @@
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class QuerySignals(QObject):
+    result = pyqtSignal(object)
+    error = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal()
+
+
+class QueryTask(QRunnable):
+    """
+    One unit of database work run on a QThreadPool thread.
+
+    The callable must not touch any widget; whatever it returns is delivered to
+    the GUI thread through signals.result. Long-running callables can accept a
+    `task` keyword (submit(..., pass_task=True)) to report progress and to check
+    is_cancelled() between steps.
+    """
+
+    def __init__(self, func, args, kwargs, key=None, pass_task=False):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.pass_task = pass_task
+        self.signals = QuerySignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def report_progress(self, done, total):
+        if not self.is_cancelled():
+            self._emit(self.signals.progress, done, total)
+
+    def run(self):
+        try:
+            if self.is_cancelled():
+                return
+            kwargs = dict(self.kwargs, task=self) if self.pass_task else self.kwargs
+            result = self.func(*self.args, **kwargs)
+        except Exception as e:
+            self._emit(self.signals.error, e)
+        else:
+            self._emit(self.signals.result, result)
+        finally:
+            self._emit(self.signals.finished)
+
+    @staticmethod
+    def _emit(signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # the executor was torn down (app quitting) while this task was still running
+            pass
+
+
+class QueryExecutor(QObject):
+    """
+    Runs database calls off the GUI thread and marshals results back to it.
+
+    Tasks submitted with the same key replace each other: the older task is
+    cancelled and its result, if it still arrives, is handed to on_discard
+    instead of on_result. This is how a quick tab switch drops the load of the
+    tab the user already left.
+
+    Args:
+        max_threads (int): Worker threads; keep it at or below the connection pool size.
+    """
+
+    def __init__(self, parent=None, max_threads=4):
+        super().__init__(parent)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads)
+        self._latest = {}       # key -> newest task for that key
+        self._tasks = set()     # keeps the Python side of running tasks alive
+
+    def submit(self, key, func, *args, on_result=None, on_error=None, on_progress=None,
+               on_discard=None, pass_task=False, **kwargs):
+        """
+        Queue func(*args, **kwargs) on a worker thread and return the task.
+
+        Args:
+            key (str): Tasks sharing a key cancel each other, None never cancels anything.
+            on_result (callable): Called on the GUI thread with the return value.
+            on_error (callable): Called on the GUI thread with the raised exception.
+            on_progress (callable): Called on the GUI thread with (done, total).
+            on_discard (callable): Called on the GUI thread with the result of a cancelled task,
+                so it can release anything the result holds (open cursors, files).
+        """
+        task = QueryTask(func, args, kwargs, key, pass_task)
+
+        if key is not None:
+            previous = self._latest.get(key)
+            if previous is not None:
+                previous.cancel()
+            self._latest[key] = task
+
+        def deliver_result(result):
+            if task.is_cancelled():
+                if on_discard is not None:
+                    on_discard(result)
+            elif on_result is not None:
+                on_result(result)
+
+        def deliver_error(error):
+            if task.is_cancelled():
+                return
+            if on_error is not None:
+                on_error(error)
+            else:
+                print(f"Background query failed: {error}")
+
+        def done():
+            self._tasks.discard(task)
+            if key is not None and self._latest.get(key) is task:
+                del self._latest[key]
+
+        task.signals.result.connect(deliver_result)
+        task.signals.error.connect(deliver_error)
+        if on_progress is not None:
+            task.signals.progress.connect(lambda done_count, total: None if task.is_cancelled() else on_progress(done_count, total))
+        task.signals.finished.connect(done)
+
+        self._tasks.add(task)
+        self.thread_pool.start(task)
+        return task
+
+    def is_busy(self, key):
+        """Whether a task submitted with key is still queued or running."""
+        return key in self._latest
+
+    def cancel(self, key):
+        task = self._latest.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def cancel_all(self):
+        for task in list(self._tasks):
+            task.cancel()
+        self._latest.clear()
+
+    def shutdown(self, timeout_ms=5000):
+        """Cancel pending work and wait for running queries to finish."""
+        self.cancel_all()
+        self.thread_pool.clear()
+        return self.thread_pool.waitForDone(timeout_ms)
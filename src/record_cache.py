@@ -0,0 +1,87 @@
+import os
+import time
+from collections import OrderedDict
+
+# records kept for the View Policy panes, least recently used dropped first
+RECORD_CACHE_SIZE = int(os.getenv("RECORD_CACHE_SIZE", "500"))
+# seconds a cached record is trusted, in case a change was missed (no change feed, lost connection)
+RECORD_CACHE_TTL = float(os.getenv("RECORD_CACHE_TTL", "300"))
+
+
+class RecordCache:
+    """
+    Bounded LRU cache of database rows keyed by (table, id), with a time to live.
+
+    Used from the GUI thread only. Rows fetched in the background go in through
+    put_many() with the generation() read when the fetch was started: if
+    anything was invalidated in between, the batch is dropped rather than
+    risking a row older than the change that invalidated it.
+
+    Args:
+        size (int): Records kept at most.
+        ttl (float): Seconds after which a record counts as missing.
+    """
+
+    def __init__(self, size=RECORD_CACHE_SIZE, ttl=RECORD_CACHE_TTL):
+        self.size = size
+        self.ttl = ttl
+        self._records = OrderedDict()   # (table, id) -> (stored at, row), oldest use first
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, key):
+        entry = self._records.get(key)
+        return entry is not None and time.monotonic() - entry[0] < self.ttl
+
+    def get(self, table, record_id):
+        """The cached row, None when it isn't cached or expired."""
+        key = (table, record_id)
+        entry = self._records.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            self._records.pop(key, None)
+            self.misses += 1
+            return None
+        self._records.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, table, record_id, row):
+        key = (table, record_id)
+        self._records[key] = (time.monotonic(), row)
+        self._records.move_to_end(key)
+        while len(self._records) > self.size:
+            self._records.popitem(last=False)
+
+    def put_many(self, records, generation=None):
+        """
+        Store {(table, id): row}.
+
+        Args:
+            generation (int): generation() from before the rows were read; the rows are
+                dropped if something was invalidated since.
+        """
+        if generation is not None and generation != self._generation:
+            return
+        for (table, record_id), row in records.items():
+            self.put(table, record_id, row)
+
+    def generation(self):
+        return self._generation
+
+    def invalidate(self, table, ids=None):
+        """Forget the given ids of a table, or all of its records when ids is None."""
+        self._generation += 1
+        if ids is None:
+            for key in [key for key in self._records if key[0] == table]:
+                del self._records[key]
+            return
+        for record_id in ids:
+            self._records.pop((table, record_id), None)
+
+    def clear(self):
+        self._generation += 1
+        self._records.clear()
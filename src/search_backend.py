@@ -0,0 +1,123 @@
+import os
+
+import db_func
+import table_model
+
+# "memory", "server" or "auto" (server search only for tables too large to hold on the client)
+SEARCH_MODE = os.getenv("SEARCH_MODE", "auto")
+SERVER_SEARCH_THRESHOLD = int(os.getenv("SERVER_SEARCH_THRESHOLD", "20000"))
+
+
+class InMemorySearch:
+    """
+    Filters the rows a table already holds through its SearchFilterProxyModel.
+
+    Pages still waiting on the server are fetched on a worker thread and
+    filtered as they arrive, so the whole table is searched without holding up
+    the first keystroke, which is fine as long as the table fits on the client.
+    """
+
+    def is_searched(self, table):
+        """True when the table shows search matches rather than its whole dashboard."""
+        return table.model().is_filtered()
+
+    def search(self, window, tables, text):
+        for table in tables:
+            if not text:
+                table_model.search_table(table, "")
+                continue
+            # Only search if table is visible and has data
+            model = table_model.source_model(table)
+            if table.isVisible() and model.total_rows() > 0:
+                # rows still on the server have to be searched too, the counts follow once they are in
+                model.fetch_remaining(window.update_table_counts)
+                table_model.search_table(table, text)
+
+        # Update the counts after filtering
+        window.update_table_counts()
+
+
+class ServerSearch:
+    """
+    Pushes the search down to PostgreSQL.
+
+    Each client table is re-queried with its DashboardTable.search_query, which
+    matches names, policy numbers and companies through the trigram indexes of
+    migrations/0001_policy_search_indexes.sql and ranks the matches, and the
+    results are paged into the table like a normal load. Only one page of
+    matches crosses the network however large the book is. Tables without a
+    search query (the collection tab) are searched in memory instead.
+    """
+
+    def __init__(self, fallback=None):
+        self.fallback = fallback or InMemorySearch()
+        self.searched = set()   # tables currently showing server results instead of their dashboard rows
+
+    def is_searched(self, table):
+        return table.objectName() in self.searched or self.fallback.is_searched(table)
+
+    def handles(self, table):
+        _, dashboard_table = db_func.find_dashboard_table(table.objectName())
+        return dashboard_table is not None and dashboard_table.search_query is not None
+
+    def search(self, window, tables, text):
+        server_tables = [table for table in tables if self.handles(table)]
+        other_tables = [table for table in tables if not self.handles(table)]
+        if other_tables:
+            self.fallback.search(window, other_tables, text)
+
+        if not text:
+            # back to the plain dashboard rows of every table that was showing matches
+            tabs = set()
+            for table in server_tables:
+                if table.objectName() in self.searched:
+                    self.searched.discard(table.objectName())
+                    tabs.add(db_func.find_dashboard_table(table.objectName())[0])
+            for tab in tabs:
+                db_func.refresh_dashboard_tables(window, tab)
+            return
+
+        by_tab = {}
+        for table in server_tables:
+            if table.isVisible():
+                tab, _ = db_func.find_dashboard_table(table.objectName())
+                by_tab.setdefault(tab, []).append(table.objectName())
+                self.searched.add(table.objectName())
+        for tab, table_names in by_tab.items():
+            db_func.search_dashboard_tables(window, tab, table_names, text)
+
+
+class AutoSearch:
+    """Searches in memory while a table is small enough to hold, on the server once it is not."""
+
+    def __init__(self, threshold=SERVER_SEARCH_THRESHOLD):
+        self.threshold = threshold
+        self.memory = InMemorySearch()
+        self.server = ServerSearch(self.memory)
+
+    def is_searched(self, table):
+        return self.server.is_searched(table)
+
+    def search(self, window, tables, text):
+        server_tables, memory_tables = [], []
+        for table in tables:
+            # a table showing server results keeps searching there, its row count is only the matches
+            large = (table.objectName() in self.server.searched
+                     or table_model.source_model(table).total_rows() > self.threshold)
+            if large and self.server.handles(table):
+                server_tables.append(table)
+            else:
+                memory_tables.append(table)
+
+        if memory_tables:
+            self.memory.search(window, memory_tables, text)
+        if server_tables:
+            self.server.search(window, server_tables, text)
+
+
+def create_search_backend(mode=SEARCH_MODE):
+    backends = {"memory": InMemorySearch, "server": ServerSearch, "auto": AutoSearch}
+    if mode not in backends:
+        print(f"Unknown SEARCH_MODE '{mode}', using auto")
+        mode = "auto"
+    return backends[mode]()
@@ -0,0 +1,102 @@
+GRAM_SIZE = 3
+
+
+def normalize(text):
+    return text.strip().lower()
+
+
+def grams_of(text):
+    # zipping shifted copies beats slicing at every offset, this runs for every row of a load
+    return set(map("".join, zip(*(text[i:] for i in range(GRAM_SIZE)))))
+
+
+class TrigramIndex:
+    """
+    Substring index over table rows.
+
+    Every row is added once as a lowercase string of its formatted cells. A
+    search narrows the rows down with trigram postings (the set of rows that
+    contain each 3-character substring of the query) and only runs the real
+    substring test on the rows left over.
+
+    Postings are built as rows are added: a load indexes its rows once and a
+    fetched page or an edited row only updates the postings of its own
+    trigrams, so no keystroke ever scans the table. A query that extends the
+    previous one (the user kept typing) only re-checks the previous matches.
+
+    Rows are identified by small integer keys handed out in load order
+    (RecordTableModel.row_key()), which survive sorting, so the index only has
+    to be rebuilt when the table is reloaded.
+    """
+
+    def __init__(self):
+        self._texts = []        # row key -> flattened lowercase row
+        self._postings = {}     # trigram -> set of row keys containing it
+        self._last_query = None
+        self._last_matches = None
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add_rows(self, rows):
+        """Index (key, text) pairs, e.g. every row after a load, a page that was just fetched or edited rows."""
+        texts = self._texts
+        postings = self._postings
+        for key, text in rows:
+            text = text.lower()
+            if key >= len(texts):
+                texts.extend([""] * (key + 1 - len(texts)))
+            elif texts[key] == text:
+                continue
+            else:
+                for gram in grams_of(texts[key]):
+                    keys = postings[gram]
+                    keys.discard(key)
+                    if not keys:
+                        del postings[gram]
+            texts[key] = text
+            for gram in grams_of(text):
+                keys = postings.get(gram)
+                if keys is None:
+                    postings[gram] = {key}
+                else:
+                    keys.add(key)
+
+        # the cached matches don't cover the new rows
+        self._last_query = None
+        self._last_matches = None
+
+    def remove_rows(self, keys):
+        """Forget rows that left the table; their keys are never handed out again."""
+        self.add_rows((key, "") for key in keys)
+
+    def search(self, text):
+        """Row keys whose formatted cells contain text (case-insensitive)."""
+        query = normalize(text)
+        texts = self._texts
+        if not query:
+            return set(range(len(texts)))
+
+        if self._last_query is not None and self._last_query in query:
+            # every match of the longer query also matched the previous one
+            candidates = self._last_matches
+        elif len(query) >= GRAM_SIZE:
+            candidates = self._candidates(query)
+        else:
+            # too short to have a trigram, a plain scan of the flattened rows is still cheap
+            candidates = range(len(texts))
+
+        matches = {key for key in candidates if query in texts[key]}
+        self._last_query = query
+        self._last_matches = matches
+        return matches
+
+    def _candidates(self, query):
+        postings = []
+        for gram in grams_of(query):
+            keys = self._postings.get(gram)
+            if keys is None:
+                return set()    # no row has this trigram
+            postings.append(keys)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
@@ -0,0 +1,694 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QAbstractProxyModel, QModelIndex
+
+from search_index import TrigramIndex
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Read-only table model over rows fetched from PostgreSQL.
+
+    Rows are kept column by column as plain Python lists (one list per column,
+    one reference per cell) and only turned into text when a view asks for a
+    visible cell in data(). Nothing is allocated per cell on the Qt side.
+
+    The rows can also come from a PagedQuery: only the first page is loaded up
+    front and the view pulls further pages through canFetchMore()/fetchMore()
+    as the user scrolls. With an executor, those pages and the server-side
+    sort of a partly loaded result run on its worker threads, and rows are
+    added when they arrive.
+
+    Once every row is loaded, patch_records() applies rows changed on the
+    server in place (see db_func.fetch_dashboard_tables()), so a refresh only
+    touches the rows that changed instead of resetting the whole model.
+
+    Args:
+        headers (list): Column labels shown in the horizontal header.
+        executor (QueryExecutor): Runs the paging queries; without one they run on the calling thread.
+    """
+
+    def __init__(self, headers, parent=None, executor=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._columns = [[] for _ in self._headers]
+        self._keys = []         # load order of each row, follows the row through sorts
+        self._next_key = 0
+        self._row_count = 0
+        self._source = None
+        self._executor = executor
+        self._fetching = None       # PagedQuery a page is being read from on a worker thread
+        self._fetching_all = None   # PagedQuery fetch_remaining() is reading every page of
+        self._sort_when_fetched = None  # (column, order) asked for while fetch_remaining() ran
+        self._sorting = None        # (task, column, order) of a server-side sort on its way
+        self._record_rows = None    # (key columns, {record key: row}) for patch_records(), built on demand
+        self.watermark = None       # newest updated_at the rows reflect, set by whoever loads them
+
+    #### Loading
+    def set_records(self, records):
+        """Replace the model contents with the given row tuples."""
+        self.release_source()
+        self._source = None
+        self._reset(records)
+
+    def set_source(self, source, first_page):
+        """Show the first page of an opened PagedQuery; the rest is fetched on scroll."""
+        self.release_source()
+        self._source = source
+        self._reset(first_page)
+
+    def release_source(self):
+        """Stop paging and hand the server cursor's connection back to the pool."""
+        self._cancel_sort()
+        if self._source is not None:
+            self._close_source(self._source)
+        # reads still on their way close the cursor when they return, and drop their rows
+        self._fetching = self._fetching_all = self._sort_when_fetched = None
+
+    def _close_source(self, source):
+        if source.exhausted:
+            return      # closed already, or left for the read that still holds it
+        if source is self._fetching or source is self._fetching_all:
+            # a worker is still reading from the cursor, paging stops now and the
+            # callback of that read hands the connection back once it returns
+            source.exhausted = True
+        else:
+            source.close()
+
+    def fetch_all(self):
+        """Load every remaining page, e.g. before searching or exporting the whole table."""
+        if not self.canFetchMore():
+            return
+        sorting = self._sorting
+        self._cancel_sort()
+        try:
+            rows = self._source.fetch_remaining()
+        except Exception as e:
+            print(f"Error fetching remaining rows: {e}")
+            return
+        self.append_records(rows)
+        if sorting is not None:
+            # every row is here now, sort them the way the server was about to
+            self._sort_rows(*sorting[1:])
+
+    def fetch_remaining(self, done=None):
+        """
+        Load every remaining page on a worker thread, appended in one go when they arrive.
+
+        done() is called on the GUI thread once they are in. Without an executor this
+        is fetch_all().
+        """
+        if not self.canFetchMore() or self._fetching_all is not None:
+            return
+        if self._executor is None:
+            self.fetch_all()
+            if done is not None:
+                done()
+            return
+
+        source = self._fetching_all = self._source
+        if self._sorting is not None:
+            # the server would restart from page one, the rows are sorted here once all are in
+            self._sort_when_fetched = self._sorting[1:]
+            self._cancel_sort()
+        self._executor.submit(None, source.fetch_ahead, True,
+                              on_result=lambda _: self._remaining_fetched(source, done),
+                              on_error=lambda e: self._remaining_fetched(source, done, e))
+
+    def _remaining_fetched(self, source, done, error=None):
+        sort_order = None
+        if self._fetching_all is source:
+            self._fetching_all = None
+            sort_order, self._sort_when_fetched = self._sort_when_fetched, None
+        if source.exhausted:
+            source.close()      # released while the pages were read; a no-op otherwise
+        if error is not None:
+            print(f"Error fetching remaining rows: {error}")
+            return
+        if source is not self._source:
+            return
+        # empty when fetch_all() already took them
+        self.append_records(source.take_ready())
+        if sort_order is not None:
+            self._sort_rows(*sort_order)
+        if done is not None:
+            done()
+
+    def is_complete(self):
+        """Whether every row of the result is loaded, so patching it keeps it equal to the server's."""
+        if self._source is None:
+            return True
+        return self._source.exhausted and self._row_count >= (self._source.total or 0)
+
+    def total_rows(self):
+        """Rows in the full result, including pages not fetched yet."""
+        if self._source is not None and self._source.total is not None:
+            return max(self._source.total, self._row_count)
+        return self._row_count
+
+    def _reset(self, records):
+        self.beginResetModel()
+        self._columns = self._to_columns(records)
+        self._keys = list(range(len(records)))
+        self._next_key = len(records)
+        self._row_count = len(records)
+        self._record_rows = None
+        self.watermark = None
+        self.endResetModel()
+
+    def append_records(self, records):
+        """Add row tuples after the existing rows."""
+        if not records:
+            return
+
+        start = self._row_count
+        self.beginInsertRows(QModelIndex(), start, start + len(records) - 1)
+        for column, values in zip(self._columns, self._to_columns(records)):
+            column.extend(values)
+        self._keys.extend(range(self._next_key, self._next_key + len(records)))
+        self._next_key += len(records)
+        self._row_count += len(records)
+        if self._record_rows is not None:
+            key_columns, record_rows = self._record_rows
+            for row in range(start, self._row_count):
+                record_rows[self._record_key(row, key_columns)] = row
+        self.endInsertRows()
+
+    def patch_records(self, changes, key_columns=(0,), total=None):
+        """
+        Apply rows that changed since the model was loaded, matched on the record key.
+
+        Args:
+            changes (list): (row tuple, visible) pairs. Visible rows replace the row with the
+                same key or are appended; rows no longer visible (archived, deleted) are removed.
+            key_columns (tuple): Columns that identify a record, e.g. (0,) for the id.
+            total (int): Rows in the full result after the changes, for a model still paging.
+                Only loaded rows are patched then; new rows show up with the next reload.
+
+        Returns:
+            (updated, inserted, removed): How many rows each change touched; rows that came
+            back unchanged don't count and emit nothing.
+        """
+        paging = self.canFetchMore()
+        record_rows = self._rows_by_record(key_columns)
+        updated, inserted, removed = [], [], []
+        for record, visible in changes:
+            row = record_rows.get(tuple(record[column] for column in key_columns))
+            if not visible:
+                if row is not None:
+                    removed.append(row)
+            elif row is not None:
+                # the overlap window re-fetches rows already patched in, those stay as they are
+                if any(column[row] != value for column, value in zip(self._columns, record)):
+                    updated.append((row, record))
+            elif not paging:
+                inserted.append(record)
+
+        if updated:
+            for row, record in updated:
+                for column, value in zip(self._columns, record):
+                    column[row] = value
+            rows = [row for row, _ in updated]
+            # one signal for the span: views only repaint what is on screen
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(self._columns) - 1))
+
+        if removed:
+            self._remove_rows(removed)
+        self.append_records(inserted)
+
+        if self._source is not None and not paging:
+            self._source.total = self._row_count
+        elif self._source is not None and total is not None:
+            self._source.total = total
+        return len(updated), len(inserted), len(removed)
+
+    def _record_key(self, row, key_columns):
+        return tuple(self._columns[column][row] for column in key_columns)
+
+    def _rows_by_record(self, key_columns):
+        if self._record_rows is None or self._record_rows[0] != key_columns:
+            self._record_rows = (key_columns, {
+                self._record_key(row, key_columns): row for row in range(self._row_count)
+            })
+        return self._record_rows[1]
+
+    def _remove_rows(self, rows):
+        # bottom-up, one beginRemoveRows() per run of adjacent rows
+        rows = sorted(set(rows), reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for column in self._columns:
+                del column[first:last + 1]
+            del self._keys[first:last + 1]
+            self._row_count -= last - first + 1
+            self._record_rows = None
+            self.endRemoveRows()
+
+    def clear(self):
+        self.set_records([])
+
+    def _to_columns(self, records):
+        if not records:
+            return [[] for _ in self._headers]
+        # zip(*rows) transposes without building an intermediate per-row structure
+        return [list(values) for values in zip(*records)]
+
+    #### Raw access for handlers and exports
+    def value(self, row, column):
+        """Raw database value of a cell (date, Decimal, int, str or None)."""
+        return self._columns[column][row]
+
+    def column_values(self, column):
+        return self._columns[column]
+
+    def row_key(self, row):
+        """Stable id of a row until the next reload, handed out in load order."""
+        return self._keys[row]
+
+    def row_keys(self):
+        """row_key() of every row, in row order. Don't modify."""
+        return self._keys
+
+    #### QAbstractTableModel interface
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._source is not None and not self._source.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if (not self.canFetchMore(parent) or self._fetching is not None or self._fetching_all is not None
+                or self._sorting is not None):
+            return
+        if self._executor is None:
+            try:
+                rows = self._source.fetch_page()
+            except Exception as e:
+                print(f"Error fetching next page: {e}")
+                return
+            self.append_records(rows)
+            return
+
+        source = self._fetching = self._source
+        self._executor.submit(None, source.fetch_ahead,
+                              on_result=lambda _: self._page_fetched(source),
+                              on_error=lambda e: self._page_fetched(source, e))
+
+    def _page_fetched(self, source, error=None):
+        if self._fetching is source:
+            self._fetching = None
+        if source.exhausted:
+            source.close()      # released while the page was read; a no-op after the last page
+        if error is not None:
+            print(f"Error fetching next page: {error}")
+        elif source is self._source:
+            # empty when fetch_all() already took the page
+            self.append_records(source.take_ready())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_cell(self._columns[index.column()][index.row()])
+        if role == Qt.ItemDataRole.UserRole:
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        # read-only, same as the old per-item ~ItemIsEditable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column < 0 or column >= len(self._columns) or self._row_count == 0:
+            return
+
+        if self._fetching_all is not None:
+            # every row is on its way, they are sorted here once they arrive
+            self._sort_when_fetched = (column, order)
+            return
+
+        # Only part of the result is loaded, so let the server sort and start from page one
+        if self.canFetchMore() or self._sorting is not None:
+            descending = order == Qt.SortOrder.DescendingOrder
+            if self._sorting is not None and self._sorting[1:] == (column, order):
+                return
+            self._cancel_sort()
+            if self._source.order_by == (column, descending):
+                return
+            source = self._source.reordered(column, descending)
+            if self._executor is not None:
+                task = self._executor.submit(None, source.open,
+                                             on_result=lambda rows: self._sorted(source, rows),
+                                             on_error=lambda e: self._sort_failed(column, order, e),
+                                             on_discard=lambda _: self._close_source(source))
+                self._sorting = (task, column, order)
+                return
+            try:
+                rows = source.open()
+            except Exception as e:
+                print(f"Error sorting on the server, sorting loaded rows instead: {e}")
+            else:
+                self._sorted(source, rows)
+                return
+
+        self._sort_rows(column, order)
+
+    def _sorted(self, source, first_page):
+        self._sorting = None
+        self._close_source(self._source)
+        self._source = source
+        watermark = self.watermark
+        self._reset(first_page)
+        self.watermark = watermark      # the new cursor is no older than the rows it replaces
+
+    def _sort_failed(self, column, order, error):
+        self._sorting = None
+        print(f"Error sorting on the server, sorting loaded rows instead: {error}")
+        self._sort_rows(column, order)
+
+    def _cancel_sort(self):
+        # a cancelled sort's cursor is closed by on_discard if it was opened at all
+        if self._sorting is not None:
+            self._sorting[0].cancel()
+            self._sorting = None
+
+    def _sort_rows(self, column, order):
+        values = self._columns[column]
+        reverse = order == Qt.SortOrder.DescendingOrder
+
+        # NULLs always go last; mixed types fall back to comparing the text
+        non_null = [row for row in range(self._row_count) if values[row] is not None]
+        nulls = [row for row in range(self._row_count) if values[row] is None]
+        try:
+            non_null.sort(key=values.__getitem__, reverse=reverse)
+        except TypeError:
+            non_null.sort(key=lambda row: format_cell(values[row]).lower(), reverse=reverse)
+        permutation = non_null + nulls
+
+        self.layoutAboutToBeChanged.emit()
+        self._columns = [[column_values[r] for r in permutation] for column_values in self._columns]
+        self._keys = [self._keys[r] for r in permutation]
+        self._record_rows = None
+
+        # keep the selection pointing at the same records
+        new_position = [0] * self._row_count
+        for new_row, old_row in enumerate(permutation):
+            new_position[old_row] = new_row
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_position[index.row()], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+
+class SearchFilterProxyModel(QAbstractProxyModel):
+    """
+    Shows only the rows of a RecordTableModel that match the current search.
+
+    The source rows are indexed once per load (a TrigramIndex built on the
+    first search and extended as later pages arrive). A search resolves to a
+    set of row keys, which becomes a plain list of visible source rows, and
+    the view is reset once; no per-row filter callback runs. Sorting and
+    paging (fetchMore) go straight to the source model.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index = None          # built on the first search after a (re)load
+        self._search_text = ""
+        self._rows = None           # visible source rows in source order, None shows every row
+        self._positions = None      # source row -> proxy row, built on demand while filtered
+        self._rows_by_key = None    # row key -> source row, built on demand until the layout changes
+        self._visible_keys = []     # keys of the visible rows while the source reorders
+        self._persistent_keys = []  # (persistent index, row key) while the source reorders
+        self._removed_keys = []     # keys of the source rows being removed
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self._on_source_about_to_be_reset)
+        model.modelReset.connect(self.endResetModel)
+        model.rowsAboutToBeInserted.connect(self._on_source_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._on_source_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_source_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._on_source_rows_removed)
+        model.layoutAboutToBeChanged.connect(self._on_source_layout_about_to_be_changed)
+        model.layoutChanged.connect(self._on_source_layout_changed)
+        model.dataChanged.connect(self._on_source_data_changed)
+        model.headerDataChanged.connect(self.headerDataChanged)
+
+    #### Searching
+    def search(self, text):
+        """Filter to rows with a cell containing text; empty text shows everything."""
+        self.beginResetModel()
+        self._search_text = text.strip()
+        if self._search_text:
+            self._rows = self._matching_rows(0, self.sourceModel().rowCount() - 1)
+        else:
+            self._rows = None
+        self._positions = None
+        self.endResetModel()
+
+    def is_filtered(self):
+        return self._rows is not None
+
+    def _search_index(self):
+        if self._index is None:
+            self._index = TrigramIndex()
+            self._index_rows(0, self.sourceModel().rowCount() - 1)
+        return self._index
+
+    def _index_rows(self, first, last):
+        model = self.sourceModel()
+        columns = [model.column_values(column) for column in range(model.columnCount())]
+        # one string per row, cells joined by a character nobody types so matches stay within a cell
+        self._index.add_rows(
+            (model.row_key(row), "\x1f".join([format_cell(values[row]) for values in columns]))
+            for row in range(first, last + 1)
+        )
+
+    def _matching_rows(self, first, last):
+        keys = self._search_index().search(self._search_text)
+        if len(keys) == len(self.sourceModel().row_keys()):
+            return list(range(first, last + 1))     # every row matches, nothing to look up
+        if self._rows_by_key is None:
+            self._rows_by_key = {key: row for row, key in enumerate(self.sourceModel().row_keys())}
+        rows = sorted(self._rows_by_key[key] for key in keys)
+        return [row for row in rows if first <= row <= last]
+
+    def _proxy_row(self, source_row):
+        if self._rows is None:
+            return source_row
+        if self._positions is None:
+            self._positions = {row: position for position, row in enumerate(self._rows)}
+        return self._positions.get(source_row, -1)
+
+    #### QAbstractProxyModel interface
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        row = proxy_index.row() if self._rows is None else self._rows[proxy_index.row()]
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = self._proxy_row(source_index.row())
+        return QModelIndex() if row < 0 else self.createIndex(row, source_index.column())
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < self.rowCount() and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().rowCount() if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        return self.sourceModel().data(self.mapToSource(index), role)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Vertical and role == Qt.ItemDataRole.DisplayRole:
+            return str(section + 1)     # number the rows as shown, not as loaded
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        # the proxy never reorders, it follows the source's layout
+        self.sourceModel().sort(column, order)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.sourceModel().canFetchMore()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not parent.isValid():
+            self.sourceModel().fetchMore()
+
+    #### Source model changes
+    def _on_source_about_to_be_reset(self):
+        # new rows, new keys: drop the index and the filter
+        self.beginResetModel()
+        self._index = None
+        self._search_text = ""
+        self._rows = None
+        self._positions = None
+        self._rows_by_key = None
+
+    def _on_source_rows_about_to_be_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _on_source_rows_inserted(self, parent, first, last):
+        self._rows_by_key = None
+        if self._index is not None:
+            self._index_rows(first, last)
+
+        if self._rows is None:
+            self.endInsertRows()
+            return
+
+        # appended rows that match the active search go to the end of the view
+        matches = self._matching_rows(first, last)
+        if matches:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(matches) - 1)
+            self._rows.extend(matches)
+            self._positions = None
+            self.endInsertRows()
+
+    def _on_source_rows_about_to_be_removed(self, parent, first, last):
+        model = self.sourceModel()
+        self._removed_keys = [model.row_key(row) for row in range(first, last + 1)]
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+        else:
+            # the visible rows after the removed ones all shift, simpler to reset the filtered view
+            self.beginResetModel()
+
+    def _on_source_rows_removed(self, parent, first, last):
+        self._rows_by_key = None
+        if self._index is not None:
+            self._index.remove_rows(self._removed_keys)
+        self._removed_keys = []
+
+        if self._rows is None:
+            self.endRemoveRows()
+            return
+        self._rows = self._matching_rows(0, self.sourceModel().rowCount() - 1)
+        self._positions = None
+        self.endResetModel()
+
+    def _on_source_layout_about_to_be_changed(self):
+        self.layoutAboutToBeChanged.emit()
+        # remember which records are shown and which one every persistent index points at
+        model = self.sourceModel()
+        if self._rows is not None:
+            self._visible_keys = [model.row_key(row) for row in self._rows]
+        self._persistent_keys = [
+            (index, model.row_key(self.mapToSource(index).row()))
+            for index in self.persistentIndexList()
+        ]
+
+    def _on_source_layout_changed(self):
+        model = self.sourceModel()
+        self._rows_by_key = rows_by_key = {key: row for row, key in enumerate(model.row_keys())}
+        if self._rows is not None:
+            self._rows = sorted(rows_by_key[key] for key in self._visible_keys)
+            self._positions = None
+
+        old_indexes, new_indexes = [], []
+        for index, key in self._persistent_keys:
+            old_indexes.append(index)
+            new_indexes.append(self.mapFromSource(model.index(rows_by_key[key], index.column())))
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self._persistent_keys = []
+        self._visible_keys = []
+        self.layoutChanged.emit()
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        if self._index is not None:
+            # patched rows: their new text replaces the old one in the index
+            self._index_rows(top_left.row(), bottom_right.row())
+        if self._rows is not None and self._rows != self._matching_rows(0, self.sourceModel().rowCount() - 1):
+            # an edited row started or stopped matching the search
+            self.search(self._search_text)
+            return
+
+        if self._rows is None:
+            self.dataChanged.emit(self.mapFromSource(top_left), self.mapFromSource(bottom_right), roles)
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            proxy_row = self._proxy_row(row)
+            if proxy_row >= 0:
+                self.dataChanged.emit(self.index(proxy_row, top_left.column()),
+                                      self.index(proxy_row, bottom_right.column()), roles)
+
+
+def format_cell(value):
+    return "" if value is None else str(value)
+
+
+#### View helpers
+def attach_model(table_view, headers, executor=None):
+    """Give a QTableView its own RecordTableModel behind a search proxy and return the model."""
+    model = RecordTableModel(headers, table_view, executor)
+    proxy = SearchFilterProxyModel(table_view)
+    proxy.setSourceModel(model)
+    table_view.setModel(proxy)
+    return model
+
+def source_model(table_view):
+    """The RecordTableModel behind a table view, looking through the search proxy."""
+    model = table_view.model()
+    if isinstance(model, QAbstractProxyModel):
+        return model.sourceModel()
+    return model
+
+def source_row(table_view, index):
+    """Model row of a view index, e.g. the one passed to doubleClicked."""
+    model = table_view.model()
+    if isinstance(model, QAbstractProxyModel):
+        index = model.mapToSource(index)
+    return index.row()
+
+def selected_rows(table_view):
+    """Model rows of the selected table rows, top to bottom."""
+    return sorted(source_row(table_view, index) for index in table_view.selectionModel().selectedRows())
+
+def visible_rows(table_view):
+    """Model rows that pass the search filter."""
+    model = table_view.model()
+    return [source_row(table_view, model.index(row, 0)) for row in range(model.rowCount())]
+
+def visible_row_count(table_view):
+    """Rows matching the search, or every row (including pages still on the server) when not searching."""
+    model = table_view.model()
+    if isinstance(model, SearchFilterProxyModel) and model.is_filtered():
+        return model.rowCount()
+    return source_model(table_view).total_rows()
+
+def search_table(table_view, text):
+    model = table_view.model()
+    if isinstance(model, SearchFilterProxyModel):
+        model.search(text)
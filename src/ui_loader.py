@@ -0,0 +1,73 @@
+import hashlib
+import importlib.util
+import os
+
+# "compiled" builds windows from the pyuic6 modules in QtGUI/ when they are up to date,
+# "uic" always parses the .ui files at runtime
+UI_MODE = os.getenv("UI_MODE", "compiled")
+
+UI_DIR = "QtGUI"
+
+# .ui file -> (compiled module, Ui_ class inside it)
+UI_FORMS = {
+    "form.ui": ("ui_form", "Ui_InvestoPinoyGUI"),
+    "login.ui": ("ui_login", "Ui_Form"),
+}
+
+_ui_classes = {}
+
+
+def ui_source_hash(ui_file: str):
+    with open(os.path.join(UI_DIR, ui_file), "rb") as f:
+        # same hash whether git checked the file out with LF or CRLF line endings
+        return hashlib.sha1(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def load_ui_class(ui_file: str):
+    """
+    The compiled Ui_ class of a .ui file, or None when it is missing or was built from another version of the file.
+
+    build_ui.py stamps every module with the UI_SOURCE_SHA1 of the .ui file
+    it was generated from, so a form edited in Designer but not rebuilt falls
+    back to uic instead of showing stale widgets.
+    """
+    if ui_file in _ui_classes:
+        return _ui_classes[ui_file]
+
+    module_name, class_name = UI_FORMS[ui_file]
+    path = os.path.join(UI_DIR, module_name + ".py")
+    ui_class = None
+    if os.path.exists(path):
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if getattr(module, "UI_SOURCE_SHA1", None) == ui_source_hash(ui_file):
+            ui_class = getattr(module, class_name)
+        else:
+            print(f"{path} is out of date with {ui_file}, run python src/build_ui.py")
+    _ui_classes[ui_file] = ui_class
+    return ui_class
+
+
+def setup_ui(widget, ui_file: str, mode: str = None):
+    """
+    Build the widgets of a .ui file into widget, the way uic.loadUi(path, widget) does.
+
+    Child widgets end up as attributes of widget in both modes.
+
+    Args:
+        ui_file (str): File name inside QtGUI/, a key of UI_FORMS.
+        mode (str): "compiled" or "uic"; defaults to UI_MODE.
+    """
+    mode = mode or UI_MODE
+    ui_class = load_ui_class(ui_file) if mode == "compiled" else None
+    if ui_class is None:
+        # only the fallback needs the .ui parser
+        from PyQt6 import uic
+        uic.loadUi(os.path.join(UI_DIR, ui_file), widget)
+        return
+    ui = ui_class()
+    ui.setupUi(widget)
+    # setupUi() keeps the children on the Ui_ object, loadUi() sets them on the widget
+    for name, child in vars(ui).items():
+        setattr(widget, name, child)